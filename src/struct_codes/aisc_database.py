@@ -1,10 +1,18 @@
-from dataclasses import fields
-from math import isnan
+import csv
+import math
+from collections.abc import Iterable, Iterator, Mapping
+from enum import Enum
+from fractions import Fraction
+from functools import cache
+from math import isnan, nan
 from pathlib import Path
-from typing import Any
+from typing import TYPE_CHECKING, Any
 
-import pandas as pd
+import numpy as np
 
+from struct_codes.angle import SingleAngle
+from struct_codes.channel import Channel
+from struct_codes.hss import HollowStructuralSection
 from struct_codes.i_section import DoublySymmetricI, DoublySymmetricIGeo
 from struct_codes.materials import Material
 from struct_codes.sections import (
@@ -14,8 +22,12 @@ from struct_codes.sections import (
     SectionType,
     section_table,
 )
+from struct_codes.tee import Tee
 from struct_codes.units import Quantity, kilogram, meter, millimeter
 
+if TYPE_CHECKING:
+    import pandas as pd
+
 DATABASE_PATH_16ed = Path(__file__).parent / Path("aisc-shapes-database-v16.0.csv")
 DATABASE_PATH_15ed = Path(__file__).parent / Path("aisc-shapes-database-v15.0.csv")
 
@@ -153,7 +165,26 @@ def process_aisc_database_v160_row(section: dict[str, Any]):
     return {name: process_entry(name, value) for name, value in section.items()}
 
 
+def process_column(name: str, values: list[Any]):
+    """Array version of `process_entry`, missing values are kept as nan"""
+    typ = PARAMS[name]
+    if typ in CONVERSION_FACTORS:
+        unit, factor = CONVERSION_FACTORS[typ]
+        return np.array(values, dtype=float) * factor * unit
+    if typ is bool:
+        return np.array([value == "T" for value in values])
+    if typ is float:
+        return np.array(values, dtype=float)
+    return tuple(values)
+
+
 def read_csv_table(file_path: Path):
+    """
+    Reference conversion of the raw AISC csv using pandas. Runtime lookups use
+    the pandas-free `AiscSectionTable`, this is kept for one-off conversions.
+    """
+    import pandas as pd
+
     with open(file_path, "r") as f:
         df = pd.read_csv(f, na_values="–")
 
@@ -266,11 +297,13 @@ def read_csv_table(file_path: Path):
 
 
 def read_json_cleaned_up_file(file_path: Path):
+    import pandas as pd
+
     df = pd.read_json(file_path)
     return convert_inputs(df)
 
 
-def convert_inputs(df: pd.DataFrame):
+def convert_inputs(df: "pd.DataFrame"):
     return {
         row.EDI_STD_Nomenclature_imp: dict(
             **process_aisc_database_v160_row(
@@ -285,16 +318,298 @@ def convert_inputs(df: pd.DataFrame):
     }
 
 
-AISC_SECTIONS_16ED = read_csv_table(DATABASE_PATH_16ed)
-AISC_SECTIONS_15ED = read_csv_table(DATABASE_PATH_15ed)
+# first occurrence of a column in the raw csv is in imperial units, second in metric
+IMPERIAL_COLUMNS_KEPT = {
+    "Type": "type",
+    "EDI_Std_Nomenclature": "EDI_STD_Nomenclature_imp",
+    "AISC_Manual_Label": "AISC_Manual_Label_imp",
+    "T_F": "T_F",
+}
+METRIC_COLUMNS_RENAMED = {
+    "tan(?)": "tan_alpha",
+    "EDI_Std_Nomenclature": "EDI_STD_Nomenclature_metric",
+    "AISC_Manual_Label": "AISC_Manual_Label_metric",
+}
+MISSING_VALUES = ("–", "")
+
+
+def _csv_column_names(header: list[str]) -> list[str | None]:
+    """Column names matching `PARAMS` keys, None for the dropped imperial columns"""
+    seen = set()
+    names = []
+    for column in header:
+        if column in seen:
+            names.append(METRIC_COLUMNS_RENAMED.get(column, column.replace("/", "_")))
+        else:
+            names.append(IMPERIAL_COLUMNS_KEPT.get(column))
+        seen.add(column)
+    return names
+
+
+def parse_raw_entry(name: str, value: str) -> Any:
+    if value.strip() in MISSING_VALUES:
+        return nan
+    if PARAMS[name] in (str, bool):
+        return value
+    return float(value)
+
 
-section_table_old = {SectionType.W: DoublySymmetricI}
+def read_csv_rows(file_path: Path) -> dict[str, dict[str, Any]]:
+    """Reads the raw AISC csv without unit conversion, no pandas required"""
+    with open(file_path, "r", newline="", encoding="utf-8") as f:
+        reader = csv.reader(f)
+        names = _csv_column_names(next(reader))
+        rows = (
+            {
+                name: parse_raw_entry(name, value)
+                for name, value in zip(names, line)
+                if name is not None
+            }
+            for line in reader
+        )
+        return {row["EDI_STD_Nomenclature_imp"]: row for row in rows}
+
+
+class DoubleAngleOrientation(str, Enum):
+    """Legs back to back, equal leg angles have no suffix"""
+
+    EQUAL = ""
+    LLBB = "LLBB"
+    SLBB = "SLBB"
+
+
+def _parse_inches(label: str) -> float:
+    """'1-1/2' -> 1.5"""
+    whole, _, fraction = label.rpartition("-")
+    if "/" not in fraction:
+        return float(label)
+    numerator, denominator = fraction.split("/")
+    return float(whole or 0) + int(numerator) / int(denominator)
+
+
+def _inch_label(inches: float) -> str:
+    """1.5 -> '1-1/2', values that aren't multiples of 1/16 in. kept as decimals"""
+    sixteenths = inches * 16
+    if not math.isclose(sixteenths, round(sixteenths)):
+        return f"{inches:g}"
+    whole, remainder = divmod(round(sixteenths), 16)
+    if not remainder:
+        return str(whole)
+    fraction = Fraction(remainder, 16)
+    fraction = f"{fraction.numerator}/{fraction.denominator}"
+    return f"{whole}-{fraction}" if whole else fraction
+
+
+def double_angle_name(
+    angle_name: str, spacing: float, orientation: DoubleAngleOrientation
+) -> str:
+    """2L name from the L name and the spacing in inches"""
+    spacing_label = f"X{_inch_label(spacing)}" if spacing else ""
+    return f"2{angle_name}{spacing_label}{orientation.value}"
+
+
+def parse_double_angle_name(
+    name: str,
+) -> tuple[str, float, DoubleAngleOrientation]:
+    """'2L8X6X1X3/8LLBB' -> ('L8X6X1', 0.375, LLBB), spacing in inches"""
+    if not name.startswith("2L"):
+        raise KeyError(name)
+    body, orientation = name[1:], DoubleAngleOrientation.EQUAL
+    for suffix in (DoubleAngleOrientation.LLBB, DoubleAngleOrientation.SLBB):
+        if body.endswith(suffix.value):
+            body, orientation = body[: -len(suffix.value)], suffix
+    parts = body.split("X")
+    if len(parts) not in (3, 4):
+        raise KeyError(name)
+    try:
+        spacing = _parse_inches(parts[3]) if len(parts) == 4 else 0.0
+    except (ValueError, ZeroDivisionError):
+        raise KeyError(name) from None
+    return "X".join(parts[:3]), spacing, orientation
+
+
+def double_angle_raw_row(
+    angle: dict[str, Any], spacing: float, orientation: DoubleAngleOrientation
+) -> dict[str, Any]:
+    """
+    Raw (csv units) row of two angles back to back, spacing in inches. Leg
+    properties follow the angle row, its x axis is parallel to the short leg.
+    Properties about the symmetry axis use the parallel axis theorem, the
+    shear center is on the leg centerline, t/2 from the backs of the legs.
+    """
+    spacing_mm = spacing * 25.4
+    long_leg, short_leg = max(angle["d"], angle["b"]), min(angle["d"], angle["b"])
+    if orientation == DoubleAngleOrientation.SLBB:
+        # short legs back to back, the angle's y axis is the pair's x axis
+        depth, width = short_leg, long_leg
+        x_axis, y_axis = ("Iy", "Zy", "Sy", "ry", "x", "xp"), ("Ix", "y")
+    else:
+        depth, width = long_leg, short_leg
+        x_axis, y_axis = ("Ix", "Zx", "Sx", "rx", "y", "yp"), ("Iy", "x")
+    inertia_x, plastic_x, elastic_x, radius_x, centroid_x, plastic_axis_x = (
+        angle[name] for name in x_axis
+    )
+    inertia_y, centroid_y = (angle[name] for name in y_axis)
+    area = 2 * angle["A"]
+    arm = centroid_y + spacing_mm / 2
+    # inertias in 10^6 mm^4, moduli in 10^3 mm^3
+    pair_inertia_x = 2 * inertia_x
+    pair_inertia_y = 2 * (inertia_y + angle["A"] * arm**2 / 10**6)
+    shear_center = centroid_x - angle["t"] / 2
+    polar_radius_squared = (
+        shear_center**2 + (pair_inertia_x + pair_inertia_y) * 10**6 / area
+    )
+    name = double_angle_name(angle["EDI_STD_Nomenclature_imp"], spacing, orientation)
+    metric_spacing = f"X{math.floor(spacing_mm)}" if spacing else ""
+    metric_name = (
+        f"2{angle['EDI_STD_Nomenclature_metric']}{metric_spacing}{orientation.value}"
+    )
+    row = {column: nan for column in angle}
+    row.update(
+        {
+            "type": SectionType.Two_L.value,
+            "EDI_STD_Nomenclature_imp": name,
+            "AISC_Manual_Label_imp": name,
+            "EDI_STD_Nomenclature_metric": metric_name,
+            "AISC_Manual_Label_metric": metric_name,
+            "W": 2 * angle["W"],
+            "A": area,
+            "d": depth,
+            "b": width,
+            "t": angle["t"],
+            "y": centroid_x,
+            "yp": plastic_axis_x,
+            "b_t": angle["b_t"],
+            "Ix": pair_inertia_x,
+            "Zx": 2 * plastic_x,
+            "Sx": 2 * elastic_x,
+            "rx": radius_x,
+            "Iy": pair_inertia_y,
+            "Zy": area * arm / 10**3,
+            "Sy": pair_inertia_y * 10**3 / (width + spacing_mm / 2),
+            "ry": (pair_inertia_y * 10**6 / area) ** 0.5,
+            "ro": polar_radius_squared**0.5,
+            "H": 1 - shear_center**2 / polar_radius_squared,
+        }
+    )
+    if "T_F" in angle:
+        row["T_F"] = angle["T_F"]
+    return row
+
+
+class AiscSectionTable(Mapping):
+    """
+    Section name to processed row mapping. Rows are only converted to
+    quantities when looked up, and kept for later lookups.
+
+    Double angles (2L) aren't stored, they are generated from their L row on
+    first lookup, for any spacing, e.g. "2L8X6X1X5/8LLBB".
+    """
+
+    def __init__(self, raw_rows: dict[str, dict[str, Any]]):
+        self._names = tuple(raw_rows)
+        self._double_angle_names = frozenset(
+            name for name, row in raw_rows.items() if row["type"] == SectionType.Two_L
+        )
+        self._raw_rows = {
+            name: row
+            for name, row in raw_rows.items()
+            if name not in self._double_angle_names
+        }
+        self._rows: dict[str, dict[str, Any]] = {}
+
+    def _raw_row(self, name: str) -> dict[str, Any]:
+        try:
+            return self._raw_rows[name]
+        except KeyError:
+            angle_name, spacing, orientation = parse_double_angle_name(name)
+            row = double_angle_raw_row(self._raw_rows[angle_name], spacing, orientation)
+            self._raw_rows[name] = row
+            return row
+
+    def __getitem__(self, name: str) -> dict[str, Any]:
+        try:
+            return self._rows[name]
+        except KeyError:
+            row = process_aisc_database_v160_row(self._raw_row(name))
+            self._rows[name] = row
+            return row
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(self._names)
+
+    def names(self, section_type: SectionType | None = None) -> tuple[str, ...]:
+        if section_type == SectionType.Two_L:
+            return tuple(
+                name for name in self._names if name in self._double_angle_names
+            )
+        return tuple(
+            name
+            for name in self._names
+            if section_type is None
+            or (
+                name not in self._double_angle_names
+                and self._raw_rows[name]["type"] == section_type
+            )
+        )
+
+    def double_angle(
+        self,
+        angle_name: str,
+        spacing: Quantity,
+        orientation: DoubleAngleOrientation = DoubleAngleOrientation.EQUAL,
+    ) -> dict[str, Any]:
+        """Row of two angles back to back at any spacing"""
+        name = double_angle_name(angle_name, spacing.to("inch").magnitude, orientation)
+        return self[name]
+
+    def geometry_table(self, names: Iterable[str]) -> AiscSectionGeometry:
+        """Columnar geometry, every field is an array over the given sections"""
+        rows = [self._raw_row(name) for name in names]
+        return AiscSectionGeometry(
+            **{
+                name: process_column(name, [row[name] for row in rows])
+                for name in PARAMS
+            }
+        )
+
+    def __len__(self) -> int:
+        return len(self._names)
+
+
+DATABASE_PATHS = {RuleEd.ED15: DATABASE_PATH_15ed, RuleEd.ED16: DATABASE_PATH_16ed}
+
+
+@cache
+def aisc_sections(ed: RuleEd = RuleEd.ED15) -> AiscSectionTable:
+    return AiscSectionTable(read_csv_rows(DATABASE_PATHS[ed]))
+
+
+def __getattr__(name: str):
+    # database tables are only read on first use
+    tables = {"AISC_SECTIONS_16ED": RuleEd.ED16, "AISC_SECTIONS_15ED": RuleEd.ED15}
+    if name in tables:
+        return aisc_sections(tables[name])
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
+section_table_old = {
+    SectionType.W: DoublySymmetricI,
+    SectionType.HSS: HollowStructuralSection,
+    SectionType.PIPE: HollowStructuralSection,
+    SectionType.L: SingleAngle,
+    SectionType.C: Channel,
+    SectionType.MC: Channel,
+    SectionType.WT: Tee,
+    SectionType.MT: Tee,
+    SectionType.ST: Tee,
+}
 
 
 def create_aisc_section(
     section_name: str, material: Material, construction: ConstructionType
 ):
-    section_dict = AISC_SECTIONS_15ED[section_name]
+    section_dict = aisc_sections(RuleEd.ED15)[section_name]
     section_type = section_dict["type"]
     section_class = section_table_old[section_type]
     return section_class(
@@ -304,8 +619,21 @@ def create_aisc_section(
     )
 
 
+def get_aisc_geometry_table(
+    names: Iterable[str] | None = None,
+    section_type: SectionType | None = None,
+    ed: RuleEd = RuleEd.ED15,
+) -> AiscSectionGeometry:
+    """
+    Columnar geometry for batch calculations, selected by name or for the whole
+    catalog of a section type.
+    """
+    table = aisc_sections(ed)
+    if names is None:
+        names = table.names(section_type)
+    return table.geometry_table(names)
+
+
 def get_aisc_section_geo_and_type(name: str, ed: RuleEd = RuleEd.ED15):
-    section = {RuleEd.ED15: AISC_SECTIONS_15ED, RuleEd.ED16: AISC_SECTIONS_16ED}[ed][
-        name
-    ]
+    section = aisc_sections(ed)[name]
     return AiscSectionGeometry(**section), section_table[section["type"]]
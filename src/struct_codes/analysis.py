@@ -1,10 +1,18 @@
 from abc import ABC, abstractmethod
-from dataclasses import dataclass
-from typing import Callable, Iterable, Protocol
+from dataclasses import dataclass, fields, replace
+from functools import cached_property
+from math import nan
+from typing import Any, Callable, Iterable, Protocol
 
+import numpy as np
+
+from struct_codes.angle import SingleAngle
 from struct_codes.beam import Beam
+from struct_codes.channel import Channel
 from struct_codes.compression import compression_criteria_table
 from struct_codes.criteria import DesignType, Strength, StrengthType
+from struct_codes.hss import HollowStructuralSection
+from struct_codes.i_section import DoublySymmetricI
 from struct_codes.materials import Material
 from struct_codes.sections import (
     Connection,
@@ -13,6 +21,7 @@ from struct_codes.sections import (
     SectionClassification,
     SectionGeometry,
 )
+from struct_codes.tee import Tee
 from struct_codes.units import Quantity
 
 
@@ -54,50 +63,216 @@ class BeamAnalysisPipe(Protocol):
         pass
 
 
+SECTION_CLASSES = {
+    SectionClassification.DOUBLY_SYMMETRIC_I: DoublySymmetricI,
+    SectionClassification.CHANEL: Channel,
+    SectionClassification.TEE: Tee,
+    SectionClassification.HSS: HollowStructuralSection,
+    SectionClassification.PIPE: HollowStructuralSection,
+    SectionClassification.ANGLE: SingleAngle,
+}
+
+
+CriteriaTable = dict[
+    SectionClassification,
+    Iterable[tuple[StrengthType, Callable[["Analysis"], Strength]]],
+]
+
+
+def _default_lengths(beam: Beam) -> Beam:
+    """Minor axis and torsion unbraced lengths default to the major axis one"""
+    return replace(
+        beam,
+        length_minor_axis=(
+            beam.length_major_axis
+            if beam.length_minor_axis is None
+            else beam.length_minor_axis
+        ),
+        length_torsion=(
+            beam.length_major_axis
+            if beam.length_torsion is None
+            else beam.length_torsion
+        ),
+    )
+
+
 @dataclass
-class AnalysisInput:
+class Analysis:
+    """
+    A member of a model, geometry, material and beam fields may be arrays over
+    several members of the same classification.
+    """
+
     geometry: SectionGeometry
     section_type: SectionClassification
     material: Material
     construction: ConstructionType
     beam: Beam
-    design_type: DesignType
+    design_type: DesignType = DesignType.ASD
     connection: Connection = None
-    
 
+    def __post_init__(self):
+        self.beam = _default_lengths(self.beam)
 
-    # @property
-    # def compression(self):
-    #     return load_check(self, compression_criteria_table)
-    
-    @abstractmethod
+    @cached_property
+    def section(self) -> Any:
+        """Section class of the classification, from SECTION_CLASSES"""
+        section_class = SECTION_CLASSES[self.section_type]
+        if section_class is DoublySymmetricI:
+            return DoublySymmetricI(
+                self.geometry, self.material, self.construction, self.connection
+            )
+        return section_class(self.geometry, self.material, self.construction)
+
+    @cached_property
+    def section_compression(self) -> LoadStrengthCalculation:
+        """compression() of the section class over the beam lengths"""
+        beam = self.beam
+        lengths = dict(
+            length_major_axis=beam.length_major_axis,
+            factor_k_major_axis=beam.factor_k_major_axis,
+            length_minor_axis=beam.length_minor_axis,
+            factor_k_minor_axis=beam.factor_k_minor_axis,
+        )
+        # torsional buckling doesn't govern closed sections
+        if not isinstance(self.section, HollowStructuralSection):
+            lengths.update(
+                length_torsion=beam.length_torsion,
+                factor_k_torsion=beam.factor_k_torsion,
+            )
+        return self.section.compression(**lengths, design_type=self.design_type)
+
+    @property
     def compression(self) -> LoadStrengthCalculation:
-        ...
-
-
-
-
-# def load_check(
-#     model: Analysis,
-#     criteria_per_section_table: dict[
-#         SectionClassification,
-#         Iterable[
-#             tuple[
-#                 StrengthType,
-#                 Callable[
-#                     [
-#                         Analysis,
-#                     ],
-#                     Strength,
-#                 ],
-#             ]
-#         ],
-#     ],
-# ):
-#     criteria_list = criteria_per_section_table[model.section_type]
-#     criteria_dict = {name: criteria(model) for name, criteria in criteria_list}
-#     return LoadStrengthCalculation(criteria=criteria_dict)
-
-
-if __name__ == "__main__":
-    # Analysis()
+        return load_check(self, compression_criteria_table)
+
+
+def load_check(
+    model: Analysis, criteria_per_section_table: CriteriaTable
+) -> LoadStrengthCalculation:
+    criteria_list = criteria_per_section_table[model.section_type]
+    criteria_dict = {name: criteria(model) for name, criteria in criteria_list}
+    return LoadStrengthCalculation(criteria=criteria_dict)
+
+
+def _stack_values(values: list[Any]) -> Any:
+    """
+    One column from the same field of several members. Missing values are NaN
+    as in the database geometry tables, fields missing from every member stay
+    None.
+    """
+    present = [value for value in values if value is not None]
+    if not present:
+        return None
+    if isinstance(present[0], Quantity):
+        units = present[0].units
+        return (
+            np.array(
+                [
+                    nan if value is None else value.to(units).magnitude
+                    for value in values
+                ]
+            )
+            * units
+        )
+    if all(
+        isinstance(value, (int, float)) and not isinstance(value, bool)
+        for value in present
+    ):
+        return np.array([nan if value is None else value for value in values])
+    return np.array(values, dtype=object)
+
+
+def _stack(items: list[Any]) -> Any:
+    """Dataclass of columns from dataclasses of the same type, shared ones kept"""
+    if all(item is items[0] for item in items):
+        return items[0]
+    return type(items[0])(
+        **{
+            field.name: _stack_values([getattr(item, field.name) for item in items])
+            for field in fields(items[0])
+            if field.init
+        }
+    )
+
+
+@dataclass
+class ModelCheck:
+    """
+    Results of a model in the member order, each group one batch of members
+    with the same classification, as (member indices, calculation).
+    """
+
+    size: int
+    groups: tuple[tuple[np.ndarray, LoadStrengthCalculation], ...]
+
+    @cached_property
+    def design_strength_tuple(self) -> tuple[Quantity, np.ndarray]:
+        strength = np.full(self.size, nan)
+        criterion = np.empty(self.size, dtype=object)
+        units = None
+        for indices, calculation in self.groups:
+            group_strength, group_criterion = calculation.design_strength_tuple
+            units = units or group_strength.units
+            strength[indices] = group_strength.to(units).magnitude
+            criterion[indices] = group_criterion
+        return strength * units, criterion
+
+    @property
+    def design_strength(self) -> Quantity:
+        return self.design_strength_tuple[0]
+
+    @property
+    def design_strength_criterion(self) -> np.ndarray:
+        return self.design_strength_tuple[1]
+
+    def group(self, index: int) -> tuple[LoadStrengthCalculation, int]:
+        """Batch calculation holding a member and the member position in it"""
+        for indices, calculation in self.groups:
+            (position,) = np.nonzero(indices == index)
+            if position.size:
+                return calculation, int(position[0])
+        raise IndexError(f"model has {self.size} members")
+
+
+def model_check(
+    models: Iterable[Analysis], criteria_per_section_table: CriteriaTable
+) -> ModelCheck:
+    """
+    Load check of a whole model, members grouped by classification and
+    evaluated as one batch per group with the criteria of the table.
+    """
+    models = tuple(models)
+    groups: dict[tuple, list[int]] = {}
+    for index, model in enumerate(models):
+        key = (
+            model.section_type,
+            model.construction,
+            model.design_type,
+            type(model.geometry),
+            type(model.material),
+            id(model.connection),
+        )
+        groups.setdefault(key, []).append(index)
+    results = []
+    for (section_type, construction, design_type, *_), indices in groups.items():
+        members = [models[index] for index in indices]
+        batch = Analysis(
+            geometry=_stack([model.geometry for model in members]),
+            section_type=section_type,
+            material=_stack([model.material for model in members]),
+            construction=construction,
+            beam=_stack(
+                [replace(model.beam, brace_positions=None) for model in members]
+            ),
+            design_type=design_type,
+            connection=members[0].connection,
+        )
+        results.append(
+            (np.array(indices), load_check(batch, criteria_per_section_table))
+        )
+    return ModelCheck(size=len(models), groups=tuple(results))
+
+
+def compression_check(models: Iterable[Analysis]) -> ModelCheck:
+    return model_check(models, compression_criteria_table)
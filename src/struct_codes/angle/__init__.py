@@ -0,0 +1,296 @@
+from dataclasses import dataclass
+from typing import Any
+
+import numpy as np
+
+from struct_codes.angle._compression import (
+    AngleLeg,
+    SingleAngleBucklingStrengthCalculation,
+    TrussType,
+    angle_compression_elements,
+)
+from struct_codes.angle._flexure import (
+    SingleAngleLateralTorsionalBucklingCalculation2016,
+    SingleAngleLegLocalBucklingCalculation2016,
+    SingleAngleYieldingCalculation2016,
+    single_angle_monosymmetry_parameter,
+)
+from struct_codes.angle._slenderness import (
+    axial_leg_limit_ratio,
+    flexural_leg_compact_limit,
+    flexural_leg_slender_limit,
+)
+from struct_codes.compression import (
+    CompressionElement,
+    FlexuralTorsionalBucklingUnsymmetricStrengthCalculation,
+    flexural_buckling_criteria,
+    value_or_default,
+)
+from struct_codes.criteria import DesignType, StrengthType
+from struct_codes.materials import Material
+from struct_codes.sections import (
+    ConstructionType,
+    LoadStrengthCalculation,
+    RuleEd,
+    SectionGeometry,
+)
+from struct_codes.units import Quantity
+
+
+def _smallest(*values: Quantity) -> Quantity:
+    """Smallest of the tabulated values, missing ones (None or NaN) skipped"""
+    values = [value for value in values if value is not None]
+    units = values[0].units
+    smallest = values[0].magnitude
+    for value in values[1:]:
+        smallest = np.fmin(smallest, value.to(units).magnitude)
+    return smallest * units
+
+
+@dataclass
+class SingleAngle:
+    """
+    Single angles in principal axes, w major and z minor, with the tabulated
+    tan(α), Iw, Iz and section moduli at the toes (A short leg, C long leg)
+    and heel (B). The geometry may be a columnar table of several angles.
+    """
+
+    geometry: SectionGeometry
+    material: Material
+    construction: ConstructionType = ConstructionType.ROLLED
+
+    @property
+    def short_leg_ratio(self) -> Any:
+        return (self.geometry.d / self.geometry.t).to("").magnitude
+
+    @property
+    def leg_ratio(self) -> Any:
+        """Long to short leg length ratio"""
+        return (self.geometry.b / self.geometry.d).to("").magnitude
+
+    @property
+    def major_axis_radius_of_gyration(self) -> Quantity:
+        return (self.geometry.Iw / self.geometry.A) ** 0.5
+
+    @property
+    def shear_center(self) -> tuple[Quantity, Quantity]:
+        """(w, z) of the intersection of the leg centerlines from the centroid"""
+        geometry = self.geometry
+        alpha = np.arctan(geometry.tan_alpha)
+        x = geometry.t / 2 - geometry.x
+        y = geometry.t / 2 - geometry.y
+        return (
+            x * np.cos(alpha) + y * np.sin(alpha),
+            -x * np.sin(alpha) + y * np.cos(alpha),
+        )
+
+    @property
+    def monosymmetry_parameter(self) -> Quantity:
+        geometry = self.geometry
+        return single_angle_monosymmetry_parameter(
+            long_leg=geometry.b,
+            short_leg=geometry.d,
+            thickness=geometry.t,
+            centroid_x=geometry.x,
+            centroid_y=geometry.y,
+            tan_alpha=geometry.tan_alpha,
+            major_axis_inertia=geometry.Iw,
+        )
+
+    @property
+    def _compression_elements_2016(self) -> tuple[CompressionElement, ...]:
+        return angle_compression_elements(
+            long_leg=self.geometry.b,
+            long_leg_ratio=self.geometry.b_t,
+            short_leg=self.geometry.d,
+            short_leg_ratio=self.short_leg_ratio,
+            thickness=self.geometry.t,
+            limit_ratio=axial_leg_limit_ratio(
+                modulus_linear=self.material.modulus_linear,
+                yield_strength=self.material.yield_strength,
+            ),
+        )
+
+    def compression(
+        self,
+        length_major_axis: Quantity,
+        factor_k_major_axis: float = 1.0,
+        length_minor_axis: Quantity = None,
+        factor_k_minor_axis: float = 1.0,
+        length_torsion: Quantity = None,
+        factor_k_torsion: float = 1.0,
+        design_type: DesignType = DesignType.ASD,
+        rule_editon: RuleEd = RuleEd.ED15,
+    ) -> LoadStrengthCalculation:
+        """E3, E4 and E7 about the principal axes, concentric load"""
+        length_minor_axis = value_or_default(length_minor_axis, length_major_axis)
+        length_torsion = value_or_default(length_torsion, length_major_axis)
+        geometry = self.geometry
+        material = self.material
+        elements = self._compression_elements_2016
+        criteria = flexural_buckling_criteria(
+            {
+                StrengthType.FLEXURAL_BUCKLING_MAJOR_AXIS: (
+                    length_major_axis,
+                    factor_k_major_axis,
+                    self.major_axis_radius_of_gyration,
+                ),
+                StrengthType.FLEXURAL_BUCKLING_MINOR_AXIS: (
+                    length_minor_axis,
+                    factor_k_minor_axis,
+                    geometry.rz,
+                ),
+            },
+            yield_stress=material.yield_strength,
+            modulus_linear=material.modulus_linear,
+            gross_area=geometry.A,
+            design_type=design_type,
+            elements=elements,
+        )
+        shear_center_w, shear_center_z = self.shear_center
+        criteria[StrengthType.FLEXURAL_TORSIONAL_BUCKLING] = (
+            FlexuralTorsionalBucklingUnsymmetricStrengthCalculation(
+                length_x=length_major_axis,
+                factor_k_x=factor_k_major_axis,
+                radius_of_gyration_x=self.major_axis_radius_of_gyration,
+                length_y=length_minor_axis,
+                factor_k_y=factor_k_minor_axis,
+                radius_of_gyration_y=geometry.rz,
+                length_torsion=length_torsion,
+                factor_k_torsion=factor_k_torsion,
+                yield_stress=material.yield_strength,
+                modulus_linear=material.modulus_linear,
+                modulus_shear=material.modulus_shear,
+                gross_area=geometry.A,
+                torsional_constant=geometry.J,
+                warping_constant=geometry.Cw,
+                shear_center_x=shear_center_w,
+                shear_center_y=shear_center_z,
+                design_type=design_type,
+                elements=elements,
+            )
+        )
+        return LoadStrengthCalculation(criteria=criteria)
+
+    def compression_connected_leg(
+        self,
+        length: Quantity,
+        connected_leg: AngleLeg = AngleLeg.LONG,
+        truss: TrussType = TrussType.PLANAR,
+        design_type: DesignType = DesignType.ASD,
+        rule_editon: RuleEd = RuleEd.ED15,
+    ) -> LoadStrengthCalculation:
+        """E5, angles loaded at the ends through one connected leg"""
+        geometry = self.geometry
+        # geometric axis parallel to the connected leg, y along the long leg
+        radius_of_gyration = (
+            geometry.ry if connected_leg == AngleLeg.LONG else geometry.rx
+        )
+        return LoadStrengthCalculation(
+            criteria={
+                StrengthType.FLEXURAL_BUCKLING: SingleAngleBucklingStrengthCalculation(
+                    length=length,
+                    yield_stress=self.material.yield_strength,
+                    modulus_linear=self.material.modulus_linear,
+                    gross_area=geometry.A,
+                    radius_of_gyration=radius_of_gyration,
+                    minor_axis_radius_of_gyration=geometry.rz,
+                    leg_ratio=self.leg_ratio,
+                    connected_leg=connected_leg,
+                    truss=truss,
+                    design_type=design_type,
+                    elements=self._compression_elements_2016,
+                )
+            }
+        )
+
+    def _leg_local_buckling(
+        self,
+        short_leg_toe_section_modulus: Quantity,
+        long_leg_toe_section_modulus: Quantity,
+        design_type: DesignType,
+    ) -> SingleAngleLegLocalBucklingCalculation2016:
+        modulus = self.material.modulus_linear
+        yield_stress = self.material.yield_strength
+        return SingleAngleLegLocalBucklingCalculation2016(
+            yield_stress=yield_stress,
+            modulus=modulus,
+            toe_section_moduli=(
+                short_leg_toe_section_modulus,
+                long_leg_toe_section_modulus,
+            ),
+            toe_leg_ratios=(self.short_leg_ratio, self.geometry.b_t),
+            compact_limit=flexural_leg_compact_limit(
+                modulus_linear=modulus, yield_strength=yield_stress
+            ),
+            slender_limit=flexural_leg_slender_limit(
+                modulus_linear=modulus, yield_strength=yield_stress
+            ),
+            design_type=design_type,
+        )
+
+    def flexure_major_axis(
+        self,
+        length: Quantity = None,
+        lateral_torsional_buckling_modification_factor: float = 1.0,
+        long_leg_in_compression: bool = True,
+        design_type: DesignType = DesignType.ASD,
+        rule_editon: RuleEd = RuleEd.ED15,
+    ) -> LoadStrengthCalculation:
+        """
+        F10 bending about the major principal axis w, lateral-torsional
+        buckling only with an unbraced length
+        """
+        geometry = self.geometry
+        section_modulus = _smallest(geometry.SwA, geometry.SwB, geometry.SwC)
+        criteria = {
+            StrengthType.YIELD: SingleAngleYieldingCalculation2016(
+                yield_stress=self.material.yield_strength,
+                section_modulus=section_modulus,
+                design_type=design_type,
+            )
+        }
+        if length is not None:
+            criteria[StrengthType.LATERAL_TORSIONAL_BUCKLING] = (
+                SingleAngleLateralTorsionalBucklingCalculation2016(
+                    length=length,
+                    yield_stress=self.material.yield_strength,
+                    modulus=self.material.modulus_linear,
+                    section_modulus=section_modulus,
+                    area=geometry.A,
+                    minor_axis_radius_of_gyration=geometry.rz,
+                    thickness=geometry.t,
+                    monosymmetry_parameter=self.monosymmetry_parameter,
+                    modification_factor=lateral_torsional_buckling_modification_factor,
+                    long_leg_in_compression=long_leg_in_compression,
+                    design_type=design_type,
+                )
+            )
+        criteria[StrengthType.LEG_LOCAL_BUCKLING] = self._leg_local_buckling(
+            short_leg_toe_section_modulus=geometry.SwA,
+            long_leg_toe_section_modulus=geometry.SwC,
+            design_type=design_type,
+        )
+        return LoadStrengthCalculation(criteria=criteria)
+
+    def flexure_minor_axis(
+        self,
+        design_type: DesignType = DesignType.ASD,
+        rule_editon: RuleEd = RuleEd.ED15,
+    ) -> LoadStrengthCalculation:
+        """F10 bending about the minor principal axis z, toes in compression"""
+        geometry = self.geometry
+        return LoadStrengthCalculation(
+            criteria={
+                StrengthType.YIELD: SingleAngleYieldingCalculation2016(
+                    yield_stress=self.material.yield_strength,
+                    section_modulus=_smallest(geometry.SzA, geometry.SzB, geometry.SzC),
+                    design_type=design_type,
+                ),
+                StrengthType.LEG_LOCAL_BUCKLING: self._leg_local_buckling(
+                    short_leg_toe_section_modulus=geometry.SzA,
+                    long_leg_toe_section_modulus=geometry.SzC,
+                    design_type=design_type,
+                ),
+            }
+        )
@@ -0,0 +1,121 @@
+from dataclasses import dataclass
+from enum import Enum
+
+from pint import Quantity
+
+from struct_codes.compression import (
+    BucklingStrengthCalculationMixin,
+    CompressionElement,
+    EffectiveWidthCoefficient,
+    elastic_flexural_buckling_stress,
+)
+from struct_codes.criteria import DesignType
+from struct_codes.instrumentation import instrumented_formula
+from struct_codes.vectorize import maximum, where
+
+
+class AngleLeg(str, Enum):
+    LONG = "long"
+    SHORT = "short"
+
+
+class TrussType(str, Enum):
+    """E5(a) individual members and planar trusses, E5(b) box and space trusses"""
+
+    PLANAR = "planar"
+    SPACE = "space"
+
+
+def angle_compression_elements(
+    long_leg: Quantity,
+    long_leg_ratio: float,
+    short_leg: Quantity,
+    short_leg_ratio: float,
+    thickness: Quantity,
+    limit_ratio: float,
+) -> tuple[CompressionElement, CompressionElement]:
+    """Both legs, TABLE E7.1 case (c) - aisc 360-16"""
+    return (
+        CompressionElement(
+            width=long_leg,
+            thickness=thickness,
+            slenderness=long_leg_ratio,
+            limit_slenderness=limit_ratio,
+            coefficient_1=EffectiveWidthCoefficient.UNSTIFFENED,
+        ),
+        CompressionElement(
+            width=short_leg,
+            thickness=thickness,
+            slenderness=short_leg_ratio,
+            limit_slenderness=limit_ratio,
+            coefficient_1=EffectiveWidthCoefficient.UNSTIFFENED,
+        ),
+    )
+
+
+@instrumented_formula
+def single_angle_effective_slenderness_ratio(
+    slenderness: float,
+    minor_axis_slenderness: float,
+    leg_ratio: float,
+    connected_leg: AngleLeg,
+    truss: TrussType,
+) -> float:
+    """
+    E5-1 to E5-4 - aisc 360-16, slenderness = L/ra about the geometric axis
+    parallel to the connected leg and minor_axis_slenderness = L/rz
+    """
+    if truss == TrussType.PLANAR:
+        ratio = where(
+            slenderness <= 80, 72 + 0.75 * slenderness, 32 + 1.25 * slenderness
+        )
+        increase, lower_limit = 4, 0.95
+    else:
+        ratio = where(slenderness <= 75, 60 + 0.8 * slenderness, 45 + slenderness)
+        increase, lower_limit = 6, 0.82
+    if connected_leg == AngleLeg.SHORT:
+        ratio = maximum(
+            ratio + increase * (leg_ratio**2 - 1),
+            lower_limit * minor_axis_slenderness,
+        )
+    return ratio
+
+
+@dataclass
+class SingleAngleBucklingStrengthCalculation(BucklingStrengthCalculationMixin):
+    """
+    E5 single angles loaded through one leg, the eccentricity accounted for by
+    the effective slenderness ratio. The limits of E5 (end connections, legs
+    ratio under 1.7 when connected through the short leg) are not checked.
+    """
+
+    length: Quantity
+    yield_stress: Quantity
+    modulus_linear: Quantity
+    gross_area: Quantity
+    radius_of_gyration: Quantity
+    minor_axis_radius_of_gyration: Quantity
+    leg_ratio: float
+    connected_leg: AngleLeg
+    truss: TrussType
+    design_type: DesignType
+    elements: tuple[CompressionElement, ...] = ()
+
+    @property
+    def beam_slenderness(self) -> float:
+        return single_angle_effective_slenderness_ratio(
+            slenderness=(self.length / self.radius_of_gyration).to("").magnitude,
+            minor_axis_slenderness=(self.length / self.minor_axis_radius_of_gyration)
+            .to("")
+            .magnitude,
+            leg_ratio=self.leg_ratio,
+            connected_leg=self.connected_leg,
+            truss=self.truss,
+        )
+
+    @property
+    def elastic_buckling_stress(self):
+        return elastic_flexural_buckling_stress(
+            modulus_linear=self.modulus_linear,
+            member_slenderness_ratio=self.beam_slenderness,
+        )
@@ -0,0 +1,213 @@
+from dataclasses import dataclass
+from itertools import product
+
+import numpy as np
+from pint import Quantity
+
+from struct_codes.criteria import DesignType, Strength
+from struct_codes.instrumentation import instrumented_formula
+from struct_codes.vectorize import minimum, where
+
+# 2 point Gauss rule, exact for the cubic integrand of the monosymmetry parameter
+_GAUSS_POINTS = (-(3**-0.5), 3**-0.5)
+
+
+@instrumented_formula
+def single_angle_monosymmetry_parameter(
+    long_leg: Quantity,
+    short_leg: Quantity,
+    thickness: Quantity,
+    centroid_x: Quantity,
+    centroid_y: Quantity,
+    tan_alpha: float,
+    major_axis_inertia: Quantity,
+) -> Quantity:
+    """
+    |βw| of F10.2 user note aisc 360-16, 1/Iw ∫z(w²+z²)dA - 2zo over the two
+    leg rectangles, shear center at the intersection of the leg centerlines.
+    Long leg vertical and short leg horizontal from the heel, x and y the
+    distances from the heel to the centroid.
+    """
+    alpha = np.arctan(tan_alpha)
+    cos, sin = np.cos(alpha), np.sin(alpha)
+
+    def z_coordinate(x, y):
+        return -(x - centroid_x) * sin + (y - centroid_y) * cos
+
+    def w_coordinate(x, y):
+        return (x - centroid_x) * cos + (y - centroid_y) * sin
+
+    legs = (
+        (0 * thickness, thickness, 0 * thickness, long_leg),
+        (thickness, short_leg, 0 * thickness, thickness),
+    )
+    integral = 0 * thickness**5
+    for x0, x1, y0, y1 in legs:
+        weight = (x1 - x0) * (y1 - y0) / 4
+        for gauss_x, gauss_y in product(_GAUSS_POINTS, repeat=2):
+            x = (x0 + x1) / 2 + gauss_x * (x1 - x0) / 2
+            y = (y0 + y1) / 2 + gauss_y * (y1 - y0) / 2
+            z = z_coordinate(x, y)
+            integral = integral + weight * z * (w_coordinate(x, y) ** 2 + z**2)
+    shear_center = z_coordinate(thickness / 2, thickness / 2)
+    return np.abs(integral / major_axis_inertia - 2 * shear_center)
+
+
+@instrumented_formula
+def single_angle_major_axis_elastic_lateral_torsional_buckling_moment(
+    modulus: Quantity,
+    area: Quantity,
+    minor_axis_radius_of_gyration: Quantity,
+    thickness: Quantity,
+    length: Quantity,
+    monosymmetry_parameter: Quantity,
+    modification_factor: float = 1.0,
+) -> Quantity:
+    """eq F10-4 aisc 360-16"""
+    term = (
+        (
+            4.4
+            * monosymmetry_parameter
+            * minor_axis_radius_of_gyration
+            / (length * thickness)
+        )
+        .to("")
+        .magnitude
+    )
+    return (
+        9
+        * modulus
+        * area
+        * minor_axis_radius_of_gyration
+        * thickness
+        * modification_factor
+        / (8 * length)
+        * ((1 + term**2) ** 0.5 + term)
+    )
+
+
+@instrumented_formula
+def single_angle_lateral_torsional_buckling_strength(
+    yield_moment: Quantity, elastic_moment: Quantity
+) -> Quantity:
+    """eq F10-2 and F10-3 aisc 360-16"""
+    ratio = (yield_moment / elastic_moment).to("").magnitude
+    return where(
+        ratio <= 1,
+        minimum((1.92 - 1.17 * ratio**0.5) * yield_moment, 1.5 * yield_moment),
+        (0.92 - 0.17 / ratio) * elastic_moment,
+    )
+
+
+@instrumented_formula
+def single_angle_leg_local_buckling_strength(
+    yield_stress: Quantity,
+    modulus: Quantity,
+    section_modulus: Quantity,
+    leg_ratio: float,
+    compact_limit: float,
+    slender_limit: float,
+) -> Quantity:
+    """eq F10-1 (compact legs), F10-7 and F10-8 aisc 360-16"""
+    return where(
+        leg_ratio < compact_limit,
+        1.5 * yield_stress * section_modulus,
+        where(
+            leg_ratio < slender_limit,
+            yield_stress
+            * section_modulus
+            * (2.43 - 1.72 * leg_ratio * (yield_stress / modulus) ** 0.5),
+            # eq F10-9
+            0.71 * modulus / leg_ratio**2 * section_modulus,
+        ),
+    )
+
+
+@dataclass
+class SingleAngleYieldingCalculation2016(Strength):
+    """AISC 360 2016 F10.1, My with the smallest section modulus"""
+
+    yield_stress: Quantity
+    section_modulus: Quantity
+    design_type: DesignType = DesignType.ASD
+
+    evaluation_cost = 0
+
+    @property
+    def nominal_strength(self):
+        return 1.5 * self.yield_stress * self.section_modulus
+
+
+@dataclass
+class SingleAngleLateralTorsionalBucklingCalculation2016(Strength):
+    """
+    AISC 360 2016 F10.2, major principal axis bending. βw is taken negative
+    (long leg in compression) unless the short leg is the only one compressed.
+    """
+
+    length: Quantity
+    yield_stress: Quantity
+    modulus: Quantity
+    section_modulus: Quantity
+    area: Quantity
+    minor_axis_radius_of_gyration: Quantity
+    thickness: Quantity
+    monosymmetry_parameter: Quantity
+    modification_factor: float = 1.0
+    long_leg_in_compression: bool = True
+    design_type: DesignType = DesignType.ASD
+
+    @property
+    def elastic_moment(self) -> Quantity:
+        sign = -1 if self.long_leg_in_compression else 1
+        return single_angle_major_axis_elastic_lateral_torsional_buckling_moment(
+            modulus=self.modulus,
+            area=self.area,
+            minor_axis_radius_of_gyration=self.minor_axis_radius_of_gyration,
+            thickness=self.thickness,
+            length=self.length,
+            monosymmetry_parameter=sign * self.monosymmetry_parameter,
+            modification_factor=self.modification_factor,
+        )
+
+    @property
+    def nominal_strength(self):
+        return single_angle_lateral_torsional_buckling_strength(
+            yield_moment=self.yield_stress * self.section_modulus,
+            elastic_moment=self.elastic_moment,
+        )
+
+
+@dataclass
+class SingleAngleLegLocalBucklingCalculation2016(Strength):
+    """
+    AISC 360 2016 F10.3, limits of Table B4.1b case 12. Each toe is checked in
+    compression with the section modulus to it and the b/t of its leg.
+    """
+
+    yield_stress: Quantity
+    modulus: Quantity
+    toe_section_moduli: tuple[Quantity, ...]
+    toe_leg_ratios: tuple[float, ...]
+    compact_limit: float
+    slender_limit: float
+    design_type: DesignType = DesignType.ASD
+
+    @property
+    def nominal_strength(self):
+        strength = None
+        for section_modulus, leg_ratio in zip(
+            self.toe_section_moduli, self.toe_leg_ratios
+        ):
+            toe_strength = single_angle_leg_local_buckling_strength(
+                yield_stress=self.yield_stress,
+                modulus=self.modulus,
+                section_modulus=section_modulus,
+                leg_ratio=leg_ratio,
+                compact_limit=self.compact_limit,
+                slender_limit=self.slender_limit,
+            )
+            strength = (
+                toe_strength if strength is None else minimum(strength, toe_strength)
+            )
+        return strength
@@ -0,0 +1,27 @@
+from pint import Quantity
+
+
+def axial_leg_limit_ratio(modulus_linear: Quantity, yield_strength: Quantity) -> float:
+    """
+    TABLE B4.1a Width-to-Thickness Ratios: Compression Elements
+    Members Subject to Axial Compression - Case 3
+    """
+    return 0.45 * (modulus_linear / yield_strength) ** 0.5
+
+
+def flexural_leg_compact_limit(
+    modulus_linear: Quantity, yield_strength: Quantity
+) -> float:
+    """TABLE B4.1b
+    Width-to-Thickness Ratios: Compression Elements
+    Members Subject to Flexure - Case 12"""
+    return 0.54 * (modulus_linear / yield_strength) ** 0.5
+
+
+def flexural_leg_slender_limit(
+    modulus_linear: Quantity, yield_strength: Quantity
+) -> float:
+    """TABLE B4.1b
+    Width-to-Thickness Ratios: Compression Elements
+    Members Subject to Flexure - Case 12"""
+    return 0.91 * (modulus_linear / yield_strength) ** 0.5
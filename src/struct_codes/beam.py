@@ -1,5 +1,7 @@
 from dataclasses import dataclass
 
+import numpy as np
+
 from struct_codes.units import Quantity
 
 
@@ -12,6 +14,30 @@ class Beam:
     length_torsion: Quantity = None
     factor_k_torsion: float = 1.0
     length_bracing_lateral_torsional_buckling: Quantity = None
+    # positions of the lateral braces along the member, measured from one end
+    brace_positions: Quantity = None
+
+    @property
+    def brace_points(self) -> Quantity:
+        """Member ends and brace positions, sorted"""
+        length = self.length_major_axis
+        if self.brace_positions is None:
+            return np.array([0.0, length.magnitude]) * length.units
+        positions = np.asarray(self.brace_positions.to(length.units).magnitude)
+        points = np.unique(np.concatenate([[0.0, length.magnitude], positions]))
+        if points[0] < 0 or points[-1] > length.magnitude:
+            raise ValueError("brace positions must lie within the member length")
+        return points * length.units
+
+    @property
+    def unbraced_lengths(self) -> Quantity:
+        """Unbraced length of every lateral torsional buckling segment"""
+        if (
+            self.brace_positions is None
+            and self.length_bracing_lateral_torsional_buckling is not None
+        ):
+            return np.atleast_1d(self.length_bracing_lateral_torsional_buckling)
+        return np.diff(self.brace_points)
 
 
 # @dataclass
@@ -0,0 +1,200 @@
+import json
+from dataclasses import dataclass
+from enum import StrEnum
+from pathlib import Path
+from typing import Iterable
+
+import numpy as np
+
+from struct_codes.aisc_database import create_aisc_section
+from struct_codes.criteria import DesignType
+from struct_codes.i_section import DoublySymmetricI
+from struct_codes.materials import Material
+from struct_codes.sections import ConstructionType
+from struct_codes.units import Quantity, meter, newton
+
+
+class CapacityCurve(StrEnum):
+    COMPRESSION = "compression"
+    FLEXURE_MAJOR_AXIS = "flexure_major_axis"
+
+
+class ScreeningResult(StrEnum):
+    PASS = "pass"
+    FAIL = "fail"
+    VERIFY = "verify"
+
+
+CURVE_UNITS = {
+    CapacityCurve.COMPRESSION: newton,
+    CapacityCurve.FLEXURE_MAJOR_AXIS: newton * meter,
+}
+
+
+@dataclass
+class CapacityEstimate:
+    value: Quantity
+    lower_bound: Quantity
+    upper_bound: Quantity
+
+    @property
+    def error_bound(self) -> Quantity:
+        return self.upper_bound - self.lower_bound
+
+
+def _exact_design_strengths(
+    section: DoublySymmetricI, curve: CapacityCurve, length: Quantity
+) -> dict[DesignType, float]:
+    if curve == CapacityCurve.COMPRESSION:
+        calc = section.compression(length_major_axis=length)
+    else:
+        calc = section.flexure_major_axis(
+            length=length, lateral_torsional_buckling_modification_factor=1.0
+        )
+    return {
+        design_type: strength.to(CURVE_UNITS[curve]).magnitude
+        for design_type, (strength, _) in calc.design_strengths().items()
+    }
+
+
+@dataclass
+class CapacityTable:
+    """
+    Design strengths per section on a common unbraced length grid, in newton
+    and newton * meter, generated with the exact calculators (E3/E4
+    compression and F2 with Cb = 1). Both strengths never increase with the
+    unbraced length, so between two grid points the exact value lies within
+    the tabulated values, which is the guaranteed error bound of an estimate.
+    nan entries are always screened as `ScreeningResult.VERIFY`.
+    """
+
+    lengths: np.ndarray
+    section_names: tuple[str, ...]
+    values: dict[CapacityCurve, dict[DesignType, np.ndarray]]
+
+    @classmethod
+    def build(
+        cls,
+        section_names: Iterable[str],
+        material: Material,
+        lengths: Quantity,
+        construction: ConstructionType = ConstructionType.ROLLED,
+    ) -> "CapacityTable":
+        section_names = tuple(section_names)
+        grid = np.sort(np.asarray(lengths.to(meter).magnitude, dtype=float))
+        values = {
+            curve: {
+                design_type: np.empty((len(section_names), len(grid)))
+                for design_type in DesignType
+            }
+            for curve in CapacityCurve
+        }
+        for i, name in enumerate(section_names):
+            section = create_aisc_section(name, material, construction)
+            for j, length in enumerate(grid):
+                for curve in CapacityCurve:
+                    strengths = _exact_design_strengths(section, curve, length * meter)
+                    for design_type, strength in strengths.items():
+                        values[curve][design_type][i, j] = strength
+        return cls(lengths=grid, section_names=section_names, values=values)
+
+    def _interval(self, length: Quantity) -> tuple[np.ndarray, np.ndarray]:
+        lengths = np.atleast_1d(np.asarray(length.to(meter).magnitude, dtype=float))
+        if np.any(lengths < self.lengths[0]) or np.any(lengths > self.lengths[-1]):
+            raise ValueError(
+                f"length outside of table range {self.lengths[0]} m to {self.lengths[-1]} m"
+            )
+        index = np.clip(
+            np.searchsorted(self.lengths, lengths, side="right") - 1,
+            0,
+            len(self.lengths) - 2,
+        )
+        return lengths, index
+
+    def _bounds(
+        self,
+        rows: np.ndarray,
+        curve: CapacityCurve,
+        length: Quantity,
+        design_type: DesignType,
+    ) -> tuple[np.ndarray, np.ndarray, np.ndarray]:
+        table = self.values[CapacityCurve(curve)][DesignType(design_type)]
+        lengths, index = self._interval(length)
+        start, end = self.lengths[index], self.lengths[index + 1]
+        upper = table[rows, index]
+        lower = table[rows, index + 1]
+        value = upper + (lower - upper) * (lengths - start) / (end - start)
+        return value, lower, upper
+
+    def estimate(
+        self,
+        section_name: str,
+        curve: CapacityCurve,
+        length: Quantity,
+        design_type: DesignType = DesignType.ASD,
+    ) -> CapacityEstimate:
+        row = self.section_names.index(section_name)
+        value, lower, upper = self._bounds(np.array([row]), curve, length, design_type)
+        unit = CURVE_UNITS[CapacityCurve(curve)]
+        return CapacityEstimate(
+            value=value[0] * unit,
+            lower_bound=lower[0] * unit,
+            upper_bound=upper[0] * unit,
+        )
+
+    def screen(
+        self,
+        curve: CapacityCurve,
+        length: Quantity,
+        demand: Quantity,
+        design_type: DesignType = DesignType.ASD,
+    ) -> dict[str, ScreeningResult]:
+        """
+        Screens every section of the table in one pass. Sections are only
+        marked PASS/FAIL when the error bound proves it, the others need an
+        exact verification.
+        """
+        rows = np.arange(len(self.section_names))
+        _, lower, upper = self._bounds(rows, curve, length, design_type)
+        demand = demand.to(CURVE_UNITS[CapacityCurve(curve)]).magnitude
+        return {
+            name: (
+                ScreeningResult.PASS
+                if passed
+                else ScreeningResult.FAIL if failed else ScreeningResult.VERIFY
+            )
+            for name, passed, failed in zip(
+                self.section_names, lower >= demand, upper < demand
+            )
+        }
+
+    def save(self, file_path: Path | str):
+        data = {
+            "lengths": self.lengths.tolist(),
+            "section_names": list(self.section_names),
+            "values": {
+                curve.value: {
+                    design_type.value: np.where(np.isnan(table), None, table).tolist()
+                    for design_type, table in tables.items()
+                }
+                for curve, tables in self.values.items()
+            },
+        }
+        with open(file_path, "w") as f:
+            json.dump(data, f)
+
+    @classmethod
+    def load(cls, file_path: Path | str) -> "CapacityTable":
+        with open(file_path, "r") as f:
+            data = json.load(f)
+        return cls(
+            lengths=np.array(data["lengths"], dtype=float),
+            section_names=tuple(data["section_names"]),
+            values={
+                CapacityCurve(curve): {
+                    DesignType(design_type): np.array(table, dtype=float)
+                    for design_type, table in tables.items()
+                }
+                for curve, tables in data["values"].items()
+            },
+        )
@@ -0,0 +1,256 @@
+from dataclasses import dataclass
+from functools import cached_property
+
+from struct_codes.channel._compression import channel_compression_elements
+from struct_codes.channel._flexure import lateral_torsional_buckling_coefficient_c
+from struct_codes.compression import (
+    CompressionElement,
+    SinglySymmetricCompressionMixin,
+    channel_shear_center_distance,
+)
+from struct_codes.criteria import DesignType, StrengthType
+from struct_codes.flexure import look_up_limit_states
+from struct_codes.i_section._flexure import (
+    CompressionFlangeLocalBucklingCalculation2016,
+    LateralTorsionalBucklingCalculation2016,
+    LateralTorsionalBucklingSectionParam2016,
+    MinorAxisFlangeLocalBucklingCalculation2016,
+    MinorAxisYieldingCalculation2016,
+    YieldingMomentCalculation16,
+)
+from struct_codes.materials import Material
+from struct_codes.sections import (
+    ConstructionType,
+    LoadStrengthCalculation,
+    RuleEd,
+    SectionClassification,
+    SectionGeometry,
+    classified_criteria,
+)
+from struct_codes.slenderness import (
+    axial_doubly_symmetric_web_limit,
+    axial_rolled_flanges_limit_ratio,
+    flexural_doubly_symmetric_web_compact_limit,
+    flexural_doubly_symmetric_web_slender_limit_ratio,
+    flexural_rolled_i_channel_tees_flange_compact_limit,
+    flexural_rolled_i_channel_tees_flange_slender_limit,
+    flexural_slenderness_per_element,
+    kc_coefficient,
+)
+from struct_codes.units import Quantity
+
+
+@dataclass
+class Channel(SinglySymmetricCompressionMixin):
+    """
+    C and MC channels, x the axis of symmetry. The geometry may be a columnar
+    table of several channels.
+    """
+
+    geometry: SectionGeometry
+    material: Material
+    construction: ConstructionType = ConstructionType.ROLLED
+
+    symmetry_axis = StrengthType.FLEXURAL_BUCKLING_MAJOR_AXIS
+
+    @property
+    def shear_center(self) -> Quantity:
+        """Distance from the centroid to the shear center, along x"""
+        return channel_shear_center_distance(
+            centroid_distance=self.geometry.x,
+            shear_center_distance=self.geometry.eo,
+        )
+
+    @property
+    def _compression_elements_2016(self) -> tuple[CompressionElement, ...]:
+        modulus = self.material.modulus_linear
+        yield_stress = self.material.yield_strength
+        return channel_compression_elements(
+            flange_width=self.geometry.bf,
+            flange_thickness=self.geometry.tf,
+            flange_ratio=self.geometry.b_t,
+            flange_limit_ratio=axial_rolled_flanges_limit_ratio(
+                modulus_linear=modulus, yield_strength=yield_stress
+            ),
+            web_thickness=self.geometry.tw,
+            web_ratio=self.geometry.h_tw,
+            web_limit_ratio=axial_doubly_symmetric_web_limit(
+                modulus_linear=modulus, yield_strength=yield_stress
+            ),
+        )
+
+    @property
+    def _flange_flexural_compact_limit(self) -> float:
+        return flexural_rolled_i_channel_tees_flange_compact_limit(
+            modulus_linear=self.material.modulus_linear,
+            yield_strength=self.material.yield_strength,
+        )
+
+    @property
+    def _flange_flexural_slender_limit(self) -> float:
+        return flexural_rolled_i_channel_tees_flange_slender_limit(
+            modulus_linear=self.material.modulus_linear,
+            yield_strength=self.material.yield_strength,
+        )
+
+    def flexure_major_axis(
+        self,
+        length: Quantity = None,
+        lateral_torsional_buckling_modification_factor: float = 1.0,
+        design_type: DesignType = DesignType.ASD,
+        rule_editon: RuleEd = RuleEd.ED15,
+    ) -> LoadStrengthCalculation:
+        """
+        F2, and F3 for noncompact or slender flanges, lateral-torsional
+        buckling only with an unbraced length
+        """
+        modulus = self.material.modulus_linear
+        yield_stress = self.material.yield_strength
+        calculations = _ChannelMajorAxisFlexureCalculations2016(
+            section=self,
+            length=length,
+            modification_factor=lateral_torsional_buckling_modification_factor,
+            design_type=design_type,
+        )
+
+        def limit_states(classification: tuple) -> tuple[StrengthType, ...]:
+            return tuple(
+                limit_state
+                for limit_state in look_up_limit_states(classification)
+                if length is not None
+                or limit_state != StrengthType.LATERAL_TORSIONAL_BUCKLING
+            )
+
+        return LoadStrengthCalculation(
+            criteria=classified_criteria(
+                classification=(
+                    SectionClassification.CHANEL,
+                    flexural_slenderness_per_element(
+                        limit_slender=self._flange_flexural_slender_limit,
+                        limit_compact=self._flange_flexural_compact_limit,
+                        ratio=self.geometry.b_t,
+                    ),
+                    flexural_slenderness_per_element(
+                        limit_slender=flexural_doubly_symmetric_web_slender_limit_ratio(
+                            modulus_linear=modulus, yield_strength=yield_stress
+                        ),
+                        limit_compact=flexural_doubly_symmetric_web_compact_limit(
+                            modulus_linear=modulus, yield_strength=yield_stress
+                        ),
+                        ratio=self.geometry.h_tw,
+                    ),
+                ),
+                limit_states=limit_states,
+                calculation=calculations.calculation,
+                design_type=design_type,
+            )
+        )
+
+    def flexure_minor_axis(
+        self,
+        design_type: DesignType = DesignType.ASD,
+        rule_editon: RuleEd = RuleEd.ED15,
+    ) -> LoadStrengthCalculation:
+        """F6, flange b/t with b the full flange width"""
+        return LoadStrengthCalculation(
+            criteria={
+                StrengthType.YIELD: MinorAxisYieldingCalculation2016(
+                    yield_stress=self.material.yield_strength,
+                    plastic_section_modulus=self.geometry.Zy,
+                    elastic_section_modulus=self.geometry.Sy,
+                    design_type=design_type,
+                ),
+                StrengthType.FLANGE_LOCAL_BUCKLING: MinorAxisFlangeLocalBucklingCalculation2016(
+                    yield_stress=self.material.yield_strength,
+                    modulus=self.material.modulus_linear,
+                    plastic_section_modulus=self.geometry.Zy,
+                    elastic_section_modulus=self.geometry.Sy,
+                    flange_ratio=self.geometry.b_t,
+                    compact_limit=self._flange_flexural_compact_limit,
+                    slender_limit=self._flange_flexural_slender_limit,
+                    design_type=design_type,
+                ),
+            }
+        )
+
+
+@dataclass
+class _ChannelMajorAxisFlexureCalculations2016:
+    """Chapter F calculations of a channel, built once per limit state"""
+
+    section: Channel
+    length: Quantity
+    modification_factor: float
+    design_type: DesignType
+
+    def calculation(self, limit_state: StrengthType, classification: tuple):
+        table = {
+            StrengthType.YIELD: "yielding",
+            StrengthType.LATERAL_TORSIONAL_BUCKLING: "lateral_torsional_buckling",
+            StrengthType.COMPRESSION_FLANGE_LOCAL_BUCKLING: "flange_local_buckling",
+        }
+        return getattr(self, table[limit_state])
+
+    @cached_property
+    def yielding(self) -> YieldingMomentCalculation16:
+        return YieldingMomentCalculation16(
+            plastic_section_modulus=self.section.geometry.Zx,
+            yield_stress=self.section.material.yield_strength,
+            design_type=self.design_type,
+        )
+
+    @cached_property
+    def lateral_torsional_buckling(self) -> LateralTorsionalBucklingCalculation2016:
+        geometry = self.section.geometry
+        material = self.section.material
+        section_param = LateralTorsionalBucklingSectionParam2016(
+            plastic_section_modulus=geometry.Zx,
+            yield_stress=material.yield_strength,
+            modulus=material.modulus_linear,
+            radius_of_gyration=geometry.ry,
+            elastic_section_modulus=geometry.Sx,
+            minor_axis_inertia=geometry.Iy,
+            warping_constant=geometry.Cw,
+            torsional_constant=geometry.J,
+            distance_between_flange_centroids=geometry.ho,
+            coefficient_c=lateral_torsional_buckling_coefficient_c(
+                distance_between_flange_centroids=geometry.ho,
+                minor_axis_inertia=geometry.Iy,
+                warping_constant=geometry.Cw,
+            ),
+        )
+        return LateralTorsionalBucklingCalculation2016(
+            length=self.length,
+            modulus=material.modulus_linear,
+            yield_stress=material.yield_strength,
+            plastic_section_modulus=geometry.Zx,
+            elastic_section_modulus=geometry.Sx,
+            distance_between_flange_centroids=geometry.ho,
+            torsional_constant=geometry.J,
+            warping_constant=geometry.Cw,
+            radius_of_gyration=geometry.ry,
+            minor_axis_inertia=geometry.Iy,
+            limiting_length_lateral_torsional_buckling=section_param.limiting_length_lateral_torsional_buckling,
+            limiting_yield_length=section_param.limiting_yield_length,
+            plastic_moment=section_param.plastic_moment,
+            effective_radius_of_gyration=section_param.effective_radius_of_gyration,
+            modification_factor=self.modification_factor,
+            coefficient_c=section_param.coefficient_c,
+            design_type=self.design_type,
+        )
+
+    @cached_property
+    def flange_local_buckling(self) -> CompressionFlangeLocalBucklingCalculation2016:
+        geometry = self.section.geometry
+        material = self.section.material
+        return CompressionFlangeLocalBucklingCalculation2016(
+            plastic_moment=geometry.Zx * material.yield_strength,
+            yield_stress=material.yield_strength,
+            modulus=material.modulus_linear,
+            elastic_section_modulus=geometry.Sx,
+            kc_coefficient=kc_coefficient(heigth_to_thickness_ratio=geometry.h_tw),
+            flange_ratio=geometry.b_t,
+            compact_limit=self.section._flange_flexural_compact_limit,
+            slender_limit=self.section._flange_flexural_slender_limit,
+            design_type=self.design_type,
+        )
@@ -0,0 +1,32 @@
+from pint import Quantity
+
+from struct_codes.compression import CompressionElement, EffectiveWidthCoefficient
+
+
+def channel_compression_elements(
+    flange_width: Quantity,
+    flange_thickness: Quantity,
+    flange_ratio: float,
+    flange_limit_ratio: float,
+    web_thickness: Quantity,
+    web_ratio: float,
+    web_limit_ratio: float,
+) -> tuple[CompressionElement, CompressionElement]:
+    """Flanges and web, TABLE E7.1 cases (c) and (a) - aisc 360-16"""
+    return (
+        CompressionElement(
+            width=flange_width,
+            thickness=flange_thickness,
+            slenderness=flange_ratio,
+            limit_slenderness=flange_limit_ratio,
+            coefficient_1=EffectiveWidthCoefficient.UNSTIFFENED,
+            count=2,
+        ),
+        CompressionElement(
+            width=web_ratio * web_thickness,
+            thickness=web_thickness,
+            slenderness=web_ratio,
+            limit_slenderness=web_limit_ratio,
+            coefficient_1=EffectiveWidthCoefficient.STIFFENED,
+        ),
+    )
@@ -0,0 +1,21 @@
+from pint import Quantity
+
+from struct_codes.instrumentation import instrumented_formula
+
+
+@instrumented_formula
+def lateral_torsional_buckling_coefficient_c(
+    distance_between_flange_centroids: Quantity,
+    minor_axis_inertia: Quantity,
+    warping_constant: Quantity,
+) -> float:
+    """eq F2-8b aisc 360-16"""
+    return (
+        (
+            distance_between_flange_centroids
+            / 2
+            * (minor_axis_inertia / warping_constant) ** 0.5
+        )
+        .to("")
+        .magnitude
+    )
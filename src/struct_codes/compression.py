@@ -4,16 +4,24 @@ import math
 from abc import abstractmethod
 from collections import defaultdict
 from dataclasses import dataclass
-from typing import TYPE_CHECKING
+from enum import Enum
+from typing import TYPE_CHECKING, Callable, ClassVar, Iterable
 
 from struct_codes.criteria import DesignType, Strength, StrengthType
-from struct_codes.sections import LoadStrengthCalculation, SectionClassification
+from struct_codes.instrumentation import instrumented_formula
+from struct_codes.sections import (
+    LoadStrengthCalculation,
+    RuleEd,
+    SectionClassification,
+)
 from struct_codes.units import Quantity
+from struct_codes.vectorize import minimum, where
 
 if TYPE_CHECKING:
     from struct_codes.analysis import Analysis
 
 
+@instrumented_formula
 def member_slenderness_ratio(
     factor_k: float, unbraced_length: Quantity, radius_of_gyration: Quantity
 ) -> float:
@@ -22,6 +30,7 @@ def member_slenderness_ratio(
     return factor_k * n
 
 
+@instrumented_formula
 def _nominal_compressive_strength(
     critical_stress: Quantity, sectional_area: Quantity
 ) -> Quantity:
@@ -29,6 +38,7 @@ def _nominal_compressive_strength(
     return critical_stress * sectional_area
 
 
+@instrumented_formula
 def critical_compression_stress_buckling_default(
     # member_slenderness: float,
     yield_stress: Quantity,
@@ -36,15 +46,18 @@ def critical_compression_stress_buckling_default(
     # member_slenderness_limit: float,
 ) -> Quantity:
     """E3-2 and E3-3 - aisc 360-16"""
-    if yield_stress / elastic_buckling_stress <= 2.25:
+    ratio = yield_stress / elastic_buckling_stress
+    return where(
+        ratio <= 2.25,
         # (E3-2)
-        ratio = yield_stress / elastic_buckling_stress
-        return 0.658**ratio * yield_stress
-    # (E3-3)
-    return 0.877 * elastic_buckling_stress
+        0.658**ratio * yield_stress,
+        # (E3-3)
+        0.877 * elastic_buckling_stress,
+    )
 
 
 # E(3-4)
+@instrumented_formula
 def elastic_flexural_buckling_stress(
     modulus_linear: Quantity, member_slenderness_ratio: float
 ) -> Quantity:
@@ -53,6 +66,7 @@ def elastic_flexural_buckling_stress(
 
 
 # (E4-2)
+@instrumented_formula
 def elastic_torsional_buckling_stress_doubly_symmetric_member(
     modulus_linear: Quantity,
     modulus_shear: Quantity,
@@ -69,6 +83,44 @@ def elastic_torsional_buckling_stress_doubly_symmetric_member(
     ) * (1 / (minor_axis_inertia + major_axis_inertia))
 
 
+@instrumented_formula
+def effective_width_imperfection_coefficient(coefficient_1: float) -> float:
+    """E7-4 - aisc 360-16"""
+    return (1 - (1 - 4 * coefficient_1) ** 0.5) / (2 * coefficient_1)
+
+
+@instrumented_formula
+def elastic_local_buckling_stress(
+    coefficient_2: float,
+    limit_slenderness: float,
+    slenderness: float,
+    yield_stress: Quantity,
+) -> Quantity:
+    """E7-5 - aisc 360-16"""
+    return (coefficient_2 * limit_slenderness / slenderness) ** 2 * yield_stress
+
+
+@instrumented_formula
+def effective_width(
+    width: Quantity,
+    slenderness: float,
+    limit_slenderness: float,
+    yield_stress: Quantity,
+    critical_stress: Quantity,
+    elastic_local_buckling_stress: Quantity,
+    coefficient_1: float,
+) -> Quantity:
+    """E7-2 and E7-3 - aisc 360-16"""
+    stress_ratio = (elastic_local_buckling_stress / critical_stress) ** 0.5
+    return where(
+        slenderness <= limit_slenderness * (yield_stress / critical_stress) ** 0.5,
+        # (E7-2)
+        width,
+        # (E7-3)
+        width * (1 - coefficient_1 * stress_ratio) * stress_ratio,
+    )
+
+
 # Note of page Sect. E4. TORSIONAL AND FLEXURAL-TORSIONAL BUCKLING OF MEMBERS
 def doubly_symmetric_i_warping_constant(
     moment_of_inertia: Quantity, distance_between_flanges_centroid: Quantity
@@ -76,8 +128,110 @@ def doubly_symmetric_i_warping_constant(
     return moment_of_inertia * distance_between_flanges_centroid**2 / 4
 
 
+def channel_shear_center_distance(
+    centroid_distance: Quantity, shear_center_distance: Quantity
+) -> Quantity:
+    """
+    xo of a channel, x and eo are measured from the back of the web to the
+    centroid and to the shear center, on opposite sides of it
+    """
+    return centroid_distance + shear_center_distance
+
+
+def tee_shear_center_distance(
+    centroid_distance: Quantity, flange_thickness: Quantity
+) -> Quantity:
+    """yo of a tee, shear center at the flange mid-thickness, y measured from
+    the flange face"""
+    return centroid_distance - flange_thickness / 2
+
+
+class EffectiveWidthCoefficient(float, Enum):
+    """TABLE E7.1 Effective Width Imperfection Adjustment Factors, c1"""
+
+    STIFFENED = 0.18
+    HSS_WALL = 0.20
+    UNSTIFFENED = 0.22
+
+
+@dataclass
+class CompressionElement:
+    """
+    Plate element of the cross section checked for local buckling, `count` of
+    identical elements (e.g. 4 for the flange halves of an I section).
+    """
+
+    width: Quantity
+    thickness: Quantity
+    slenderness: float
+    limit_slenderness: float
+    coefficient_1: float
+    count: int = 1
+
+
+@dataclass
+class EffectiveWidthCalculation:
+    yield_stress: Quantity
+    critical_stress: Quantity
+    width: Quantity
+    slenderness: float
+    limit_slenderness: float
+    coefficient_1: float
+
+    @property
+    def coefficient_2(self) -> float:
+        return effective_width_imperfection_coefficient(self.coefficient_1)
+
+    @property
+    def elastic_local_buckling_stress(self) -> Quantity:
+        return elastic_local_buckling_stress(
+            coefficient_2=self.coefficient_2,
+            limit_slenderness=self.limit_slenderness,
+            slenderness=self.slenderness,
+            yield_stress=self.yield_stress,
+        )
+
+    @property
+    def effective_width(self) -> Quantity:
+        return effective_width(
+            width=self.width,
+            slenderness=self.slenderness,
+            limit_slenderness=self.limit_slenderness,
+            yield_stress=self.yield_stress,
+            critical_stress=self.critical_stress,
+            elastic_local_buckling_stress=self.elastic_local_buckling_stress,
+            coefficient_1=self.coefficient_1,
+        )
+
+
+def effective_area(
+    gross_area: Quantity,
+    elements: Iterable[CompressionElement],
+    yield_stress: Quantity,
+    critical_stress: Quantity,
+) -> Quantity:
+    """E7. MEMBERS WITH SLENDER ELEMENTS, Ae - aisc 360-16"""
+    area = gross_area
+    for element in elements:
+        width = EffectiveWidthCalculation(
+            yield_stress=yield_stress,
+            critical_stress=critical_stress,
+            width=element.width,
+            slenderness=element.slenderness,
+            limit_slenderness=element.limit_slenderness,
+            coefficient_1=element.coefficient_1,
+        ).effective_width
+        area = area - element.count * (element.width - width) * element.thickness
+    return area
+
+
 @dataclass
 class BucklingStrengthCalculationMixin(Strength):
+    """
+    Without `elements` the gross area is used (E3/E4), otherwise the effective
+    area of the slender elements for the critical stress of the mode (E7).
+    """
+
     yield_stress: Quantity
     gross_area: Quantity
 
@@ -93,10 +247,35 @@ class BucklingStrengthCalculationMixin(Strength):
             yield_stress=self.yield_stress,
         )
 
+    def _nominal_strength(self, critical_stress: Quantity) -> Quantity:
+        return _nominal_compressive_strength(
+            critical_stress=critical_stress,
+            sectional_area=effective_area(
+                gross_area=self.gross_area,
+                elements=self.elements,
+                yield_stress=self.yield_stress,
+                critical_stress=critical_stress,
+            ),
+        )
+
+    @property
+    def effective_area(self) -> Quantity:
+        return effective_area(
+            gross_area=self.gross_area,
+            elements=self.elements,
+            yield_stress=self.yield_stress,
+            critical_stress=self.critical_stress,
+        )
+
     @property
     def nominal_strength(self) -> Quantity:
+        return self._nominal_strength(self.critical_stress)
+
+    @property
+    def nominal_strength_upper_bound(self) -> Quantity:
+        """Critical stress never exceeds the yield stress"""
         return _nominal_compressive_strength(
-            critical_stress=self.critical_stress,
+            critical_stress=self.yield_stress,
             sectional_area=self.gross_area,
         )
 
@@ -110,6 +289,7 @@ class FlexuralBucklingStrengthCalculation(BucklingStrengthCalculationMixin):
     gross_area: Quantity
     radius_of_gyration: Quantity
     design_type: DesignType
+    elements: tuple[CompressionElement, ...] = ()
 
     @property
     def beam_slenderness(self):
@@ -131,6 +311,8 @@ class FlexuralBucklingStrengthCalculation(BucklingStrengthCalculationMixin):
 class TorsionalBucklingDoublySymmetricStrengthCalculation(
     BucklingStrengthCalculationMixin
 ):
+    evaluation_cost = 2
+
     length: Quantity
     factor_k: Quantity
     yield_stress: Quantity
@@ -142,6 +324,7 @@ class TorsionalBucklingDoublySymmetricStrengthCalculation(
     torsional_constant: Quantity
     warping_constant: Quantity
     design_type: DesignType
+    elements: tuple[CompressionElement, ...] = ()
 
     @property
     def elastic_buckling_stress(self):
@@ -156,33 +339,383 @@ class TorsionalBucklingDoublySymmetricStrengthCalculation(
             warping_constant=self.warping_constant,
         )
 
+    @property
+    def nominal_strength_lower_bound(self) -> Quantity:
+        """
+        Nominal strength grows with the elastic buckling stress, dropping the
+        warping term of eq. E4-2 gives a length independent lower bound.
+        """
+        return self._nominal_strength(
+            critical_compression_stress_buckling_default(
+                yield_stress=self.yield_stress,
+                elastic_buckling_stress=self.modulus_shear
+                * self.torsional_constant
+                / (self.major_axis_inertia + self.minor_axis_inertia),
+            )
+        )
+
+
+@instrumented_formula
+def polar_radius_of_gyration_about_shear_center(
+    shear_center_x: Quantity,
+    shear_center_y: Quantity,
+    radius_of_gyration_x: Quantity,
+    radius_of_gyration_y: Quantity,
+) -> Quantity:
+    """E4-9 - aisc 360-16"""
+    return (
+        shear_center_x**2
+        + shear_center_y**2
+        + radius_of_gyration_x**2
+        + radius_of_gyration_y**2
+    ) ** 0.5
+
+
+@instrumented_formula
+def flexural_constant(
+    shear_center_x: Quantity,
+    shear_center_y: Quantity,
+    polar_radius_of_gyration: Quantity,
+) -> float:
+    """E4-10 - aisc 360-16"""
+    return (
+        (1 - (shear_center_x**2 + shear_center_y**2) / polar_radius_of_gyration**2)
+        .to("")
+        .magnitude
+    )
+
+
+@instrumented_formula
+def elastic_torsional_buckling_stress(
+    modulus_linear: Quantity,
+    modulus_shear: Quantity,
+    factor_k: float,
+    length: Quantity,
+    torsional_constant: Quantity,
+    warping_constant: Quantity,
+    gross_area: Quantity,
+    polar_radius_of_gyration: Quantity,
+) -> Quantity:
+    """E4-7 - aisc 360-16"""
+    return (
+        math.pi**2 * modulus_linear * warping_constant / (factor_k * length) ** 2
+        + modulus_shear * torsional_constant
+    ) / (gross_area * polar_radius_of_gyration**2)
+
+
+@instrumented_formula
+def elastic_flexural_torsional_buckling_stress_singly_symmetric_member(
+    flexural_buckling_stress: Quantity,
+    torsional_buckling_stress: Quantity,
+    flexural_constant: float,
+) -> Quantity:
+    """
+    E4-5 - aisc 360-16, flexural buckling stress about the axis of symmetry
+    (Fey for tees, Fex for channels)
+    """
+    total = flexural_buckling_stress + torsional_buckling_stress
+    return (
+        total
+        / (2 * flexural_constant)
+        * (
+            1
+            - (
+                1
+                - 4
+                * flexural_buckling_stress
+                * torsional_buckling_stress
+                * flexural_constant
+                / total**2
+            )
+            ** 0.5
+        )
+    )
+
 
 @dataclass
-class EffectiveWidthCalculation:
+class FlexuralTorsionalBucklingSinglySymmetricStrengthCalculation(
+    BucklingStrengthCalculationMixin
+):
+    """
+    E4 singly symmetric members, flexural buckling about the axis of symmetry
+    coupled with torsion. The shear center lies on that axis, at shear_center
+    from the centroid.
+    """
+
+    evaluation_cost = 2
+
+    length: Quantity
+    factor_k: float
+    radius_of_gyration: Quantity
+    other_radius_of_gyration: Quantity
+    length_torsion: Quantity
+    factor_k_torsion: float
     yield_stress: Quantity
-    critical_stress: Quantity
-    width: Quantity
-    slenderness: float
-    limit_slenderness: float
-    coefficient_1: float
+    modulus_linear: Quantity
+    modulus_shear: Quantity
+    gross_area: Quantity
+    torsional_constant: Quantity
+    warping_constant: Quantity
+    shear_center: Quantity
+    design_type: DesignType
+    elements: tuple[CompressionElement, ...] = ()
+
+    @property
+    def polar_radius_of_gyration(self) -> Quantity:
+        return polar_radius_of_gyration_about_shear_center(
+            shear_center_x=self.shear_center,
+            shear_center_y=0 * self.shear_center,
+            radius_of_gyration_x=self.radius_of_gyration,
+            radius_of_gyration_y=self.other_radius_of_gyration,
+        )
 
     @property
-    def effective_width(self):
-        return None
+    def flexural_constant(self) -> float:
+        return flexural_constant(
+            shear_center_x=self.shear_center,
+            shear_center_y=0 * self.shear_center,
+            polar_radius_of_gyration=self.polar_radius_of_gyration,
+        )
+
+    @property
+    def torsional_buckling_stress(self) -> Quantity:
+        return elastic_torsional_buckling_stress(
+            modulus_linear=self.modulus_linear,
+            modulus_shear=self.modulus_shear,
+            factor_k=self.factor_k_torsion,
+            length=self.length_torsion,
+            torsional_constant=self.torsional_constant,
+            warping_constant=self.warping_constant,
+            gross_area=self.gross_area,
+            polar_radius_of_gyration=self.polar_radius_of_gyration,
+        )
+
+    @property
+    def elastic_buckling_stress(self):
+        return elastic_flexural_torsional_buckling_stress_singly_symmetric_member(
+            flexural_buckling_stress=elastic_flexural_buckling_stress(
+                modulus_linear=self.modulus_linear,
+                member_slenderness_ratio=member_slenderness_ratio(
+                    factor_k=self.factor_k,
+                    unbraced_length=self.length,
+                    radius_of_gyration=self.radius_of_gyration,
+                ),
+            ),
+            torsional_buckling_stress=self.torsional_buckling_stress,
+            flexural_constant=self.flexural_constant,
+        )
+
+
+@instrumented_formula
+def elastic_flexural_torsional_buckling_stress_unsymmetric_member(
+    flexural_buckling_stress_x: Quantity,
+    flexural_buckling_stress_y: Quantity,
+    torsional_buckling_stress: Quantity,
+    shear_center_x: Quantity,
+    shear_center_y: Quantity,
+    polar_radius_of_gyration: Quantity,
+    iterations: int = 60,
+) -> Quantity:
+    """
+    E4-4 - aisc 360-16, x and y principal axes. The lowest root lies between
+    zero and the smallest of Fex, Fey and Fez, found by bisection. The upper
+    bound is returned so an uncoupled root is kept exact.
+    """
+    units = flexural_buckling_stress_x.units
+    fex = flexural_buckling_stress_x.to(units).magnitude
+    fey = flexural_buckling_stress_y.to(units).magnitude
+    fez = torsional_buckling_stress.to(units).magnitude
+    x_ratio = ((shear_center_x / polar_radius_of_gyration) ** 2).to("").magnitude
+    y_ratio = ((shear_center_y / polar_radius_of_gyration) ** 2).to("").magnitude
+
+    def cubic(stress):
+        return (
+            (stress - fex) * (stress - fey) * (stress - fez)
+            - stress**2 * (stress - fey) * x_ratio
+            - stress**2 * (stress - fex) * y_ratio
+        )
+
+    lower = 0 * fex
+    upper = minimum(minimum(fex, fey), fez)
+    for _ in range(iterations):
+        middle = (lower + upper) / 2
+        below = cubic(middle) < 0
+        lower = where(below, middle, lower)
+        upper = where(below, upper, middle)
+    return upper * units
 
 
 @dataclass
-class SymmetricFlangesFlexuralBuckling(FlexuralBucklingStrengthCalculation):
-    flange_width: Quantity
-    flange_thickness: Quantity
-    flange_slenderss_limit: Quantity
-    web_width: Quantity
-    web_thickness: Quantity
-    web_slenderss_limit: Quantity
+class FlexuralTorsionalBucklingUnsymmetricStrengthCalculation(
+    BucklingStrengthCalculationMixin
+):
+    """E4 unsymmetric members, x and y are the principal axes"""
+
+    evaluation_cost = 2
+
+    length_x: Quantity
+    factor_k_x: float
+    radius_of_gyration_x: Quantity
+    length_y: Quantity
+    factor_k_y: float
+    radius_of_gyration_y: Quantity
+    length_torsion: Quantity
+    factor_k_torsion: float
+    yield_stress: Quantity
+    modulus_linear: Quantity
+    modulus_shear: Quantity
+    gross_area: Quantity
+    torsional_constant: Quantity
+    warping_constant: Quantity
+    shear_center_x: Quantity
+    shear_center_y: Quantity
+    design_type: DesignType
+    elements: tuple[CompressionElement, ...] = ()
+
+    @property
+    def polar_radius_of_gyration(self) -> Quantity:
+        return polar_radius_of_gyration_about_shear_center(
+            shear_center_x=self.shear_center_x,
+            shear_center_y=self.shear_center_y,
+            radius_of_gyration_x=self.radius_of_gyration_x,
+            radius_of_gyration_y=self.radius_of_gyration_y,
+        )
 
     @property
-    def effective_flange_width(self):
-        return
+    def torsional_buckling_stress(self) -> Quantity:
+        return elastic_torsional_buckling_stress(
+            modulus_linear=self.modulus_linear,
+            modulus_shear=self.modulus_shear,
+            factor_k=self.factor_k_torsion,
+            length=self.length_torsion,
+            torsional_constant=self.torsional_constant,
+            warping_constant=self.warping_constant,
+            gross_area=self.gross_area,
+            polar_radius_of_gyration=self.polar_radius_of_gyration,
+        )
+
+    def _flexural_buckling_stress(
+        self, length: Quantity, factor_k: float, radius_of_gyration: Quantity
+    ) -> Quantity:
+        return elastic_flexural_buckling_stress(
+            modulus_linear=self.modulus_linear,
+            member_slenderness_ratio=member_slenderness_ratio(
+                factor_k=factor_k,
+                unbraced_length=length,
+                radius_of_gyration=radius_of_gyration,
+            ),
+        )
+
+    @property
+    def elastic_buckling_stress(self):
+        return elastic_flexural_torsional_buckling_stress_unsymmetric_member(
+            flexural_buckling_stress_x=self._flexural_buckling_stress(
+                self.length_x, self.factor_k_x, self.radius_of_gyration_x
+            ),
+            flexural_buckling_stress_y=self._flexural_buckling_stress(
+                self.length_y, self.factor_k_y, self.radius_of_gyration_y
+            ),
+            torsional_buckling_stress=self.torsional_buckling_stress,
+            shear_center_x=self.shear_center_x,
+            shear_center_y=self.shear_center_y,
+            polar_radius_of_gyration=self.polar_radius_of_gyration,
+        )
+
+
+def value_or_default(value, default):
+    return default if value is None else value
+
+
+def flexural_buckling_criteria(
+    axes: dict[StrengthType, tuple[Quantity, float, Quantity]],
+    yield_stress: Quantity,
+    modulus_linear: Quantity,
+    gross_area: Quantity,
+    design_type: DesignType,
+    elements: tuple[CompressionElement, ...] = (),
+) -> dict[StrengthType, FlexuralBucklingStrengthCalculation]:
+    """E3 and E7 about each axis, given as (length, K, radius of gyration)"""
+    return {
+        key: FlexuralBucklingStrengthCalculation(
+            length=length,
+            factor_k=factor_k,
+            yield_stress=yield_stress,
+            modulus_linear=modulus_linear,
+            gross_area=gross_area,
+            radius_of_gyration=radius_of_gyration,
+            design_type=design_type,
+            elements=elements,
+        )
+        for key, (length, factor_k, radius_of_gyration) in axes.items()
+    }
+
+
+class SinglySymmetricCompressionMixin:
+    """
+    E3, E4 and E7 compression of sections symmetric about one principal axis,
+    flexural buckling about the axis of symmetry coupled with torsion. Sections
+    provide geometry, material, shear_center and _compression_elements_2016.
+    """
+
+    symmetry_axis: ClassVar[StrengthType]
+
+    def compression(
+        self,
+        length_major_axis: Quantity,
+        factor_k_major_axis: float = 1.0,
+        length_minor_axis: Quantity = None,
+        factor_k_minor_axis: float = 1.0,
+        length_torsion: Quantity = None,
+        factor_k_torsion: float = 1.0,
+        design_type: DesignType = DesignType.ASD,
+        rule_editon: RuleEd = RuleEd.ED15,
+    ) -> LoadStrengthCalculation:
+        """E3, E4 and E7, the torsion length defaults to the major axis one"""
+        geometry = self.geometry
+        material = self.material
+        elements = self._compression_elements_2016
+        axes = {
+            StrengthType.FLEXURAL_BUCKLING_MAJOR_AXIS: (
+                length_major_axis,
+                factor_k_major_axis,
+                geometry.rx,
+            ),
+            StrengthType.FLEXURAL_BUCKLING_MINOR_AXIS: (
+                value_or_default(length_minor_axis, length_major_axis),
+                factor_k_minor_axis,
+                geometry.ry,
+            ),
+        }
+        criteria = flexural_buckling_criteria(
+            axes,
+            yield_stress=material.yield_strength,
+            modulus_linear=material.modulus_linear,
+            gross_area=geometry.A,
+            design_type=design_type,
+            elements=elements,
+        )
+        length, factor_k, radius_of_gyration = axes.pop(self.symmetry_axis)
+        ((_, _, other_radius_of_gyration),) = axes.values()
+        criteria[StrengthType.FLEXURAL_TORSIONAL_BUCKLING] = (
+            FlexuralTorsionalBucklingSinglySymmetricStrengthCalculation(
+                length=length,
+                factor_k=factor_k,
+                radius_of_gyration=radius_of_gyration,
+                other_radius_of_gyration=other_radius_of_gyration,
+                length_torsion=value_or_default(length_torsion, length_major_axis),
+                factor_k_torsion=factor_k_torsion,
+                yield_stress=material.yield_strength,
+                modulus_linear=material.modulus_linear,
+                modulus_shear=material.modulus_shear,
+                gross_area=geometry.A,
+                torsional_constant=geometry.J,
+                warping_constant=geometry.Cw,
+                shear_center=self.shear_center,
+                design_type=design_type,
+                elements=elements,
+            )
+        )
+        return LoadStrengthCalculation(criteria=criteria)
 
 
 def flexural_buckling_major_axis_default(model: Analysis):
@@ -225,6 +758,19 @@ def torsional_buckling_doubly_symmtric_i(model: Analysis):
     )
 
 
+def section_compression_criteria(
+    *strength_types: StrengthType,
+) -> tuple[tuple[StrengthType, Callable[[Analysis], Strength]], ...]:
+    """Criteria of the compression() of the member section class"""
+
+    def criterion(strength_type: StrengthType):
+        return lambda model: model.section_compression.criteria[strength_type]
+
+    return tuple(
+        (strength_type, criterion(strength_type)) for strength_type in strength_types
+    )
+
+
 default_flexural_buckling_major_axis = (
     StrengthType.FLEXURAL_BUCKLING_MAJOR_AXIS,
     flexural_buckling_major_axis_default,
@@ -237,32 +783,38 @@ default_flexural_buckling_minor_axis = (
 
 
 compression_criteria_table = {
-    SectionClassification.DOUBLY_SYMMETRIC_I: (
-        default_flexural_buckling_major_axis,
-        default_flexural_buckling_minor_axis,
-        (StrengthType.TORSIONAL_BUCKLING, torsional_buckling_doubly_symmtric_i),
+    SectionClassification.DOUBLY_SYMMETRIC_I: section_compression_criteria(
+        StrengthType.FLEXURAL_BUCKLING_MAJOR_AXIS,
+        StrengthType.FLEXURAL_BUCKLING_MINOR_AXIS,
+        StrengthType.TORSIONAL_BUCKLING,
     ),
     SectionClassification.SINGLY_SYMMETRIC_I: (
         default_flexural_buckling_major_axis,
         default_flexural_buckling_minor_axis,
         # (StrengthType.TORSIONAL_BUCKLING,)
     ),
-    SectionClassification.CHANEL: (
-        default_flexural_buckling_major_axis,
-        default_flexural_buckling_minor_axis,
-        # StrengthType.TORSIONAL_BUCKLING,
+    SectionClassification.CHANEL: section_compression_criteria(
+        StrengthType.FLEXURAL_BUCKLING_MAJOR_AXIS,
+        StrengthType.FLEXURAL_BUCKLING_MINOR_AXIS,
+        StrengthType.FLEXURAL_TORSIONAL_BUCKLING,
     ),
-    SectionClassification.HSS: (
-        default_flexural_buckling_major_axis,
-        default_flexural_buckling_minor_axis,
+    SectionClassification.TEE: section_compression_criteria(
+        StrengthType.FLEXURAL_BUCKLING_MAJOR_AXIS,
+        StrengthType.FLEXURAL_BUCKLING_MINOR_AXIS,
+        StrengthType.FLEXURAL_TORSIONAL_BUCKLING,
     ),
-    SectionClassification.PIPE: (
-        default_flexural_buckling_major_axis,
-        default_flexural_buckling_minor_axis,
+    SectionClassification.HSS: section_compression_criteria(
+        StrengthType.FLEXURAL_BUCKLING_MAJOR_AXIS,
+        StrengthType.FLEXURAL_BUCKLING_MINOR_AXIS,
     ),
-    SectionClassification.ANGLE: (
-        default_flexural_buckling_major_axis,
-        default_flexural_buckling_minor_axis,
+    SectionClassification.PIPE: section_compression_criteria(
+        StrengthType.FLEXURAL_BUCKLING_MAJOR_AXIS,
+        StrengthType.FLEXURAL_BUCKLING_MINOR_AXIS,
+    ),
+    SectionClassification.ANGLE: section_compression_criteria(
+        StrengthType.FLEXURAL_BUCKLING_MAJOR_AXIS,
+        StrengthType.FLEXURAL_BUCKLING_MINOR_AXIS,
+        StrengthType.FLEXURAL_TORSIONAL_BUCKLING,
     ),
 }
 
@@ -0,0 +1,265 @@
+from dataclasses import dataclass
+from functools import cached_property
+from itertools import combinations
+from typing import Any
+
+import numpy as np
+
+from struct_codes.criteria import DesignType, Strength
+from struct_codes.instrumentation import instrumented_formula
+from struct_codes.units import Quantity, inch
+from struct_codes.vectorize import maximum, minimum, where
+
+# B4.3b, hole width taken 1/16 in. (2 mm) greater than the nominal dimension
+HOLE_WIDTH_ALLOWANCE = 1 / 16 * inch
+
+
+@instrumented_formula
+def hole_width(hole_diameter: Quantity) -> Quantity:
+    """B4.3b aisc 360-16"""
+    return hole_diameter + HOLE_WIDTH_ALLOWANCE
+
+
+@instrumented_formula
+def stagger_area(stagger: Quantity, gage: Quantity, thickness: Quantity) -> Quantity:
+    """s^2/4g term of B4.3b aisc 360-16"""
+    return stagger**2 * thickness / (4 * gage)
+
+
+@instrumented_formula
+def shear_lag_factor_connection_length(
+    connection_eccentricity: Quantity, connection_length: Quantity
+) -> float:
+    """Table D3.1 case 2 aisc 360-16"""
+    return 1 - (connection_eccentricity / connection_length).to("").magnitude
+
+
+@instrumented_formula
+def shear_lag_factor_flange_connected_i(
+    flange_width: Quantity, depth: Quantity
+) -> float:
+    """Table D3.1 case 7(a) aisc 360-16, three or more fasteners per line"""
+    return where(flange_width >= 2 / 3 * depth, 0.90, 0.85)
+
+
+@instrumented_formula
+def tee_centroid_distance(
+    flange_width: Quantity,
+    flange_thickness: Quantity,
+    depth: Quantity,
+    web_thickness: Quantity,
+) -> Quantity:
+    """
+    Distance from the outer face of the flange to the centroid of half an I
+    section (the connected tee), fillets ignored
+    """
+    stem_height = depth / 2 - flange_thickness
+    flange_area = flange_width * flange_thickness
+    stem_area = web_thickness * stem_height
+    return (
+        flange_area * flange_thickness / 2
+        + stem_area * (flange_thickness + stem_height / 2)
+    ) / (flange_area + stem_area)
+
+
+@instrumented_formula
+def block_shear_strength(
+    yield_stress: Quantity,
+    ultimate_stress: Quantity,
+    gross_shear_area: Quantity,
+    net_shear_area: Quantity,
+    net_tension_area: Quantity,
+    tension_stress_factor: float = 1.0,
+) -> Quantity:
+    """eq J4-5 aisc 360-16"""
+    tension = tension_stress_factor * ultimate_stress * net_tension_area
+    return minimum(
+        0.6 * ultimate_stress * net_shear_area + tension,
+        0.6 * yield_stress * gross_shear_area + tension,
+    )
+
+
+@dataclass
+class BlockShearCalculation2016(Strength):
+    yield_stress: Quantity
+    ultimate_stress: Quantity
+    gross_shear_area: Quantity
+    net_shear_area: Quantity
+    net_tension_area: Quantity
+    tension_stress_factor: float = 1.0
+    design_type: DesignType = DesignType.ASD
+
+    asd_factor = 2.00
+    lrfd_factor = 0.75
+    evaluation_cost = 0
+
+    @property
+    def nominal_strength(self):
+        return block_shear_strength(
+            yield_stress=self.yield_stress,
+            ultimate_stress=self.ultimate_stress,
+            gross_shear_area=self.gross_shear_area,
+            net_shear_area=self.net_shear_area,
+            net_tension_area=self.net_tension_area,
+            tension_stress_factor=self.tension_stress_factor,
+        )
+
+
+def _line_stagger(offset_a: Quantity, offset_b: Quantity, pitch: Quantity) -> Any:
+    """Shortest longitudinal distance between holes of two lines"""
+    distance = np.abs(offset_b - offset_a) % pitch
+    return minimum(distance, pitch - distance)
+
+
+@dataclass
+class BoltedFlangeConnection:
+    """
+    Bolted end connection through both flanges of an I section. Each flange
+    has two gage lines at the inner gage (WGi), or four with the outer gage
+    (WGo) given, bolts_per_line holes at pitch along each line and adjacent
+    lines shifted by stagger. Dimensions may be arrays over connection
+    configurations (or sections), the line layout is shared by all of them.
+    """
+
+    flange_width: Quantity
+    flange_thickness: Quantity
+    depth: Quantity
+    web_thickness: Quantity
+    inner_gage: Quantity
+    hole_diameter: Quantity
+    pitch: Quantity
+    bolts_per_line: Any
+    end_distance: Quantity
+    stagger: Quantity = None
+    outer_gage: Quantity = None
+
+    def __post_init__(self):
+        if np.any(np.asarray(self.bolts_per_line) < 2):
+            raise ValueError(
+                "bolts_per_line must be at least 2, case 2 of table D3.1 needs "
+                "a connection length"
+            )
+
+    @classmethod
+    def from_geometry(
+        cls,
+        geometry: Any,
+        hole_diameter: Quantity,
+        pitch: Quantity,
+        bolts_per_line: Any,
+        end_distance: Quantity,
+        stagger: Quantity = None,
+        outer_lines: bool = False,
+    ) -> "BoltedFlangeConnection":
+        """Gages from the workable gages of the AISC database"""
+        return cls(
+            flange_width=geometry.bf,
+            flange_thickness=geometry.tf,
+            depth=geometry.d,
+            web_thickness=geometry.tw,
+            inner_gage=geometry.WGi,
+            hole_diameter=hole_diameter,
+            pitch=pitch,
+            bolts_per_line=bolts_per_line,
+            end_distance=end_distance,
+            stagger=stagger,
+            outer_gage=geometry.WGo if outer_lines else None,
+        )
+
+    @property
+    def hole_width(self) -> Quantity:
+        return hole_width(hole_diameter=self.hole_diameter)
+
+    @cached_property
+    def lines(self) -> tuple[tuple[Quantity, Quantity], ...]:
+        """(transverse position, longitudinal offset) of the lines of a flange"""
+        inner = self.inner_gage / 2
+        positions = [-inner, inner]
+        if self.outer_gage is not None:
+            positions = [-inner - self.outer_gage, *positions, inner + self.outer_gage]
+        stagger = 0 * self.pitch if self.stagger is None else self.stagger
+        return tuple(
+            (position, stagger * (i % 2)) for i, position in enumerate(positions)
+        )
+
+    def _path_area_loss(self, lines: tuple[tuple[Quantity, Quantity], ...]) -> Any:
+        loss = len(lines) * self.hole_width * self.flange_thickness
+        for (position_a, offset_a), (position_b, offset_b) in zip(lines, lines[1:]):
+            loss = loss - stagger_area(
+                stagger=_line_stagger(offset_a, offset_b, self.pitch),
+                gage=position_b - position_a,
+                thickness=self.flange_thickness,
+            )
+        return loss
+
+    @cached_property
+    def flange_area_loss(self) -> Quantity:
+        """Largest loss over every failure path across a flange, B4.3b"""
+        lines = self.lines
+        loss = None
+        for count in range(1, len(lines) + 1):
+            for path in combinations(lines, count):
+                path_loss = self._path_area_loss(path)
+                loss = path_loss if loss is None else maximum(loss, path_loss)
+        return loss
+
+    @property
+    def area_reduction(self) -> Quantity:
+        return 2 * self.flange_area_loss
+
+    @property
+    def connection_length(self) -> Quantity:
+        return (self.bolts_per_line - 1) * self.pitch
+
+    @property
+    def shear_lag_factor(self) -> float:
+        """Table D3.1, larger of case 2 and, for 3 or more bolts per line, case 7"""
+        case_2 = shear_lag_factor_connection_length(
+            connection_eccentricity=tee_centroid_distance(
+                flange_width=self.flange_width,
+                flange_thickness=self.flange_thickness,
+                depth=self.depth,
+                web_thickness=self.web_thickness,
+            ),
+            connection_length=self.connection_length,
+        )
+        case_7 = shear_lag_factor_flange_connected_i(
+            flange_width=self.flange_width, depth=self.depth
+        )
+        return where(
+            np.asarray(self.bolts_per_line) >= 3, maximum(case_2, case_7), case_2
+        )
+
+    def block_shear(
+        self,
+        yield_stress: Quantity,
+        ultimate_stress: Quantity,
+        design_type: DesignType = DesignType.ASD,
+    ) -> BlockShearCalculation2016:
+        """
+        Blocks from each outer line to the flange edge, four per member, their
+        areas summed in a single eq J4-5
+        """
+        thickness = self.flange_thickness
+        outer_lines = (self.lines[0], self.lines[-1])
+        gross_shear_area = 0 * thickness**2
+        net_shear_area = 0 * thickness**2
+        net_tension_area = 0 * thickness**2
+        for position, offset in outer_lines:
+            shear_length = self.end_distance + offset + self.connection_length
+            edge_distance = self.flange_width / 2 - np.abs(position)
+            gross_shear_area = gross_shear_area + 2 * thickness * shear_length
+            net_shear_area = net_shear_area + 2 * thickness * (
+                shear_length - (self.bolts_per_line - 0.5) * self.hole_width
+            )
+            net_tension_area = net_tension_area + 2 * thickness * (
+                edge_distance - 0.5 * self.hole_width
+            )
+        return BlockShearCalculation2016(
+            yield_stress=yield_stress,
+            ultimate_stress=ultimate_stress,
+            gross_shear_area=gross_shear_area,
+            net_shear_area=net_shear_area,
+            net_tension_area=net_tension_area,
+            design_type=design_type,
+        )
@@ -1,9 +1,14 @@
 from abc import ABC, abstractmethod
 from dataclasses import dataclass
 from enum import Enum
+from typing import Any, Iterable
 
+import numpy as np
 from pint import Quantity
 
+from struct_codes.instrumentation import INSTRUMENTATION, InstrumentationCategory
+from struct_codes.vectorize import is_array, where
+
 
 @dataclass
 class NotAplicable:
@@ -12,15 +17,25 @@ class NotAplicable:
 
 class StrengthType(str, Enum):
     WEB_SHEAR = "web_shear"
+    FLANGE_SHEAR = "flange_shear"
     FLEXURAL_BUCKLING_MAJOR_AXIS = "flexural_buckling_major_axis"
     FLEXURAL_BUCKLING_MINOR_AXIS = "flexural_buckling_minor_axis"
     TORSIONAL_BUCKLING = "torsional_buckling"
+    FLEXURAL_TORSIONAL_BUCKLING = "flexural_torsional_buckling"
+    FLEXURAL_BUCKLING = "flexural_buckling"
     YIELD = "yield"
     ULTIMATE = "ultimate"
+    BLOCK_SHEAR = "block_shear"
     LATERAL_TORSIONAL_BUCKLING = "lateral_torsional_buckling"
     COMPRESSION_FLANGE_LOCAL_BUCKLING = "compression_flange_local_buckling"
+    FLANGE_LOCAL_BUCKLING = "flange_local_buckling"
+    WEB_LOCAL_BUCKLING = "web_local_buckling"
+    LOCAL_BUCKLING = "local_buckling"
+    LEG_LOCAL_BUCKLING = "leg_local_buckling"
+    STEM_LOCAL_BUCKLING = "stem_local_buckling"
     COMPRESSION_FLANGE_YIELDING = "compression_flange_yielding"
     TENSION_FLANGE_YIELDING = "tension_flange_yielding"
+    TORSION = "torsion"
 
 
 class DesignType(str, Enum):
@@ -32,7 +47,8 @@ def calculate_design_strength(
     nominal_strength: Quantity, design_type: DesignType, factor: float | None = None
 ) -> Quantity:
     default_factor = {DesignType.ASD: 1.67, DesignType.LRFD: 0.9}
-    factor = factor or default_factor[design_type]
+    if factor is None:
+        factor = default_factor[design_type]
     calc_function = {
         DesignType.ASD: lambda x, y: x / y,
         DesignType.LRFD: lambda x, y: x * y,
@@ -40,6 +56,19 @@ def calculate_design_strength(
     return calc_function[design_type](nominal_strength, factor)
 
 
+def calculate_design_strengths(
+    nominal_strength: Quantity,
+    factors: dict[DesignType, float],
+) -> dict[DesignType, Quantity]:
+    """Design strengths for several design types from a single nominal strength"""
+    return {
+        design_type: calculate_design_strength(
+            nominal_strength=nominal_strength, design_type=design_type, factor=factor
+        )
+        for design_type, factor in factors.items()
+    }
+
+
 class Strength(ABC):
     design_type: DesignType
 
@@ -50,12 +79,104 @@ class Strength(ABC):
     @abstractmethod
     def nominal_strength(self) -> Quantity: ...
 
+    # relative cost of a full evaluation, used to order criteria in bounded evaluations
+    evaluation_cost = 1
+
+    @property
+    def nominal_strength_upper_bound(self) -> Quantity | None:
+        """Cheap upper bound of the nominal strength, None if not available"""
+        return None
+
+    @property
+    def nominal_strength_lower_bound(self) -> Quantity | None:
+        """Cheap lower bound of the nominal strength, None if not available"""
+        return None
+
+    def _bound_design_strength(self, bound: Quantity | None) -> Quantity | None:
+        if bound is None:
+            return None
+        return calculate_design_strength(
+            nominal_strength=bound,
+            design_type=self.design_type,
+            factor=self.factors[self.design_type],
+        )
+
+    @property
+    def design_strength_upper_bound(self) -> Quantity | None:
+        return self._bound_design_strength(self.nominal_strength_upper_bound)
+
+    @property
+    def design_strength_lower_bound(self) -> Quantity | None:
+        return self._bound_design_strength(self.nominal_strength_lower_bound)
+
+    @property
+    def factors(self) -> dict[DesignType, float]:
+        return {DesignType.ASD: self.asd_factor, DesignType.LRFD: self.lrfd_factor}
+
+    def _evaluate_nominal_strength(self) -> Quantity:
+        return INSTRUMENTATION.measure(
+            InstrumentationCategory.CALCULATION,
+            type(self).__name__,
+            lambda: self.nominal_strength,
+        )
+
     @property
     def design_strength(self) -> Quantity:
-        ns = self.nominal_strength
-        table = {DesignType.ASD: self.asd_factor, DesignType.LRFD: self.lrfd_factor}
+        ns = self._evaluate_nominal_strength()
         return calculate_design_strength(
             nominal_strength=ns,
             design_type=self.design_type,
-            factor=table[self.design_type],
+            factor=self.factors[self.design_type],
+        )
+
+    def design_strengths(
+        self,
+        design_types: Iterable[DesignType] = tuple(DesignType),
+        factors: dict[DesignType, float] | None = None,
+    ) -> dict[DesignType, Quantity]:
+        """
+        Design strengths for each design type, the nominal strength is evaluated
+        only once. `factors` overrides the resistance/safety factor per design type.
+        """
+        ns = self._evaluate_nominal_strength()
+        factors = {**self.factors, **(factors or {})}
+        return calculate_design_strengths(
+            nominal_strength=ns,
+            factors={design_type: factors[design_type] for design_type in design_types},
         )
+
+
+@dataclass
+class DispatchedStrength(Strength):
+    """
+    Limit state evaluated with a different calculation per entry of array
+    valued sections, each case applies where its mask is true. Entries not
+    covered by any case are not subjected to the limit state and get an
+    infinite strength, so they never govern.
+    """
+
+    cases: tuple[tuple[Any, Strength], ...]
+    design_type: DesignType = DesignType.ASD
+
+    @property
+    def nominal_strength(self) -> Quantity:
+        strength = None
+        for mask, calculation in self.cases:
+            value = calculation.nominal_strength
+            if strength is None:
+                strength = np.inf * value.units
+            strength = where(mask, value, strength)
+        return strength
+
+    @property
+    def factors(self) -> dict[DesignType, Any]:
+        """Factors per entry, only when the cases don't share the same factors"""
+        factors = {}
+        for design_type in DesignType:
+            factor = self.cases[0][1].factors[design_type]
+            for mask, calculation in self.cases[1:]:
+                case_factor = calculation.factors[design_type]
+                if is_array(factor) or case_factor != factor:
+                    factor = where(mask, case_factor, factor)
+            factors[design_type] = factor
+        return factors
@@ -0,0 +1,122 @@
+from dataclasses import dataclass
+from enum import Enum
+from typing import Any, Iterable
+
+import numpy as np
+
+from struct_codes.beam import Beam
+from struct_codes.interaction import (
+    InteractionSurface,
+    InteractionSurfaceCache,
+    doubly_and_singly_symmetric_interaction,
+)
+
+
+class EnvelopeCheck(str, Enum):
+    AXIAL = "axial"
+    FLEXURE_MAJOR_AXIS = "flexure_major_axis"
+    FLEXURE_MINOR_AXIS = "flexure_minor_axis"
+    INTERACTION = "interaction"
+
+
+@dataclass
+class EnvelopeEntry:
+    utilization: np.ndarray
+    step: np.ndarray
+
+
+@dataclass
+class StreamingEnvelope:
+    """
+    Running maximum utilization per member and check over demand chunks, e.g.
+    the time steps of a time-history analysis. Only the envelope is kept, the
+    memory use doesn't depend on the number of steps.
+
+    Chunks are (steps, members) arrays of axial force (positive in tension)
+    and moments, as quantities or floats in base units, (steps,) arrays for a
+    single member surface.
+    """
+
+    surface: InteractionSurface
+
+    def __post_init__(self):
+        members = np.shape(self.surface.compression_strength)
+        self.steps = 0
+        self.envelope = {
+            check: EnvelopeEntry(
+                utilization=np.zeros(members), step=np.full(members, -1)
+            )
+            for check in EnvelopeCheck
+        }
+
+    @classmethod
+    def from_surfaces(
+        cls, surfaces: Iterable[InteractionSurface]
+    ) -> "StreamingEnvelope":
+        return cls(surface=InteractionSurface.stack(surfaces))
+
+    @classmethod
+    def from_cache(
+        cls,
+        cache: InteractionSurfaceCache,
+        members: Iterable[tuple[str, Beam]],
+        lateral_torsional_buckling_modification_factor: float = 1.0,
+    ) -> "StreamingEnvelope":
+        """Capacities of (section name, beam) members, reused from the cache"""
+        return cls.from_surfaces(
+            cache.surface(
+                section_name,
+                beam,
+                lateral_torsional_buckling_modification_factor=lateral_torsional_buckling_modification_factor,
+            )
+            for section_name, beam in members
+        )
+
+    def _update_check(self, check: EnvelopeCheck, utilization: np.ndarray):
+        entry = self.envelope[check]
+        step = np.argmax(utilization, axis=0)
+        maximum = np.take_along_axis(utilization, step[None], axis=0)[0]
+        larger = maximum > entry.utilization
+        entry.utilization = np.where(larger, maximum, entry.utilization)
+        entry.step = np.where(larger, step + self.steps, entry.step)
+
+    def update(self, axial_force: Any, major_axis_moment: Any, minor_axis_moment: Any):
+        """Adds a chunk of demands, steps are numbered in the order received"""
+        members = np.shape(self.surface.compression_strength)
+        axial_ratio, major_axis_ratio, minor_axis_ratio = (
+            ratio.reshape(-1, *members)
+            for ratio in np.broadcast_arrays(
+                self.surface.axial_ratio(axial_force),
+                self.surface.major_axis_ratio(major_axis_moment),
+                self.surface.minor_axis_ratio(minor_axis_moment),
+            )
+        )
+        self._update_check(EnvelopeCheck.AXIAL, axial_ratio)
+        self._update_check(EnvelopeCheck.FLEXURE_MAJOR_AXIS, major_axis_ratio)
+        self._update_check(EnvelopeCheck.FLEXURE_MINOR_AXIS, minor_axis_ratio)
+        self._update_check(
+            EnvelopeCheck.INTERACTION,
+            doubly_and_singly_symmetric_interaction(
+                axial_ratio=axial_ratio,
+                major_axis_ratio=major_axis_ratio,
+                minor_axis_ratio=minor_axis_ratio,
+            ),
+        )
+        self.steps += axial_ratio.shape[0]
+
+    def consume(
+        self, chunks: Iterable[tuple[Any, Any, Any]]
+    ) -> dict[EnvelopeCheck, EnvelopeEntry]:
+        """Reduces an iterable of (axial force, major moment, minor moment) chunks"""
+        for chunk in chunks:
+            self.update(*chunk)
+        return self.envelope
+
+    @property
+    def governing_check(self) -> np.ndarray:
+        """Check with the largest utilization of each member"""
+        checks = tuple(EnvelopeCheck)
+        utilization = np.stack([self.envelope[check].utilization for check in checks])
+        governing = np.empty(utilization.shape[1:], dtype=object)
+        governing[...] = np.array(checks, dtype=object)[np.argmax(utilization, axis=0)]
+        return governing
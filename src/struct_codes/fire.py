@@ -0,0 +1,427 @@
+from dataclasses import dataclass
+from enum import Enum
+from functools import cached_property
+from typing import Any
+
+import numpy as np
+from pint import Quantity
+
+from struct_codes.aisc_database import get_aisc_geometry_table
+from struct_codes.compression import (
+    FlexuralBucklingStrengthCalculation,
+    TorsionalBucklingDoublySymmetricStrengthCalculation,
+)
+from struct_codes.criteria import DesignType, Strength, StrengthType
+from struct_codes.i_section._flexure import (
+    effective_radius_of_gyration,
+    flexural_lateral_torsional_buckling_critical_stress_compact_doubly_symmetric,
+)
+from struct_codes.instrumentation import instrumented_formula
+from struct_codes.materials import Material
+from struct_codes.sections import (
+    LoadStrengthCalculation,
+    RuleEd,
+    SectionGeometry,
+    SectionType,
+)
+from struct_codes.vectorize import minimum, where
+
+
+class FireExposure(str, Enum):
+    """Heated perimeters of design guide 19, values are the database columns"""
+
+    # contour of the shape minus one flange (short leg for single angles)
+    CONTOUR_THREE_SIDES = "PA"
+    # single angle contour minus the long leg
+    ANGLE_CONTOUR_THREE_SIDES = "PA2"
+    CONTOUR_FOUR_SIDES = "PB"
+    # box around the shape minus one flange
+    BOX_THREE_SIDES = "PC"
+    BOX_FOUR_SIDES = "PD"
+
+
+# Table A-4.2.1 aisc 360-16, temperatures in °C
+_TEMPERATURES = np.array(
+    [20, 93, 204, 316, 399, 427, 538, 649, 760, 871, 982, 1093, 1204]
+)
+_MODULUS_RETENTION = np.array(
+    [1.00, 1.00, 0.90, 0.78, 0.70, 0.67, 0.49, 0.22, 0.11, 0.07, 0.05, 0.02, 0.00]
+)
+_PROPORTIONAL_LIMIT_RETENTION = np.array(
+    [1.00, 1.00, 0.80, 0.58, 0.42, 0.40, 0.29, 0.13, 0.06, 0.04, 0.03, 0.01, 0.00]
+)
+_YIELD_RETENTION = np.array(
+    [1.00, 1.00, 1.00, 1.00, 1.00, 0.94, 0.66, 0.35, 0.16, 0.07, 0.04, 0.02, 0.00]
+)
+
+
+@instrumented_formula
+def section_factor(weight: Quantity, heated_perimeter: Quantity) -> Quantity:
+    """W/D of design guide 19, weight per unit length over heated perimeter"""
+    return weight / heated_perimeter
+
+
+@instrumented_formula
+def retention_factors(temperature: Any) -> tuple[Any, Any, Any]:
+    """
+    kE = E(T)/E = G(T)/G, kp = Fp(T)/Fy and ky = Fy(T)/Fy of table A-4.2.1
+    aisc 360-16, linearly interpolated, temperature in °C
+    """
+    return tuple(
+        np.interp(temperature, _TEMPERATURES, factors)
+        for factors in (
+            _MODULUS_RETENTION,
+            _PROPORTIONAL_LIMIT_RETENTION,
+            _YIELD_RETENTION,
+        )
+    )
+
+
+@instrumented_formula
+def elevated_temperature_critical_stress(
+    yield_stress: Quantity, elastic_buckling_stress: Quantity
+) -> Quantity:
+    """Fcr(T) = 0.42^(Fy(T)/Fe(T))^0.5 Fy(T), appendix 4.2.4d(b) aisc 360-16"""
+    ratio = (yield_stress / elastic_buckling_stress).to("").magnitude
+    return 0.42 ** (ratio**0.5) * yield_stress
+
+
+@instrumented_formula
+def elevated_temperature_limiting_length_lateral_torsional_buckling(
+    modulus: Quantity,
+    limiting_stress: Quantity,
+    elastic_section_modulus: Quantity,
+    torsional_constant: Quantity,
+    effective_radius_of_gyration: Quantity,
+    distance_between_centroids: Quantity,
+    coefficient_c: float,
+) -> Quantity:
+    """Lr(T), appendix 4.2.4d(c) aisc 360-16, eq F2-6 with FL(T) for 0.7Fy"""
+    ratio = (
+        torsional_constant
+        * coefficient_c
+        / (elastic_section_modulus * distance_between_centroids)
+    )
+    inner_root = (ratio**2 + 6.76 * (limiting_stress / modulus) ** 2) ** 0.5
+    return (
+        1.95
+        * effective_radius_of_gyration
+        * modulus
+        / limiting_stress
+        * (ratio + inner_root) ** 0.5
+    )
+
+
+@instrumented_formula
+def elevated_temperature_lateral_torsional_buckling_exponent(
+    temperature: Any,
+) -> Any:
+    """cx = 0.6 + T/250 <= 3.0, appendix 4.2.4d(c) aisc 360-16, T in °C"""
+    return minimum(0.6 + np.asarray(temperature) / 250, 3.0)
+
+
+@dataclass
+class ElevatedTemperatureMaterial:
+    """
+    Material with the retention factors of table A-4.2.1 applied, temperature
+    in °C and possibly an array, the ultimate strength is taken with ky.
+    """
+
+    material: Material
+    temperature: Any
+
+    @cached_property
+    def _retention(self) -> tuple[Any, Any, Any]:
+        return retention_factors(self.temperature)
+
+    @property
+    def modulus_linear(self) -> Quantity:
+        return self._retention[0] * self.material.modulus_linear
+
+    @property
+    def modulus_shear(self) -> Quantity:
+        return self._retention[0] * self.material.modulus_shear
+
+    @property
+    def poisson_ratio(self) -> float:
+        return self.material.poisson_ratio
+
+    @property
+    def proportional_limit(self) -> Quantity:
+        return self._retention[1] * self.material.yield_strength
+
+    @property
+    def yield_strength(self) -> Quantity:
+        return self._retention[2] * self.material.yield_strength
+
+    @property
+    def ultimate_strength(self) -> Quantity:
+        return self._retention[2] * self.material.ultimate_strength
+
+
+class _ElevatedTemperatureBucklingMixin:
+    """Appendix 4.2.4d(b) critical stress for the chapter E calculations"""
+
+    @property
+    def critical_stress(self):
+        return elevated_temperature_critical_stress(
+            yield_stress=self.yield_stress,
+            elastic_buckling_stress=self.elastic_buckling_stress,
+        )
+
+    @property
+    def nominal_strength_lower_bound(self) -> Quantity | None:
+        # the ambient temperature bounds use eq E3-2
+        return None
+
+
+@dataclass
+class ElevatedTemperatureFlexuralBucklingCalculation(
+    _ElevatedTemperatureBucklingMixin, FlexuralBucklingStrengthCalculation
+):
+    """AISC 360 2016 appendix 4.2.4d(b), flexural buckling"""
+
+
+@dataclass
+class ElevatedTemperatureTorsionalBucklingCalculation(
+    _ElevatedTemperatureBucklingMixin,
+    TorsionalBucklingDoublySymmetricStrengthCalculation,
+):
+    """AISC 360 2016 appendix 4.2.4d(b), torsional buckling"""
+
+
+@dataclass
+class ElevatedTemperatureLateralTorsionalBucklingCalculation2016(Strength):
+    """AISC 360 2016 appendix 4.2.4d(c), doubly symmetric I-shapes"""
+
+    length: Quantity
+    temperature: Any
+    modulus: Quantity
+    yield_stress: Quantity
+    proportional_limit: Quantity
+    plastic_section_modulus: Quantity
+    elastic_section_modulus: Quantity
+    minor_axis_inertia: Quantity
+    torsional_constant: Quantity
+    warping_constant: Quantity
+    distance_between_flange_centroids: Quantity
+    modification_factor: float = 1.0
+    coefficient_c: float = 1.0
+    design_type: DesignType = DesignType.LRFD
+
+    evaluation_cost = 2
+
+    @property
+    def plastic_moment(self) -> Quantity:
+        return self.plastic_section_modulus * self.yield_stress
+
+    @property
+    def limiting_stress(self) -> Quantity:
+        """FL(T) = Fy(kp - 0.3ky), with Fp(T) = kp Fy and Fy(T) = ky Fy"""
+        return self.proportional_limit - 0.3 * self.yield_stress
+
+    @property
+    def effective_radius_of_gyration(self) -> Quantity:
+        return effective_radius_of_gyration(
+            major_section_modulus=self.elastic_section_modulus,
+            minor_inertia=self.minor_axis_inertia,
+            warping_constant=self.warping_constant,
+        )
+
+    @property
+    def limiting_length_lateral_torsional_buckling(self) -> Quantity:
+        return elevated_temperature_limiting_length_lateral_torsional_buckling(
+            modulus=self.modulus,
+            limiting_stress=self.limiting_stress,
+            elastic_section_modulus=self.elastic_section_modulus,
+            torsional_constant=self.torsional_constant,
+            effective_radius_of_gyration=self.effective_radius_of_gyration,
+            distance_between_centroids=self.distance_between_flange_centroids,
+            coefficient_c=self.coefficient_c,
+        )
+
+    @property
+    def nominal_strength(self):
+        plastic_moment = self.plastic_moment
+        limiting_length = self.limiting_length_lateral_torsional_buckling
+        limiting_moment = self.limiting_stress * self.elastic_section_modulus
+        ratio = np.clip((self.length / limiting_length).to("").magnitude, 0, 1)
+        inelastic = self.modification_factor * (
+            limiting_moment
+            + (plastic_moment - limiting_moment)
+            * (1 - ratio)
+            ** elevated_temperature_lateral_torsional_buckling_exponent(
+                self.temperature
+            )
+        )
+        elastic = (
+            flexural_lateral_torsional_buckling_critical_stress_compact_doubly_symmetric(
+                mod_factor=self.modification_factor,
+                length_between_braces=self.length,
+                modulus=self.modulus,
+                effective_radius_of_gyration=self.effective_radius_of_gyration,
+                coefficient_c=self.coefficient_c,
+                torsional_constant=self.torsional_constant,
+                section_modulus=self.elastic_section_modulus,
+                distance_between_flange_centroids=self.distance_between_flange_centroids,
+            )
+            * self.elastic_section_modulus
+        )
+        return minimum(
+            where(self.length <= limiting_length, inelastic, elastic),
+            plastic_moment,
+        )
+
+
+@dataclass
+class ElevatedTemperatureYieldingCalculation2016(Strength):
+    """AISC 360 2016 appendix 4.2.4d(c), Mn(T) = Fy(T) Zx"""
+
+    yield_stress: Quantity
+    plastic_section_modulus: Quantity
+    design_type: DesignType = DesignType.LRFD
+
+    evaluation_cost = 0
+
+    @property
+    def nominal_strength(self):
+        return self.yield_stress * self.plastic_section_modulus
+
+
+def _per_member(value):
+    """Trailing axis for the temperatures, arrays are over the members"""
+    if np.ndim(value) == 0:
+        return value
+    return value[..., np.newaxis]
+
+
+def section_factors(geometry: SectionGeometry) -> dict[FireExposure, Quantity]:
+    """W/D of every exposure with a tabulated perimeter"""
+    return {
+        exposure: section_factor(
+            weight=geometry.W, heated_perimeter=getattr(geometry, exposure.value)
+        )
+        for exposure in FireExposure
+        if getattr(geometry, exposure.value, None) is not None
+    }
+
+
+def catalog_section_factors(
+    section_type: SectionType, ed: RuleEd = RuleEd.ED15
+) -> dict[FireExposure, Quantity]:
+    """W/D arrays over the whole catalog of a section type, NaN if not tabulated"""
+    return section_factors(get_aisc_geometry_table(section_type=section_type, ed=ed))
+
+
+@dataclass
+class FireDesign:
+    """
+    Appendix 4.2.4d simple method for doubly symmetric I-shapes at uniform
+    steel temperatures (°C). Geometry may be a columnar table, results are
+    (members, temperatures) arrays for an array of temperatures.
+    """
+
+    geometry: SectionGeometry
+    material: Material
+    temperature: Any
+
+    @cached_property
+    def elevated_material(self) -> ElevatedTemperatureMaterial:
+        return ElevatedTemperatureMaterial(
+            material=self.material, temperature=self.temperature
+        )
+
+    def _geometry(self, name: str) -> Quantity:
+        return _per_member(getattr(self.geometry, name))
+
+    def compression(
+        self,
+        length_major_axis: Quantity,
+        factor_k_major_axis: float = 1.0,
+        length_minor_axis: Quantity = None,
+        factor_k_minor_axis: float = 1.0,
+        length_torsion: Quantity = None,
+        factor_k_torsion: float = 1.0,
+        design_type: DesignType = DesignType.LRFD,
+    ) -> LoadStrengthCalculation:
+        """E3 and E4 with the appendix 4 critical stress, gross area"""
+        length_minor_axis = (
+            length_major_axis if length_minor_axis is None else length_minor_axis
+        )
+        length_torsion = length_major_axis if length_torsion is None else length_torsion
+        material = self.elevated_material
+        flexural_buckling = {
+            StrengthType.FLEXURAL_BUCKLING_MAJOR_AXIS: (
+                length_major_axis,
+                factor_k_major_axis,
+                "rx",
+            ),
+            StrengthType.FLEXURAL_BUCKLING_MINOR_AXIS: (
+                length_minor_axis,
+                factor_k_minor_axis,
+                "ry",
+            ),
+        }
+        criteria = {
+            key: ElevatedTemperatureFlexuralBucklingCalculation(
+                length=_per_member(length),
+                factor_k=_per_member(factor_k),
+                yield_stress=material.yield_strength,
+                modulus_linear=material.modulus_linear,
+                gross_area=self._geometry("A"),
+                radius_of_gyration=self._geometry(radius_of_gyration),
+                design_type=design_type,
+            )
+            for key, (length, factor_k, radius_of_gyration) in flexural_buckling.items()
+        }
+        criteria[StrengthType.TORSIONAL_BUCKLING] = (
+            ElevatedTemperatureTorsionalBucklingCalculation(
+                length=_per_member(length_torsion),
+                factor_k=_per_member(factor_k_torsion),
+                yield_stress=material.yield_strength,
+                modulus_linear=material.modulus_linear,
+                modulus_shear=material.modulus_shear,
+                gross_area=self._geometry("A"),
+                major_axis_inertia=self._geometry("Ix"),
+                minor_axis_inertia=self._geometry("Iy"),
+                torsional_constant=self._geometry("J"),
+                warping_constant=self._geometry("Cw"),
+                design_type=design_type,
+            )
+        )
+        return LoadStrengthCalculation(criteria=criteria)
+
+    def flexure_major_axis(
+        self,
+        length: Quantity = None,
+        lateral_torsional_buckling_modification_factor: float = 1.0,
+        design_type: DesignType = DesignType.LRFD,
+    ) -> LoadStrengthCalculation:
+        """Mp(T) and, with an unbraced length, lateral-torsional buckling"""
+        material = self.elevated_material
+        criteria = {
+            StrengthType.YIELD: ElevatedTemperatureYieldingCalculation2016(
+                yield_stress=material.yield_strength,
+                plastic_section_modulus=self._geometry("Zx"),
+                design_type=design_type,
+            )
+        }
+        if length is not None:
+            criteria[StrengthType.LATERAL_TORSIONAL_BUCKLING] = (
+                ElevatedTemperatureLateralTorsionalBucklingCalculation2016(
+                    length=_per_member(length),
+                    temperature=self.temperature,
+                    modulus=material.modulus_linear,
+                    yield_stress=material.yield_strength,
+                    proportional_limit=material.proportional_limit,
+                    plastic_section_modulus=self._geometry("Zx"),
+                    elastic_section_modulus=self._geometry("Sx"),
+                    minor_axis_inertia=self._geometry("Iy"),
+                    torsional_constant=self._geometry("J"),
+                    warping_constant=self._geometry("Cw"),
+                    distance_between_flange_centroids=self._geometry("ho"),
+                    modification_factor=lateral_torsional_buckling_modification_factor,
+                    design_type=design_type,
+                )
+            )
+        return LoadStrengthCalculation(criteria=criteria)
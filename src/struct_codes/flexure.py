@@ -1,4 +1,9 @@
+from typing import Any
+
+import numpy as np
+
 from struct_codes.criteria import StrengthType
+from struct_codes.instrumentation import instrumented_formula
 from struct_codes.sections import SectionClassification
 from struct_codes.slenderness import Slenderness
 
@@ -8,17 +13,138 @@ WEB_SLENDERNESS = "web_slenderness"
 
 
 def look_up_limit_states(data):
+    """Major axis flexure limit states from (section, flange slenderness, web slenderness)"""
     match data:
         case (
             SectionClassification.DOUBLY_SYMMETRIC_I | SectionClassification.CHANEL,
             Slenderness.COMPACT,
             Slenderness.COMPACT,
         ):
+            # F2
             return StrengthType.YIELD, StrengthType.LATERAL_TORSIONAL_BUCKLING
+        case (
+            SectionClassification.DOUBLY_SYMMETRIC_I | SectionClassification.CHANEL,
+            Slenderness.NON_COMPACT | Slenderness.SLENDER,
+            Slenderness.COMPACT,
+        ):
+            # F3, yielding is kept for uniformity with F2, it's never lower.
+            # Channels with noncompact flanges are checked with F3 as well
+            return (
+                StrengthType.YIELD,
+                StrengthType.LATERAL_TORSIONAL_BUCKLING,
+                StrengthType.COMPRESSION_FLANGE_LOCAL_BUCKLING,
+            )
+        case (
+            SectionClassification.DOUBLY_SYMMETRIC_I,
+            Slenderness.COMPACT,
+            Slenderness.NON_COMPACT | Slenderness.SLENDER,
+        ):
+            # F4 and F5, tension flange yielding doesn't apply with Sxt = Sxc
+            return (
+                StrengthType.COMPRESSION_FLANGE_YIELDING,
+                StrengthType.LATERAL_TORSIONAL_BUCKLING,
+            )
+        case (
+            SectionClassification.DOUBLY_SYMMETRIC_I,
+            Slenderness.NON_COMPACT | Slenderness.SLENDER,
+            Slenderness.NON_COMPACT | Slenderness.SLENDER,
+        ):
+            return (
+                StrengthType.COMPRESSION_FLANGE_YIELDING,
+                StrengthType.LATERAL_TORSIONAL_BUCKLING,
+                StrengthType.COMPRESSION_FLANGE_LOCAL_BUCKLING,
+            )
         case _:
             raise ValueError(f"{data} configuration of analysis is not valid")
 
 
+def _interpolate(
+    positions: np.ndarray, values: np.ndarray, x: np.ndarray
+) -> np.ndarray:
+    """np.interp over the last axis of stacked diagrams"""
+    x = np.broadcast_to(x, values.shape[:-1] + x.shape[-1:])
+    index = np.clip(
+        np.sum(positions[..., None, :] <= x[..., :, None], axis=-1) - 1,
+        0,
+        values.shape[-1] - 2,
+    )
+    x0 = np.take_along_axis(positions, index, axis=-1)
+    x1 = np.take_along_axis(positions, index + 1, axis=-1)
+    y0 = np.take_along_axis(values, index, axis=-1)
+    y1 = np.take_along_axis(values, index + 1, axis=-1)
+    return y0 + (y1 - y0) * (x - x0) / (x1 - x0)
+
+
+def _magnitude(value: Any, units: Any) -> np.ndarray:
+    """Float array of a quantity in the given units, plain values as they are"""
+    if units is not None and hasattr(value, "units"):
+        value = value.to(units)
+    return np.asarray(getattr(value, "magnitude", value), dtype=float)
+
+
+@instrumented_formula
+def lateral_torsional_buckling_modification_factor(
+    moments: Any, positions: Any = None, brace_positions: Any = None
+) -> Any:
+    """
+    eq F1-1 aisc 360-16, Cb = 12.5 Mmax / (2.5 Mmax + 3 MA + 4 MB + 3 MC)
+
+    moments: diagrams sampled along the members, shape (..., k), e.g. N members
+    with k points each. Quantities or plain floats.
+    positions: sample positions, shape (k,) or (..., k), equally spaced if not
+    given.
+    brace_positions: brace points including the member ends, shape (m,) or
+    (..., m), converted to the units of positions. Without it each member is a
+    single unbraced segment.
+
+    Returns Cb per member, shape (...), or per segment, shape (..., m - 1).
+    """
+    moments = np.asarray(getattr(moments, "magnitude", moments), dtype=float)
+    if positions is None:
+        positions = np.linspace(0.0, 1.0, moments.shape[-1])
+    units = getattr(positions, "units", None)
+    positions = np.broadcast_to(_magnitude(positions, units), moments.shape)
+    single_segment = brace_positions is None
+    if single_segment:
+        brace_positions = positions[..., [0, -1]]
+    else:
+        brace_positions = _magnitude(brace_positions, units)
+    start, end = brace_positions[..., :-1], brace_positions[..., 1:]
+    # (..., segments, points) with the segment ends and quarter points
+    fractions = np.array([0.0, 0.25, 0.5, 0.75, 1.0])
+    points = start[..., None] + (end - start)[..., None] * fractions
+    segments = points.shape[-2]
+    lead_shape = np.broadcast_shapes(moments.shape[:-1], points.shape[:-2])
+    values = np.abs(
+        _interpolate(
+            np.broadcast_to(positions, lead_shape + moments.shape[-1:]),
+            np.broadcast_to(moments, lead_shape + moments.shape[-1:]),
+            np.broadcast_to(points, lead_shape + points.shape[-2:]).reshape(
+                lead_shape + (-1,)
+            ),
+        )
+    ).reshape(lead_shape + (segments, fractions.size))
+    inside = (positions[..., None, :] >= start[..., None]) & (
+        positions[..., None, :] <= end[..., None]
+    )
+    sampled_max = np.max(np.where(inside, np.abs(moments)[..., None, :], 0.0), axis=-1)
+    moment_max = np.maximum(sampled_max, np.max(values, axis=-1))
+    moment_a, moment_b, moment_c = values[..., 1], values[..., 2], values[..., 3]
+    with np.errstate(invalid="ignore", divide="ignore"):
+        factor = (
+            12.5
+            * moment_max
+            / (2.5 * moment_max + 3 * moment_a + 4 * moment_b + 3 * moment_c)
+        )
+    # no moment along the segment, lateral torsional buckling is not a concern
+    factor = np.where(moment_max > 0, factor, 1.0)
+    if single_segment:
+        factor = factor[..., 0]
+    if factor.ndim == 0:
+        return float(factor)
+    return factor
+
+
 if __name__ == "__main__":
     print(
         look_up_limit_states(
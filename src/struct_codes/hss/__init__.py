@@ -0,0 +1,513 @@
+from dataclasses import dataclass
+from functools import cached_property
+from typing import Any
+
+import numpy as np
+
+from struct_codes.compression import (
+    FlexuralBucklingStrengthCalculation,
+    value_or_default,
+)
+from struct_codes.criteria import DesignType, StrengthType
+from struct_codes.hss._compression import (
+    RoundFlexuralBucklingStrengthCalculation,
+    rectangular_hss_compression_elements,
+)
+from struct_codes.hss._flexure import (
+    RectangularFlangeLocalBucklingCalculation2016,
+    RectangularLateralTorsionalBucklingCalculation2016,
+    RectangularWebLocalBucklingCalculation2016,
+    RoundLocalBucklingCalculation2016,
+)
+from struct_codes.hss._shear import (
+    RectangularHSSShearCalculation2016,
+    RoundHSSShearCalculation2016,
+)
+from struct_codes.hss._slenderness import (
+    axial_rectangular_wall_limit_ratio,
+    axial_round_limit_ratio,
+    flexural_rectangular_flange_compact_limit,
+    flexural_rectangular_flange_slender_limit,
+    flexural_rectangular_web_compact_limit,
+    flexural_rectangular_web_slender_limit,
+    flexural_round_compact_limit,
+    flexural_round_slender_limit,
+)
+from struct_codes.hss._torsion import (
+    RectangularHSSTorsionCalculation2016,
+    RoundHSSTorsionCalculation2016,
+)
+from struct_codes.i_section._flexure import YieldingMomentCalculation16
+from struct_codes.materials import Material
+from struct_codes.sections import (
+    ConstructionType,
+    LoadStrengthCalculation,
+    RuleEd,
+    SectionClassification,
+    SectionGeometry,
+    classified_criteria,
+)
+from struct_codes.units import Quantity
+from struct_codes.vectorize import maximum, select
+
+
+@dataclass
+class _RectangularBendingAxis:
+    """Walls of a rectangular HSS named after their role bending about an axis"""
+
+    depth: Quantity
+    flange_width: Quantity
+    flange_ratio: float
+    web_height: Quantity
+    web_ratio: float
+    moment_of_inertia: Quantity
+    elastic_section_modulus: Quantity
+    plastic_section_modulus: Quantity
+
+    @classmethod
+    def major_axis(cls, geometry: SectionGeometry) -> "_RectangularBendingAxis":
+        return cls(
+            depth=geometry.Ht,
+            flange_width=geometry.b,
+            flange_ratio=geometry.b_tdes,
+            web_height=geometry.h,
+            web_ratio=geometry.h_tdes,
+            moment_of_inertia=geometry.Ix,
+            elastic_section_modulus=geometry.Sx,
+            plastic_section_modulus=geometry.Zx,
+        )
+
+    @classmethod
+    def minor_axis(cls, geometry: SectionGeometry) -> "_RectangularBendingAxis":
+        return cls(
+            depth=geometry.B,
+            flange_width=geometry.h,
+            flange_ratio=geometry.h_tdes,
+            web_height=geometry.b,
+            web_ratio=geometry.b_tdes,
+            moment_of_inertia=geometry.Iy,
+            elastic_section_modulus=geometry.Sy,
+            plastic_section_modulus=geometry.Zy,
+        )
+
+
+@dataclass
+class HollowStructuralSection:
+    """
+    Rectangular and round HSS and pipes. The geometry may be a columnar table
+    mixing both shapes, each row is checked with the provisions of its shape
+    (rows with an outside diameter are round).
+    """
+
+    geometry: SectionGeometry
+    material: Material
+    construction: ConstructionType = ConstructionType.ROLLED
+
+    @property
+    def shape(self) -> Any:
+        """SectionClassification.HSS for rectangular, PIPE for round rows"""
+        diameter = self.geometry.OD
+        if diameter is None:
+            return SectionClassification.HSS
+        return select(
+            [np.logical_not(np.isnan(np.asarray(diameter.magnitude, dtype=float)))],
+            [SectionClassification.PIPE],
+            SectionClassification.HSS,
+        )
+
+    def _criteria(
+        self,
+        calculations: "_HollowSectionCalculations2016",
+        table: dict[SectionClassification, dict[StrengthType, str]],
+    ) -> LoadStrengthCalculation:
+        return LoadStrengthCalculation(
+            criteria=classified_criteria(
+                classification=(self.shape,),
+                limit_states=lambda classification: tuple(table[classification[0]]),
+                calculation=lambda limit_state, classification: getattr(
+                    calculations, table[classification[0]][limit_state]
+                ),
+                design_type=calculations.design_type,
+            )
+        )
+
+    def compression(
+        self,
+        length_major_axis: Quantity,
+        factor_k_major_axis: float = 1.0,
+        length_minor_axis: Quantity = None,
+        factor_k_minor_axis: float = 1.0,
+        design_type: DesignType = DesignType.ASD,
+        rule_editon: RuleEd = RuleEd.ED15,
+    ) -> LoadStrengthCalculation:
+        """E3 and E7, torsional buckling doesn't govern closed sections"""
+        calculations = _HollowSectionCalculations2016(
+            section=self,
+            design_type=design_type,
+            length_major_axis=length_major_axis,
+            factor_k_major_axis=factor_k_major_axis,
+            length_minor_axis=value_or_default(length_minor_axis, length_major_axis),
+            factor_k_minor_axis=factor_k_minor_axis,
+        )
+        return self._criteria(calculations, _COMPRESSION_TABLE)
+
+    def flexure_major_axis(
+        self,
+        length: Quantity = None,
+        lateral_torsional_buckling_modification_factor: float = 1.0,
+        design_type: DesignType = DesignType.ASD,
+        rule_editon: RuleEd = RuleEd.ED15,
+    ) -> LoadStrengthCalculation:
+        """F7 and F8, lateral-torsional buckling only with an unbraced length"""
+        calculations = _HollowSectionCalculations2016(
+            section=self,
+            design_type=design_type,
+            length=length,
+            modification_factor=lateral_torsional_buckling_modification_factor,
+        )
+        table = _FLEXURE_TABLE
+        if length is not None:
+            table = {
+                SectionClassification.HSS: {
+                    **table[SectionClassification.HSS],
+                    StrengthType.LATERAL_TORSIONAL_BUCKLING: "lateral_torsional_buckling",
+                },
+                SectionClassification.PIPE: table[SectionClassification.PIPE],
+            }
+        return self._criteria(calculations, table)
+
+    def flexure_minor_axis(
+        self,
+        design_type: DesignType = DesignType.ASD,
+        rule_editon: RuleEd = RuleEd.ED15,
+    ) -> LoadStrengthCalculation:
+        calculations = _HollowSectionCalculations2016(
+            section=self, design_type=design_type, minor_axis=True
+        )
+        return self._criteria(calculations, _FLEXURE_TABLE)
+
+    def shear_major_axis(
+        self,
+        design_type: DesignType = DesignType.ASD,
+        rule_editon: RuleEd = RuleEd.ED15,
+        shear_length: Quantity = None,
+    ) -> LoadStrengthCalculation:
+        """
+        G4 and G5, shear_length is the distance from maximum to zero shear
+        force of round sections (Lv)
+        """
+        calculations = _HollowSectionCalculations2016(
+            section=self, design_type=design_type, shear_length=shear_length
+        )
+        return self._criteria(calculations, _SHEAR_TABLE)
+
+    def shear_minor_axis(
+        self,
+        design_type: DesignType = DesignType.ASD,
+        rule_editon: RuleEd = RuleEd.ED15,
+        shear_length: Quantity = None,
+    ) -> LoadStrengthCalculation:
+        calculations = _HollowSectionCalculations2016(
+            section=self,
+            design_type=design_type,
+            shear_length=shear_length,
+            minor_axis=True,
+        )
+        return self._criteria(calculations, _SHEAR_TABLE)
+
+    def torsion(
+        self,
+        length: Quantity = None,
+        design_type: DesignType = DesignType.ASD,
+        rule_editon: RuleEd = RuleEd.ED15,
+    ) -> LoadStrengthCalculation:
+        """H3.1, the member length only matters for round sections"""
+        calculations = _HollowSectionCalculations2016(
+            section=self, design_type=design_type, length=length
+        )
+        return self._criteria(calculations, _TORSION_TABLE)
+
+
+@dataclass
+class _HollowSectionCalculations2016:
+    """
+    Calculations of both shapes, built lazily so a scalar section only builds
+    those of its own shape and array sections build each one once.
+    """
+
+    section: HollowStructuralSection
+    design_type: DesignType
+    length: Quantity = None
+    modification_factor: float = 1.0
+    length_major_axis: Quantity = None
+    factor_k_major_axis: float = 1.0
+    length_minor_axis: Quantity = None
+    factor_k_minor_axis: float = 1.0
+    shear_length: Quantity = None
+    minor_axis: bool = False
+
+    @property
+    def _geometry(self) -> SectionGeometry:
+        return self.section.geometry
+
+    @property
+    def _yield_stress(self) -> Quantity:
+        return self.section.material.yield_strength
+
+    @property
+    def _modulus(self) -> Quantity:
+        return self.section.material.modulus_linear
+
+    @cached_property
+    def _axis(self) -> _RectangularBendingAxis:
+        if self.minor_axis:
+            return _RectangularBendingAxis.minor_axis(self._geometry)
+        return _RectangularBendingAxis.major_axis(self._geometry)
+
+    @property
+    def _radius_of_gyration(self) -> Quantity:
+        return self._geometry.ry if self.minor_axis else self._geometry.rx
+
+    @property
+    def _plastic_section_modulus(self) -> Quantity:
+        return self._geometry.Zy if self.minor_axis else self._geometry.Zx
+
+    @property
+    def _elastic_section_modulus(self) -> Quantity:
+        return self._geometry.Sy if self.minor_axis else self._geometry.Sx
+
+    def _flexural_buckling(
+        self, length: Quantity, factor_k: float, radius_of_gyration: Quantity
+    ) -> FlexuralBucklingStrengthCalculation:
+        geometry = self._geometry
+        return FlexuralBucklingStrengthCalculation(
+            length=length,
+            factor_k=factor_k,
+            yield_stress=self._yield_stress,
+            modulus_linear=self._modulus,
+            gross_area=geometry.A,
+            radius_of_gyration=radius_of_gyration,
+            design_type=self.design_type,
+            elements=rectangular_hss_compression_elements(
+                flange_width=geometry.b,
+                flange_ratio=geometry.b_tdes,
+                web_height=geometry.h,
+                web_ratio=geometry.h_tdes,
+                thickness=geometry.tdes,
+                limit_ratio=axial_rectangular_wall_limit_ratio(
+                    modulus_linear=self._modulus, yield_strength=self._yield_stress
+                ),
+            ),
+        )
+
+    def _round_flexural_buckling(
+        self, length: Quantity, factor_k: float, radius_of_gyration: Quantity
+    ) -> RoundFlexuralBucklingStrengthCalculation:
+        return RoundFlexuralBucklingStrengthCalculation(
+            length=length,
+            factor_k=factor_k,
+            yield_stress=self._yield_stress,
+            modulus_linear=self._modulus,
+            gross_area=self._geometry.A,
+            radius_of_gyration=radius_of_gyration,
+            design_type=self.design_type,
+            diameter_ratio=self._geometry.D_t,
+            limit_ratio=axial_round_limit_ratio(
+                modulus_linear=self._modulus, yield_strength=self._yield_stress
+            ),
+        )
+
+    @cached_property
+    def flexural_buckling_major_axis(self) -> FlexuralBucklingStrengthCalculation:
+        return self._flexural_buckling(
+            self.length_major_axis, self.factor_k_major_axis, self._geometry.rx
+        )
+
+    @cached_property
+    def flexural_buckling_minor_axis(self) -> FlexuralBucklingStrengthCalculation:
+        return self._flexural_buckling(
+            self.length_minor_axis, self.factor_k_minor_axis, self._geometry.ry
+        )
+
+    @cached_property
+    def round_flexural_buckling_major_axis(
+        self,
+    ) -> RoundFlexuralBucklingStrengthCalculation:
+        return self._round_flexural_buckling(
+            self.length_major_axis, self.factor_k_major_axis, self._geometry.rx
+        )
+
+    @cached_property
+    def round_flexural_buckling_minor_axis(
+        self,
+    ) -> RoundFlexuralBucklingStrengthCalculation:
+        return self._round_flexural_buckling(
+            self.length_minor_axis, self.factor_k_minor_axis, self._geometry.ry
+        )
+
+    @cached_property
+    def yielding(self) -> YieldingMomentCalculation16:
+        """eq F7-1 and F8-1 aisc 360-16"""
+        return YieldingMomentCalculation16(
+            plastic_section_modulus=self._plastic_section_modulus,
+            yield_stress=self._yield_stress,
+            design_type=self.design_type,
+        )
+
+    @cached_property
+    def flange_local_buckling(self) -> RectangularFlangeLocalBucklingCalculation2016:
+        axis = self._axis
+        return RectangularFlangeLocalBucklingCalculation2016(
+            yield_stress=self._yield_stress,
+            modulus=self._modulus,
+            plastic_section_modulus=axis.plastic_section_modulus,
+            elastic_section_modulus=axis.elastic_section_modulus,
+            moment_of_inertia=axis.moment_of_inertia,
+            area=self._geometry.A,
+            depth=axis.depth,
+            thickness=self._geometry.tdes,
+            flange_width=axis.flange_width,
+            flange_ratio=axis.flange_ratio,
+            compact_limit=flexural_rectangular_flange_compact_limit(
+                modulus_linear=self._modulus, yield_strength=self._yield_stress
+            ),
+            slender_limit=flexural_rectangular_flange_slender_limit(
+                modulus_linear=self._modulus, yield_strength=self._yield_stress
+            ),
+            design_type=self.design_type,
+        )
+
+    @cached_property
+    def web_local_buckling(self) -> RectangularWebLocalBucklingCalculation2016:
+        axis = self._axis
+        return RectangularWebLocalBucklingCalculation2016(
+            yield_stress=self._yield_stress,
+            modulus=self._modulus,
+            plastic_section_modulus=axis.plastic_section_modulus,
+            elastic_section_modulus=axis.elastic_section_modulus,
+            flange_ratio=axis.flange_ratio,
+            web_ratio=axis.web_ratio,
+            compact_limit=flexural_rectangular_web_compact_limit(
+                modulus_linear=self._modulus, yield_strength=self._yield_stress
+            ),
+            slender_limit=flexural_rectangular_web_slender_limit(
+                modulus_linear=self._modulus, yield_strength=self._yield_stress
+            ),
+            design_type=self.design_type,
+        )
+
+    @cached_property
+    def lateral_torsional_buckling(
+        self,
+    ) -> RectangularLateralTorsionalBucklingCalculation2016:
+        geometry = self._geometry
+        return RectangularLateralTorsionalBucklingCalculation2016(
+            length=self.length,
+            yield_stress=self._yield_stress,
+            modulus=self._modulus,
+            plastic_section_modulus=geometry.Zx,
+            elastic_section_modulus=geometry.Sx,
+            radius_of_gyration=geometry.ry,
+            torsional_constant=geometry.J,
+            area=geometry.A,
+            modification_factor=self.modification_factor,
+            design_type=self.design_type,
+        )
+
+    @cached_property
+    def round_local_buckling(self) -> RoundLocalBucklingCalculation2016:
+        return RoundLocalBucklingCalculation2016(
+            yield_stress=self._yield_stress,
+            modulus=self._modulus,
+            plastic_section_modulus=self._plastic_section_modulus,
+            elastic_section_modulus=self._elastic_section_modulus,
+            diameter_ratio=self._geometry.D_t,
+            compact_limit=flexural_round_compact_limit(
+                modulus_linear=self._modulus, yield_strength=self._yield_stress
+            ),
+            slender_limit=flexural_round_slender_limit(
+                modulus_linear=self._modulus, yield_strength=self._yield_stress
+            ),
+            design_type=self.design_type,
+        )
+
+    @cached_property
+    def shear(self) -> RectangularHSSShearCalculation2016:
+        axis = self._axis
+        return RectangularHSSShearCalculation2016(
+            yield_stress=self._yield_stress,
+            modulus=self._modulus,
+            web_height=axis.web_height,
+            thickness=self._geometry.tdes,
+            web_ratio=axis.web_ratio,
+            design_type=self.design_type,
+        )
+
+    @cached_property
+    def round_shear(self) -> RoundHSSShearCalculation2016:
+        return RoundHSSShearCalculation2016(
+            yield_stress=self._yield_stress,
+            modulus=self._modulus,
+            gross_area=self._geometry.A,
+            diameter=self._geometry.OD,
+            diameter_ratio=self._geometry.D_t,
+            shear_length=self.shear_length,
+            design_type=self.design_type,
+        )
+
+    @cached_property
+    def torsion(self) -> RectangularHSSTorsionCalculation2016:
+        geometry = self._geometry
+        return RectangularHSSTorsionCalculation2016(
+            yield_stress=self._yield_stress,
+            modulus=self._modulus,
+            torsional_constant=geometry.C,
+            wall_ratio=maximum(geometry.h_tdes, geometry.b_tdes),
+            design_type=self.design_type,
+        )
+
+    @cached_property
+    def round_torsion(self) -> RoundHSSTorsionCalculation2016:
+        geometry = self._geometry
+        return RoundHSSTorsionCalculation2016(
+            yield_stress=self._yield_stress,
+            modulus=self._modulus,
+            diameter=geometry.OD,
+            torsional_moment_of_inertia=geometry.J,
+            diameter_ratio=geometry.D_t,
+            length=self.length,
+            design_type=self.design_type,
+        )
+
+
+# limit states of each shape, in the order ties are resolved, and the
+# calculation of _HollowSectionCalculations2016 that checks them
+_COMPRESSION_TABLE = {
+    SectionClassification.HSS: {
+        StrengthType.FLEXURAL_BUCKLING_MAJOR_AXIS: "flexural_buckling_major_axis",
+        StrengthType.FLEXURAL_BUCKLING_MINOR_AXIS: "flexural_buckling_minor_axis",
+    },
+    SectionClassification.PIPE: {
+        StrengthType.FLEXURAL_BUCKLING_MAJOR_AXIS: "round_flexural_buckling_major_axis",
+        StrengthType.FLEXURAL_BUCKLING_MINOR_AXIS: "round_flexural_buckling_minor_axis",
+    },
+}
+_FLEXURE_TABLE = {
+    SectionClassification.HSS: {
+        StrengthType.YIELD: "yielding",
+        StrengthType.COMPRESSION_FLANGE_LOCAL_BUCKLING: "flange_local_buckling",
+        StrengthType.WEB_LOCAL_BUCKLING: "web_local_buckling",
+    },
+    SectionClassification.PIPE: {
+        StrengthType.YIELD: "yielding",
+        StrengthType.LOCAL_BUCKLING: "round_local_buckling",
+    },
+}
+_SHEAR_TABLE = {
+    SectionClassification.HSS: {StrengthType.WEB_SHEAR: "shear"},
+    SectionClassification.PIPE: {StrengthType.WEB_SHEAR: "round_shear"},
+}
+_TORSION_TABLE = {
+    SectionClassification.HSS: {StrengthType.TORSION: "torsion"},
+    SectionClassification.PIPE: {StrengthType.TORSION: "round_torsion"},
+}
@@ -0,0 +1,84 @@
+from dataclasses import dataclass
+
+from pint import Quantity
+
+from struct_codes.compression import (
+    CompressionElement,
+    EffectiveWidthCoefficient,
+    FlexuralBucklingStrengthCalculation,
+    _nominal_compressive_strength,
+)
+from struct_codes.instrumentation import instrumented_formula
+from struct_codes.vectorize import where
+
+
+def rectangular_hss_compression_elements(
+    flange_width: Quantity,
+    flange_ratio: float,
+    web_height: Quantity,
+    web_ratio: float,
+    thickness: Quantity,
+    limit_ratio: float,
+) -> tuple[CompressionElement, CompressionElement]:
+    """Flange and web walls, two of each, TABLE E7.1 case (b) - aisc 360-16"""
+    return (
+        CompressionElement(
+            width=flange_width,
+            thickness=thickness,
+            slenderness=flange_ratio,
+            limit_slenderness=limit_ratio,
+            coefficient_1=EffectiveWidthCoefficient.HSS_WALL,
+            count=2,
+        ),
+        CompressionElement(
+            width=web_height,
+            thickness=thickness,
+            slenderness=web_ratio,
+            limit_slenderness=limit_ratio,
+            coefficient_1=EffectiveWidthCoefficient.HSS_WALL,
+            count=2,
+        ),
+    )
+
+
+@instrumented_formula
+def round_hss_effective_area(
+    gross_area: Quantity,
+    diameter_ratio: float,
+    limit_ratio: float,
+    modulus_linear: Quantity,
+    yield_stress: Quantity,
+) -> Quantity:
+    """E7-6 and E7-7 - aisc 360-16"""
+    return where(
+        diameter_ratio <= limit_ratio,
+        gross_area,
+        (
+            (0.038 * modulus_linear / (yield_stress * diameter_ratio)).to("").magnitude
+            + 2 / 3
+        )
+        * gross_area,
+    )
+
+
+@dataclass
+class RoundFlexuralBucklingStrengthCalculation(FlexuralBucklingStrengthCalculation):
+    """E7.2 round HSS, the effective area doesn't depend on the critical stress"""
+
+    diameter_ratio: float = None
+    limit_ratio: float = None
+
+    def _nominal_strength(self, critical_stress: Quantity) -> Quantity:
+        return _nominal_compressive_strength(
+            critical_stress=critical_stress, sectional_area=self.effective_area
+        )
+
+    @property
+    def effective_area(self) -> Quantity:
+        return round_hss_effective_area(
+            gross_area=self.gross_area,
+            diameter_ratio=self.diameter_ratio,
+            limit_ratio=self.limit_ratio,
+            modulus_linear=self.modulus_linear,
+            yield_stress=self.yield_stress,
+        )
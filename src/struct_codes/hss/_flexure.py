@@ -0,0 +1,400 @@
+from dataclasses import dataclass
+
+from pint import Quantity
+
+from struct_codes.criteria import DesignType, Strength
+from struct_codes.i_section._flexure import (
+    bending_strength_reduction_factor,
+    flexural_lateral_torsional_buckling_strength_compact_doubly_symmetric_case_b,
+    yielding_moment,
+)
+from struct_codes.instrumentation import instrumented_formula
+from struct_codes.vectorize import minimum, where
+
+
+@instrumented_formula
+def noncompact_flange_local_buckling_strength_hss(
+    plastic_moment: Quantity,
+    yield_stress: Quantity,
+    section_modulus: Quantity,
+    flange_ratio: float,
+    modulus: Quantity,
+) -> Quantity:
+    """eq F7-2 aisc 360-16"""
+    factor = 3.57 * flange_ratio * (yield_stress / modulus) ** 0.5 - 4.0
+    return minimum(
+        plastic_moment - (plastic_moment - yield_stress * section_modulus) * factor,
+        plastic_moment,
+    )
+
+
+@instrumented_formula
+def effective_flange_width_hss(
+    flange_width: Quantity,
+    thickness: Quantity,
+    flange_ratio: float,
+    modulus: Quantity,
+    yield_stress: Quantity,
+) -> Quantity:
+    """eq F7-4 aisc 360-16"""
+    root = (modulus / yield_stress) ** 0.5
+    return minimum(
+        1.92 * thickness * root * (1 - 0.38 / flange_ratio * root), flange_width
+    )
+
+
+@instrumented_formula
+def effective_section_modulus_hss(
+    moment_of_inertia: Quantity,
+    area: Quantity,
+    depth: Quantity,
+    thickness: Quantity,
+    flange_width: Quantity,
+    effective_flange_width: Quantity,
+) -> Quantity:
+    """
+    Se of F7.2(c) aisc 360-16, the ineffective part of the compression flange
+    removed at the flange mid-thickness, about the shifted neutral axis
+    """
+    removed_area = (flange_width - effective_flange_width) * thickness
+    arm = (depth - thickness) / 2
+    shift = removed_area * arm / (area - removed_area)
+    inertia = (
+        moment_of_inertia - removed_area * arm**2 - (area - removed_area) * shift**2
+    )
+    return inertia / (depth / 2 + shift)
+
+
+@instrumented_formula
+def noncompact_web_local_buckling_strength_hss(
+    plastic_moment: Quantity,
+    yield_stress: Quantity,
+    section_modulus: Quantity,
+    web_ratio: float,
+    modulus: Quantity,
+) -> Quantity:
+    """eq F7-5 aisc 360-16"""
+    factor = 0.305 * web_ratio * (yield_stress / modulus) ** 0.5 - 0.738
+    return minimum(
+        plastic_moment - (plastic_moment - yield_stress * section_modulus) * factor,
+        plastic_moment,
+    )
+
+
+@instrumented_formula
+def slender_web_flange_critical_stress_hss(
+    modulus: Quantity, yield_stress: Quantity, flange_ratio: float
+) -> Quantity:
+    """eq F7-8 aisc 360-16, limited to Fy (eq F7-6)"""
+    return minimum(9 * modulus / flange_ratio**2, yield_stress)
+
+
+@instrumented_formula
+def limiting_length_yield_hss(
+    modulus: Quantity,
+    radius_of_gyration: Quantity,
+    torsional_constant: Quantity,
+    area: Quantity,
+    plastic_moment: Quantity,
+) -> Quantity:
+    """eq F7-12 aisc 360-16"""
+    return (
+        0.13
+        * modulus
+        * radius_of_gyration
+        * (torsional_constant * area) ** 0.5
+        / plastic_moment
+    )
+
+
+@instrumented_formula
+def limiting_length_lateral_torsional_buckling_hss(
+    modulus: Quantity,
+    radius_of_gyration: Quantity,
+    torsional_constant: Quantity,
+    area: Quantity,
+    yield_stress: Quantity,
+    section_modulus: Quantity,
+) -> Quantity:
+    """eq F7-13 aisc 360-16"""
+    return (
+        2
+        * modulus
+        * radius_of_gyration
+        * (torsional_constant * area) ** 0.5
+        / (0.7 * yield_stress * section_modulus)
+    )
+
+
+@instrumented_formula
+def elastic_lateral_torsional_buckling_strength_hss(
+    modulus: Quantity,
+    modification_factor: float,
+    torsional_constant: Quantity,
+    area: Quantity,
+    length: Quantity,
+    radius_of_gyration: Quantity,
+    plastic_moment: Quantity,
+) -> Quantity:
+    """eq F7-11 aisc 360-16, Fcr Sx of eq F7-12"""
+    return minimum(
+        2
+        * modulus
+        * modification_factor
+        * (torsional_constant * area) ** 0.5
+        / (length / radius_of_gyration),
+        plastic_moment,
+    )
+
+
+@instrumented_formula
+def noncompact_local_buckling_strength_round_hss(
+    modulus: Quantity,
+    yield_stress: Quantity,
+    diameter_ratio: float,
+    section_modulus: Quantity,
+) -> Quantity:
+    """eq F8-2 aisc 360-16"""
+    return (0.021 * modulus / diameter_ratio + yield_stress) * section_modulus
+
+
+@instrumented_formula
+def slender_local_buckling_strength_round_hss(
+    modulus: Quantity, diameter_ratio: float, section_modulus: Quantity
+) -> Quantity:
+    """eq F8-3 and F8-4 aisc 360-16"""
+    return 0.33 * modulus / diameter_ratio * section_modulus
+
+
+@dataclass
+class RectangularFlangeLocalBucklingCalculation2016(Strength):
+    """AISC 360 2016 F7.2, limits of Table B4.1b case 17"""
+
+    yield_stress: Quantity
+    modulus: Quantity
+    plastic_section_modulus: Quantity
+    elastic_section_modulus: Quantity
+    moment_of_inertia: Quantity
+    area: Quantity
+    depth: Quantity
+    thickness: Quantity
+    flange_width: Quantity
+    flange_ratio: float
+    compact_limit: float
+    slender_limit: float
+    design_type: DesignType = DesignType.ASD
+
+    @property
+    def plastic_moment(self) -> Quantity:
+        return yielding_moment(
+            plastic_section_modulus=self.plastic_section_modulus,
+            yield_stress=self.yield_stress,
+        )
+
+    @property
+    def effective_section_modulus(self) -> Quantity:
+        return effective_section_modulus_hss(
+            moment_of_inertia=self.moment_of_inertia,
+            area=self.area,
+            depth=self.depth,
+            thickness=self.thickness,
+            flange_width=self.flange_width,
+            effective_flange_width=effective_flange_width_hss(
+                flange_width=self.flange_width,
+                thickness=self.thickness,
+                flange_ratio=self.flange_ratio,
+                modulus=self.modulus,
+                yield_stress=self.yield_stress,
+            ),
+        )
+
+    @property
+    def nominal_strength(self):
+        # F7.2(a) compact flanges, limit state does not apply
+        return where(
+            self.flange_ratio < self.compact_limit,
+            self.plastic_moment,
+            where(
+                self.flange_ratio < self.slender_limit,
+                noncompact_flange_local_buckling_strength_hss(
+                    plastic_moment=self.plastic_moment,
+                    yield_stress=self.yield_stress,
+                    section_modulus=self.elastic_section_modulus,
+                    flange_ratio=self.flange_ratio,
+                    modulus=self.modulus,
+                ),
+                # eq F7-3 aisc 360-16
+                self.yield_stress * self.effective_section_modulus,
+            ),
+        )
+
+
+@dataclass
+class RectangularWebLocalBucklingCalculation2016(Strength):
+    """AISC 360 2016 F7.3, limits of Table B4.1b case 19"""
+
+    yield_stress: Quantity
+    modulus: Quantity
+    plastic_section_modulus: Quantity
+    elastic_section_modulus: Quantity
+    flange_ratio: float
+    web_ratio: float
+    compact_limit: float
+    slender_limit: float
+    design_type: DesignType = DesignType.ASD
+
+    @property
+    def plastic_moment(self) -> Quantity:
+        return yielding_moment(
+            plastic_section_modulus=self.plastic_section_modulus,
+            yield_stress=self.yield_stress,
+        )
+
+    @property
+    def bending_strength_reduction_factor(self) -> float:
+        """Rpg of eq F5-6 with aw = 2ht/(bt)"""
+        return bending_strength_reduction_factor(
+            web_flange_area_ratio=2 * self.web_ratio / self.flange_ratio,
+            web_ratio=self.web_ratio,
+            modulus=self.modulus,
+            yield_stress=self.yield_stress,
+        )
+
+    @property
+    def nominal_strength(self):
+        # F7.3(a) compact webs, limit state does not apply
+        return where(
+            self.web_ratio < self.compact_limit,
+            self.plastic_moment,
+            where(
+                self.web_ratio < self.slender_limit,
+                noncompact_web_local_buckling_strength_hss(
+                    plastic_moment=self.plastic_moment,
+                    yield_stress=self.yield_stress,
+                    section_modulus=self.elastic_section_modulus,
+                    web_ratio=self.web_ratio,
+                    modulus=self.modulus,
+                ),
+                # eq F7-6 and F7-7 aisc 360-16
+                self.bending_strength_reduction_factor
+                * slender_web_flange_critical_stress_hss(
+                    modulus=self.modulus,
+                    yield_stress=self.yield_stress,
+                    flange_ratio=self.flange_ratio,
+                )
+                * self.elastic_section_modulus,
+            ),
+        )
+
+
+@dataclass
+class RectangularLateralTorsionalBucklingCalculation2016(Strength):
+    """AISC 360 2016 F7.4, major axis bending"""
+
+    length: Quantity
+    yield_stress: Quantity
+    modulus: Quantity
+    plastic_section_modulus: Quantity
+    elastic_section_modulus: Quantity
+    radius_of_gyration: Quantity
+    torsional_constant: Quantity
+    area: Quantity
+    modification_factor: float = 1.0
+    design_type: DesignType = DesignType.ASD
+
+    @property
+    def plastic_moment(self) -> Quantity:
+        return yielding_moment(
+            plastic_section_modulus=self.plastic_section_modulus,
+            yield_stress=self.yield_stress,
+        )
+
+    @property
+    def limiting_yield_length(self) -> Quantity:
+        return limiting_length_yield_hss(
+            modulus=self.modulus,
+            radius_of_gyration=self.radius_of_gyration,
+            torsional_constant=self.torsional_constant,
+            area=self.area,
+            plastic_moment=self.plastic_moment,
+        )
+
+    @property
+    def limiting_length_lateral_torsional_buckling(self) -> Quantity:
+        return limiting_length_lateral_torsional_buckling_hss(
+            modulus=self.modulus,
+            radius_of_gyration=self.radius_of_gyration,
+            torsional_constant=self.torsional_constant,
+            area=self.area,
+            yield_stress=self.yield_stress,
+            section_modulus=self.elastic_section_modulus,
+        )
+
+    @property
+    def nominal_strength(self):
+        # F7.4(a) Lb <= Lp, limit state does not apply
+        return where(
+            self.length <= self.limiting_yield_length,
+            self.plastic_moment,
+            where(
+                self.length <= self.limiting_length_lateral_torsional_buckling,
+                # eq F7-10 aisc 360-16
+                flexural_lateral_torsional_buckling_strength_compact_doubly_symmetric_case_b(
+                    mod_factor=self.modification_factor,
+                    plastic_moment=self.plastic_moment,
+                    yield_stress=self.yield_stress,
+                    section_modulus=self.elastic_section_modulus,
+                    length_between_braces=self.length,
+                    limiting_length_yield=self.limiting_yield_length,
+                    limiting_length_torsional_buckling=self.limiting_length_lateral_torsional_buckling,
+                ),
+                elastic_lateral_torsional_buckling_strength_hss(
+                    modulus=self.modulus,
+                    modification_factor=self.modification_factor,
+                    torsional_constant=self.torsional_constant,
+                    area=self.area,
+                    length=self.length,
+                    radius_of_gyration=self.radius_of_gyration,
+                    plastic_moment=self.plastic_moment,
+                ),
+            ),
+        )
+
+
+@dataclass
+class RoundLocalBucklingCalculation2016(Strength):
+    """AISC 360 2016 F8.2, limits of Table B4.1b case 20"""
+
+    yield_stress: Quantity
+    modulus: Quantity
+    plastic_section_modulus: Quantity
+    elastic_section_modulus: Quantity
+    diameter_ratio: float
+    compact_limit: float
+    slender_limit: float
+    design_type: DesignType = DesignType.ASD
+
+    @property
+    def nominal_strength(self):
+        # F8.2(a) compact sections, limit state does not apply
+        return where(
+            self.diameter_ratio < self.compact_limit,
+            yielding_moment(
+                plastic_section_modulus=self.plastic_section_modulus,
+                yield_stress=self.yield_stress,
+            ),
+            where(
+                self.diameter_ratio < self.slender_limit,
+                noncompact_local_buckling_strength_round_hss(
+                    modulus=self.modulus,
+                    yield_stress=self.yield_stress,
+                    diameter_ratio=self.diameter_ratio,
+                    section_modulus=self.elastic_section_modulus,
+                ),
+                slender_local_buckling_strength_round_hss(
+                    modulus=self.modulus,
+                    diameter_ratio=self.diameter_ratio,
+                    section_modulus=self.elastic_section_modulus,
+                ),
+            ),
+        )
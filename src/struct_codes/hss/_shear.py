@@ -0,0 +1,99 @@
+from dataclasses import dataclass
+
+from pint import Quantity
+
+from struct_codes.criteria import DesignType, Strength
+from struct_codes.instrumentation import instrumented_formula
+from struct_codes.shear import (
+    nominal_shear_strength,
+    web_shear_buckling_coefficient_tension_field,
+)
+from struct_codes.vectorize import maximum, minimum
+
+
+@instrumented_formula
+def round_hss_shear_critical_stress(
+    modulus: Quantity,
+    yield_stress: Quantity,
+    diameter: Quantity,
+    diameter_ratio: float,
+    shear_length: Quantity = None,
+) -> Quantity:
+    """
+    eq G5-2a and G5-2b aisc 360-16, only G5-2b without the distance from
+    maximum to zero shear force
+    """
+    critical_stress = 0.78 * modulus / diameter_ratio**1.5
+    if shear_length is not None:
+        critical_stress = maximum(
+            1.60
+            * modulus
+            / (
+                (shear_length / diameter).to("").magnitude ** 0.5 * diameter_ratio**1.25
+            ),
+            critical_stress,
+        )
+    return minimum(critical_stress, 0.6 * yield_stress)
+
+
+@dataclass
+class RectangularHSSShearCalculation2016(Strength):
+    """
+    AISC 360 2016 G4, both walls parallel to the shear force with
+    h = flat width and kv = 5
+    """
+
+    yield_stress: Quantity
+    modulus: Quantity
+    web_height: Quantity
+    thickness: Quantity
+    web_ratio: float
+    design_type: DesignType = DesignType.ASD
+
+    plate_shear_buckling_coefficient = 5.0
+
+    @property
+    def web_shear_coefficient(self):
+        return web_shear_buckling_coefficient_tension_field(
+            shear_buckling_coefficient=self.plate_shear_buckling_coefficient,
+            modulus_linear=self.modulus,
+            yield_stress=self.yield_stress,
+            web_ratio=self.web_ratio,
+        )
+
+    @property
+    def nominal_strength(self):
+        """eq G4-1 aisc 360-16"""
+        return nominal_shear_strength(
+            yield_stress=self.yield_stress,
+            web_area=2 * self.web_height * self.thickness,
+            web_shear_coefficient=self.web_shear_coefficient,
+        )
+
+
+@dataclass
+class RoundHSSShearCalculation2016(Strength):
+    """AISC 360 2016 G5"""
+
+    yield_stress: Quantity
+    modulus: Quantity
+    gross_area: Quantity
+    diameter: Quantity
+    diameter_ratio: float
+    shear_length: Quantity = None
+    design_type: DesignType = DesignType.ASD
+
+    @property
+    def critical_stress(self) -> Quantity:
+        return round_hss_shear_critical_stress(
+            modulus=self.modulus,
+            yield_stress=self.yield_stress,
+            diameter=self.diameter,
+            diameter_ratio=self.diameter_ratio,
+            shear_length=self.shear_length,
+        )
+
+    @property
+    def nominal_strength(self):
+        """eq G5-1 aisc 360-16"""
+        return self.critical_stress * self.gross_area / 2
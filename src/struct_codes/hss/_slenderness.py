@@ -0,0 +1,75 @@
+from pint import Quantity
+
+
+def axial_rectangular_wall_limit_ratio(
+    modulus_linear: Quantity, yield_strength: Quantity
+) -> float:
+    """
+    TABLE B4.1a Width-to-Thickness Ratios: Compression Elements
+    Members Subject to Axial Compression - Case 6
+    """
+    return 1.40 * (modulus_linear / yield_strength) ** 0.5
+
+
+def axial_round_limit_ratio(
+    modulus_linear: Quantity, yield_strength: Quantity
+) -> float:
+    """
+    TABLE B4.1a Width-to-Thickness Ratios: Compression Elements
+    Members Subject to Axial Compression - Case 9
+    """
+    return (0.11 * modulus_linear / yield_strength).to("").magnitude
+
+
+def flexural_rectangular_flange_compact_limit(
+    modulus_linear: Quantity, yield_strength: Quantity
+) -> float:
+    """TABLE B4.1b
+    Width-to-Thickness Ratios: Compression Elements
+    Members Subject to Flexure - Case 17"""
+    return 1.12 * (modulus_linear / yield_strength) ** 0.5
+
+
+def flexural_rectangular_flange_slender_limit(
+    modulus_linear: Quantity, yield_strength: Quantity
+) -> float:
+    """TABLE B4.1b
+    Width-to-Thickness Ratios: Compression Elements
+    Members Subject to Flexure - Case 17"""
+    return 1.40 * (modulus_linear / yield_strength) ** 0.5
+
+
+def flexural_rectangular_web_compact_limit(
+    modulus_linear: Quantity, yield_strength: Quantity
+) -> float:
+    """TABLE B4.1b
+    Width-to-Thickness Ratios: Compression Elements
+    Members Subject to Flexure - Case 19"""
+    return 2.42 * (modulus_linear / yield_strength) ** 0.5
+
+
+def flexural_rectangular_web_slender_limit(
+    modulus_linear: Quantity, yield_strength: Quantity
+) -> float:
+    """TABLE B4.1b
+    Width-to-Thickness Ratios: Compression Elements
+    Members Subject to Flexure - Case 19"""
+    return 5.70 * (modulus_linear / yield_strength) ** 0.5
+
+
+def flexural_round_compact_limit(
+    modulus_linear: Quantity, yield_strength: Quantity
+) -> float:
+    """TABLE B4.1b
+    Width-to-Thickness Ratios: Compression Elements
+    Members Subject to Flexure - Case 20"""
+    return (0.07 * modulus_linear / yield_strength).to("").magnitude
+
+
+def flexural_round_slender_limit(
+    modulus_linear: Quantity, yield_strength: Quantity
+) -> float:
+    """TABLE B4.1b
+    Width-to-Thickness Ratios: Compression Elements
+    Members Subject to Flexure - Case 20"""
+    return (0.31 * modulus_linear / yield_strength).to("").magnitude
@@ -0,0 +1,112 @@
+import math
+from dataclasses import dataclass
+
+from pint import Quantity
+
+from struct_codes.criteria import DesignType, Strength
+from struct_codes.instrumentation import instrumented_formula
+from struct_codes.vectorize import maximum, minimum, where
+
+
+@instrumented_formula
+def round_hss_torsional_constant(
+    torsional_moment_of_inertia: Quantity, diameter: Quantity
+) -> Quantity:
+    """C = 2J/D as tabulated for round HSS, the database has no C for pipes"""
+    return 2 * torsional_moment_of_inertia / diameter
+
+
+@instrumented_formula
+def round_hss_torsion_critical_stress(
+    modulus: Quantity,
+    yield_stress: Quantity,
+    diameter: Quantity,
+    diameter_ratio: float,
+    length: Quantity = None,
+) -> Quantity:
+    """
+    eq H3-2a and H3-2b aisc 360-16, only H3-2b without the member length
+    """
+    critical_stress = 0.60 * modulus / diameter_ratio**1.5
+    if length is not None:
+        critical_stress = maximum(
+            1.23
+            * modulus
+            / ((length / diameter).to("").magnitude ** 0.5 * diameter_ratio**1.25),
+            critical_stress,
+        )
+    return minimum(critical_stress, 0.6 * yield_stress)
+
+
+@instrumented_formula
+def rectangular_hss_torsion_critical_stress(
+    modulus: Quantity, yield_stress: Quantity, wall_ratio: float
+) -> Quantity:
+    """eq H3-3 to H3-5 aisc 360-16, h/t of the longer wall"""
+    root = (modulus / yield_stress).to("").magnitude ** 0.5
+    return where(
+        wall_ratio <= 2.45 * root,
+        0.6 * yield_stress,
+        where(
+            wall_ratio <= 3.07 * root,
+            0.6 * yield_stress * 2.45 * root / wall_ratio,
+            0.458 * math.pi**2 * modulus / wall_ratio**2,
+        ),
+    )
+
+
+@dataclass
+class RectangularHSSTorsionCalculation2016(Strength):
+    """AISC 360 2016 H3.1"""
+
+    yield_stress: Quantity
+    modulus: Quantity
+    torsional_constant: Quantity
+    wall_ratio: float
+    design_type: DesignType = DesignType.ASD
+
+    @property
+    def nominal_strength(self):
+        """eq H3-1 aisc 360-16"""
+        return (
+            rectangular_hss_torsion_critical_stress(
+                modulus=self.modulus,
+                yield_stress=self.yield_stress,
+                wall_ratio=self.wall_ratio,
+            )
+            * self.torsional_constant
+        )
+
+
+@dataclass
+class RoundHSSTorsionCalculation2016(Strength):
+    """AISC 360 2016 H3.1"""
+
+    yield_stress: Quantity
+    modulus: Quantity
+    diameter: Quantity
+    torsional_moment_of_inertia: Quantity
+    diameter_ratio: float
+    length: Quantity = None
+    design_type: DesignType = DesignType.ASD
+
+    @property
+    def torsional_constant(self) -> Quantity:
+        return round_hss_torsional_constant(
+            torsional_moment_of_inertia=self.torsional_moment_of_inertia,
+            diameter=self.diameter,
+        )
+
+    @property
+    def nominal_strength(self):
+        """eq H3-1 aisc 360-16"""
+        return (
+            round_hss_torsion_critical_stress(
+                modulus=self.modulus,
+                yield_stress=self.yield_stress,
+                diameter=self.diameter,
+                diameter_ratio=self.diameter_ratio,
+                length=self.length,
+            )
+            * self.torsional_constant
+        )
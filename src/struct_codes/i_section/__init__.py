@@ -1,36 +1,69 @@
 from dataclasses import dataclass
+from functools import cached_property
 
+import numpy as np
+
+from struct_codes.beam import Beam
+from struct_codes.compression import value_or_default
 from struct_codes.criteria import DesignType, StrengthType
+from struct_codes.i_section._built_up import (
+    BuiltUpIGeometry,
+    built_up_i_geometry_grid,
+)
 from struct_codes.i_section._compression import (
-    BucklingStrengthCalculationMixin,
+    CompressionElement,
     FlexuralBucklingStrengthCalculation,
     TorsionalBucklingDoublySymmetricStrengthCalculation,
+    doubly_symmetric_i_compression_elements,
+)
+from struct_codes.flexure import (
+    lateral_torsional_buckling_modification_factor as moment_gradient_factor,
+    look_up_limit_states,
 )
 from struct_codes.i_section._flexure import (
+    CompressionFlangeLocalBucklingCalculation2016,
     LateralTorsionalBucklingCalculation2016,
+    LateralTorsionalBucklingSectionParam2016,
+    MinorAxisFlangeLocalBucklingCalculation2016,
     MinorAxisYieldingCalculation2016,
+    NonCompactWebCompressionFlangeLocalBucklingCalculation2016,
+    NonCompactWebCompressionFlangeYieldingCalculation2016,
+    NonCompactWebLateralTorsionalBucklingCalculation2016,
+    SlenderWebCompressionFlangeLocalBucklingCalculation2016,
+    SlenderWebCompressionFlangeYieldingCalculation2016,
+    SlenderWebLateralTorsionalBucklingCalculation2016,
+    WebSlendernessSectionParam2016,
     YieldingMomentCalculation16,
 )
-from struct_codes.i_section._shear import WebShearCalculation2016
+from struct_codes.i_section._shear import (
+    ShearMinorAxis,
+    WebShearCalculation2016,
+    tension_field_action_flange_limits,
+    tension_field_action_permitted,
+)
 from struct_codes.i_section._slenderness import (
     DoublySymmetricSlenderness,
     DoublySymmetricSlendernessCalcMemory,
     DoublySymmetricSlendernessCalculation2016,
-    _is_slender,
 )
 from struct_codes.i_section._tension import (
     TesionUltimateCalculation,
     TesionYieldCalculation,
 )
+from struct_codes.interaction import CombinedForcesCalculation2016
 from struct_codes.materials import Material
 from struct_codes.sections import (
     Connection,
     ConstructionType,
     LoadStrengthCalculation,
     RuleEd,
+    SectionClassification,
+    SegmentedLoadStrengthCalculation,
     SectionGeometry,
     SectionType,
+    classified_criteria,
 )
+from struct_codes.slenderness import Slenderness
 from struct_codes.units import Quantity
 
 
@@ -101,7 +134,10 @@ class DoublySymmetricI:
         design_type: DesignType = DesignType.ASD,
         rule_editon: RuleEd = RuleEd.ED15,
     ):
-        compression = LoadStrengthCalculation(
+        length_minor_axis = value_or_default(length_minor_axis, length_major_axis)
+        length_torsion = value_or_default(length_torsion, length_major_axis)
+        elements = self._compression_elements_2016
+        return LoadStrengthCalculation(
             criteria={
                 StrengthType.FLEXURAL_BUCKLING_MAJOR_AXIS: FlexuralBucklingStrengthCalculation(
                     length=length_major_axis,
@@ -111,48 +147,47 @@ class DoublySymmetricI:
                     gross_area=self.geometry.A,
                     radius_of_gyration=self.geometry.rx,
                     design_type=design_type,
+                    elements=elements,
                 ),
                 StrengthType.FLEXURAL_BUCKLING_MINOR_AXIS: FlexuralBucklingStrengthCalculation(
-                    length=length_minor_axis or length_major_axis,
-                    factor_k=factor_k_minor_axis or factor_k_major_axis,
+                    length=length_minor_axis,
+                    factor_k=value_or_default(factor_k_minor_axis, factor_k_major_axis),
                     yield_stress=self.material.yield_strength,
                     modulus_linear=self.material.modulus_linear,
                     gross_area=self.geometry.A,
                     radius_of_gyration=self.geometry.ry,
                     design_type=design_type,
+                    elements=elements,
                 ),
                 StrengthType.TORSIONAL_BUCKLING: TorsionalBucklingDoublySymmetricStrengthCalculation(
                     design_type=design_type,
                     yield_stress=self.material.yield_strength,
                     gross_area=self.geometry.A,
-                    length=length_torsion or length_major_axis,
-                    factor_k=factor_k_torsion or factor_k_major_axis,
+                    length=length_torsion,
+                    factor_k=value_or_default(factor_k_torsion, factor_k_major_axis),
                     modulus_linear=self.material.modulus_linear,
                     modulus_shear=self.material.modulus_shear,
                     major_axis_inertia=self.geometry.Ix,
                     minor_axis_inertia=self.geometry.Iy,
                     torsional_constant=self.geometry.J,
                     warping_constant=self.geometry.Cw,
+                    elements=elements,
                 ),
             }
         )
-        # TODO implement cases for section with slender elements
-        design_calculation: BucklingStrengthCalculationMixin = (
-            compression.design_strength_calculation
-        )
-        _is_slender(
-            lamdba_ratio=self._slenderness_2016.flange_ratio,
-            lambda_limit=self._slenderness_2016._flange_axial_limit,
-            yield_stess=self.material.yield_strength,
-            critical_stress=design_calculation.critical_stress,
-        )
-        _is_slender(
-            lamdba_ratio=self._slenderness_2016.web_ratio,
-            lambda_limit=self._slenderness_2016._web_axial_slender_limit,
-            yield_stess=self.material.yield_strength,
-            critical_stress=design_calculation.critical_stress,
+
+    @property
+    def _compression_elements_2016(self) -> tuple[CompressionElement, ...]:
+        slenderness = self._slenderness_2016
+        return doubly_symmetric_i_compression_elements(
+            flange_width=self.geometry.bf,
+            flange_thickness=self.geometry.tf,
+            flange_ratio=slenderness.flange_ratio,
+            flange_limit_ratio=slenderness._flange_axial_limit,
+            web_thickness=self.geometry.tw,
+            web_ratio=slenderness.web_ratio,
+            web_limit_ratio=slenderness._web_axial_slender_limit,
         )
-        return compression
 
     @property
     def slenderness_2016(self) -> DoublySymmetricSlenderness:
@@ -172,6 +207,23 @@ class DoublySymmetricI:
             yield_strength=self.material.yield_strength,
         )
 
+    @property
+    def _lateral_torsional_buckling_param_2016(
+        self,
+    ) -> LateralTorsionalBucklingSectionParam2016:
+        return LateralTorsionalBucklingSectionParam2016(
+            plastic_section_modulus=self.geometry.Zx,
+            yield_stress=self.material.yield_strength,
+            modulus=self.material.modulus_linear,
+            radius_of_gyration=self.geometry.ry,
+            elastic_section_modulus=self.geometry.Sx,
+            minor_axis_inertia=self.geometry.Iy,
+            warping_constant=self.geometry.Cw,
+            torsional_constant=self.geometry.J,
+            distance_between_flange_centroids=self.geometry.ho,
+            coefficient_c=1,
+        )
+
     @property
     def _net_area(self) -> Quantity:
         reduction = 0
@@ -182,22 +234,35 @@ class DoublySymmetricI:
     def _tension_2016(
         self, shear_lag_factor: float = None, design_type: DesignType = DesignType.ASD
     ):
-        shear_lag_factor = shear_lag_factor or 1.0
-        return LoadStrengthCalculation(
-            criteria={
-                StrengthType.YIELD: TesionYieldCalculation(
-                    gross_area=self.geometry.A,
-                    yield_stress=self.material.yield_strength,
-                    design_type=design_type,
-                ),
-                StrengthType.ULTIMATE: TesionUltimateCalculation(
-                    net_area=self._net_area,
-                    ultimate_stress=self.material.ultimate_strength,
-                    shear_lag_factor=shear_lag_factor,
-                    design_type=design_type,
-                ),
-            }
+        if shear_lag_factor is None:
+            shear_lag_factor = (
+                self.connection.shear_lag_factor if self.connection else 1.0
+            )
+        criteria = {
+            StrengthType.YIELD: TesionYieldCalculation(
+                gross_area=self.geometry.A,
+                yield_stress=self.material.yield_strength,
+                design_type=design_type,
+            ),
+            StrengthType.ULTIMATE: TesionUltimateCalculation(
+                net_area=self._net_area,
+                ultimate_stress=self.material.ultimate_strength,
+                shear_lag_factor=shear_lag_factor,
+                design_type=design_type,
+            ),
+        }
+        block_shear = (
+            self.connection.block_shear(
+                yield_stress=self.material.yield_strength,
+                ultimate_stress=self.material.ultimate_strength,
+                design_type=design_type,
+            )
+            if self.connection
+            else None
         )
+        if block_shear is not None:
+            criteria[StrengthType.BLOCK_SHEAR] = block_shear
+        return LoadStrengthCalculation(criteria=criteria)
 
     def tension(
         self,
@@ -213,29 +278,94 @@ class DoublySymmetricI:
         design_type: DesignType = DesignType.ASD,
         rule_editon: RuleEd = RuleEd.ED15,
     ) -> LoadStrengthCalculation:
+        slenderness = self._slenderness_2016
+        calculations = _MajorAxisFlexureCalculations2016(
+            section=self,
+            length=length,
+            modification_factor=lateral_torsional_buckling_modification_factor,
+            design_type=design_type,
+        )
         return LoadStrengthCalculation(
-            criteria={
-                StrengthType.YIELD: YieldingMomentCalculation16(
-                    plastic_section_modulus=self.geometry.Zx,
-                    yield_stress=self.material.yield_strength,
-                    design_type=design_type,
-                ),
-                StrengthType.LATERAL_TORSIONAL_BUCKLING: LateralTorsionalBucklingCalculation2016(
-                    length=length,
-                    modulus=self.material.modulus_linear,
-                    yield_stress=self.material.yield_strength,
-                    plastic_section_modulus=self.geometry.Zx,
-                    elastic_section_modulus=self.geometry.Sx,
-                    distance_between_flange_centroids=self.geometry.ho,
-                    torsional_constant=self.geometry.J,
-                    warping_constant=self.geometry.Cw,
-                    radius_of_gyration=self.geometry.ry,
-                    minor_axis_inertia=self.geometry.Iy,
-                    modification_factor=lateral_torsional_buckling_modification_factor,
-                    coefficient_c=1,
-                    design_type=design_type,
+            criteria=classified_criteria(
+                classification=(
+                    SectionClassification.DOUBLY_SYMMETRIC_I,
+                    slenderness._flange_flexural_major_axis_slenderness,
+                    slenderness._web_flexural_slenderness,
                 ),
-            }
+                limit_states=look_up_limit_states,
+                calculation=calculations.calculation,
+                design_type=design_type,
+            )
+        )
+
+    def flexure_major_axis_segments(
+        self,
+        beam: Beam,
+        moments: Quantity = None,
+        moment_positions: Quantity = None,
+        lateral_torsional_buckling_modification_factor: float = 1.0,
+        design_type: DesignType = DesignType.ASD,
+        rule_editon: RuleEd = RuleEd.ED15,
+    ) -> SegmentedLoadStrengthCalculation:
+        """
+        Major axis flexure of every unbraced segment of the beam in one call,
+        the section invariants (Lp, Lr, rts, Mp) are shared by the segments.
+        With a moment diagram along the member Cb is computed per segment
+        (eq F1-1), otherwise the given modification factor applies to all.
+        """
+        lengths = beam.unbraced_lengths
+        factors = lateral_torsional_buckling_modification_factor
+        if moments is not None:
+            if moment_positions is None:
+                moment_positions = (
+                    np.linspace(0.0, 1.0, np.shape(moments)[-1])
+                    * beam.length_major_axis
+                )
+            factors = moment_gradient_factor(
+                moments=moments,
+                positions=moment_positions.to(beam.length_major_axis.units),
+                brace_positions=beam.brace_points,
+            )
+        return SegmentedLoadStrengthCalculation(
+            segment_lengths=lengths,
+            modification_factors=factors,
+            calculation=self.flexure_major_axis(
+                length=lengths,
+                lateral_torsional_buckling_modification_factor=factors,
+                design_type=design_type,
+                rule_editon=rule_editon,
+            ),
+        )
+
+    def combined_forces(
+        self,
+        beam: Beam,
+        lateral_torsional_buckling_modification_factor: float = 1.0,
+        design_type: DesignType = DesignType.ASD,
+        rule_editon: RuleEd = RuleEd.ED15,
+    ) -> CombinedForcesCalculation2016:
+        """H1 interaction with the member capacities computed once"""
+        return CombinedForcesCalculation2016.from_calculations(
+            compression=self.compression(
+                length_major_axis=beam.length_major_axis,
+                factor_k_major_axis=beam.factor_k_major_axis,
+                length_minor_axis=beam.length_minor_axis,
+                factor_k_minor_axis=beam.factor_k_minor_axis,
+                length_torsion=beam.length_torsion,
+                factor_k_torsion=beam.factor_k_torsion,
+                design_type=design_type,
+                rule_editon=rule_editon,
+            ),
+            tension=self.tension(design_type=design_type, rule_editon=rule_editon),
+            flexure_major_axis=self.flexure_major_axis_segments(
+                beam,
+                lateral_torsional_buckling_modification_factor=lateral_torsional_buckling_modification_factor,
+                design_type=design_type,
+                rule_editon=rule_editon,
+            ),
+            flexure_minor_axis=self.flexure_minor_axis(
+                design_type=design_type, rule_editon=rule_editon
+            ),
         )
 
     def flexure_minor_axis(
@@ -243,6 +373,7 @@ class DoublySymmetricI:
         design_type: DesignType = DesignType.ASD,
         rule_editon: RuleEd = RuleEd.ED15,
     ):
+        slenderness = self._slenderness_2016
         return LoadStrengthCalculation(
             {
                 StrengthType.YIELD: MinorAxisYieldingCalculation2016(
@@ -251,6 +382,16 @@ class DoublySymmetricI:
                     elastic_section_modulus=self.geometry.Sy,
                     design_type=design_type,
                 ),
+                StrengthType.FLANGE_LOCAL_BUCKLING: MinorAxisFlangeLocalBucklingCalculation2016(
+                    yield_stress=self.material.yield_strength,
+                    modulus=self.material.modulus_linear,
+                    plastic_section_modulus=self.geometry.Zy,
+                    elastic_section_modulus=self.geometry.Sy,
+                    flange_ratio=self.geometry.bf_2tf,
+                    compact_limit=slenderness._flange_flexural_rolled_compact_limit,
+                    slender_limit=slenderness._flange_flexural_rolled_slender_limit,
+                    design_type=design_type,
+                ),
             }
         )
 
@@ -258,15 +399,45 @@ class DoublySymmetricI:
         self,
         design_type: DesignType = DesignType.ASD,
         rule_editon: RuleEd = RuleEd.ED15,
+        stiffener_spacing: Quantity = None,
+        tension_field_action: bool = False,
     ):
+        """
+        G2 web shear, stiffener_spacing may be an array of spacings. Tension
+        field action, if asked for, is only used where G2.2 permits it
+        (interior panels are assumed), eq G2-8 where the flanges fall outside
+        the limits of eq G2-7.
+        """
+        geometry = self.geometry
+        web_height = geometry.h_tw * geometry.tw
+        flange_area = geometry.bf * geometry.tf
+        if tension_field_action:
+            tension_field_action = tension_field_action_permitted(
+                panel_aspect_ratio=(
+                    np.inf
+                    if stiffener_spacing is None
+                    else (stiffener_spacing / web_height).to("").magnitude
+                ),
+            )
         return LoadStrengthCalculation(
             criteria={
                 StrengthType.WEB_SHEAR: WebShearCalculation2016(
                     yield_stress=self.material.yield_strength,
-                    web_area=self.geometry.d * self.geometry.tw,
+                    web_area=geometry.d * geometry.tw,
                     modulus=self.material.modulus_linear,
-                    web_ratio=self.geometry.h_tw,
+                    web_ratio=geometry.h_tw,
                     construction_type=self.construction,
+                    web_height=web_height,
+                    stiffener_spacing=stiffener_spacing,
+                    tension_field_action=tension_field_action,
+                    flange_limits=tension_field_action_flange_limits(
+                        web_area=geometry.d * geometry.tw,
+                        compression_flange_area=flange_area,
+                        tension_flange_area=flange_area,
+                        web_height=web_height,
+                        compression_flange_width=geometry.bf,
+                        tension_flange_width=geometry.bf,
+                    ),
                     design_type=design_type,
                 )
             }
@@ -279,13 +450,228 @@ class DoublySymmetricI:
     ):
         return LoadStrengthCalculation(
             criteria={
-                StrengthType.WEB_SHEAR: WebShearCalculation2016(
+                StrengthType.FLANGE_SHEAR: ShearMinorAxis(
                     yield_stress=self.material.yield_strength,
-                    web_area=self.geometry.d * self.geometry.tw,
                     modulus=self.material.modulus_linear,
-                    web_ratio=self.geometry.h_tw,
-                    construction_type=self.construction,
+                    flange_width=self.geometry.bf,
+                    flange_thickness=self.geometry.tf,
                     design_type=design_type,
                 )
             }
         )
+
+
+@dataclass
+class _MajorAxisFlexureCalculations2016:
+    """
+    Chapter F calculations of a doubly symmetric I section, picked per limit
+    state and web slenderness (F2/F3 compact, F4 noncompact, F5 slender web).
+    Each calculation is built once and shared by the flange classifications.
+    """
+
+    section: DoublySymmetricI
+    length: Quantity
+    modification_factor: float
+    design_type: DesignType
+
+    def calculation(self, limit_state: StrengthType, classification: tuple):
+        _, _, web = classification
+        table = {
+            (StrengthType.YIELD, Slenderness.COMPACT): "yielding",
+            (
+                StrengthType.LATERAL_TORSIONAL_BUCKLING,
+                Slenderness.COMPACT,
+            ): "lateral_torsional_buckling",
+            (
+                StrengthType.COMPRESSION_FLANGE_LOCAL_BUCKLING,
+                Slenderness.COMPACT,
+            ): "flange_local_buckling",
+            (
+                StrengthType.COMPRESSION_FLANGE_YIELDING,
+                Slenderness.NON_COMPACT,
+            ): "noncompact_web_flange_yielding",
+            (
+                StrengthType.LATERAL_TORSIONAL_BUCKLING,
+                Slenderness.NON_COMPACT,
+            ): "noncompact_web_lateral_torsional_buckling",
+            (
+                StrengthType.COMPRESSION_FLANGE_LOCAL_BUCKLING,
+                Slenderness.NON_COMPACT,
+            ): "noncompact_web_flange_local_buckling",
+            (
+                StrengthType.COMPRESSION_FLANGE_YIELDING,
+                Slenderness.SLENDER,
+            ): "slender_web_flange_yielding",
+            (
+                StrengthType.LATERAL_TORSIONAL_BUCKLING,
+                Slenderness.SLENDER,
+            ): "slender_web_lateral_torsional_buckling",
+            (
+                StrengthType.COMPRESSION_FLANGE_LOCAL_BUCKLING,
+                Slenderness.SLENDER,
+            ): "slender_web_flange_local_buckling",
+        }
+        return getattr(self, table[limit_state, web])
+
+    @cached_property
+    def _slenderness(self) -> DoublySymmetricSlendernessCalculation2016:
+        return self.section._slenderness_2016
+
+    @cached_property
+    def _web_param(self) -> WebSlendernessSectionParam2016:
+        geometry = self.section.geometry
+        return WebSlendernessSectionParam2016(
+            plastic_section_modulus=geometry.Zx,
+            elastic_section_modulus=geometry.Sx,
+            yield_stress=self.section.material.yield_strength,
+            modulus=self.section.material.modulus_linear,
+            flange_width=geometry.bf,
+            flange_thickness=geometry.tf,
+            web_thickness=geometry.tw,
+            web_ratio=geometry.h_tw,
+            web_compact_limit=self._slenderness._web_flexural_compact_limit,
+            web_slender_limit=self._slenderness._web_flexural_slender_limit,
+            torsional_constant=geometry.J,
+            distance_between_flange_centroids=geometry.ho,
+        )
+
+    @cached_property
+    def yielding(self) -> YieldingMomentCalculation16:
+        return YieldingMomentCalculation16(
+            plastic_section_modulus=self.section.geometry.Zx,
+            yield_stress=self.section.material.yield_strength,
+            design_type=self.design_type,
+        )
+
+    @cached_property
+    def lateral_torsional_buckling(self) -> LateralTorsionalBucklingCalculation2016:
+        geometry = self.section.geometry
+        material = self.section.material
+        section_param = self.section._lateral_torsional_buckling_param_2016
+        return LateralTorsionalBucklingCalculation2016(
+            length=self.length,
+            modulus=material.modulus_linear,
+            yield_stress=material.yield_strength,
+            plastic_section_modulus=geometry.Zx,
+            elastic_section_modulus=geometry.Sx,
+            distance_between_flange_centroids=geometry.ho,
+            torsional_constant=geometry.J,
+            warping_constant=geometry.Cw,
+            radius_of_gyration=geometry.ry,
+            minor_axis_inertia=geometry.Iy,
+            limiting_length_lateral_torsional_buckling=section_param.limiting_length_lateral_torsional_buckling,
+            limiting_yield_length=section_param.limiting_yield_length,
+            plastic_moment=section_param.plastic_moment,
+            effective_radius_of_gyration=section_param.effective_radius_of_gyration,
+            modification_factor=self.modification_factor,
+            coefficient_c=section_param.coefficient_c,
+            design_type=self.design_type,
+        )
+
+    @cached_property
+    def flange_local_buckling(self) -> CompressionFlangeLocalBucklingCalculation2016:
+        return CompressionFlangeLocalBucklingCalculation2016(
+            plastic_moment=self.section.geometry.Zx
+            * self.section.material.yield_strength,
+            yield_stress=self.section.material.yield_strength,
+            modulus=self.section.material.modulus_linear,
+            elastic_section_modulus=self.section.geometry.Sx,
+            kc_coefficient=self._slenderness.kc_coeficient,
+            flange_ratio=self.section.geometry.bf_2tf,
+            compact_limit=self._slenderness._flange_flexural_compact_limit,
+            slender_limit=self._slenderness._flange_flexural_slender_limit,
+            design_type=self.design_type,
+        )
+
+    @cached_property
+    def noncompact_web_flange_yielding(
+        self,
+    ) -> NonCompactWebCompressionFlangeYieldingCalculation2016:
+        return NonCompactWebCompressionFlangeYieldingCalculation2016(
+            yield_moment_capacity=self._web_param.yield_moment_capacity,
+            design_type=self.design_type,
+        )
+
+    @cached_property
+    def noncompact_web_lateral_torsional_buckling(
+        self,
+    ) -> NonCompactWebLateralTorsionalBucklingCalculation2016:
+        web_param = self._web_param
+        return NonCompactWebLateralTorsionalBucklingCalculation2016(
+            length=self.length,
+            modulus=web_param.modulus,
+            elastic_section_modulus=web_param.elastic_section_modulus,
+            torsional_constant=web_param.torsional_constant,
+            distance_between_flange_centroids=web_param.distance_between_flange_centroids,
+            effective_radius_of_gyration=web_param.effective_radius_of_gyration,
+            limiting_yield_length=web_param.limiting_yield_length,
+            limiting_length_lateral_torsional_buckling=web_param.limiting_length_lateral_torsional_buckling,
+            yield_moment_capacity=web_param.yield_moment_capacity,
+            flange_stress=web_param.flange_stress,
+            modification_factor=self.modification_factor,
+            design_type=self.design_type,
+        )
+
+    @cached_property
+    def noncompact_web_flange_local_buckling(
+        self,
+    ) -> NonCompactWebCompressionFlangeLocalBucklingCalculation2016:
+        web_param = self._web_param
+        return NonCompactWebCompressionFlangeLocalBucklingCalculation2016(
+            yield_moment_capacity=web_param.yield_moment_capacity,
+            flange_stress=web_param.flange_stress,
+            modulus=web_param.modulus,
+            elastic_section_modulus=web_param.elastic_section_modulus,
+            kc_coefficient=self._slenderness.kc_coeficient,
+            flange_ratio=self.section.geometry.bf_2tf,
+            compact_limit=self._slenderness._flange_flexural_compact_limit,
+            slender_limit=self._slenderness._flange_flexural_slender_limit,
+            design_type=self.design_type,
+        )
+
+    @cached_property
+    def slender_web_flange_yielding(
+        self,
+    ) -> SlenderWebCompressionFlangeYieldingCalculation2016:
+        web_param = self._web_param
+        return SlenderWebCompressionFlangeYieldingCalculation2016(
+            yield_stress=web_param.yield_stress,
+            elastic_section_modulus=web_param.elastic_section_modulus,
+            bending_strength_reduction_factor=web_param.bending_strength_reduction_factor,
+            design_type=self.design_type,
+        )
+
+    @cached_property
+    def slender_web_lateral_torsional_buckling(
+        self,
+    ) -> SlenderWebLateralTorsionalBucklingCalculation2016:
+        web_param = self._web_param
+        return SlenderWebLateralTorsionalBucklingCalculation2016(
+            length=self.length,
+            yield_stress=web_param.yield_stress,
+            modulus=web_param.modulus,
+            elastic_section_modulus=web_param.elastic_section_modulus,
+            effective_radius_of_gyration=web_param.effective_radius_of_gyration,
+            limiting_yield_length=web_param.limiting_yield_length,
+            limiting_length_lateral_torsional_buckling=web_param.limiting_length_lateral_torsional_buckling_slender_web,
+            bending_strength_reduction_factor=web_param.bending_strength_reduction_factor,
+            modification_factor=self.modification_factor,
+            design_type=self.design_type,
+        )
+
+    @cached_property
+    def slender_web_flange_local_buckling(
+        self,
+    ) -> SlenderWebCompressionFlangeLocalBucklingCalculation2016:
+        web_param = self._web_param
+        return SlenderWebCompressionFlangeLocalBucklingCalculation2016(
+            yield_stress=web_param.yield_stress,
+            modulus=web_param.modulus,
+            elastic_section_modulus=web_param.elastic_section_modulus,
+            bending_strength_reduction_factor=web_param.bending_strength_reduction_factor,
+            kc_coefficient=self._slenderness.kc_coeficient,
+            flange_ratio=self.section.geometry.bf_2tf,
+            compact_limit=self._slenderness._flange_flexural_compact_limit,
+            slender_limit=self._slenderness._flange_flexural_slender_limit,
+            design_type=self.design_type,
+        )
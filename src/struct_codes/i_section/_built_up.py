@@ -0,0 +1,159 @@
+from dataclasses import dataclass
+from functools import cached_property
+
+import numpy as np
+
+from struct_codes.i_section._flexure import effective_radius_of_gyration
+from struct_codes.units import Quantity, kilogram, meter
+
+STEEL_DENSITY = 7850 * kilogram / meter**3
+
+
+@dataclass
+class BuiltUpIGeometry:
+    """
+    Doubly symmetric welded I from plate dimensions, fillet welds neglected.
+    Dimensions may be arrays over several girders, broadcasting with each
+    other, so the properties form a columnar geometry table like the database
+    ones. h is the web plate height, clear between the flanges.
+    """
+
+    bf: Quantity
+    tf: Quantity
+    h: Quantity
+    tw: Quantity
+
+    @cached_property
+    def d(self) -> Quantity:
+        return self.h + 2 * self.tf
+
+    @cached_property
+    def ho(self) -> Quantity:
+        """Distance between flange centroids"""
+        return self.h + self.tf
+
+    @cached_property
+    def A(self) -> Quantity:
+        return 2 * self.bf * self.tf + self.h * self.tw
+
+    @cached_property
+    def W(self) -> Quantity:
+        """Mass per unit length"""
+        return (self.A * STEEL_DENSITY).to(kilogram / meter)
+
+    @cached_property
+    def bf_2tf(self) -> float:
+        return (self.bf / (2 * self.tf)).to("").magnitude
+
+    @cached_property
+    def h_tw(self) -> float:
+        return (self.h / self.tw).to("").magnitude
+
+    @cached_property
+    def Ix(self) -> Quantity:
+        return self.tw * self.h**3 / 12 + 2 * (
+            self.bf * self.tf**3 / 12 + self.bf * self.tf * (self.ho / 2) ** 2
+        )
+
+    @cached_property
+    def Iy(self) -> Quantity:
+        return self.tf * self.bf**3 / 6 + self.h * self.tw**3 / 12
+
+    @cached_property
+    def Sx(self) -> Quantity:
+        return 2 * self.Ix / self.d
+
+    @cached_property
+    def Sy(self) -> Quantity:
+        return 2 * self.Iy / self.bf
+
+    @cached_property
+    def Zx(self) -> Quantity:
+        return self.bf * self.tf * self.ho + self.tw * self.h**2 / 4
+
+    @cached_property
+    def Zy(self) -> Quantity:
+        return self.tf * self.bf**2 / 2 + self.h * self.tw**2 / 4
+
+    @cached_property
+    def rx(self) -> Quantity:
+        return (self.Ix / self.A) ** 0.5
+
+    @cached_property
+    def ry(self) -> Quantity:
+        return (self.Iy / self.A) ** 0.5
+
+    @cached_property
+    def J(self) -> Quantity:
+        """Sum of bt³/3 of the plates"""
+        return (2 * self.bf * self.tf**3 + self.h * self.tw**3) / 3
+
+    @cached_property
+    def Cw(self) -> Quantity:
+        """Iy ho²/4 of the user note of F2 aisc 360-16, flanges only"""
+        return self.tf * self.bf**3 * self.ho**2 / 24
+
+    @cached_property
+    def rts(self) -> Quantity:
+        return effective_radius_of_gyration(
+            major_section_modulus=self.Sx,
+            minor_inertia=self.Iy,
+            warping_constant=self.Cw,
+        )
+
+    @cached_property
+    def Wno(self) -> Quantity:
+        return self.bf * self.ho / 4
+
+    @cached_property
+    def Sw1(self) -> Quantity:
+        return self.tf * self.bf**2 * self.ho / 16
+
+    @cached_property
+    def Qf(self) -> Quantity:
+        """Statical moment of the flange outstand over the web face"""
+        return self.tf * (self.bf - self.tw) / 2 * self.ho / 2
+
+    @cached_property
+    def Qw(self) -> Quantity:
+        """Statical moment of half the section about the major axis"""
+        return self.Zx / 2
+
+    @cached_property
+    def PA(self) -> Quantity:
+        """Shape perimeter minus one flange surface"""
+        return self.PB - self.bf
+
+    @cached_property
+    def PB(self) -> Quantity:
+        """Shape perimeter"""
+        return 4 * self.bf + 2 * self.d - 2 * self.tw
+
+    @cached_property
+    def PC(self) -> Quantity:
+        """Box perimeter minus one flange surface"""
+        return self.PD - self.bf
+
+    @cached_property
+    def PD(self) -> Quantity:
+        """Box perimeter"""
+        return 2 * (self.bf + self.d)
+
+
+def built_up_i_geometry_grid(
+    bf: Quantity, tf: Quantity, h: Quantity, tw: Quantity
+) -> BuiltUpIGeometry:
+    """
+    Every combination of the plate dimensions, flattened into one columnar
+    table in C order of (bf, tf, h, tw).
+    """
+    grid = np.meshgrid(
+        *(np.atleast_1d(dimension.magnitude) for dimension in (bf, tf, h, tw)),
+        indexing="ij",
+    )
+    return BuiltUpIGeometry(
+        *(
+            values.ravel() * dimension.units
+            for values, dimension in zip(grid, (bf, tf, h, tw))
+        )
+    )
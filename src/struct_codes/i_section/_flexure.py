@@ -4,9 +4,12 @@ from dataclasses import dataclass
 from pint import Quantity
 
 from struct_codes.criteria import DesignType, Strength
+from struct_codes.instrumentation import instrumented_formula
+from struct_codes.vectorize import minimum, where
 
 
 # ed15 360-2016 - F2-1
+@instrumented_formula
 def yielding_moment(
     plastic_section_modulus: Quantity, yield_stress: Quantity
 ) -> Quantity:
@@ -14,6 +17,7 @@ def yielding_moment(
 
 
 # ed15 360-2016 F2-2
+@instrumented_formula
 def flexural_lateral_torsional_buckling_strength_compact_doubly_symmetric_case_b(
     mod_factor: float,
     plastic_moment: Quantity,
@@ -28,17 +32,19 @@ def flexural_lateral_torsional_buckling_strength_compact_doubly_symmetric_case_b
     )
     mp_factor = plastic_moment - 0.7 * yield_stress * section_modulus
     calculated_moment = mod_factor * (plastic_moment - mp_factor * l_factor)
-    return min(calculated_moment, plastic_moment)
+    return minimum(calculated_moment, plastic_moment)
 
 
+@instrumented_formula
 def flexural_lateral_torsional_buckling_strength_compact_doubly_symmetric_case_c(
     plastic_moment: Quantity,
     section_modulus: Quantity,
     critical_stress: Quantity,
 ) -> Quantity:
-    return min(critical_stress * section_modulus, plastic_moment)
+    return minimum(critical_stress * section_modulus, plastic_moment)
 
 
+@instrumented_formula
 def flexural_lateral_torsional_buckling_critical_stress_compact_doubly_symmetric(
     mod_factor: float,
     length_between_braces: Quantity,
@@ -62,6 +68,7 @@ def flexural_lateral_torsional_buckling_critical_stress_compact_doubly_symmetric
     return first_term * second_term
 
 
+@instrumented_formula
 def limiting_length_yield(
     radius_of_gyration: Quantity, modulus: Quantity, yield_stress: Quantity
 ) -> Quantity:
@@ -70,18 +77,20 @@ def limiting_length_yield(
     return 1.76 * radius_of_gyration * (modulus / yield_stress) ** 0.5
 
 
+@instrumented_formula
 def minor_axis_yield(
     yield_stress: Quantity,
     plastic_section_modulus: Quantity,
     elastic_section_modulus: Quantity,
 ):
     """eq F6-1 aisc 360-16"""
-    return min(
+    return minimum(
         yield_stress * plastic_section_modulus,
         1.6 * elastic_section_modulus * yield_stress,
     )
 
 
+@instrumented_formula
 def limiting_length_lateral_torsional_buckling(
     modulus: Quantity,
     yield_stress: Quantity,
@@ -109,6 +118,7 @@ def limiting_length_lateral_torsional_buckling(
     return value
 
 
+@instrumented_formula
 def effective_radius_of_gyration(
     major_section_modulus: Quantity,
     minor_inertia: Quantity,
@@ -118,18 +128,17 @@ def effective_radius_of_gyration(
     return ((minor_inertia * warping_constant) ** 0.5 / major_section_modulus) ** 0.5
 
 
+@instrumented_formula
 def flexural_lateral_torsional_buckling_strength(
-    case_b: Quantity | str,
-    case_c: Quantity | str,
+    case_b: Quantity,
+    case_c: Quantity,
     length_between_braces: Quantity,
-    limiting_length_yield: Quantity,
     limiting_length_torsional_buckling: Quantity,
-) -> Quantity | None:
-    if length_between_braces <= limiting_length_yield:
-        return None
-    elif length_between_braces <= limiting_length_torsional_buckling:
-        return case_b
-    return case_c
+) -> Quantity:
+    """F2.2 (b) and (c), for lengths between braces above the limiting yield length"""
+    return where(
+        length_between_braces <= limiting_length_torsional_buckling, case_b, case_c
+    )
 
 
 @dataclass
@@ -140,6 +149,8 @@ class YieldingMomentCalculation16(Strength):
     yield_stress: Quantity
     design_type: DesignType
 
+    evaluation_cost = 0
+
     @property
     def nominal_strength(self):
         return yielding_moment(
@@ -155,6 +166,8 @@ class MinorAxisYieldingCalculation2016(Strength):
     elastic_section_modulus: Quantity
     design_type: DesignType = DesignType.ASD
 
+    evaluation_cost = 0
+
     @property
     def nominal_strength(self):
         return minor_axis_yield(
@@ -230,6 +243,8 @@ class LateralTorsionalBucklingCalculation2016(Strength):
     coefficient_c: float
     design_type: DesignType = DesignType.ASD
 
+    evaluation_cost = 2
+
     # @property
     # def plastic_moment(self):
     #     return self.plastic_section_modulus * self.yield_stress
@@ -298,10 +313,722 @@ class LateralTorsionalBucklingCalculation2016(Strength):
 
     @property
     def nominal_strength(self):
-        return flexural_lateral_torsional_buckling_strength(
-            case_b=self.strength_lateral_torsion_compact_case_b,
-            case_c=self.strength_lateral_torsion_compact_case_c,
+        # F2.2(a) limit state does not apply, bounded by the plastic moment
+        return where(
+            self.length <= self.limiting_yield_length,
+            self.plastic_moment,
+            flexural_lateral_torsional_buckling_strength(
+                case_b=self.strength_lateral_torsion_compact_case_b,
+                case_c=self.strength_lateral_torsion_compact_case_c,
+                length_between_braces=self.length,
+                limiting_length_torsional_buckling=self.limiting_length_lateral_torsional_buckling,
+            ),
+        )
+
+    @property
+    def nominal_strength_upper_bound(self) -> Quantity:
+        return self.plastic_moment
+
+    @property
+    def nominal_strength_lower_bound(self) -> Quantity | None:
+        """Lp and Lr tests, eq. F2-2 is never below Cb 0.7 Fy Sx up to Lr"""
+        if self.length <= self.limiting_yield_length:
+            return self.plastic_moment
+        if self.length <= self.limiting_length_lateral_torsional_buckling:
+            return min(
+                self.modification_factor
+                * 0.7
+                * self.yield_stress
+                * self.elastic_section_modulus,
+                self.plastic_moment,
+            )
+        return None
+
+
+def _linear_transition(
+    upper: Quantity, lower: Quantity, ratio: float, start: float, end: float
+) -> Quantity:
+    return upper - (upper - lower) * (ratio - start) / (end - start)
+
+
+@instrumented_formula
+def noncompact_flange_local_buckling_strength(
+    plastic_moment: Quantity,
+    yield_stress: Quantity,
+    section_modulus: Quantity,
+    flange_ratio: float,
+    compact_limit: float,
+    slender_limit: float,
+) -> Quantity:
+    """eq F3-1 and F6-2 aisc 360-16"""
+    return _linear_transition(
+        plastic_moment,
+        0.7 * yield_stress * section_modulus,
+        flange_ratio,
+        compact_limit,
+        slender_limit,
+    )
+
+
+@instrumented_formula
+def slender_flange_local_buckling_strength(
+    modulus: Quantity,
+    kc_coefficient: float,
+    section_modulus: Quantity,
+    flange_ratio: float,
+) -> Quantity:
+    """eq F3-2 and F4-14 aisc 360-16"""
+    return 0.9 * modulus * kc_coefficient * section_modulus / flange_ratio**2
+
+
+@instrumented_formula
+def minor_axis_slender_flange_local_buckling_strength(
+    modulus: Quantity,
+    section_modulus: Quantity,
+    flange_ratio: float,
+) -> Quantity:
+    """eq F6-3 and F6-4 aisc 360-16"""
+    return 0.69 * modulus / flange_ratio**2 * section_modulus
+
+
+@instrumented_formula
+def web_flange_area_ratio(
+    web_height: Quantity,
+    web_thickness: Quantity,
+    flange_width: Quantity,
+    flange_thickness: Quantity,
+) -> float:
+    """eq F4-12 aisc 360-16"""
+    return web_height * web_thickness / (flange_width * flange_thickness)
+
+
+@instrumented_formula
+def flange_effective_radius_of_gyration(
+    flange_width: Quantity, web_flange_area_ratio: float
+) -> Quantity:
+    """eq F4-11 aisc 360-16"""
+    return flange_width / (12 * (1 + web_flange_area_ratio / 6)) ** 0.5
+
+
+@instrumented_formula
+def web_plastification_factor(
+    plastic_moment: Quantity,
+    yield_moment: Quantity,
+    web_ratio: float,
+    compact_limit: float,
+    slender_limit: float,
+) -> float:
+    """eq F4-9a and F4-9b aisc 360-16"""
+    ratio = plastic_moment / yield_moment
+    return where(
+        web_ratio <= compact_limit,
+        ratio,
+        minimum(
+            _linear_transition(ratio, 1, web_ratio, compact_limit, slender_limit),
+            ratio,
+        ),
+    )
+
+
+@instrumented_formula
+def limiting_length_yield_noncompact_web(
+    effective_radius_of_gyration: Quantity, modulus: Quantity, yield_stress: Quantity
+) -> Quantity:
+    """eq F4-7 aisc 360-16"""
+    return 1.1 * effective_radius_of_gyration * (modulus / yield_stress) ** 0.5
+
+
+@instrumented_formula
+def limiting_length_lateral_torsional_buckling_noncompact_web(
+    modulus: Quantity,
+    flange_stress: Quantity,
+    elastic_section_modulus: Quantity,
+    torsional_constant: Quantity,
+    effective_radius_of_gyration: Quantity,
+    distance_between_centroids: Quantity,
+) -> Quantity:
+    """eq F4-8 aisc 360-16"""
+    ratio = torsional_constant / (elastic_section_modulus * distance_between_centroids)
+    inner_root = (ratio**2 + 6.76 * (flange_stress / modulus) ** 2) ** 0.5
+    return (
+        1.95
+        * effective_radius_of_gyration
+        * modulus
+        / flange_stress
+        * (ratio + inner_root) ** 0.5
+    )
+
+
+@instrumented_formula
+def lateral_torsional_buckling_critical_stress_noncompact_web(
+    mod_factor: float,
+    length_between_braces: Quantity,
+    modulus: Quantity,
+    effective_radius_of_gyration: Quantity,
+    torsional_constant: Quantity,
+    section_modulus: Quantity,
+    distance_between_flange_centroids: Quantity,
+) -> Quantity:
+    """eq F4-5 aisc 360-16"""
+    ratio = (length_between_braces / effective_radius_of_gyration) ** 2
+    return (
+        mod_factor
+        * math.pi**2
+        * modulus
+        / ratio
+        * (
+            1
+            + 0.078
+            * torsional_constant
+            / (section_modulus * distance_between_flange_centroids)
+            * ratio
+        )
+        ** 0.5
+    )
+
+
+@instrumented_formula
+def lateral_torsional_buckling_strength_noncompact_web(
+    mod_factor: float,
+    yield_moment_capacity: Quantity,
+    flange_stress: Quantity,
+    section_modulus: Quantity,
+    critical_stress: Quantity,
+    length_between_braces: Quantity,
+    limiting_length_yield: Quantity,
+    limiting_length_torsional_buckling: Quantity,
+) -> Quantity:
+    """eq F4-1 to F4-3 aisc 360-16, F4.2(a) bounded by Rpc Myc"""
+    case_b = mod_factor * _linear_transition(
+        yield_moment_capacity,
+        flange_stress * section_modulus,
+        length_between_braces,
+        limiting_length_yield,
+        limiting_length_torsional_buckling,
+    )
+    case_c = critical_stress * section_modulus
+    return where(
+        length_between_braces <= limiting_length_yield,
+        yield_moment_capacity,
+        minimum(
+            where(
+                length_between_braces <= limiting_length_torsional_buckling,
+                case_b,
+                case_c,
+            ),
+            yield_moment_capacity,
+        ),
+    )
+
+
+@instrumented_formula
+def flange_local_buckling_strength_noncompact_web(
+    yield_moment_capacity: Quantity,
+    flange_stress: Quantity,
+    section_modulus: Quantity,
+    modulus: Quantity,
+    kc_coefficient: float,
+    flange_ratio: float,
+    compact_limit: float,
+    slender_limit: float,
+) -> Quantity:
+    """eq F4-13 and F4-14 aisc 360-16, F4.3(a) bounded by Rpc Myc"""
+    return where(
+        flange_ratio < compact_limit,
+        yield_moment_capacity,
+        where(
+            flange_ratio < slender_limit,
+            _linear_transition(
+                yield_moment_capacity,
+                flange_stress * section_modulus,
+                flange_ratio,
+                compact_limit,
+                slender_limit,
+            ),
+            slender_flange_local_buckling_strength(
+                modulus=modulus,
+                kc_coefficient=kc_coefficient,
+                section_modulus=section_modulus,
+                flange_ratio=flange_ratio,
+            ),
+        ),
+    )
+
+
+@instrumented_formula
+def bending_strength_reduction_factor(
+    web_flange_area_ratio: float,
+    web_ratio: float,
+    modulus: Quantity,
+    yield_stress: Quantity,
+) -> float:
+    """eq F5-6 aisc 360-16"""
+    area_ratio = minimum(web_flange_area_ratio, 10)
+    return minimum(
+        1
+        - area_ratio
+        / (1200 + 300 * area_ratio)
+        * (web_ratio - 5.7 * (modulus / yield_stress) ** 0.5),
+        1.0,
+    )
+
+
+@instrumented_formula
+def limiting_length_lateral_torsional_buckling_slender_web(
+    effective_radius_of_gyration: Quantity, modulus: Quantity, yield_stress: Quantity
+) -> Quantity:
+    """eq F5-5 aisc 360-16"""
+    return (
+        math.pi * effective_radius_of_gyration * (modulus / (0.7 * yield_stress)) ** 0.5
+    )
+
+
+@instrumented_formula
+def lateral_torsional_buckling_critical_stress_slender_web(
+    mod_factor: float,
+    yield_stress: Quantity,
+    modulus: Quantity,
+    effective_radius_of_gyration: Quantity,
+    length_between_braces: Quantity,
+    limiting_length_yield: Quantity,
+    limiting_length_torsional_buckling: Quantity,
+) -> Quantity:
+    """eq F5-3 and F5-4 aisc 360-16, F5.2(a) bounded by Fy"""
+    case_b = mod_factor * _linear_transition(
+        yield_stress,
+        0.7 * yield_stress,
+        length_between_braces,
+        limiting_length_yield,
+        limiting_length_torsional_buckling,
+    )
+    case_c = (
+        mod_factor
+        * math.pi**2
+        * modulus
+        / (length_between_braces / effective_radius_of_gyration) ** 2
+    )
+    return where(
+        length_between_braces <= limiting_length_yield,
+        yield_stress,
+        minimum(
+            where(
+                length_between_braces <= limiting_length_torsional_buckling,
+                case_b,
+                case_c,
+            ),
+            yield_stress,
+        ),
+    )
+
+
+@instrumented_formula
+def flange_local_buckling_critical_stress_slender_web(
+    yield_stress: Quantity,
+    modulus: Quantity,
+    kc_coefficient: float,
+    flange_ratio: float,
+    compact_limit: float,
+    slender_limit: float,
+) -> Quantity:
+    """eq F5-8 and F5-9 aisc 360-16, F5.3(a) bounded by Fy"""
+    return where(
+        flange_ratio < compact_limit,
+        yield_stress,
+        where(
+            flange_ratio < slender_limit,
+            _linear_transition(
+                yield_stress,
+                0.7 * yield_stress,
+                flange_ratio,
+                compact_limit,
+                slender_limit,
+            ),
+            0.9 * modulus * kc_coefficient / flange_ratio**2,
+        ),
+    )
+
+
+@dataclass
+class WebSlendernessSectionParam2016:
+    """
+    Section parameters of doubly symmetric I shapes with noncompact (F4) or
+    slender (F5) webs. Sxc = Sxt = Sx and hc = h, FL = 0.7 Fy (eq F4-6a).
+    """
+
+    plastic_section_modulus: Quantity
+    elastic_section_modulus: Quantity
+    yield_stress: Quantity
+    modulus: Quantity
+    flange_width: Quantity
+    flange_thickness: Quantity
+    web_thickness: Quantity
+    web_ratio: float
+    web_compact_limit: float
+    web_slender_limit: float
+    torsional_constant: Quantity
+    distance_between_flange_centroids: Quantity
+
+    @property
+    def plastic_moment(self) -> Quantity:
+        """F4.1, Mp = Fy Zx <= 1.6 Fy Sx"""
+        return minimum(
+            self.plastic_section_modulus * self.yield_stress,
+            1.6 * self.elastic_section_modulus * self.yield_stress,
+        )
+
+    @property
+    def yield_moment(self) -> Quantity:
+        """eq F4-4 aisc 360-16"""
+        return self.yield_stress * self.elastic_section_modulus
+
+    @property
+    def flange_stress(self) -> Quantity:
+        """eq F4-6a aisc 360-16"""
+        return 0.7 * self.yield_stress
+
+    @property
+    def web_plastification_factor(self) -> float:
+        return web_plastification_factor(
+            plastic_moment=self.plastic_moment,
+            yield_moment=self.yield_moment,
+            web_ratio=self.web_ratio,
+            compact_limit=self.web_compact_limit,
+            slender_limit=self.web_slender_limit,
+        )
+
+    @property
+    def yield_moment_capacity(self) -> Quantity:
+        """Rpc Myc"""
+        return self.web_plastification_factor * self.yield_moment
+
+    @property
+    def web_flange_area_ratio(self) -> float:
+        return web_flange_area_ratio(
+            web_height=self.web_ratio * self.web_thickness,
+            web_thickness=self.web_thickness,
+            flange_width=self.flange_width,
+            flange_thickness=self.flange_thickness,
+        )
+
+    @property
+    def effective_radius_of_gyration(self) -> Quantity:
+        return flange_effective_radius_of_gyration(
+            flange_width=self.flange_width,
+            web_flange_area_ratio=self.web_flange_area_ratio,
+        )
+
+    @property
+    def limiting_yield_length(self) -> Quantity:
+        return limiting_length_yield_noncompact_web(
+            effective_radius_of_gyration=self.effective_radius_of_gyration,
+            modulus=self.modulus,
+            yield_stress=self.yield_stress,
+        )
+
+    @property
+    def limiting_length_lateral_torsional_buckling(self) -> Quantity:
+        return limiting_length_lateral_torsional_buckling_noncompact_web(
+            modulus=self.modulus,
+            flange_stress=self.flange_stress,
+            elastic_section_modulus=self.elastic_section_modulus,
+            torsional_constant=self.torsional_constant,
+            effective_radius_of_gyration=self.effective_radius_of_gyration,
+            distance_between_centroids=self.distance_between_flange_centroids,
+        )
+
+    @property
+    def bending_strength_reduction_factor(self) -> float:
+        return bending_strength_reduction_factor(
+            web_flange_area_ratio=self.web_flange_area_ratio,
+            web_ratio=self.web_ratio,
+            modulus=self.modulus,
+            yield_stress=self.yield_stress,
+        )
+
+    @property
+    def limiting_length_lateral_torsional_buckling_slender_web(self) -> Quantity:
+        return limiting_length_lateral_torsional_buckling_slender_web(
+            effective_radius_of_gyration=self.effective_radius_of_gyration,
+            modulus=self.modulus,
+            yield_stress=self.yield_stress,
+        )
+
+
+@dataclass
+class CompressionFlangeLocalBucklingCalculation2016(Strength):
+    """AISC 360 2016 F3.2, compact web"""
+
+    plastic_moment: Quantity
+    yield_stress: Quantity
+    modulus: Quantity
+    elastic_section_modulus: Quantity
+    kc_coefficient: float
+    flange_ratio: float
+    compact_limit: float
+    slender_limit: float
+    design_type: DesignType = DesignType.ASD
+
+    @property
+    def nominal_strength(self):
+        # F3.2(a) compact flanges, limit state does not apply
+        return where(
+            self.flange_ratio < self.compact_limit,
+            self.plastic_moment,
+            where(
+                self.flange_ratio < self.slender_limit,
+                noncompact_flange_local_buckling_strength(
+                    plastic_moment=self.plastic_moment,
+                    yield_stress=self.yield_stress,
+                    section_modulus=self.elastic_section_modulus,
+                    flange_ratio=self.flange_ratio,
+                    compact_limit=self.compact_limit,
+                    slender_limit=self.slender_limit,
+                ),
+                slender_flange_local_buckling_strength(
+                    modulus=self.modulus,
+                    kc_coefficient=self.kc_coefficient,
+                    section_modulus=self.elastic_section_modulus,
+                    flange_ratio=self.flange_ratio,
+                ),
+            ),
+        )
+
+
+@dataclass
+class NonCompactWebCompressionFlangeYieldingCalculation2016(Strength):
+    """AISC 360 2016 F4.1"""
+
+    yield_moment_capacity: Quantity
+    design_type: DesignType = DesignType.ASD
+
+    evaluation_cost = 0
+
+    @property
+    def nominal_strength(self):
+        return self.yield_moment_capacity
+
+
+@dataclass
+class NonCompactWebLateralTorsionalBucklingCalculation2016(Strength):
+    """AISC 360 2016 F4.2"""
+
+    length: Quantity
+    modulus: Quantity
+    elastic_section_modulus: Quantity
+    torsional_constant: Quantity
+    distance_between_flange_centroids: Quantity
+    effective_radius_of_gyration: Quantity
+    limiting_yield_length: Quantity
+    limiting_length_lateral_torsional_buckling: Quantity
+    yield_moment_capacity: Quantity
+    flange_stress: Quantity
+    modification_factor: float
+    design_type: DesignType = DesignType.ASD
+
+    evaluation_cost = 2
+
+    @property
+    def critical_stress_lateral_torsional_buckling(self) -> Quantity:
+        return lateral_torsional_buckling_critical_stress_noncompact_web(
+            mod_factor=self.modification_factor,
+            length_between_braces=self.length,
+            modulus=self.modulus,
+            effective_radius_of_gyration=self.effective_radius_of_gyration,
+            torsional_constant=self.torsional_constant,
+            section_modulus=self.elastic_section_modulus,
+            distance_between_flange_centroids=self.distance_between_flange_centroids,
+        )
+
+    @property
+    def nominal_strength(self):
+        return lateral_torsional_buckling_strength_noncompact_web(
+            mod_factor=self.modification_factor,
+            yield_moment_capacity=self.yield_moment_capacity,
+            flange_stress=self.flange_stress,
+            section_modulus=self.elastic_section_modulus,
+            critical_stress=self.critical_stress_lateral_torsional_buckling,
             length_between_braces=self.length,
             limiting_length_yield=self.limiting_yield_length,
             limiting_length_torsional_buckling=self.limiting_length_lateral_torsional_buckling,
         )
+
+    @property
+    def nominal_strength_upper_bound(self) -> Quantity:
+        return self.yield_moment_capacity
+
+
+@dataclass
+class NonCompactWebCompressionFlangeLocalBucklingCalculation2016(Strength):
+    """AISC 360 2016 F4.3"""
+
+    yield_moment_capacity: Quantity
+    flange_stress: Quantity
+    modulus: Quantity
+    elastic_section_modulus: Quantity
+    kc_coefficient: float
+    flange_ratio: float
+    compact_limit: float
+    slender_limit: float
+    design_type: DesignType = DesignType.ASD
+
+    @property
+    def nominal_strength(self):
+        return flange_local_buckling_strength_noncompact_web(
+            yield_moment_capacity=self.yield_moment_capacity,
+            flange_stress=self.flange_stress,
+            section_modulus=self.elastic_section_modulus,
+            modulus=self.modulus,
+            kc_coefficient=self.kc_coefficient,
+            flange_ratio=self.flange_ratio,
+            compact_limit=self.compact_limit,
+            slender_limit=self.slender_limit,
+        )
+
+
+@dataclass
+class SlenderWebCompressionFlangeYieldingCalculation2016(Strength):
+    """AISC 360 2016 F5.1"""
+
+    yield_stress: Quantity
+    elastic_section_modulus: Quantity
+    bending_strength_reduction_factor: float
+    design_type: DesignType = DesignType.ASD
+
+    evaluation_cost = 0
+
+    @property
+    def nominal_strength(self):
+        """eq F5-1 aisc 360-16"""
+        return (
+            self.bending_strength_reduction_factor
+            * self.yield_stress
+            * self.elastic_section_modulus
+        )
+
+
+@dataclass
+class SlenderWebLateralTorsionalBucklingCalculation2016(Strength):
+    """AISC 360 2016 F5.2"""
+
+    length: Quantity
+    yield_stress: Quantity
+    modulus: Quantity
+    elastic_section_modulus: Quantity
+    effective_radius_of_gyration: Quantity
+    limiting_yield_length: Quantity
+    limiting_length_lateral_torsional_buckling: Quantity
+    bending_strength_reduction_factor: float
+    modification_factor: float
+    design_type: DesignType = DesignType.ASD
+
+    evaluation_cost = 2
+
+    @property
+    def critical_stress_lateral_torsional_buckling(self) -> Quantity:
+        return lateral_torsional_buckling_critical_stress_slender_web(
+            mod_factor=self.modification_factor,
+            yield_stress=self.yield_stress,
+            modulus=self.modulus,
+            effective_radius_of_gyration=self.effective_radius_of_gyration,
+            length_between_braces=self.length,
+            limiting_length_yield=self.limiting_yield_length,
+            limiting_length_torsional_buckling=self.limiting_length_lateral_torsional_buckling,
+        )
+
+    @property
+    def nominal_strength(self):
+        """eq F5-2 aisc 360-16"""
+        return (
+            self.bending_strength_reduction_factor
+            * self.critical_stress_lateral_torsional_buckling
+            * self.elastic_section_modulus
+        )
+
+    @property
+    def nominal_strength_upper_bound(self) -> Quantity:
+        return (
+            self.bending_strength_reduction_factor
+            * self.yield_stress
+            * self.elastic_section_modulus
+        )
+
+
+@dataclass
+class SlenderWebCompressionFlangeLocalBucklingCalculation2016(Strength):
+    """AISC 360 2016 F5.3"""
+
+    yield_stress: Quantity
+    modulus: Quantity
+    elastic_section_modulus: Quantity
+    bending_strength_reduction_factor: float
+    kc_coefficient: float
+    flange_ratio: float
+    compact_limit: float
+    slender_limit: float
+    design_type: DesignType = DesignType.ASD
+
+    @property
+    def critical_stress_flange_local_buckling(self) -> Quantity:
+        return flange_local_buckling_critical_stress_slender_web(
+            yield_stress=self.yield_stress,
+            modulus=self.modulus,
+            kc_coefficient=self.kc_coefficient,
+            flange_ratio=self.flange_ratio,
+            compact_limit=self.compact_limit,
+            slender_limit=self.slender_limit,
+        )
+
+    @property
+    def nominal_strength(self):
+        """eq F5-7 aisc 360-16"""
+        return (
+            self.bending_strength_reduction_factor
+            * self.critical_stress_flange_local_buckling
+            * self.elastic_section_modulus
+        )
+
+
+@dataclass
+class MinorAxisFlangeLocalBucklingCalculation2016(Strength):
+    """AISC 360 2016 F6.2, limits of Table B4.1b case 10"""
+
+    yield_stress: Quantity
+    modulus: Quantity
+    plastic_section_modulus: Quantity
+    elastic_section_modulus: Quantity
+    flange_ratio: float
+    compact_limit: float
+    slender_limit: float
+    design_type: DesignType = DesignType.ASD
+
+    @property
+    def plastic_moment(self) -> Quantity:
+        return minor_axis_yield(
+            yield_stress=self.yield_stress,
+            plastic_section_modulus=self.plastic_section_modulus,
+            elastic_section_modulus=self.elastic_section_modulus,
+        )
+
+    @property
+    def nominal_strength(self):
+        # F6.2(a) compact flanges, limit state does not apply
+        return where(
+            self.flange_ratio < self.compact_limit,
+            self.plastic_moment,
+            where(
+                self.flange_ratio < self.slender_limit,
+                noncompact_flange_local_buckling_strength(
+                    plastic_moment=self.plastic_moment,
+                    yield_stress=self.yield_stress,
+                    section_modulus=self.elastic_section_modulus,
+                    flange_ratio=self.flange_ratio,
+                    compact_limit=self.compact_limit,
+                    slender_limit=self.slender_limit,
+                ),
+                minor_axis_slender_flange_local_buckling_strength(
+                    modulus=self.modulus,
+                    section_modulus=self.elastic_section_modulus,
+                    flange_ratio=self.flange_ratio,
+                ),
+            ),
+        )
@@ -1,19 +1,22 @@
 from dataclasses import dataclass
+from typing import Any
 
+import numpy as np
 from pint import Quantity
 
 from struct_codes.criteria import DesignType, Strength
+from struct_codes.instrumentation import instrumented_formula
 from struct_codes.sections import ConstructionType
+from struct_codes.shear import (
+    nominal_shear_strength,
+    web_shear_buckling_coefficient,
+    web_shear_buckling_coefficient_tension_field,
+    web_shear_coefficient_limit,
+)
+from struct_codes.vectorize import where
 
 
-def nominal_shear_strength(
-    yield_stress: Quantity,
-    web_area: Quantity,
-    web_shear_coefficient: float = 1.0,
-):
-    return 0.6 * yield_stress * web_area * web_shear_coefficient
-
-
+@instrumented_formula
 def web_shear_coefficient_limit_rolled(
     modulus_linear: Quantity,
     yield_stress: Quantity,
@@ -22,55 +25,94 @@ def web_shear_coefficient_limit_rolled(
     return 2.24 * (modulus_linear / yield_stress) ** 0.5
 
 
-def web_shear_coefficient_limit(
-    shear_buckling_coefficient: float,
-    modulus_linear: Quantity,
-    yield_stress: Quantity,
-    factor: float = 1.10,
-) -> float:
-    """Condition of eq. G2-3 aisc 360-16"""
-    return factor * (shear_buckling_coefficient * modulus_linear / yield_stress) ** 0.5
+@instrumented_formula
+def web_plate_shear_buckling_coefficient(panel_aspect_ratio: Any) -> Any:
+    """eq. G2-5 aisc 360-16, 5.34 for unstiffened webs (infinite a/h)"""
+    return where(panel_aspect_ratio > 3.0, 5.34, 5 + 5 / panel_aspect_ratio**2)
 
 
-def web_shear_coefficient(
-    shear_buckling_coefficient: float,
-    modulus_linear: Quantity,
-    yield_stress: Quantity,
-    web_ratio: float,
-) -> float:
-    """eq. G2-4 aisc 360-16"""
-    return (
-        1.10
-        * (shear_buckling_coefficient * modulus_linear / yield_stress) ** 0.5
-        / web_ratio
+@instrumented_formula
+def tension_field_action_shear_coefficient(
+    web_shear_coefficient: float, panel_aspect_ratio: Any
+) -> Any:
+    """
+    Term in brackets of eq. G2-7 aisc 360-16, equal to 1 (eq. G2-6) when
+    Cv2 = 1
+    """
+    return web_shear_coefficient + (1 - web_shear_coefficient) / (
+        1.15 * (1 + panel_aspect_ratio**2) ** 0.5
     )
 
 
-def web_shear_coefficient_2(
-    shear_buckling_coefficient: float,
-    modulus_linear: Quantity,
-    yield_stress: Quantity,
-    web_ratio: float,
-) -> float:
-    """eq. G2-4 aisc 360-16"""
+@instrumented_formula
+def tension_field_action_shear_coefficient_narrow_flanges(
+    web_shear_coefficient: float, panel_aspect_ratio: Any
+) -> Any:
+    """Term in brackets of eq. G2-8 aisc 360-16"""
+    return web_shear_coefficient + (1 - web_shear_coefficient) / (
+        1.15 * (panel_aspect_ratio + (1 + panel_aspect_ratio**2) ** 0.5)
+    )
+
+
+@instrumented_formula
+def tension_field_action_permitted(panel_aspect_ratio: Any) -> Any:
+    """
+    Condition of G2.2 aisc 360-16 on the panel, interior panels with both
+    flanges and stiffeners on all four sides are the caller's concern
+    """
+    return panel_aspect_ratio <= 3.0
+
+
+@instrumented_formula
+def tension_field_action_flange_limits(
+    web_area: Quantity,
+    compression_flange_area: Quantity,
+    tension_flange_area: Quantity,
+    web_height: Quantity,
+    compression_flange_width: Quantity,
+    tension_flange_width: Quantity,
+) -> Any:
+    """Conditions of G2.2(b)(1) aisc 360-16 for eq. G2-7, else eq. G2-8"""
     return (
-        1.51
-        * shear_buckling_coefficient
-        * modulus_linear
-        / (web_ratio**2 * yield_stress)
+        (2 * web_area / (compression_flange_area + tension_flange_area) <= 2.5)
+        & (web_height / compression_flange_width <= 6.0)
+        & (web_height / tension_flange_width <= 6.0)
     )
 
 
 @dataclass
 class WebShearCalculation2016(Strength):
+    """
+    G2 shear strength of I-shaped webs, with or without transverse stiffeners
+    at stiffener_spacing (a), and with tension field action (G2.2) where
+    tension_field_action is true, eq. G2-7 where flange_limits is true and
+    eq. G2-8 elsewhere. Any of the inputs may be arrays, e.g. a range of
+    stiffener spacings for a single girder.
+    """
+
     yield_stress: Quantity
     modulus: Quantity
     web_area: Quantity
     web_ratio: float
     construction_type: ConstructionType
-    web_plate_shear_buckling_coefficient: float = 5.34
+    web_height: Quantity = None
+    stiffener_spacing: Quantity = None
+    tension_field_action: Any = False
+    flange_limits: Any = True
     design_type: DesignType = DesignType.ASD
 
+    @property
+    def panel_aspect_ratio(self) -> Any:
+        if self.stiffener_spacing is None:
+            return np.inf
+        return (self.stiffener_spacing / self.web_height).to("").magnitude
+
+    @property
+    def web_plate_shear_buckling_coefficient(self) -> Any:
+        return web_plate_shear_buckling_coefficient(
+            panel_aspect_ratio=self.panel_aspect_ratio
+        )
+
     @property
     def rolled_web_ratio_limit(self):
         return web_shear_coefficient_limit_rolled(
@@ -79,12 +121,11 @@ class WebShearCalculation2016(Strength):
         )
 
     @property
-    def _web_shear_strength_coefficient(self):
-        return web_shear_coefficient(
-            shear_buckling_coefficient=self.web_plate_shear_buckling_coefficient,
-            modulus_linear=self.modulus,
-            yield_stress=self.yield_stress,
-            web_ratio=self.web_ratio,
+    def rolled_web(self) -> Any:
+        """G2.1(a), rolled I-shaped members with stocky webs"""
+        return np.logical_and(
+            self.construction_type == ConstructionType.ROLLED,
+            self.web_ratio <= self.rolled_web_ratio_limit,
         )
 
     @property
@@ -97,69 +138,83 @@ class WebShearCalculation2016(Strength):
 
     @property
     def web_shear_strength_coefficient(self):
-        if (
-            self.construction_type == ConstructionType.ROLLED
-            and self.web_ratio <= self.rolled_web_ratio_limit
-        ):
-            self.asd_factor = 1.50
-            self.lrfd_factor = 1.0
-            return 1
-        if self.web_ratio <= self.web_shear_strength_coefficient_limit:
-            return 1
-        return self._web_shear_strength_coefficient
+        return where(
+            self.rolled_web,
+            1.0,
+            web_shear_buckling_coefficient(
+                shear_buckling_coefficient=self.web_plate_shear_buckling_coefficient,
+                modulus_linear=self.modulus,
+                yield_stress=self.yield_stress,
+                web_ratio=self.web_ratio,
+            ),
+        )
+
+    @property
+    def tension_field_action_strength_coefficient(self):
+        web_shear_coefficient = web_shear_buckling_coefficient_tension_field(
+            shear_buckling_coefficient=self.web_plate_shear_buckling_coefficient,
+            modulus_linear=self.modulus,
+            yield_stress=self.yield_stress,
+            web_ratio=self.web_ratio,
+        )
+        return where(
+            self.flange_limits,
+            tension_field_action_shear_coefficient(
+                web_shear_coefficient=web_shear_coefficient,
+                panel_aspect_ratio=self.panel_aspect_ratio,
+            ),
+            tension_field_action_shear_coefficient_narrow_flanges(
+                web_shear_coefficient=web_shear_coefficient,
+                panel_aspect_ratio=self.panel_aspect_ratio,
+            ),
+        )
+
+    @property
+    def asd_factor(self):
+        return where(self.rolled_web, 1.50, 1.67)
+
+    @property
+    def lrfd_factor(self):
+        return where(self.rolled_web, 1.0, 0.9)
 
     @property
     def nominal_strength(self):
         return nominal_shear_strength(
             yield_stress=self.yield_stress,
             web_area=self.web_area,
-            web_shear_coefficient=self.web_shear_strength_coefficient,
+            web_shear_coefficient=where(
+                np.logical_and(
+                    self.tension_field_action, np.logical_not(self.rolled_web)
+                ),
+                self.tension_field_action_strength_coefficient,
+                self.web_shear_strength_coefficient,
+            ),
         )
 
 
 @dataclass
 class ShearMinorAxis(Strength):
+    """
+    G7 shear of I-shaped members loaded in the weak axis, each flange a shear
+    resisting element with h/tw = b/tf, b = bf/2 and kv = 1.2
+    """
+
     yield_stress: Quantity
     modulus: Quantity
     flange_width: Quantity
     flange_thickness: Quantity
     design_type: DesignType = DesignType.ASD
+    flange_count: int = 2
 
     plate_shear_buckling_coefficient = 1.2
 
-    @property
-    def web_shear_buckling_coefficient_limit_i(self):
-        return web_shear_coefficient_limit(
-            shear_buckling_coefficient=self.plate_shear_buckling_coefficient,
-            modulus_linear=self.modulus,
-            yield_stress=self.yield_stress,
-        )
-
-    @property
-    def web_shear_buckling_coefficient_limit_ii(self):
-        return web_shear_coefficient_limit(
-            shear_buckling_coefficient=self.plate_shear_buckling_coefficient,
-            modulus_linear=self.modulus,
-            yield_stress=self.yield_stress,
-            factor=1.37,
-        )
-
     @property
     def flange_ratio(self):
-        return self.flange_width / self.flange_thickness
+        return (self.flange_width / (2 * self.flange_thickness)).to("").magnitude
 
     @property
-    def web_shear_coefficoent(self):
-        if self.flange_ratio <= self.web_shear_buckling_coefficient_limit_i:
-            return 1
-        if self.flange_ratio <= self.web_shear_buckling_coefficient_limit_ii:
-            return web_shear_coefficient(
-                shear_buckling_coefficient=self.plate_shear_buckling_coefficient,
-                modulus_linear=self.modulus,
-                yield_stress=self.yield_stress,
-                web_ratio=self.flange_ratio,
-            )
-        return web_shear_coefficient_2(
+    def web_shear_coefficient(self):
+        return web_shear_buckling_coefficient_tension_field(
             shear_buckling_coefficient=self.plate_shear_buckling_coefficient,
             modulus_linear=self.modulus,
             yield_stress=self.yield_stress,
@@ -168,8 +223,9 @@ class ShearMinorAxis(Strength):
 
     @property
     def nominal_strength(self):
+        """eq G7-1 aisc 360-16, summed over the flanges"""
         return nominal_shear_strength(
             yield_stress=self.yield_stress,
-            web_area=self.flange_thickness * self.flange_width,
-            web_shear_coefficient=self.web_shear_coefficoent,
+            web_area=self.flange_count * self.flange_thickness * self.flange_width,
+            web_shear_coefficient=self.web_shear_coefficient,
         )
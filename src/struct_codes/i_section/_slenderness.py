@@ -5,12 +5,11 @@ from pint import Quantity
 
 from struct_codes.sections import ConstructionType
 from struct_codes.slenderness import Slenderness, flexural_slenderness_per_element
+from struct_codes.vectorize import clip, select
 
 
 def axial_slenderness_per_element(ratio: float, limit: float):
-    if ratio < limit:
-        return Slenderness.NON_SLENDER
-    return Slenderness.SLENDER
+    return select([ratio < limit], [Slenderness.NON_SLENDER], Slenderness.SLENDER)
 
 
 def axial_rolled_flanges_limit_ratio(
@@ -38,7 +37,7 @@ def kc_coefficient(heigth_to_thickness_ratio: float):
     TABLE B4.1a Width-to-Thickness Ratios: Compression Elements
     Members Subject to Axial Compression - note [a]
     """
-    return min((max((4 / heigth_to_thickness_ratio**0.5, 0.35)), 0.76))
+    return clip(4 / heigth_to_thickness_ratio**0.5, 0.35, 0.76)
 
 
 def axial_doubly_symmetric_web_limit(
@@ -82,8 +81,8 @@ def flexural_built_up_i_flange_slender_limit(
 ) -> float:
     """TABLE B4.1b
     Width-to-Thickness Ratios: Compression Elements
-    Members Subject to Flexure"""
-    return 0.95 * (modulus_linear * kc_coefficient / yield_strength) ** 0.5
+    Members Subject to Flexure - Case 11, FL = 0.7 Fy for doubly symmetric shapes"""
+    return 0.95 * (modulus_linear * kc_coefficient / (0.7 * yield_strength)) ** 0.5
 
 
 def flexural_doubly_symmetric_web_compact_limit(
@@ -324,14 +323,3 @@ class DoublySymmetricSlendernessCalculation2016:
             flange_flexural_minor_axis_slender_limit=self._flange_flexural_rolled_slender_limit,
             flange_flexural_minor_axis_slenderness=self._flange_flexural_minor_axis_slenderness,
         )
-
-
-def _is_slender(
-    lamdba_ratio: float,
-    lambda_limit: float,
-    yield_stess: Quantity,
-    critical_stress: Quantity,
-):
-    if lamdba_ratio > lambda_limit * (yield_stess / critical_stress) ** 0.5:
-        raise NotImplementedError("Chapter E section 7 not implemented")
-    return False
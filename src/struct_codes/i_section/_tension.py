@@ -10,6 +10,8 @@ class TesionYieldCalculation(Strength):
     yield_stress: Quantity
     design_type: DesignType
 
+    evaluation_cost = 0
+
     @property
     def nominal_strength(self):
         return self.yield_stress * self.gross_area
@@ -24,6 +26,7 @@ class TesionUltimateCalculation(Strength):
 
     asd_factor = 2
     lrfd_factor = 0.75
+    evaluation_cost = 0
 
     @property
     def nominal_strength(self):
@@ -0,0 +1,139 @@
+import marshal
+from collections.abc import Callable
+from contextlib import contextmanager
+from dataclasses import dataclass
+from enum import StrEnum
+from functools import wraps
+from pathlib import Path
+from time import perf_counter
+from typing import Any, Iterator
+
+FUNCTION_LOCATION = "struct_codes"
+
+
+class InstrumentationCategory(StrEnum):
+    STRENGTH_TYPE = "strength_type"
+    CALCULATION = "calculation"
+    FORMULA = "formula"
+
+
+@dataclass
+class InstrumentationRecord:
+    location: tuple[str, int, str]
+    count: int = 0
+    total_time: float = 0.0
+
+
+@dataclass
+class Instrumentation:
+    """
+    Opt-in counters and cumulative timings per strength type, calculation
+    class and formula function. When disabled the hooks only check `enabled`.
+    Timings are inclusive, a formula call is also part of the calculation and
+    strength type that triggered it.
+    """
+
+    enabled: bool = False
+
+    def __post_init__(self):
+        self.records: dict[
+            tuple[InstrumentationCategory, str], InstrumentationRecord
+        ] = {}
+
+    def reset(self):
+        self.records = {}
+
+    def record(
+        self,
+        category: InstrumentationCategory,
+        name: str,
+        elapsed: float,
+        location: tuple[str, int, str] | None = None,
+    ):
+        key = category, name
+        record = self.records.get(key)
+        if record is None:
+            record = InstrumentationRecord(
+                location=location or (FUNCTION_LOCATION, 0, f"{category}:{name}")
+            )
+            self.records[key] = record
+        record.count += 1
+        record.total_time += elapsed
+
+    def measure(
+        self, category: InstrumentationCategory, name: str, func: Callable[[], Any]
+    ) -> Any:
+        if not self.enabled:
+            return func()
+        start = perf_counter()
+        try:
+            return func()
+        finally:
+            self.record(category, name, perf_counter() - start)
+
+    def as_dict(self) -> dict[str, dict[str, dict[str, float]]]:
+        result = {category.value: {} for category in InstrumentationCategory}
+        for (category, name), record in self.records.items():
+            result[category.value][name] = {
+                "count": record.count,
+                "total_time": record.total_time,
+            }
+        return result
+
+    def dump_stats(self, file_path: Path | str):
+        """Writes the records in the `pstats` format, readable by pstats, snakeviz, etc."""
+        stats = {
+            record.location: (
+                record.count,
+                record.count,
+                record.total_time,
+                record.total_time,
+                {},
+            )
+            for record in self.records.values()
+        }
+        with open(file_path, "wb") as f:
+            marshal.dump(stats, f)
+
+
+INSTRUMENTATION = Instrumentation()
+
+
+@contextmanager
+def instrumented(reset: bool = True) -> Iterator[Instrumentation]:
+    """Enables the instrumentation within the context"""
+    if reset:
+        INSTRUMENTATION.reset()
+    INSTRUMENTATION.enabled = True
+    try:
+        yield INSTRUMENTATION
+    finally:
+        INSTRUMENTATION.enabled = False
+
+
+def instrumented_formula(func: Callable) -> Callable:
+    """Decorator recording calls and time of a formula function"""
+    # qualified so same named formulas of different modules stay apart
+    name = f"{func.__module__}.{func.__qualname__}"
+    location = (
+        func.__code__.co_filename,
+        func.__code__.co_firstlineno,
+        func.__qualname__,
+    )
+
+    @wraps(func)
+    def wrapper(*args, **kwargs):
+        if not INSTRUMENTATION.enabled:
+            return func(*args, **kwargs)
+        start = perf_counter()
+        try:
+            return func(*args, **kwargs)
+        finally:
+            INSTRUMENTATION.record(
+                InstrumentationCategory.FORMULA,
+                name,
+                perf_counter() - start,
+                location=location,
+            )
+
+    return wrapper
@@ -0,0 +1,261 @@
+from dataclasses import dataclass, fields
+from enum import Enum
+from typing import Any, Iterable
+
+import numpy as np
+
+from struct_codes.beam import Beam
+from struct_codes.criteria import DesignType
+from struct_codes.instrumentation import instrumented_formula
+from struct_codes.materials import Material
+from struct_codes.sections import (
+    ConstructionType,
+    LoadStrengthCalculation,
+    SegmentedLoadStrengthCalculation,
+)
+from struct_codes.units import Quantity, meter
+from struct_codes.vectorize import select, where
+
+
+class InteractionEquation(str, Enum):
+    H1_1A = "H1-1a"
+    H1_1B = "H1-1b"
+
+
+@instrumented_formula
+def doubly_and_singly_symmetric_interaction(
+    axial_ratio: Any, major_axis_ratio: Any, minor_axis_ratio: Any
+) -> Any:
+    """eq H1-1a and H1-1b aisc 360-16"""
+    flexure_ratio = major_axis_ratio + minor_axis_ratio
+    return where(
+        axial_ratio >= 0.2,
+        axial_ratio + 8 / 9 * flexure_ratio,
+        axial_ratio / 2 + flexure_ratio,
+    )
+
+
+@dataclass
+class InteractionResult:
+    ratio: Any
+    equation: Any
+
+    @property
+    def passed(self) -> Any:
+        return self.ratio <= 1.0
+
+
+@dataclass
+class CombinedForcesCalculation2016:
+    """
+    AISC 360 2016 H1, doubly and singly symmetric members subject to flexure
+    and axial force. Capacities are available strengths (design strengths),
+    computed once and reused for every demand. Axial forces are positive in
+    tension, H1.2 uses the tension available strength as Pc.
+    """
+
+    compression_strength: Quantity
+    tension_strength: Quantity
+    major_axis_flexural_strength: Quantity
+    minor_axis_flexural_strength: Quantity
+
+    @classmethod
+    def from_calculations(
+        cls,
+        compression: LoadStrengthCalculation,
+        tension: LoadStrengthCalculation,
+        flexure_major_axis: LoadStrengthCalculation | SegmentedLoadStrengthCalculation,
+        flexure_minor_axis: LoadStrengthCalculation,
+    ) -> "CombinedForcesCalculation2016":
+        return cls(
+            compression_strength=compression.design_strength,
+            tension_strength=tension.design_strength,
+            major_axis_flexural_strength=flexure_major_axis.design_strength,
+            minor_axis_flexural_strength=flexure_minor_axis.design_strength,
+        )
+
+    def axial_ratio(self, axial_force: Quantity) -> Any:
+        axial_strength = where(
+            axial_force >= 0 * axial_force.units,
+            self.tension_strength,
+            self.compression_strength,
+        )
+        return np.abs((axial_force / axial_strength).to("").magnitude)
+
+    def major_axis_ratio(self, major_axis_moment: Quantity) -> Any:
+        return np.abs(
+            (major_axis_moment / self.major_axis_flexural_strength).to("").magnitude
+        )
+
+    def minor_axis_ratio(self, minor_axis_moment: Quantity) -> Any:
+        return np.abs(
+            (minor_axis_moment / self.minor_axis_flexural_strength).to("").magnitude
+        )
+
+    def utilization(
+        self,
+        axial_force: Quantity,
+        major_axis_moment: Quantity,
+        minor_axis_moment: Quantity,
+    ) -> InteractionResult:
+        """Ratio and governing equation of every demand, arrays broadcast together"""
+        axial_ratio = self.axial_ratio(axial_force)
+        ratio = doubly_and_singly_symmetric_interaction(
+            axial_ratio=axial_ratio,
+            major_axis_ratio=self.major_axis_ratio(major_axis_moment),
+            minor_axis_ratio=self.minor_axis_ratio(minor_axis_moment),
+        )
+        equation = select(
+            [np.broadcast_to(axial_ratio >= 0.2, np.shape(ratio))],
+            [InteractionEquation.H1_1A],
+            InteractionEquation.H1_1B,
+        )
+        return InteractionResult(ratio=ratio, equation=equation)
+
+
+def _base_magnitude(value: Any) -> np.ndarray:
+    if isinstance(value, Quantity):
+        return np.asarray(value.to_base_units().magnitude, dtype=float)
+    return np.asarray(value, dtype=float)
+
+
+@dataclass(frozen=True)
+class InteractionSurface:
+    """
+    H1 design interaction surface of a member, the available strengths as
+    floats in base units (newton, newton * meter). Checks only run numpy float
+    operations, demands given as plain arrays must be in base units too.
+    """
+
+    compression_strength: float
+    tension_strength: float
+    major_axis_flexural_strength: float
+    minor_axis_flexural_strength: float
+
+    @classmethod
+    def from_calculation(
+        cls, calculation: CombinedForcesCalculation2016
+    ) -> "InteractionSurface":
+        return cls(
+            compression_strength=float(
+                _base_magnitude(calculation.compression_strength)
+            ),
+            tension_strength=float(_base_magnitude(calculation.tension_strength)),
+            major_axis_flexural_strength=float(
+                _base_magnitude(calculation.major_axis_flexural_strength)
+            ),
+            minor_axis_flexural_strength=float(
+                _base_magnitude(calculation.minor_axis_flexural_strength)
+            ),
+        )
+
+    @classmethod
+    def stack(cls, surfaces: Iterable["InteractionSurface"]) -> "InteractionSurface":
+        """Surface of several members, each strength an array over the members"""
+        surfaces = tuple(surfaces)
+        return cls(
+            **{
+                field.name: np.array(
+                    [getattr(surface, field.name) for surface in surfaces]
+                )
+                for field in fields(cls)
+            }
+        )
+
+    def axial_ratio(self, axial_force: Any) -> np.ndarray:
+        axial_force = _base_magnitude(axial_force)
+        return np.abs(axial_force) / np.where(
+            axial_force >= 0, self.tension_strength, self.compression_strength
+        )
+
+    def major_axis_ratio(self, major_axis_moment: Any) -> np.ndarray:
+        return (
+            np.abs(_base_magnitude(major_axis_moment))
+            / self.major_axis_flexural_strength
+        )
+
+    def minor_axis_ratio(self, minor_axis_moment: Any) -> np.ndarray:
+        return (
+            np.abs(_base_magnitude(minor_axis_moment))
+            / self.minor_axis_flexural_strength
+        )
+
+    def utilization(
+        self, axial_force: Any, major_axis_moment: Any, minor_axis_moment: Any
+    ) -> np.ndarray:
+        """eq H1-1a and H1-1b aisc 360-16, axial forces positive in tension"""
+        return doubly_and_singly_symmetric_interaction(
+            axial_ratio=self.axial_ratio(axial_force),
+            major_axis_ratio=self.major_axis_ratio(major_axis_moment),
+            minor_axis_ratio=self.minor_axis_ratio(minor_axis_moment),
+        )
+
+    def contains(
+        self, axial_force: Any, major_axis_moment: Any, minor_axis_moment: Any
+    ) -> np.ndarray:
+        """True for demand points inside the design surface"""
+        return (
+            self.utilization(axial_force, major_axis_moment, minor_axis_moment) <= 1.0
+        )
+
+
+def _beam_key(beam: Beam, modification_factor: Any) -> tuple:
+    def meters(value: Quantity | None):
+        if value is None:
+            return None
+        return tuple(np.atleast_1d(value.to(meter).magnitude).tolist())
+
+    return (
+        meters(beam.length_major_axis),
+        beam.factor_k_major_axis,
+        meters(beam.length_minor_axis),
+        beam.factor_k_minor_axis,
+        meters(beam.length_torsion),
+        beam.factor_k_torsion,
+        meters(beam.unbraced_lengths),
+        np.shape(modification_factor),
+        np.asarray(modification_factor, dtype=float).tobytes(),
+    )
+
+
+@dataclass
+class InteractionSurfaceCache:
+    """
+    H1 interaction surfaces of AISC sections for a material, built from the
+    exact capacity calculators the first time a section and beam are requested
+    and reused afterwards.
+    """
+
+    material: Material
+    construction: ConstructionType = ConstructionType.ROLLED
+    design_type: DesignType = DesignType.ASD
+
+    def __post_init__(self):
+        self.surfaces: dict[tuple, InteractionSurface] = {}
+
+    def surface(
+        self,
+        section_name: str,
+        beam: Beam,
+        lateral_torsional_buckling_modification_factor: float = 1.0,
+    ) -> InteractionSurface:
+        key = section_name, _beam_key(
+            beam, lateral_torsional_buckling_modification_factor
+        )
+        surface = self.surfaces.get(key)
+        if surface is None:
+            # the database builds the sections, which use this module
+            from struct_codes.aisc_database import create_aisc_section
+
+            section = create_aisc_section(
+                section_name, self.material, self.construction
+            )
+            surface = InteractionSurface.from_calculation(
+                section.combined_forces(
+                    beam,
+                    lateral_torsional_buckling_modification_factor=lateral_torsional_buckling_modification_factor,
+                    design_type=self.design_type,
+                )
+            )
+            self.surfaces[key] = surface
+        return surface
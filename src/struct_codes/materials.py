@@ -1,9 +1,10 @@
-from dataclasses import dataclass
-from typing import Protocol
+from dataclasses import dataclass, fields
+from typing import Iterable, Protocol
 
+import numpy as np
 from pint import Quantity
 
-from struct_codes.units import gigapascal, megapascal
+from struct_codes.units import gigapascal, kilogram, ksi, megapascal, meter
 
 
 @dataclass
@@ -39,3 +40,98 @@ steel250MPa = UserDefiniedMaterial(
     yield_strength=250 * megapascal,
     ultimate_strength=400 * megapascal,
 )
+
+
+def _astm_grade(yield_strength: float, ultimate_strength: float):
+    """Minimum Fy and Fu in ksi, E and G as in aisc 360-16"""
+    return UserDefiniedMaterial(
+        modulus_linear=200 * gigapascal,
+        modulus_shear=77 * gigapascal,
+        poisson_ratio=0.3,
+        yield_strength=(yield_strength * ksi).to(megapascal),
+        ultimate_strength=(ultimate_strength * ksi).to(megapascal),
+        density=7850 * kilogram / meter**3,
+    )
+
+
+def _en_grade(yield_strength: float, ultimate_strength: float):
+    """
+    fy in MPa for t <= 16 mm and fu for 3 mm <= t <= 100 mm, EN 10025-2 and
+    EN 10025-3 for S460, E and G as in EN 1993-1-1
+    """
+    return UserDefiniedMaterial(
+        modulus_linear=210 * gigapascal,
+        modulus_shear=81 * gigapascal,
+        poisson_ratio=0.3,
+        yield_strength=yield_strength * megapascal,
+        ultimate_strength=ultimate_strength * megapascal,
+        density=7850 * kilogram / meter**3,
+    )
+
+
+# minimum Fy and Fu of table 2-4 aisc steel construction manual, 15th edition,
+# rectangular HSS for A500
+steel_grades = {
+    "A36": _astm_grade(36, 58),
+    "A53-B": _astm_grade(35, 60),
+    "A500-B": _astm_grade(46, 58),
+    "A500-C": _astm_grade(50, 62),
+    "A572-50": _astm_grade(50, 65),
+    "A588": _astm_grade(50, 70),
+    "A913-65": _astm_grade(65, 80),
+    "A992": _astm_grade(50, 65),
+    "S235": _en_grade(235, 360),
+    "S275": _en_grade(275, 410),
+    "S355": _en_grade(355, 470),
+    "S460": _en_grade(460, 540),
+}
+
+
+def _column(values: list, shape: tuple[int, ...]):
+    present = [value for value in values if value is not None]
+    if len(present) == len(values) and all(value == values[0] for value in values):
+        return values[0]
+    if not present:
+        return None
+    if isinstance(present[0], Quantity):
+        units = present[0].units
+        return (
+            np.reshape(
+                [
+                    np.nan if value is None else value.to(units).magnitude
+                    for value in values
+                ],
+                shape,
+            )
+            * units
+        )
+    return np.reshape(values, shape)
+
+
+def material_array(
+    materials: Iterable[Material], sections_axis: bool = True
+) -> UserDefiniedMaterial:
+    """
+    One material with array valued properties, one entry per material. With
+    the sections axis the arrays are (materials, 1), so calculations with a
+    columnar geometry give (materials, sections) results. Properties shared by
+    every material are kept scalar.
+    """
+    materials = tuple(materials)
+    shape = (len(materials), 1) if sections_axis else (len(materials),)
+    return UserDefiniedMaterial(
+        **{
+            field.name: _column(
+                [getattr(material, field.name, None) for material in materials],
+                shape,
+            )
+            for field in fields(UserDefiniedMaterial)
+        }
+    )
+
+
+def grades(*names: str, sections_axis: bool = True) -> UserDefiniedMaterial:
+    """Array valued material of grades from the library, e.g. grades("A36", "A992")"""
+    return material_array(
+        (steel_grades[name] for name in names), sections_axis=sections_axis
+    )
@@ -0,0 +1,252 @@
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass
+from enum import Enum
+
+import numpy as np
+from pint import set_application_registry
+
+from struct_codes.criteria import DesignType, StrengthType
+from struct_codes.i_section import BuiltUpIGeometry, DoublySymmetricI
+from struct_codes.instrumentation import instrumented_formula
+from struct_codes.materials import Material
+from struct_codes.sections import ConstructionType
+from struct_codes.units import Quantity, kilogram, meter, millimeter, ureg
+
+DIMENSIONS = ("bf", "tf", "h", "tw")
+
+
+class GirderConstraint(str, Enum):
+    FLEXURE = "flexure"
+    SHEAR = "shear"
+    WEB_SLENDERNESS = "web_slenderness"
+    WEB_AREA = "web_area"
+
+
+@instrumented_formula
+def maximum_web_ratio(
+    modulus_linear: Quantity, yield_strength: Quantity, panel_aspect_ratio: float
+) -> float:
+    """
+    (h/tw)max of F13.2 aisc 360-16, eq F13-3 and F13-4, at most 260 in
+    unstiffened girders (infinite a/h)
+    """
+    ratio = (modulus_linear / yield_strength).to("").magnitude
+    maximum = np.where(panel_aspect_ratio <= 1.5, 12.0 * ratio**0.5, 0.40 * ratio)
+    return np.where(np.isinf(panel_aspect_ratio), np.minimum(maximum, 260), maximum)
+
+
+@dataclass
+class PlateGirderProblem:
+    """
+    Lightest doubly symmetric welded I carrying the required major axis moment
+    and shear over an unbraced length, plate dimensions within (lower, upper)
+    bounds. Unstiffened webs unless a stiffener spacing is given.
+    """
+
+    moment: Quantity
+    shear: Quantity
+    length: Quantity
+    material: Material
+    bf: tuple[Quantity, Quantity]
+    tf: tuple[Quantity, Quantity]
+    h: tuple[Quantity, Quantity]
+    tw: tuple[Quantity, Quantity]
+    lateral_torsional_buckling_modification_factor: float = 1.0
+    stiffener_spacing: Quantity = None
+    design_type: DesignType = DesignType.LRFD
+
+    @property
+    def bounds(self) -> np.ndarray:
+        """(lower, upper) rows of the dimensions in mm"""
+        return np.array(
+            [
+                [bound.to(millimeter).magnitude for bound in getattr(self, name)]
+                for name in DIMENSIONS
+            ]
+        ).T
+
+    def geometry(self, dimensions: np.ndarray) -> BuiltUpIGeometry:
+        """Columnar geometry of (candidates, dimensions) rows in mm"""
+        return BuiltUpIGeometry(*(np.asarray(dimensions).T * millimeter))
+
+    def utilizations(
+        self, geometry: BuiltUpIGeometry
+    ) -> tuple[dict[GirderConstraint, np.ndarray], np.ndarray]:
+        """Required over available ratios and the governing flexure limit states"""
+        section = DoublySymmetricI(
+            geometry=geometry,
+            material=self.material,
+            construction=ConstructionType.BUILT_UP,
+        )
+        flexure, criteria = section.flexure_major_axis(
+            length=self.length,
+            lateral_torsional_buckling_modification_factor=self.lateral_torsional_buckling_modification_factor,
+            design_type=self.design_type,
+        ).design_strength_tuple
+        shear = section.shear_major_axis(
+            design_type=self.design_type, stiffener_spacing=self.stiffener_spacing
+        ).design_strength
+        panel_aspect_ratio = (
+            np.inf
+            if self.stiffener_spacing is None
+            else (self.stiffener_spacing / geometry.h).to("").magnitude
+        )
+        web_area_ratio = (
+            (geometry.h * geometry.tw / (geometry.bf * geometry.tf)).to("").magnitude
+        )
+        utilizations = {
+            GirderConstraint.FLEXURE: (self.moment / flexure).to("").magnitude,
+            GirderConstraint.SHEAR: (self.shear / shear).to("").magnitude,
+            GirderConstraint.WEB_SLENDERNESS: geometry.h_tw
+            / maximum_web_ratio(
+                modulus_linear=self.material.modulus_linear,
+                yield_strength=self.material.yield_strength,
+                panel_aspect_ratio=panel_aspect_ratio,
+            ),
+            # F13.2, web area at most 10 times the compression flange area
+            GirderConstraint.WEB_AREA: web_area_ratio / 10,
+        }
+        return {
+            key: np.broadcast_to(value, geometry.A.shape)
+            for key, value in utilizations.items()
+        }, np.broadcast_to(criteria, geometry.A.shape)
+
+
+def _use_package_registry():
+    """Worker initializer, quantities unpickled there belong to this registry"""
+    set_application_registry(ureg)
+
+
+def _evaluate(
+    problem: PlateGirderProblem, dimensions: np.ndarray
+) -> tuple[np.ndarray, np.ndarray]:
+    """Weights in kg/m and constraint violations, the sum of utilizations over 1"""
+    geometry = problem.geometry(dimensions)
+    utilizations, _ = problem.utilizations(geometry)
+    ratios = np.stack(list(utilizations.values()))
+    violation = np.sum(np.maximum(ratios - 1, 0), axis=0)
+    return (
+        geometry.W.to(kilogram / meter).magnitude,
+        np.where(np.isnan(violation), np.inf, violation),
+    )
+
+
+@dataclass
+class PlateGirderOptimum:
+    """
+    Best candidate found, active constraints those within the tolerance of
+    their limit and active bounds the dimensions at a bound.
+    """
+
+    geometry: BuiltUpIGeometry
+    weight: Quantity
+    utilizations: dict[GirderConstraint, float]
+    flexure_criterion: StrengthType
+    active_constraints: tuple[GirderConstraint, ...]
+    active_bounds: tuple[tuple[str, str], ...]
+    evaluations: int
+
+    @property
+    def feasible(self) -> bool:
+        return all(value <= 1 for value in self.utilizations.values())
+
+
+def _optimum(
+    problem: PlateGirderProblem,
+    dimensions: np.ndarray,
+    evaluations: int,
+    tolerance: float,
+) -> PlateGirderOptimum:
+    geometry = problem.geometry(dimensions[np.newaxis])
+    utilizations, criteria = problem.utilizations(geometry)
+    utilizations = {key: float(value[0]) for key, value in utilizations.items()}
+    lower, upper = problem.bounds
+    span = np.maximum(upper - lower, np.finfo(float).tiny)
+    active_bounds = tuple(
+        (name, side)
+        for name, value, low, high, width in zip(
+            DIMENSIONS, dimensions, lower, upper, span
+        )
+        for side, at_bound in (
+            ("lower", value - low <= tolerance * width),
+            ("upper", high - value <= tolerance * width),
+        )
+        if at_bound
+    )
+    return PlateGirderOptimum(
+        geometry=BuiltUpIGeometry(*(dimensions * millimeter)),
+        weight=geometry.W[0],
+        utilizations=utilizations,
+        flexure_criterion=criteria[0],
+        active_constraints=tuple(
+            key for key, value in utilizations.items() if value >= 1 - tolerance
+        ),
+        active_bounds=active_bounds,
+        evaluations=evaluations,
+    )
+
+
+def optimize_plate_girder(
+    problem: PlateGirderProblem,
+    population: int = 40,
+    generations: int = 200,
+    mutation: float = 0.7,
+    crossover: float = 0.9,
+    workers: int = 1,
+    seed: int | None = None,
+    tolerance: float = 0.01,
+) -> PlateGirderOptimum:
+    """
+    Differential evolution (rand/1/bin) over the continuous plate dimensions,
+    feasible candidates compared by weight and infeasible ones by constraint
+    violation. Each generation is evaluated as one batch, split over worker
+    processes when workers > 1.
+    """
+    rng = np.random.default_rng(seed)
+    lower, upper = problem.bounds
+    size = len(DIMENSIONS)
+    executor = (
+        ProcessPoolExecutor(workers, initializer=_use_package_registry)
+        if workers > 1
+        else None
+    )
+
+    def evaluate(candidates: np.ndarray) -> tuple[np.ndarray, np.ndarray]:
+        if executor is None:
+            return _evaluate(problem, candidates)
+        chunks = np.array_split(candidates, workers)
+        results = list(executor.map(_evaluate, [problem] * len(chunks), chunks))
+        return tuple(np.concatenate(values) for values in zip(*results))
+
+    try:
+        candidates = lower + rng.random((population, size)) * (upper - lower)
+        weight, violation = evaluate(candidates)
+        others = np.array(
+            [np.delete(np.arange(population), i) for i in range(population)]
+        )
+        for _ in range(generations):
+            picks = rng.permuted(others, axis=1)[:, :3]
+            base, first, second = (candidates[picks[:, i]] for i in range(3))
+            mutants = np.clip(base + mutation * (first - second), lower, upper)
+            crossed = rng.random((population, size)) < crossover
+            crossed[np.arange(population), rng.integers(size, size=population)] = True
+            trials = np.where(crossed, mutants, candidates)
+            trial_weight, trial_violation = evaluate(trials)
+            better = np.where(
+                (trial_violation == 0) & (violation == 0),
+                trial_weight <= weight,
+                trial_violation <= violation,
+            )
+            candidates[better] = trials[better]
+            weight[better] = trial_weight[better]
+            violation[better] = trial_violation[better]
+    finally:
+        if executor is not None:
+            executor.shutdown()
+    best = np.lexsort((weight, violation))[0]
+    return _optimum(
+        problem,
+        candidates[best],
+        evaluations=population * (generations + 1),
+        tolerance=tolerance,
+    )
@@ -1,10 +1,15 @@
+import math
 from dataclasses import dataclass
 from enum import Enum, StrEnum, auto
-from typing import Protocol
+from typing import Any, Callable, Iterable, Protocol
 
-from struct_codes.criteria import Strength, StrengthType
+import numpy as np
+
+from struct_codes.criteria import DesignType, DispatchedStrength, Strength, StrengthType
+from struct_codes.instrumentation import INSTRUMENTATION, InstrumentationCategory
 from struct_codes.materials import Material
 from struct_codes.units import Quantity
+from struct_codes.vectorize import equal, is_array
 
 
 class RuleEd(str, Enum):
@@ -52,15 +57,16 @@ section_table = {
     SectionType.ST: SectionClassification.TEE,
     SectionType.Two_L: SectionClassification.TWO_L,
     SectionType.W: SectionClassification.DOUBLY_SYMMETRIC_I,
+    SectionType.WT: SectionClassification.TEE,
 }
 
-DOUBLY_SYMMETRIC_I = (SectionType.W, SectionType.WT, SectionType.M, SectionType.HP)
+DOUBLY_SYMMETRIC_I = (SectionType.W, SectionType.M, SectionType.HP)
 CHANEL = (
     SectionType.C,
     SectionType.MC,
 )
 ANGLE = (SectionType.L,)
-TEE = (SectionType.Two_L, SectionType.MT, SectionType.ST)
+TEE = (SectionType.Two_L, SectionType.WT, SectionType.MT, SectionType.ST)
 HSS = (SectionType.HSS,)
 PIPE = (SectionType.PIPE,)
 
@@ -332,12 +338,184 @@ class AiscSectionGeometry:
     WGo: Quantity
 
 
+def _design_strength(key: StrengthType, criterion: Strength) -> Quantity:
+    return INSTRUMENTATION.measure(
+        InstrumentationCategory.STRENGTH_TYPE,
+        key.value,
+        lambda: criterion.design_strength,
+    )
+
+
+def _design_strengths(
+    key: StrengthType,
+    criterion: Strength,
+    design_types: tuple[DesignType, ...],
+    factors: dict[DesignType, float] | None,
+) -> dict[DesignType, Quantity]:
+    return INSTRUMENTATION.measure(
+        InstrumentationCategory.STRENGTH_TYPE,
+        key.value,
+        lambda: criterion.design_strengths(design_types, factors),
+    )
+
+
+def _governing(strengths: dict[StrengthType, Quantity]) -> tuple[Quantity, Any]:
+    """
+    Minimum strength and its criterion. For array valued strengths (batch
+    calculations) the minimum is taken element wise and the criterion is an
+    object array of `StrengthType`.
+    """
+    if not is_array(*strengths.values()):
+        key = min(strengths, key=strengths.get)
+        return strengths[key], key
+    keys = tuple(strengths)
+    unit = strengths[keys[0]].units
+    stacked = np.stack(
+        np.broadcast_arrays(*(strengths[key].to(unit).magnitude for key in keys))
+    )
+    index = np.argmin(stacked, axis=0)
+    governing = np.empty(index.shape, dtype=object)
+    governing[...] = np.array(keys, dtype=object)[index]
+    return np.take_along_axis(stacked, index[None], axis=0)[0] * unit, governing
+
+
 def _get_min_design_strength(
     criteria: dict[StrengthType, Strength],
 ) -> tuple[Quantity, StrengthType]:
-    d = {key: value.design_strength for key, value in criteria.items()}
-    key = min(d, key=d.get)
-    return d[key], key
+    d = {key: _design_strength(key, value) for key, value in criteria.items()}
+    return _governing(d)
+
+
+def _get_min_design_strengths(
+    criteria: dict[StrengthType, Strength],
+    design_types: Iterable[DesignType],
+    factors: dict[StrengthType, dict[DesignType, float]] | None = None,
+) -> dict[DesignType, tuple[Quantity, StrengthType]]:
+    factors = factors or {}
+    design_types = tuple(design_types)
+    d = {
+        key: _design_strengths(key, value, design_types, factors.get(key))
+        for key, value in criteria.items()
+    }
+    result = {}
+    for design_type in design_types:
+        result[design_type] = _governing(
+            {key: strengths[design_type] for key, strengths in d.items()}
+        )
+    return result
+
+
+def classified_criteria(
+    classification: tuple[Any, ...],
+    limit_states: Callable[[tuple[Any, ...]], Iterable[StrengthType]],
+    calculation: Callable[[StrengthType, tuple[Any, ...]], Strength],
+    design_type: DesignType = DesignType.ASD,
+) -> dict[StrengthType, Strength]:
+    """
+    Criteria from a section classification, e.g. (section, flange slenderness,
+    web slenderness). Array valued classifications are dispatched once per
+    distinct classification present, calculations returned more than once for
+    the same limit state are evaluated once over the combined entries.
+    """
+    if not is_array(*classification):
+        return {
+            key: calculation(key, classification)
+            for key in limit_states(classification)
+        }
+    arrays = np.broadcast_arrays(
+        *(np.asarray(value, dtype=object) for value in classification)
+    )
+    cases: dict[StrengthType, dict[int, tuple[Any, Strength]]] = {}
+    # keeps the scalar order of the limit states, so ties resolve the same way
+    order: dict[StrengthType, int] = {}
+    for case in dict.fromkeys(zip(*(array.ravel() for array in arrays))):
+        mask = np.logical_and.reduce(
+            [equal(array, value) for array, value in zip(arrays, case)]
+        )
+        for index, key in enumerate(limit_states(case)):
+            order[key] = min(order.get(key, index), index)
+            criterion = calculation(key, case)
+            key_cases = cases.setdefault(key, {})
+            previous_mask, _ = key_cases.get(id(criterion), (False, None))
+            key_cases[id(criterion)] = mask | previous_mask, criterion
+    return {
+        key: DispatchedStrength(
+            cases=tuple(cases[key].values()), design_type=design_type
+        )
+        for key in sorted(cases, key=order.get)
+    }
+
+
+@dataclass
+class BoundedDesignStrength:
+    design_strength: Quantity
+    criterion: StrengthType
+    evaluated: tuple[StrengthType, ...]
+    skipped: tuple[StrengthType, ...]
+    exact: bool
+
+    @property
+    def skipped_evaluations(self) -> int:
+        return len(self.skipped)
+
+
+def _demand_satisfied_by_bounds(criteria: Iterable[Strength], demand: Quantity) -> bool:
+    for criterion in criteria:
+        lower_bound = criterion.design_strength_lower_bound
+        if lower_bound is None or lower_bound < demand:
+            return False
+    return True
+
+
+def _evaluation_order(criterion: Strength) -> tuple[int, float]:
+    upper_bound = criterion.design_strength_upper_bound
+    if upper_bound is None:
+        return criterion.evaluation_cost, math.inf
+    return criterion.evaluation_cost, upper_bound.to_base_units().magnitude
+
+
+def _get_min_design_strength_bounded(
+    criteria: dict[StrengthType, Strength],
+    demand: Quantity | None = None,
+) -> BoundedDesignStrength:
+    """
+    Evaluates criteria from cheapest to most expensive, lowest upper bound
+    first, skipping the ones whose lower bound shows they can't govern. With a
+    demand, stops once the evaluated strengths and the lower bounds of the
+    remaining criteria all exceed it, in which case the result is not exact
+    but an upper bound of the governing strength.
+    """
+    ordered = sorted(criteria, key=lambda key: _evaluation_order(criteria[key]))
+    strength, criterion = None, None
+    evaluated, skipped = [], []
+    exact = True
+    for index, key in enumerate(ordered):
+        if strength is not None:
+            lower_bound = criteria[key].design_strength_lower_bound
+            if lower_bound is not None and lower_bound >= strength:
+                skipped.append(key)
+                continue
+            if (
+                demand is not None
+                and strength >= demand
+                and _demand_satisfied_by_bounds(
+                    (criteria[remaining] for remaining in ordered[index:]), demand
+                )
+            ):
+                skipped.extend(ordered[index:])
+                exact = False
+                break
+        value = _design_strength(key, criteria[key])
+        evaluated.append(key)
+        if strength is None or value < strength:
+            strength, criterion = value, key
+    return BoundedDesignStrength(
+        design_strength=strength,
+        criterion=criterion,
+        evaluated=tuple(evaluated),
+        skipped=tuple(skipped),
+        exact=exact,
+    )
 
 
 @dataclass
@@ -363,9 +541,82 @@ class LoadStrengthCalculation:
     @property
     def strengths(self):
         return {
-            key.value: value.design_strength for key, value in self.criteria.items()
+            key.value: _design_strength(key, value)
+            for key, value in self.criteria.items()
         }
 
+    def bounded_design_strength(
+        self, demand: Quantity | None = None
+    ) -> BoundedDesignStrength:
+        return _get_min_design_strength_bounded(self.criteria, demand)
+
+    @property
+    def nominal_strengths(self):
+        return {
+            key.value: value.nominal_strength for key, value in self.criteria.items()
+        }
+
+    def design_strengths(
+        self,
+        design_types: Iterable[DesignType] = tuple(DesignType),
+        factors: dict[StrengthType, dict[DesignType, float]] | None = None,
+    ) -> dict[DesignType, tuple[Quantity, StrengthType]]:
+        """
+        Governing design strength and criterion per design type, computing each
+        criterion nominal strength once.
+        """
+        return _get_min_design_strengths(self.criteria, design_types, factors)
+
+    def strengths_per_design_type(
+        self,
+        design_types: Iterable[DesignType] = tuple(DesignType),
+        factors: dict[StrengthType, dict[DesignType, float]] | None = None,
+    ) -> dict[str, dict[DesignType, Quantity]]:
+        factors = factors or {}
+        design_types = tuple(design_types)
+        return {
+            key.value: _design_strengths(key, value, design_types, factors.get(key))
+            for key, value in self.criteria.items()
+        }
+
+
+@dataclass
+class SegmentedLoadStrengthCalculation:
+    """
+    Strength of a member along its unbraced segments, `calculation` is array
+    valued with one entry per segment. The member strength is the one of the
+    governing segment.
+    """
+
+    segment_lengths: Quantity
+    modification_factors: Any
+    calculation: LoadStrengthCalculation
+
+    @property
+    def segment_design_strengths(self) -> tuple[Quantity, Any]:
+        strengths, criteria = self.calculation.design_strength_tuple
+        shape = np.shape(self.segment_lengths)
+        return np.broadcast_to(strengths, shape), np.broadcast_to(criteria, shape)
+
+    @property
+    def governing_segment(self) -> int:
+        strengths, _ = self.segment_design_strengths
+        return int(np.argmin(strengths.magnitude))
+
+    @property
+    def design_strength_tuple(self) -> tuple[Quantity, StrengthType]:
+        strengths, criteria = self.segment_design_strengths
+        segment = self.governing_segment
+        return strengths[segment], criteria[segment]
+
+    @property
+    def design_strength(self) -> Quantity:
+        return self.design_strength_tuple[0]
+
+    @property
+    def design_strength_criterion(self) -> StrengthType:
+        return self.design_strength_tuple[1]
+
 
 class ConstructionType(str, Enum):
     ROLLED = "ROLLED"
@@ -379,6 +630,13 @@ class Connection(Protocol):
     @property
     def shear_lag_factor(self) -> float: ...
 
+    def block_shear(
+        self,
+        yield_stress: Quantity,
+        ultimate_stress: Quantity,
+        design_type: DesignType = DesignType.ASD,
+    ) -> Strength | None: ...
+
 
 @dataclass
 class Beam:
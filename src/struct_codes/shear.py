@@ -0,0 +1,120 @@
+from pint import Quantity
+
+from struct_codes.instrumentation import instrumented_formula
+from struct_codes.vectorize import where
+
+
+@instrumented_formula
+def nominal_shear_strength(
+    yield_stress: Quantity,
+    web_area: Quantity,
+    web_shear_coefficient: float = 1.0,
+):
+    return 0.6 * yield_stress * web_area * web_shear_coefficient
+
+
+@instrumented_formula
+def web_shear_coefficient_limit(
+    shear_buckling_coefficient: float,
+    modulus_linear: Quantity,
+    yield_stress: Quantity,
+    factor: float = 1.10,
+) -> float:
+    """Condition of eq. G2-3 aisc 360-16"""
+    return factor * (shear_buckling_coefficient * modulus_linear / yield_stress) ** 0.5
+
+
+@instrumented_formula
+def web_shear_coefficient(
+    shear_buckling_coefficient: float,
+    modulus_linear: Quantity,
+    yield_stress: Quantity,
+    web_ratio: float,
+) -> float:
+    """eq. G2-4 and G2-10 aisc 360-16"""
+    return (
+        1.10
+        * (shear_buckling_coefficient * modulus_linear / yield_stress) ** 0.5
+        / web_ratio
+    )
+
+
+@instrumented_formula
+def web_shear_coefficient_2(
+    shear_buckling_coefficient: float,
+    modulus_linear: Quantity,
+    yield_stress: Quantity,
+    web_ratio: float,
+) -> float:
+    """eq. G2-11 aisc 360-16"""
+    return (
+        1.51
+        * shear_buckling_coefficient
+        * modulus_linear
+        / (web_ratio**2 * yield_stress)
+    )
+
+
+@instrumented_formula
+def web_shear_buckling_coefficient(
+    shear_buckling_coefficient: float,
+    modulus_linear: Quantity,
+    yield_stress: Quantity,
+    web_ratio: float,
+) -> float:
+    """Cv1, eq. G2-3 and G2-4 aisc 360-16"""
+    limit = web_shear_coefficient_limit(
+        shear_buckling_coefficient=shear_buckling_coefficient,
+        modulus_linear=modulus_linear,
+        yield_stress=yield_stress,
+    )
+    return where(
+        web_ratio <= limit,
+        1.0,
+        web_shear_coefficient(
+            shear_buckling_coefficient=shear_buckling_coefficient,
+            modulus_linear=modulus_linear,
+            yield_stress=yield_stress,
+            web_ratio=web_ratio,
+        ),
+    )
+
+
+@instrumented_formula
+def web_shear_buckling_coefficient_tension_field(
+    shear_buckling_coefficient: float,
+    modulus_linear: Quantity,
+    yield_stress: Quantity,
+    web_ratio: float,
+) -> float:
+    """Cv2, eq. G2-9 to G2-11 aisc 360-16"""
+    limit_i = web_shear_coefficient_limit(
+        shear_buckling_coefficient=shear_buckling_coefficient,
+        modulus_linear=modulus_linear,
+        yield_stress=yield_stress,
+    )
+    limit_ii = web_shear_coefficient_limit(
+        shear_buckling_coefficient=shear_buckling_coefficient,
+        modulus_linear=modulus_linear,
+        yield_stress=yield_stress,
+        factor=1.37,
+    )
+    return where(
+        web_ratio <= limit_i,
+        1.0,
+        where(
+            web_ratio <= limit_ii,
+            web_shear_coefficient(
+                shear_buckling_coefficient=shear_buckling_coefficient,
+                modulus_linear=modulus_linear,
+                yield_stress=yield_stress,
+                web_ratio=web_ratio,
+            ),
+            web_shear_coefficient_2(
+                shear_buckling_coefficient=shear_buckling_coefficient,
+                modulus_linear=modulus_linear,
+                yield_stress=yield_stress,
+                web_ratio=web_ratio,
+            ),
+        ),
+    )
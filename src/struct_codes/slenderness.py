@@ -4,6 +4,7 @@ from dataclasses import dataclass
 from pint import Quantity
 
 from struct_codes.sections import ConstructionType
+from struct_codes.vectorize import clip, select
 
 
 class Slenderness(str, Enum):
@@ -16,18 +17,15 @@ class Slenderness(str, Enum):
 def flexural_slenderness_per_element(
     limit_slender: float, limit_compact: float, ratio: float
 ) -> Slenderness:
-    if ratio < limit_compact:
-        return Slenderness.COMPACT
-    elif ratio < limit_slender:
-        return Slenderness.NON_COMPACT
-    else:
-        return Slenderness.SLENDER
+    return select(
+        [ratio < limit_compact, ratio < limit_slender],
+        [Slenderness.COMPACT, Slenderness.NON_COMPACT],
+        Slenderness.SLENDER,
+    )
 
 
 def axial_slenderness_per_element(ratio: float, limit: float):
-    if ratio < limit:
-        return Slenderness.NON_SLENDER
-    return Slenderness.SLENDER
+    return select([ratio < limit], [Slenderness.NON_SLENDER], Slenderness.SLENDER)
 
 
 def axial_rolled_flanges_limit_ratio(
@@ -55,7 +53,7 @@ def kc_coefficient(heigth_to_thickness_ratio: float):
     TABLE B4.1a Width-to-Thickness Ratios: Compression Elements
     Members Subject to Axial Compression - note [a]
     """
-    return min((max((4 / heigth_to_thickness_ratio**0.5, 0.35)), 0.76))
+    return clip(4 / heigth_to_thickness_ratio**0.5, 0.35, 0.76)
 
 
 def axial_doubly_symmetric_web_limit(
@@ -99,8 +97,8 @@ def flexural_built_up_i_flange_slender_limit(
 ) -> float:
     """TABLE B4.1b
     Width-to-Thickness Ratios: Compression Elements
-    Members Subject to Flexure"""
-    return 0.95 * (modulus_linear * kc_coefficient / yield_strength) ** 0.5
+    Members Subject to Flexure - Case 11, FL = 0.7 Fy for doubly symmetric shapes"""
+    return 0.95 * (modulus_linear * kc_coefficient / (0.7 * yield_strength)) ** 0.5
 
 
 def flexural_doubly_symmetric_web_compact_limit(
@@ -283,14 +281,3 @@ class DefaultSlendernessCalculation2016:
             limit_compact=self._flange_flexural_rolled_compact_limit,
             ratio=self.flange_ratio,
         )
-
-
-def _is_slender(
-    lamdba_ratio: float,
-    lambda_limit: float,
-    yield_stess: Quantity,
-    critical_stress: Quantity,
-):
-    if lamdba_ratio > lambda_limit * (yield_stess / critical_stress) ** 0.5:
-        raise NotImplementedError("Chapter E section 7 not implemented")
-    return False
@@ -0,0 +1,196 @@
+from dataclasses import dataclass
+
+from struct_codes.compression import (
+    CompressionElement,
+    SinglySymmetricCompressionMixin,
+    tee_shear_center_distance,
+)
+from struct_codes.criteria import DesignType, StrengthType
+from struct_codes.i_section._flexure import (
+    MinorAxisFlangeLocalBucklingCalculation2016,
+    MinorAxisYieldingCalculation2016,
+)
+from struct_codes.materials import Material
+from struct_codes.sections import (
+    ConstructionType,
+    LoadStrengthCalculation,
+    RuleEd,
+    SectionGeometry,
+)
+from struct_codes.slenderness import (
+    axial_rolled_flanges_limit_ratio,
+    flexural_rolled_i_channel_tees_flange_compact_limit,
+    flexural_rolled_i_channel_tees_flange_slender_limit,
+)
+from struct_codes.tee._compression import tee_compression_elements
+from struct_codes.tee._flexure import (
+    TeeFlangeLocalBucklingCalculation2016,
+    TeeLateralTorsionalBucklingCalculation2016,
+    TeeStemLocalBucklingCalculation2016,
+    TeeYieldingCalculation2016,
+)
+from struct_codes.tee._slenderness import (
+    axial_stem_limit_ratio,
+    flexural_stem_compact_limit,
+    flexural_stem_slender_limit,
+)
+from struct_codes.units import Quantity
+
+
+@dataclass
+class Tee(SinglySymmetricCompressionMixin):
+    """
+    WT, MT and ST tees, y the axis of symmetry along the stem. The geometry
+    may be a columnar table of several tees.
+    """
+
+    geometry: SectionGeometry
+    material: Material
+    construction: ConstructionType = ConstructionType.ROLLED
+
+    symmetry_axis = StrengthType.FLEXURAL_BUCKLING_MINOR_AXIS
+
+    @property
+    def shear_center(self) -> Quantity:
+        """Distance from the centroid to the shear center, along y"""
+        return tee_shear_center_distance(
+            centroid_distance=self.geometry.y, flange_thickness=self.geometry.tf
+        )
+
+    @property
+    def flange_section_modulus(self) -> Quantity:
+        """Sxc, elastic section modulus to the flange face"""
+        return self.geometry.Ix / self.geometry.y
+
+    @property
+    def _compression_elements_2016(self) -> tuple[CompressionElement, ...]:
+        modulus = self.material.modulus_linear
+        yield_stress = self.material.yield_strength
+        return tee_compression_elements(
+            flange_width=self.geometry.bf,
+            flange_thickness=self.geometry.tf,
+            flange_ratio=self.geometry.bf_2tf,
+            flange_limit_ratio=axial_rolled_flanges_limit_ratio(
+                modulus_linear=modulus, yield_strength=yield_stress
+            ),
+            stem_depth=self.geometry.d,
+            stem_thickness=self.geometry.tw,
+            stem_ratio=self.geometry.D_t,
+            stem_limit_ratio=axial_stem_limit_ratio(
+                modulus_linear=modulus, yield_strength=yield_stress
+            ),
+        )
+
+    @property
+    def _flange_flexural_compact_limit(self) -> float:
+        return flexural_rolled_i_channel_tees_flange_compact_limit(
+            modulus_linear=self.material.modulus_linear,
+            yield_strength=self.material.yield_strength,
+        )
+
+    @property
+    def _flange_flexural_slender_limit(self) -> float:
+        return flexural_rolled_i_channel_tees_flange_slender_limit(
+            modulus_linear=self.material.modulus_linear,
+            yield_strength=self.material.yield_strength,
+        )
+
+    def flexure_major_axis(
+        self,
+        length: Quantity = None,
+        stem_in_compression: bool = False,
+        design_type: DesignType = DesignType.ASD,
+        rule_editon: RuleEd = RuleEd.ED15,
+    ) -> LoadStrengthCalculation:
+        """
+        F9, flange local buckling with the stem in tension and stem local
+        buckling with the stem in compression. Lateral-torsional buckling only
+        with an unbraced length, F9 has no Cb in the 2016 edition.
+        """
+        geometry = self.geometry
+        material = self.material
+        criteria = {
+            StrengthType.YIELD: TeeYieldingCalculation2016(
+                yield_stress=material.yield_strength,
+                plastic_section_modulus=geometry.Zx,
+                elastic_section_modulus=geometry.Sx,
+                stem_in_compression=stem_in_compression,
+                design_type=design_type,
+            )
+        }
+        if length is not None:
+            criteria[StrengthType.LATERAL_TORSIONAL_BUCKLING] = (
+                TeeLateralTorsionalBucklingCalculation2016(
+                    length=length,
+                    yield_stress=material.yield_strength,
+                    modulus=material.modulus_linear,
+                    plastic_section_modulus=geometry.Zx,
+                    elastic_section_modulus=geometry.Sx,
+                    radius_of_gyration=geometry.ry,
+                    minor_axis_inertia=geometry.Iy,
+                    torsional_constant=geometry.J,
+                    depth=geometry.d,
+                    stem_in_compression=stem_in_compression,
+                    design_type=design_type,
+                )
+            )
+        if stem_in_compression:
+            criteria[StrengthType.STEM_LOCAL_BUCKLING] = (
+                TeeStemLocalBucklingCalculation2016(
+                    yield_stress=material.yield_strength,
+                    modulus=material.modulus_linear,
+                    elastic_section_modulus=geometry.Sx,
+                    stem_ratio=geometry.D_t,
+                    compact_limit=flexural_stem_compact_limit(
+                        modulus_linear=material.modulus_linear,
+                        yield_strength=material.yield_strength,
+                    ),
+                    slender_limit=flexural_stem_slender_limit(
+                        modulus_linear=material.modulus_linear,
+                        yield_strength=material.yield_strength,
+                    ),
+                    design_type=design_type,
+                )
+            )
+        else:
+            criteria[StrengthType.COMPRESSION_FLANGE_LOCAL_BUCKLING] = (
+                TeeFlangeLocalBucklingCalculation2016(
+                    yield_stress=material.yield_strength,
+                    modulus=material.modulus_linear,
+                    plastic_section_modulus=geometry.Zx,
+                    elastic_section_modulus=geometry.Sx,
+                    flange_section_modulus=self.flange_section_modulus,
+                    flange_ratio=geometry.bf_2tf,
+                    compact_limit=self._flange_flexural_compact_limit,
+                    slender_limit=self._flange_flexural_slender_limit,
+                    design_type=design_type,
+                )
+            )
+        return LoadStrengthCalculation(criteria=criteria)
+
+    def flexure_minor_axis(
+        self,
+        design_type: DesignType = DesignType.ASD,
+        rule_editon: RuleEd = RuleEd.ED15,
+    ) -> LoadStrengthCalculation:
+        """F6 applied to the tee flange"""
+        return LoadStrengthCalculation(
+            criteria={
+                StrengthType.YIELD: MinorAxisYieldingCalculation2016(
+                    yield_stress=self.material.yield_strength,
+                    plastic_section_modulus=self.geometry.Zy,
+                    elastic_section_modulus=self.geometry.Sy,
+                    design_type=design_type,
+                ),
+                StrengthType.FLANGE_LOCAL_BUCKLING: MinorAxisFlangeLocalBucklingCalculation2016(
+                    yield_stress=self.material.yield_strength,
+                    modulus=self.material.modulus_linear,
+                    plastic_section_modulus=self.geometry.Zy,
+                    elastic_section_modulus=self.geometry.Sy,
+                    flange_ratio=self.geometry.bf_2tf,
+                    compact_limit=self._flange_flexural_compact_limit,
+                    slender_limit=self._flange_flexural_slender_limit,
+                    design_type=design_type,
+                ),
+            }
+        )
@@ -0,0 +1,33 @@
+from pint import Quantity
+
+from struct_codes.compression import CompressionElement, EffectiveWidthCoefficient
+
+
+def tee_compression_elements(
+    flange_width: Quantity,
+    flange_thickness: Quantity,
+    flange_ratio: float,
+    flange_limit_ratio: float,
+    stem_depth: Quantity,
+    stem_thickness: Quantity,
+    stem_ratio: float,
+    stem_limit_ratio: float,
+) -> tuple[CompressionElement, CompressionElement]:
+    """Flange halves and stem, TABLE E7.1 case (c) - aisc 360-16"""
+    return (
+        CompressionElement(
+            width=flange_width / 2,
+            thickness=flange_thickness,
+            slenderness=flange_ratio,
+            limit_slenderness=flange_limit_ratio,
+            coefficient_1=EffectiveWidthCoefficient.UNSTIFFENED,
+            count=2,
+        ),
+        CompressionElement(
+            width=stem_depth,
+            thickness=stem_thickness,
+            slenderness=stem_ratio,
+            limit_slenderness=stem_limit_ratio,
+            coefficient_1=EffectiveWidthCoefficient.UNSTIFFENED,
+        ),
+    )
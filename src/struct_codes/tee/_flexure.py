@@ -0,0 +1,291 @@
+from dataclasses import dataclass
+
+from pint import Quantity
+
+from struct_codes.criteria import DesignType, Strength
+from struct_codes.i_section._flexure import limiting_length_yield
+from struct_codes.instrumentation import instrumented_formula
+from struct_codes.vectorize import minimum, where
+
+
+@instrumented_formula
+def tee_plastic_moment(
+    yield_stress: Quantity,
+    plastic_section_modulus: Quantity,
+    elastic_section_modulus: Quantity,
+) -> Quantity:
+    """F9.1(a) aisc 360-16, stems in tension, Mp = FyZx <= 1.6My"""
+    return minimum(
+        yield_stress * plastic_section_modulus,
+        1.6 * yield_stress * elastic_section_modulus,
+    )
+
+
+@instrumented_formula
+def tee_limiting_length_lateral_torsional_buckling(
+    modulus: Quantity,
+    yield_stress: Quantity,
+    elastic_section_modulus: Quantity,
+    minor_axis_inertia: Quantity,
+    torsional_constant: Quantity,
+    depth: Quantity,
+) -> Quantity:
+    """Lr of F9.2(a) aisc 360-16"""
+    return (
+        1.95
+        * modulus
+        / yield_stress
+        * (minor_axis_inertia * torsional_constant) ** 0.5
+        / elastic_section_modulus
+        * (
+            2.36
+            * yield_stress
+            / modulus
+            * depth
+            * elastic_section_modulus
+            / torsional_constant
+            + 1
+        )
+        ** 0.5
+    )
+
+
+@instrumented_formula
+def tee_elastic_lateral_torsional_buckling_moment(
+    modulus: Quantity,
+    length: Quantity,
+    minor_axis_inertia: Quantity,
+    torsional_constant: Quantity,
+    depth: Quantity,
+    stem_in_compression: bool = False,
+) -> Quantity:
+    """Mcr of F9.2 aisc 360-16, B negative with the stem in compression"""
+    sign = -1 if stem_in_compression else 1
+    factor_b = (
+        sign
+        * 2.3
+        * (depth / length * (minor_axis_inertia / torsional_constant) ** 0.5)
+        .to("")
+        .magnitude
+    )
+    return (
+        1.95
+        * modulus
+        / length
+        * (minor_axis_inertia * torsional_constant) ** 0.5
+        * (factor_b + (1 + factor_b**2) ** 0.5)
+    )
+
+
+@instrumented_formula
+def tee_flange_local_buckling_strength(
+    plastic_moment: Quantity,
+    yield_stress: Quantity,
+    modulus: Quantity,
+    elastic_section_modulus: Quantity,
+    flange_section_modulus: Quantity,
+    flange_ratio: float,
+    compact_limit: float,
+    slender_limit: float,
+) -> Quantity:
+    """F9.3 aisc 360-16, Sxc the elastic section modulus to the flange"""
+    return where(
+        flange_ratio < compact_limit,
+        plastic_moment,
+        where(
+            flange_ratio < slender_limit,
+            minimum(
+                plastic_moment
+                - (plastic_moment - 0.7 * yield_stress * flange_section_modulus)
+                * (flange_ratio - compact_limit)
+                / (slender_limit - compact_limit),
+                1.6 * yield_stress * elastic_section_modulus,
+            ),
+            0.7 * modulus * flange_section_modulus / flange_ratio**2,
+        ),
+    )
+
+
+@instrumented_formula
+def tee_stem_critical_stress(
+    yield_stress: Quantity,
+    modulus: Quantity,
+    stem_ratio: float,
+    compact_limit: float,
+    slender_limit: float,
+) -> Quantity:
+    """F9.4(a) aisc 360-16"""
+    return where(
+        stem_ratio <= compact_limit,
+        yield_stress,
+        where(
+            stem_ratio <= slender_limit,
+            (1.43 - 0.515 * stem_ratio * (yield_stress / modulus) ** 0.5)
+            * yield_stress,
+            1.52 * modulus / stem_ratio**2,
+        ),
+    )
+
+
+@dataclass
+class TeeYieldingCalculation2016(Strength):
+    """AISC 360 2016 F9.1, Mp limited to My with the stem in compression"""
+
+    yield_stress: Quantity
+    plastic_section_modulus: Quantity
+    elastic_section_modulus: Quantity
+    stem_in_compression: bool = False
+    design_type: DesignType = DesignType.ASD
+
+    evaluation_cost = 0
+
+    @property
+    def nominal_strength(self):
+        if self.stem_in_compression:
+            return self.yield_stress * self.elastic_section_modulus
+        return tee_plastic_moment(
+            yield_stress=self.yield_stress,
+            plastic_section_modulus=self.plastic_section_modulus,
+            elastic_section_modulus=self.elastic_section_modulus,
+        )
+
+
+@dataclass
+class TeeLateralTorsionalBucklingCalculation2016(Strength):
+    """AISC 360 2016 F9.2"""
+
+    length: Quantity
+    yield_stress: Quantity
+    modulus: Quantity
+    plastic_section_modulus: Quantity
+    elastic_section_modulus: Quantity
+    radius_of_gyration: Quantity
+    minor_axis_inertia: Quantity
+    torsional_constant: Quantity
+    depth: Quantity
+    stem_in_compression: bool = False
+    design_type: DesignType = DesignType.ASD
+
+    evaluation_cost = 2
+
+    @property
+    def plastic_moment(self) -> Quantity:
+        return tee_plastic_moment(
+            yield_stress=self.yield_stress,
+            plastic_section_modulus=self.plastic_section_modulus,
+            elastic_section_modulus=self.elastic_section_modulus,
+        )
+
+    @property
+    def yield_moment(self) -> Quantity:
+        return self.yield_stress * self.elastic_section_modulus
+
+    @property
+    def limiting_yield_length(self) -> Quantity:
+        """Lp of F9.2(a), same expression as eq F2-5"""
+        return limiting_length_yield(
+            radius_of_gyration=self.radius_of_gyration,
+            modulus=self.modulus,
+            yield_stress=self.yield_stress,
+        )
+
+    @property
+    def limiting_length_lateral_torsional_buckling(self) -> Quantity:
+        return tee_limiting_length_lateral_torsional_buckling(
+            modulus=self.modulus,
+            yield_stress=self.yield_stress,
+            elastic_section_modulus=self.elastic_section_modulus,
+            minor_axis_inertia=self.minor_axis_inertia,
+            torsional_constant=self.torsional_constant,
+            depth=self.depth,
+        )
+
+    @property
+    def elastic_moment(self) -> Quantity:
+        return tee_elastic_lateral_torsional_buckling_moment(
+            modulus=self.modulus,
+            length=self.length,
+            minor_axis_inertia=self.minor_axis_inertia,
+            torsional_constant=self.torsional_constant,
+            depth=self.depth,
+            stem_in_compression=self.stem_in_compression,
+        )
+
+    @property
+    def nominal_strength(self):
+        if self.stem_in_compression:
+            # F9.2(b), in the units of My so ties with yielding stay exact
+            return minimum(self.yield_moment, self.elastic_moment)
+        limiting_yield_length = self.limiting_yield_length
+        limiting_length = self.limiting_length_lateral_torsional_buckling
+        # F9.2(a), the limit state doesn't apply up to Lp
+        return where(
+            self.length <= limiting_yield_length,
+            self.plastic_moment,
+            where(
+                self.length <= limiting_length,
+                self.plastic_moment
+                - (self.plastic_moment - self.yield_moment)
+                * (self.length - limiting_yield_length)
+                / (limiting_length - limiting_yield_length),
+                self.elastic_moment,
+            ),
+        )
+
+
+@dataclass
+class TeeFlangeLocalBucklingCalculation2016(Strength):
+    """AISC 360 2016 F9.3, flange in compression (stem in tension)"""
+
+    yield_stress: Quantity
+    modulus: Quantity
+    plastic_section_modulus: Quantity
+    elastic_section_modulus: Quantity
+    flange_section_modulus: Quantity
+    flange_ratio: float
+    compact_limit: float
+    slender_limit: float
+    design_type: DesignType = DesignType.ASD
+
+    @property
+    def nominal_strength(self):
+        return tee_flange_local_buckling_strength(
+            plastic_moment=tee_plastic_moment(
+                yield_stress=self.yield_stress,
+                plastic_section_modulus=self.plastic_section_modulus,
+                elastic_section_modulus=self.elastic_section_modulus,
+            ),
+            yield_stress=self.yield_stress,
+            modulus=self.modulus,
+            elastic_section_modulus=self.elastic_section_modulus,
+            flange_section_modulus=self.flange_section_modulus,
+            flange_ratio=self.flange_ratio,
+            compact_limit=self.compact_limit,
+            slender_limit=self.slender_limit,
+        )
+
+
+@dataclass
+class TeeStemLocalBucklingCalculation2016(Strength):
+    """AISC 360 2016 F9.4(a), stem in compression, Sx to the stem toe"""
+
+    yield_stress: Quantity
+    modulus: Quantity
+    elastic_section_modulus: Quantity
+    stem_ratio: float
+    compact_limit: float
+    slender_limit: float
+    design_type: DesignType = DesignType.ASD
+
+    @property
+    def nominal_strength(self):
+        return (
+            tee_stem_critical_stress(
+                yield_stress=self.yield_stress,
+                modulus=self.modulus,
+                stem_ratio=self.stem_ratio,
+                compact_limit=self.compact_limit,
+                slender_limit=self.slender_limit,
+            )
+            * self.elastic_section_modulus
+        )
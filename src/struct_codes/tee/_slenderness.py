@@ -0,0 +1,23 @@
+from pint import Quantity
+
+
+def axial_stem_limit_ratio(modulus_linear: Quantity, yield_strength: Quantity) -> float:
+    """
+    TABLE B4.1a Width-to-Thickness Ratios: Compression Elements
+    Members Subject to Axial Compression - Case 4
+    """
+    return 0.75 * (modulus_linear / yield_strength) ** 0.5
+
+
+def flexural_stem_compact_limit(
+    modulus_linear: Quantity, yield_strength: Quantity
+) -> float:
+    """F9.4(a) aisc 360-16, stem d/tw below which Fcr = Fy"""
+    return 0.84 * (modulus_linear / yield_strength) ** 0.5
+
+
+def flexural_stem_slender_limit(
+    modulus_linear: Quantity, yield_strength: Quantity
+) -> float:
+    """F9.4(a) aisc 360-16, stem d/tw above which the stem buckles elastically"""
+    return 1.52 * (modulus_linear / yield_strength) ** 0.5
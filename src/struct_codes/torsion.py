@@ -0,0 +1,349 @@
+from dataclasses import dataclass
+from enum import Enum
+from functools import cached_property
+
+import numpy as np
+from pint import Quantity
+
+from struct_codes.criteria import DesignType, Strength
+from struct_codes.instrumentation import instrumented_formula
+from struct_codes.materials import Material
+from struct_codes.sections import SectionGeometry
+
+
+class TorsionCase(str, Enum):
+    """Design Guide 9 Appendix B load cases"""
+
+    # concentrated torque anywhere along the span, torsionally pinned ends
+    CONCENTRATED_PINNED = "concentrated_pinned"
+    UNIFORM_PINNED = "uniform_pinned"
+    # uniformly distributed torque, warping and twist restrained at both ends
+    UNIFORM_FIXED = "uniform_fixed"
+    # torque at the free end, warping and twist restrained at the support
+    CONCENTRATED_CANTILEVER = "concentrated_cantilever"
+    UNIFORM_CANTILEVER = "uniform_cantilever"
+
+
+@instrumented_formula
+def torsional_bending_constant(
+    modulus_linear: Quantity,
+    modulus_shear: Quantity,
+    warping_constant: Quantity,
+    torsional_constant: Quantity,
+) -> Quantity:
+    """a = (ECw/GJ)^0.5, eq 3.6 design guide 9"""
+    return (
+        modulus_linear * warping_constant / (modulus_shear * torsional_constant)
+    ) ** 0.5
+
+
+# Solutions of the differential equation of torsion, eq 4.1 design guide 9, as
+# (θ GJ/(T a), θ' GJ/T, θ'' GJ a/T, θ''' GJ a²/T) of x = z/a and l = L/a. T is
+# the concentrated torque, or t a for a torque t per unit length.
+
+
+def _concentrated_pinned(x: np.ndarray, l: np.ndarray, alpha: np.ndarray):
+    b = alpha * l
+    before = x <= b
+    coefficient = np.sinh(b) / np.tanh(l) - np.cosh(b)
+    after_sinh = np.sinh(x) / np.tanh(l) - np.cosh(x)
+    after_cosh = np.cosh(x) / np.tanh(l) - np.sinh(x)
+    return (
+        np.where(
+            before,
+            (1 - alpha) * x + coefficient * np.sinh(x),
+            alpha * (l - x) + np.sinh(b) * after_sinh,
+        ),
+        np.where(
+            before,
+            1 - alpha + coefficient * np.cosh(x),
+            -alpha + np.sinh(b) * after_cosh,
+        ),
+        np.where(before, coefficient * np.sinh(x), np.sinh(b) * after_sinh),
+        np.where(before, coefficient * np.cosh(x), np.sinh(b) * after_cosh),
+    )
+
+
+def _uniform_pinned(x: np.ndarray, l: np.ndarray, alpha: np.ndarray):
+    half = l / 2
+    cosh = np.cosh(half - x) / np.cosh(half)
+    sinh = np.sinh(half - x) / np.cosh(half)
+    return (x * (l - x) / 2 + cosh - 1, (l - 2 * x) / 2 - sinh, cosh - 1, -sinh)
+
+
+def _uniform_fixed(x: np.ndarray, l: np.ndarray, alpha: np.ndarray):
+    half = l / 2
+    xi = x - half
+    ratio = half / np.sinh(half)
+    return (
+        (half**2 - xi**2) / 2 + ratio * (np.cosh(xi) - np.cosh(half)),
+        -xi + ratio * np.sinh(xi),
+        -1 + ratio * np.cosh(xi),
+        ratio * np.sinh(xi),
+    )
+
+
+def _concentrated_cantilever(x: np.ndarray, l: np.ndarray, alpha: np.ndarray):
+    tanh = np.tanh(l)
+    return (
+        x - np.sinh(x) + tanh * (np.cosh(x) - 1),
+        1 - np.cosh(x) + tanh * np.sinh(x),
+        -np.sinh(x) + tanh * np.cosh(x),
+        -np.cosh(x) + tanh * np.sinh(x),
+    )
+
+
+def _uniform_cantilever(x: np.ndarray, l: np.ndarray, alpha: np.ndarray):
+    coefficient = (1 + l * np.sinh(l)) / np.cosh(l)
+    return (
+        l * x - x**2 / 2 + coefficient * (np.cosh(x) - 1) - l * np.sinh(x),
+        l - x + coefficient * np.sinh(x) - l * np.cosh(x),
+        -1 + coefficient * np.cosh(x) - l * np.sinh(x),
+        coefficient * np.sinh(x) - l * np.cosh(x),
+    )
+
+
+_solutions = {
+    TorsionCase.CONCENTRATED_PINNED: _concentrated_pinned,
+    TorsionCase.UNIFORM_PINNED: _uniform_pinned,
+    TorsionCase.UNIFORM_FIXED: _uniform_fixed,
+    TorsionCase.CONCENTRATED_CANTILEVER: _concentrated_cantilever,
+    TorsionCase.UNIFORM_CANTILEVER: _uniform_cantilever,
+}
+
+_UNIFORM_CASES = (
+    TorsionCase.UNIFORM_PINNED,
+    TorsionCase.UNIFORM_FIXED,
+    TorsionCase.UNIFORM_CANTILEVER,
+)
+
+
+@instrumented_formula
+def rotation_derivatives(
+    case: TorsionCase,
+    torque: Quantity,
+    position: Quantity,
+    length: Quantity,
+    torsional_rigidity: Quantity,
+    torsional_bending_constant: Quantity,
+    load_position: float = 0.5,
+) -> tuple[Quantity, Quantity, Quantity, Quantity]:
+    """
+    θ, θ', θ'' and θ''' at the positions, design guide 9 appendix B. The torque
+    is per unit length for the uniform cases, load_position the fraction of the
+    span to the concentrated torque of the pinned case.
+    """
+    a = torsional_bending_constant
+    reference_torque = torque * a if case in _UNIFORM_CASES else torque
+    shapes = _solutions[case](
+        (position / a).to("").magnitude,
+        (length / a).to("").magnitude,
+        np.asarray(load_position),
+    )
+    scale = reference_torque / torsional_rigidity
+    return tuple(shape * scale * a ** (1 - order) for order, shape in enumerate(shapes))
+
+
+@instrumented_formula
+def warping_normal_stress(
+    modulus_linear: Quantity,
+    normalized_warping_function: Quantity,
+    second_derivative: Quantity,
+) -> Quantity:
+    """σw = E Wno θ'', eq 4.3a design guide 9"""
+    return modulus_linear * normalized_warping_function * second_derivative
+
+
+@instrumented_formula
+def warping_shear_stress(
+    modulus_linear: Quantity,
+    warping_statical_moment: Quantity,
+    thickness: Quantity,
+    third_derivative: Quantity,
+) -> Quantity:
+    """τws = -E Sw θ'''/t, eq 4.2a design guide 9"""
+    return -modulus_linear * warping_statical_moment * third_derivative / thickness
+
+
+@instrumented_formula
+def pure_torsion_shear_stress(
+    modulus_shear: Quantity, thickness: Quantity, first_derivative: Quantity
+) -> Quantity:
+    """τt = G t θ', eq 4.1 design guide 9"""
+    return modulus_shear * thickness * first_derivative
+
+
+@dataclass
+class TorsionNormalYieldingCalculation2016(Strength):
+    """Design guide 9 4.7.1, yielding under normal stress"""
+
+    yield_stress: Quantity
+    design_type: DesignType = DesignType.ASD
+
+    @property
+    def nominal_strength(self):
+        return self.yield_stress
+
+
+@dataclass
+class TorsionShearYieldingCalculation2016(Strength):
+    """Design guide 9 4.7.1, shear yielding"""
+
+    yield_stress: Quantity
+    design_type: DesignType = DesignType.ASD
+
+    @property
+    def nominal_strength(self):
+        return 0.6 * self.yield_stress
+
+
+@dataclass
+class TorsionStresses:
+    """
+    Stresses at the stations, torsion added in absolute value to flexure as in
+    design guide 9 4.6: normal stress at the flange tips, flange shear at the
+    web junction and web shear at mid-depth.
+    """
+
+    normal: Quantity
+    flange_shear: Quantity
+    web_shear: Quantity
+    yield_stress: Quantity
+    design_type: DesignType = DesignType.ASD
+
+    @property
+    def normal_utilization(self) -> np.ndarray:
+        design = TorsionNormalYieldingCalculation2016(
+            yield_stress=self.yield_stress, design_type=self.design_type
+        ).design_strength
+        return (self.normal / design).to("").magnitude
+
+    @property
+    def shear_utilization(self) -> np.ndarray:
+        design = TorsionShearYieldingCalculation2016(
+            yield_stress=self.yield_stress, design_type=self.design_type
+        ).design_strength
+        return (np.maximum(self.flange_shear, self.web_shear) / design).to("").magnitude
+
+    @property
+    def utilization(self) -> np.ndarray:
+        """Largest ratio along each member"""
+        return np.max(
+            np.maximum(self.normal_utilization, self.shear_utilization), axis=-1
+        )
+
+
+def _per_member(value):
+    """Trailing axis for the stations, arrays are over the members"""
+    if np.ndim(value) == 0:
+        return value
+    return value[..., np.newaxis]
+
+
+@dataclass
+class TorsionalAnalysis:
+    """
+    Design guide 9 torsion of open sections along the member, evaluated at
+    equally spaced stations. Geometry, material, length and torque may be
+    arrays over several members, results are (members, stations) arrays.
+    Warping shear uses Sw1, the flange value of I-shapes.
+    """
+
+    geometry: SectionGeometry
+    material: Material
+    length: Quantity
+    torque: Quantity
+    case: TorsionCase = TorsionCase.CONCENTRATED_PINNED
+    load_position: float = 0.5
+    stations: int = 101
+
+    @cached_property
+    def torsional_bending_constant(self) -> Quantity:
+        return torsional_bending_constant(
+            modulus_linear=self.material.modulus_linear,
+            modulus_shear=self.material.modulus_shear,
+            warping_constant=self.geometry.Cw,
+            torsional_constant=self.geometry.J,
+        )
+
+    @cached_property
+    def positions(self) -> Quantity:
+        return _per_member(self.length) * np.linspace(0, 1, self.stations)
+
+    @cached_property
+    def rotation(self) -> tuple[Quantity, Quantity, Quantity, Quantity]:
+        """θ, θ', θ'' and θ''' at the stations"""
+        return rotation_derivatives(
+            case=self.case,
+            torque=_per_member(self.torque),
+            position=self.positions,
+            length=_per_member(self.length),
+            torsional_rigidity=_per_member(
+                self.material.modulus_shear * self.geometry.J
+            ),
+            torsional_bending_constant=_per_member(self.torsional_bending_constant),
+            load_position=_per_member(np.asarray(self.load_position)),
+        )
+
+    @property
+    def warping_normal_stress(self) -> Quantity:
+        return warping_normal_stress(
+            modulus_linear=_per_member(self.material.modulus_linear),
+            normalized_warping_function=_per_member(self.geometry.Wno),
+            second_derivative=self.rotation[2],
+        )
+
+    @property
+    def flange_warping_shear_stress(self) -> Quantity:
+        return warping_shear_stress(
+            modulus_linear=_per_member(self.material.modulus_linear),
+            warping_statical_moment=_per_member(self.geometry.Sw1),
+            thickness=_per_member(self.geometry.tf),
+            third_derivative=self.rotation[3],
+        )
+
+    @property
+    def flange_pure_torsion_shear_stress(self) -> Quantity:
+        return pure_torsion_shear_stress(
+            modulus_shear=_per_member(self.material.modulus_shear),
+            thickness=_per_member(self.geometry.tf),
+            first_derivative=self.rotation[1],
+        )
+
+    @property
+    def web_pure_torsion_shear_stress(self) -> Quantity:
+        return pure_torsion_shear_stress(
+            modulus_shear=_per_member(self.material.modulus_shear),
+            thickness=_per_member(self.geometry.tw),
+            first_derivative=self.rotation[1],
+        )
+
+    def stresses(
+        self,
+        major_axis_moment: Quantity = None,
+        major_axis_shear: Quantity = None,
+        design_type: DesignType = DesignType.ASD,
+    ) -> TorsionStresses:
+        """
+        Torsion combined with major axis flexure, moment and shear given at the
+        stations, broadcasting with the positions.
+        """
+        geometry = self.geometry
+        normal = np.abs(self.warping_normal_stress)
+        flange_shear = np.abs(self.flange_pure_torsion_shear_stress) + np.abs(
+            self.flange_warping_shear_stress
+        )
+        web_shear = np.abs(self.web_pure_torsion_shear_stress)
+        if major_axis_moment is not None:
+            normal = normal + np.abs(major_axis_moment) / _per_member(geometry.Sx)
+        if major_axis_shear is not None:
+            shear = np.abs(major_axis_shear) / _per_member(geometry.Ix)
+            flange_shear = flange_shear + shear * _per_member(geometry.Qf / geometry.tf)
+            web_shear = web_shear + shear * _per_member(geometry.Qw / geometry.tw)
+        return TorsionStresses(
+            normal=normal,
+            flange_shear=flange_shear,
+            web_shear=web_shear,
+            yield_stress=_per_member(self.material.yield_strength),
+            design_type=design_type,
+        )
@@ -13,5 +13,6 @@ inch = ureg.inch
 kilogram = ureg.kilogram
 gigapascal = ureg.GPa
 megapascal = ureg.MPa
+ksi = ureg.ksi
 newton = ureg.newton
 kilonewton = 1000 * ureg.newton
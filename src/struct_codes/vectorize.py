@@ -0,0 +1,59 @@
+from typing import Any
+
+import numpy as np
+
+
+def is_array(*values: Any) -> bool:
+    """True if any of the values is an array (or array valued quantity)"""
+    return any(np.ndim(value) > 0 for value in values)
+
+
+def _keep_scalar(result: Any) -> Any:
+    if np.ndim(result) == 0:
+        return result[()]
+    return result
+
+
+def where(condition: Any, x: Any, y: Any) -> Any:
+    """np.where returning scalars for scalar inputs"""
+    return _keep_scalar(np.where(condition, x, y))
+
+
+def minimum(x: Any, y: Any) -> Any:
+    return _keep_scalar(np.minimum(x, y))
+
+
+def maximum(x: Any, y: Any) -> Any:
+    return _keep_scalar(np.maximum(x, y))
+
+
+def clip(value: Any, lower: Any, upper: Any) -> Any:
+    return _keep_scalar(np.clip(value, lower, upper))
+
+
+def select(conditions: list[Any], choices: list[Any], default: Any) -> Any:
+    """
+    np.select for any kind of choices (enums, strings), the first true condition
+    wins. Array results have dtype object so the choices are kept as given.
+    """
+    if not is_array(*conditions):
+        for condition, choice in zip(conditions, choices):
+            if condition:
+                return choice
+        return default
+    shape = np.broadcast_shapes(*(np.shape(condition) for condition in conditions))
+    result = np.empty(shape, dtype=object)
+    result.fill(default)
+    for condition, choice in reversed(list(zip(conditions, choices))):
+        result[np.broadcast_to(condition, shape)] = choice
+    return result
+
+
+def equal(array: Any, value: Any) -> Any:
+    """
+    Element wise equality with any object, numpy would otherwise convert str
+    based enums to plain strings before comparing
+    """
+    item = np.empty((), dtype=object)
+    item[()] = value
+    return np.asarray(array, dtype=object) == item
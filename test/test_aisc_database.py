@@ -0,0 +1,106 @@
+import os
+import subprocess
+import sys
+
+from math import isnan
+
+from pytest import approx, importorskip, mark, raises
+
+from struct_codes.aisc_database import (
+    DATABASE_PATHS,
+    AiscSectionTable,
+    DoubleAngleOrientation,
+    aisc_sections,
+    get_aisc_geometry_table,
+    process_aisc_database_v160_row,
+    read_csv_rows,
+    read_csv_table,
+)
+from struct_codes.sections import RuleEd, SectionType
+from struct_codes.units import Quantity, inch
+
+IMPORT_TIME_BUDGET = 2.0  # seconds
+
+IMPORT_SCRIPT = """
+import sys
+import time
+
+start = time.perf_counter()
+import struct_codes
+import struct_codes.aisc_database
+print(time.perf_counter() - start)
+print("pandas" in sys.modules)
+"""
+
+
+def test_import_time_budget():
+    env = dict(os.environ, PYTHONPATH=os.pathsep.join(sys.path))
+    result = subprocess.run(
+        [sys.executable, "-c", IMPORT_SCRIPT],
+        capture_output=True,
+        text=True,
+        env=env,
+        check=True,
+    )
+    elapsed, pandas_imported = result.stdout.split()
+    assert pandas_imported == "False"
+    assert float(elapsed) < IMPORT_TIME_BUDGET
+
+
+@mark.parametrize("ed", [RuleEd.ED15, RuleEd.ED16])
+def test_pandas_free_loader_matches_csv_conversion(ed: RuleEd):
+    importorskip("pandas")
+    table = aisc_sections(ed)
+    expected = read_csv_table(DATABASE_PATHS[ed])
+    assert list(table) == list(expected)
+    # double angles are generated, compared in test_double_angles_generated_from_angles
+    assert {name: table[name] for name in table if not name.startswith("2L")} == {
+        name: row for name, row in expected.items() if not name.startswith("2L")
+    }
+
+
+def test_double_angles_generated_from_angles():
+    stored = read_csv_rows(DATABASE_PATHS[RuleEd.ED16])
+    table = AiscSectionTable(dict(stored))
+    names = table.names(SectionType.Two_L)
+    assert len(names) == 639
+    for name in names:
+        row = table[name]
+        expected = process_aisc_database_v160_row(stored[name])
+        for key, value in expected.items():
+            if isinstance(value, Quantity) and not isnan(value.magnitude):
+                assert row[key].to(value.units).magnitude == approx(
+                    value.magnitude, rel=0.025
+                ), (name, key)
+            elif not isinstance(value, (Quantity, float)):
+                assert row[key] == value, (name, key)
+
+
+def test_double_angle_any_spacing():
+    table = aisc_sections()
+    row = table.double_angle(
+        "L8X6X1", 5 / 8 * inch, orientation=DoubleAngleOrientation.SLBB
+    )
+    assert row["EDI_STD_Nomenclature_imp"] == "2L8X6X1X5/8SLBB"
+    assert table["2L8X6X1X5/8SLBB"] is row
+    assert table["2L8X6X1X3/8SLBB"]["Iy"] < row["Iy"] < table["2L8X6X1X3/4SLBB"]["Iy"]
+    assert table["2L8X6X1X5/8SLBB"]["Ix"] == table["2L8X6X1SLBB"]["Ix"]
+
+
+@mark.parametrize("name", ["2L8X6X1XAB/8LLBB", "2L8X6X1X3/0", "2L8X6"])
+def test_malformed_double_angle_name(name: str):
+    table = aisc_sections()
+    with raises(KeyError):
+        table[name]
+    assert name not in table
+
+
+def test_geometry_table_columns():
+    names = ("W6X15", "W14X90")
+    table = get_aisc_geometry_table(names)
+    assert table.EDI_STD_Nomenclature_imp == names
+    for i, name in enumerate(names):
+        section = aisc_sections()[name]
+        assert table.A[i] == section["A"]
+        assert table.bf_2tf[i] == section["bf_2tf"]
+        assert table.T_F[i] == section["T_F"]
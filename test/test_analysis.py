@@ -0,0 +1,129 @@
+from dataclasses import replace
+
+from pytest import approx, raises
+from unit_processing import compare_quantites
+
+from struct_codes.aisc_database import (
+    aisc_sections,
+    create_aisc_section,
+    get_aisc_section_geo_and_type,
+)
+from struct_codes.analysis import Analysis, compression_check, model_check
+from struct_codes.beam import Beam
+from struct_codes.connections import BoltedFlangeConnection
+from struct_codes.criteria import StrengthType
+from struct_codes.i_section import DoublySymmetricI
+from struct_codes.materials import steel250MPa, steel355MPa
+from struct_codes.sections import (
+    ConstructionType,
+    RuleEd,
+    SectionClassification,
+    SectionType,
+)
+from struct_codes.units import meter, millimeter, newton
+
+
+def analysis(section_name: str, beam: Beam, material=steel355MPa) -> Analysis:
+    geometry, section_type = get_aisc_section_geo_and_type(section_name)
+    return Analysis(
+        geometry=geometry,
+        section_type=section_type,
+        material=material,
+        construction=ConstructionType.ROLLED,
+        beam=beam,
+    )
+
+
+def test_lengths_default_to_major_axis():
+    model = analysis("W6X15", Beam(2 * meter, length_torsion=1 * meter))
+    assert model.beam.length_minor_axis == 2 * meter
+    assert model.beam.length_torsion == 1 * meter
+
+
+def test_model_matches_sections():
+    catalog = aisc_sections(RuleEd.ED15)
+    names = (
+        ("W21X44", "HSS8X8X.125", "L6X4X5/16")
+        + catalog.names(SectionType.W)[:20]
+        + catalog.names(SectionType.C)[:10]
+        + catalog.names(SectionType.WT)[:10]
+        + catalog.names(SectionType.HSS)[:10]
+        + catalog.names(SectionType.L)[:10]
+    )
+    lengths = [(1 + i % 3) * meter for i in range(len(names))]
+    materials = [(steel355MPa, steel250MPa)[i % 2] for i in range(len(names))]
+    check = compression_check(
+        analysis(name, Beam(length), material)
+        for name, length, material in zip(names, lengths, materials)
+    )
+    assert len(check.groups) == 5
+    for i, name in enumerate(names):
+        # E7 slender elements, E4 and the principal axes of angles included
+        calc = create_aisc_section(
+            name, materials[i], ConstructionType.ROLLED
+        ).compression(length_major_axis=lengths[i])
+        assert calc.design_strength.to(check.design_strength.units).magnitude == approx(
+            check.design_strength[i].magnitude
+        )
+        assert calc.design_strength_criterion == check.design_strength_criterion[i]
+
+
+def test_model_carries_connection():
+    geometry, _ = get_aisc_section_geo_and_type("W14X90")
+    connection = BoltedFlangeConnection.from_geometry(
+        geometry,
+        hole_diameter=24 * millimeter,
+        pitch=75 * millimeter,
+        bolts_per_line=3,
+        end_distance=40 * millimeter,
+    )
+    models = [
+        replace(analysis("W14X90", Beam(3 * meter)), connection=connection),
+        analysis("W14X90", Beam(3 * meter)),
+        replace(analysis("W14X90", Beam(2 * meter)), connection=connection),
+    ]
+    table = {
+        SectionClassification.DOUBLY_SYMMETRIC_I: (
+            (
+                StrengthType.ULTIMATE,
+                lambda model: model.section.tension().criteria[StrengthType.ULTIMATE],
+            ),
+        )
+    }
+    check = model_check(models, table)
+    assert len(check.groups) == 2
+    for i, model in enumerate(models):
+        calc = DoublySymmetricI(
+            geometry, steel355MPa, connection=model.connection
+        ).tension()
+        compare_quantites(
+            check.design_strength[i],
+            calc.criteria[StrengthType.ULTIMATE].design_strength,
+        )
+
+
+def test_group_of_member():
+    models = [
+        analysis("W6X15", Beam(1 * meter)),
+        analysis("C10X15.3", Beam(1 * meter)),
+        analysis("W6X15", Beam(3 * meter)),
+    ]
+    check = compression_check(models)
+    calc, position = check.group(2)
+    compare_quantites(
+        calc.criteria[StrengthType.FLEXURAL_BUCKLING_MAJOR_AXIS].design_strength[
+            position
+        ],
+        models[2]
+        .compression.criteria[StrengthType.FLEXURAL_BUCKLING_MAJOR_AXIS]
+        .design_strength,
+    )
+    calc, position = check.group(0)
+    compare_quantites(
+        calc.criteria[StrengthType.FLEXURAL_BUCKLING_MAJOR_AXIS].design_strength[
+            position
+        ],
+        597228.27 * newton,
+    )
+    with raises(IndexError):
+        check.group(3)
@@ -0,0 +1,123 @@
+from pytest import approx, mark
+from unit_processing import assert_catalog_matches_scalar, compare_quantites
+
+from struct_codes.aisc_database import aisc_sections, create_aisc_section
+from struct_codes.angle import AngleLeg, SingleAngle, TrussType
+from struct_codes.criteria import StrengthType
+from struct_codes.materials import steel250MPa, steel355MPa
+from struct_codes.sections import ConstructionType, RuleEd, SectionType
+from struct_codes.units import megapascal, meter, millimeter, newton
+
+
+def angle(section_name: str) -> SingleAngle:
+    return create_aisc_section(section_name, steel250MPa, ConstructionType.ROLLED)
+
+
+@mark.parametrize(
+    "section_name, expected_parameter",
+    [
+        # AISC Commentary Table C-F10.1 gives 3.14 in
+        ("L6X4X1/2", 78.62077 * millimeter),
+        # AISC Commentary Table C-F10.1 gives 5.50 in
+        ("L8X4X1/2", 139.64621 * millimeter),
+        ("L4X4X1/4", 0 * millimeter),
+    ],
+)
+def test_monosymmetry_parameter(section_name, expected_parameter):
+    assert angle(section_name).monosymmetry_parameter.to("mm").magnitude == approx(
+        expected_parameter.to("mm").magnitude, abs=1e-5
+    )
+
+
+@mark.parametrize(
+    "connected_leg, truss, expected_strength",
+    [
+        # L/ra = 69.0, eq E5-1
+        (AngleLeg.LONG, TrussType.PLANAR, 339820.09206 * newton),
+        # L/ra = 41.2 <= 80, eq E5-1 plus 4[(152/102)² - 1]
+        (AngleLeg.SHORT, TrussType.PLANAR, 413118.31361 * newton),
+    ],
+)
+def test_compression_connected_leg(connected_leg, truss, expected_strength):
+    calc = angle("L6X4X1/2").compression_connected_leg(
+        length=2 * meter, connected_leg=connected_leg, truss=truss
+    )
+    compare_quantites(
+        calc.criteria[StrengthType.FLEXURAL_BUCKLING].nominal_strength,
+        expected_strength,
+    )
+
+
+def test_flexural_torsional_buckling():
+    """Lowest root of eq E4-4, slender long leg by eq E7-2"""
+    calc = angle("L6X4X5/16").compression(length_major_axis=2 * meter)
+    assert calc.design_strength_criterion == StrengthType.FLEXURAL_TORSIONAL_BUCKLING
+    criterion = calc.criteria[StrengthType.FLEXURAL_TORSIONAL_BUCKLING]
+    compare_quantites(criterion.elastic_buckling_stress, 185.84598 * megapascal)
+    compare_quantites(criterion.nominal_strength, 265641.84961 * newton)
+
+
+def test_equal_leg_flexural_torsional_buckling_matches_minor_axis():
+    """Shear center on the major axis, minor axis buckling is uncoupled"""
+    calc = angle("L4X4X1/4").compression(length_major_axis=2 * meter)
+    compare_quantites(
+        calc.criteria[StrengthType.FLEXURAL_TORSIONAL_BUCKLING].nominal_strength,
+        calc.criteria[StrengthType.FLEXURAL_BUCKLING_MINOR_AXIS].nominal_strength,
+    )
+
+
+@mark.parametrize(
+    "section_name, flexure, kwargs, expected_strength, expected_criterion",
+    [
+        # eq F10-1 with SwC
+        (
+            "L6X4X1/2",
+            "flexure_major_axis",
+            {},
+            30975 * newton * meter,
+            StrengthType.YIELD,
+        ),
+        # βw negative, eq F10-2
+        (
+            "L6X4X1/2",
+            "flexure_major_axis",
+            {"length": 2 * meter},
+            26650.84140 * newton * meter,
+            StrengthType.LATERAL_TORSIONAL_BUCKLING,
+        ),
+        # noncompact long leg b/t = 19.2, eq F10-7
+        (
+            "L6X4X5/16",
+            "flexure_major_axis",
+            {},
+            16853.37753 * newton * meter,
+            StrengthType.LEG_LOCAL_BUCKLING,
+        ),
+    ],
+)
+def test_flexure(section_name, flexure, kwargs, expected_strength, expected_criterion):
+    calc = getattr(angle(section_name), flexure)(**kwargs)
+    assert calc.design_strength_criterion == expected_criterion
+    compare_quantites(
+        calc.criteria[expected_criterion].nominal_strength, expected_strength
+    )
+
+
+@mark.parametrize("material", [steel355MPa, steel250MPa])
+def test_whole_catalog_matches_scalar(material):
+    names = aisc_sections(RuleEd.ED15).names(SectionType.L)
+
+    def calculations(section: SingleAngle):
+        return (
+            section.compression(length_major_axis=2 * meter),
+            section.compression_connected_leg(length=2 * meter),
+            section.compression_connected_leg(
+                length=2 * meter,
+                connected_leg=AngleLeg.SHORT,
+                truss=TrussType.SPACE,
+            ),
+            section.flexure_major_axis(length=2 * meter),
+            section.flexure_minor_axis(),
+        )
+
+    assert_catalog_matches_scalar(SingleAngle, names, material, calculations)
@@ -0,0 +1,60 @@
+import numpy as np
+from pytest import fixture, mark, raises
+from unit_processing import compare_quantites
+
+from struct_codes.aisc_database import create_aisc_section
+from struct_codes.capacity_tables import (
+    CapacityCurve,
+    CapacityTable,
+    ScreeningResult,
+)
+from struct_codes.materials import steel355MPa
+from struct_codes.sections import ConstructionType
+from struct_codes.units import meter, newton
+
+SECTIONS = ("W6X15", "W14X90")
+
+
+@fixture(scope="module")
+def table() -> CapacityTable:
+    return CapacityTable.build(
+        SECTIONS, steel355MPa, np.array([0.5, 2.0, 4.0, 6.0, 8.0]) * meter
+    )
+
+
+@mark.parametrize("section_name", SECTIONS)
+@mark.parametrize("length", [2.0 * meter, 4.7 * meter])
+def test_estimate_bounds_exact_strength(table: CapacityTable, section_name, length):
+    section = create_aisc_section(section_name, steel355MPa, ConstructionType.ROLLED)
+    exact = {
+        CapacityCurve.COMPRESSION: section.compression(
+            length_major_axis=length
+        ).design_strength,
+        CapacityCurve.FLEXURE_MAJOR_AXIS: section.flexure_major_axis(
+            length=length
+        ).design_strength,
+    }
+    for curve, strength in exact.items():
+        estimate = table.estimate(section_name, curve, length)
+        assert estimate.lower_bound <= strength <= estimate.upper_bound
+        assert abs(estimate.value - strength) <= estimate.error_bound
+
+
+def test_screen(table: CapacityTable):
+    results = table.screen(CapacityCurve.COMPRESSION, 3 * meter, 500_000 * newton)
+    assert results == {"W6X15": ScreeningResult.FAIL, "W14X90": ScreeningResult.PASS}
+
+
+def test_length_outside_table(table: CapacityTable):
+    with raises(ValueError):
+        table.estimate("W6X15", CapacityCurve.COMPRESSION, 10 * meter)
+
+
+def test_save_and_load(table: CapacityTable, tmp_path):
+    file_path = tmp_path / "table.json"
+    table.save(file_path)
+    loaded = CapacityTable.load(file_path)
+    compare_quantites(
+        loaded.estimate("W14X90", CapacityCurve.FLEXURE_MAJOR_AXIS, 5 * meter).value,
+        table.estimate("W14X90", CapacityCurve.FLEXURE_MAJOR_AXIS, 5 * meter).value,
+    )
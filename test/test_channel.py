@@ -0,0 +1,64 @@
+from pytest import mark
+from unit_processing import assert_catalog_matches_scalar, compare_quantites
+
+from struct_codes.aisc_database import aisc_sections, create_aisc_section
+from struct_codes.channel import Channel
+from struct_codes.criteria import StrengthType
+from struct_codes.materials import steel250MPa, steel355MPa
+from struct_codes.sections import ConstructionType, RuleEd, SectionType
+from struct_codes.units import megapascal, meter, millimeter, newton
+
+
+def channel(section_name: str) -> Channel:
+    return create_aisc_section(section_name, steel250MPa, ConstructionType.ROLLED)
+
+
+def test_flexural_torsional_buckling():
+    """eq E4-5 with Fex, tabulated ro = 4.18 in and H = 0.884"""
+    calc = channel("C10X15.3").compression(length_major_axis=3 * meter)
+    criterion = calc.criteria[StrengthType.FLEXURAL_TORSIONAL_BUCKLING]
+    compare_quantites(criterion.elastic_buckling_stress, 280.44551 * megapascal)
+    compare_quantites(criterion.nominal_strength, 497504.90271 * newton)
+    assert calc.design_strength_criterion == StrengthType.FLEXURAL_BUCKLING_MINOR_AXIS
+
+
+def test_shear_center():
+    compare_quantites(channel("C10X15.3").shear_center, 36.3 * millimeter)
+
+
+@mark.parametrize(
+    "flexure, kwargs, expected_strength, expected_criterion",
+    [
+        ("flexure_major_axis", {}, 65250 * newton * meter, StrengthType.YIELD),
+        # Lp < Lb < Lr, eq F2-2 with c from eq F2-8b
+        (
+            "flexure_major_axis",
+            {"length": 3 * meter},
+            42272.88874 * newton * meter,
+            StrengthType.LATERAL_TORSIONAL_BUCKLING,
+        ),
+        ("flexure_minor_axis", {}, 7520 * newton * meter, StrengthType.YIELD),
+    ],
+)
+def test_flexure(flexure, kwargs, expected_strength, expected_criterion):
+    calc = getattr(channel("C10X15.3"), flexure)(**kwargs)
+    assert calc.design_strength_criterion == expected_criterion
+    compare_quantites(
+        calc.criteria[expected_criterion].nominal_strength, expected_strength
+    )
+
+
+@mark.parametrize("material", [steel355MPa, steel250MPa])
+def test_whole_catalog_matches_scalar(material):
+    catalog = aisc_sections(RuleEd.ED15)
+    names = catalog.names(SectionType.C) + catalog.names(SectionType.MC)
+
+    def calculations(section: Channel):
+        return (
+            section.compression(length_major_axis=3 * meter),
+            section.flexure_major_axis(),
+            section.flexure_major_axis(length=3 * meter),
+            section.flexure_minor_axis(),
+        )
+
+    assert_catalog_matches_scalar(Channel, names, material, calculations)
@@ -0,0 +1,100 @@
+import numpy as np
+from pytest import approx, mark, raises
+from unit_processing import compare_quantites
+
+from struct_codes.aisc_database import create_aisc_section, get_aisc_geometry_table
+from struct_codes.connections import BoltedFlangeConnection
+from struct_codes.criteria import StrengthType
+from struct_codes.i_section import DoublySymmetricI
+from struct_codes.materials import steel355MPa
+from struct_codes.sections import ConstructionType, SectionType
+from struct_codes.units import millimeter, newton
+
+W14X90 = create_aisc_section("W14X90", steel355MPa, ConstructionType.ROLLED)
+
+
+def flange_connection(geometry, **kwargs) -> BoltedFlangeConnection:
+    return BoltedFlangeConnection.from_geometry(
+        geometry,
+        **{
+            "hole_diameter": 24 * millimeter,
+            "pitch": 75 * millimeter,
+            "bolts_per_line": 3,
+            "end_distance": 40 * millimeter,
+            **kwargs,
+        },
+    )
+
+
+@mark.parametrize(
+    "stagger, pitch, expected_net_area",
+    [
+        (None, 75 * millimeter, 15257.7 * millimeter**2),
+        # holes of the other line are 35 mm away, not 40 mm
+        (40 * millimeter, 75 * millimeter, 15336.45 * millimeter**2),
+        (37.5 * millimeter, 75 * millimeter, 15348.10179 * millimeter**2),
+        # single hole path governs
+        (150 * millimeter, 300 * millimeter, 16178.85 * millimeter**2),
+    ],
+)
+def test_net_area(stagger, pitch, expected_net_area):
+    connection = flange_connection(W14X90.geometry, stagger=stagger, pitch=pitch)
+    compare_quantites(W14X90.geometry.A - connection.area_reduction, expected_net_area)
+
+
+@mark.parametrize(
+    "bolts_per_line, expected_shear_lag_factor",
+    [(3, 0.90), (2, 0.62732573)],
+)
+def test_shear_lag_factor(bolts_per_line, expected_shear_lag_factor):
+    connection = flange_connection(W14X90.geometry, bolts_per_line=bolts_per_line)
+    assert connection.shear_lag_factor == approx(expected_shear_lag_factor)
+
+
+def test_bolted_tension():
+    section = DoublySymmetricI(
+        W14X90.geometry, steel355MPa, connection=flange_connection(W14X90.geometry)
+    )
+    calc = section.tension()
+    compare_quantites(
+        calc.criteria[StrengthType.ULTIMATE].design_strength, 3432982.5 * newton
+    )
+    compare_quantites(
+        calc.criteria[StrengthType.BLOCK_SHEAR].design_strength, 3182850.0 * newton
+    )
+    assert calc.design_strength_criterion == StrengthType.BLOCK_SHEAR
+
+
+def test_connection_library_batch_matches_scalar():
+    names = get_aisc_geometry_table(
+        section_type=SectionType.W
+    ).EDI_STD_Nomenclature_imp[::10]
+    geometry = get_aisc_geometry_table(names)
+    pitches = np.linspace(60, 100, len(names)) * millimeter
+    batch = DoublySymmetricI(
+        geometry,
+        steel355MPa,
+        connection=flange_connection(
+            geometry, pitch=pitches, stagger=30 * millimeter, bolts_per_line=4
+        ),
+    ).tension()
+    strengths, criteria = batch.design_strength_tuple
+    for i, name in enumerate(names):
+        section = create_aisc_section(name, steel355MPa, ConstructionType.ROLLED)
+        calc = DoublySymmetricI(
+            section.geometry,
+            steel355MPa,
+            connection=flange_connection(
+                section.geometry,
+                pitch=pitches[i],
+                stagger=30 * millimeter,
+                bolts_per_line=4,
+            ),
+        ).tension()
+        compare_quantites(strengths[i], calc.design_strength)
+        assert criteria[i] == calc.design_strength_criterion
+
+
+def test_single_bolt_per_line_rejected():
+    with raises(ValueError):
+        flange_connection(W14X90.geometry, bolts_per_line=1)
@@ -0,0 +1,76 @@
+import numpy as np
+from pytest import approx
+
+from struct_codes.beam import Beam
+from struct_codes.envelope import EnvelopeCheck, StreamingEnvelope
+from struct_codes.interaction import InteractionSurface, InteractionSurfaceCache
+from struct_codes.materials import steel355MPa
+from struct_codes.units import kilonewton, meter
+
+SURFACES = (
+    InteractionSurface(1000e3, 1200e3, 200e3, 80e3),
+    InteractionSurface(2000e3, 2400e3, 500e3, 150e3),
+)
+
+
+def demand_history(steps: int, seed: int = 0) -> tuple[np.ndarray, ...]:
+    rng = np.random.default_rng(seed)
+    return (
+        rng.uniform(-1500e3, 1500e3, (steps, 2)),
+        rng.uniform(-300e3, 300e3, (steps, 2)),
+        rng.uniform(-100e3, 100e3, (steps, 2)),
+    )
+
+
+def test_streaming_envelope_matches_full_history():
+    history = demand_history(1000)
+    envelope = StreamingEnvelope.from_surfaces(SURFACES)
+    envelope.consume(
+        tuple(component[start : start + 64] for component in history)
+        for start in range(0, 1000, 64)
+    )
+    assert envelope.steps == 1000
+    for i, surface in enumerate(SURFACES):
+        expected = {
+            EnvelopeCheck.AXIAL: surface.axial_ratio(history[0][:, i]),
+            EnvelopeCheck.FLEXURE_MAJOR_AXIS: surface.major_axis_ratio(
+                history[1][:, i]
+            ),
+            EnvelopeCheck.FLEXURE_MINOR_AXIS: surface.minor_axis_ratio(
+                history[2][:, i]
+            ),
+            EnvelopeCheck.INTERACTION: surface.utilization(
+                *(component[:, i] for component in history)
+            ),
+        }
+        for check, utilization in expected.items():
+            entry = envelope.envelope[check]
+            assert entry.utilization[i] == approx(utilization.max())
+            assert entry.step[i] == np.argmax(utilization)
+    assert envelope.governing_check[0] == EnvelopeCheck.INTERACTION
+
+
+def test_streaming_envelope_from_cache_with_quantities():
+    cache = InteractionSurfaceCache(steel355MPa)
+    members = [("W14X90", Beam(length_major_axis=4 * meter))] * 2
+    envelope = StreamingEnvelope.from_cache(cache, members)
+    assert len(cache.surfaces) == 1
+    envelope.update(
+        np.array([[-1000.0, 0.0]]) * kilonewton,
+        np.array([[100.0, 0.0]]) * kilonewton * meter,
+        np.zeros((1, 2)) * kilonewton * meter,
+    )
+    surface = cache.surface("W14X90", Beam(length_major_axis=4 * meter))
+    assert envelope.envelope[EnvelopeCheck.INTERACTION].utilization == approx(
+        [surface.utilization(-1000e3, 100e3, 0.0), 0.0]
+    )
+    assert list(envelope.envelope[EnvelopeCheck.INTERACTION].step) == [0, -1]
+
+
+def test_streaming_envelope_single_member():
+    envelope = StreamingEnvelope(InteractionSurface(1e6, 1e6, 1e5, 5e4))
+    envelope.update(np.array([1e5, 5e5, 2e5]), 0, 0)
+    entry = envelope.envelope[EnvelopeCheck.AXIAL]
+    assert entry.utilization == approx(0.5)
+    assert entry.step == 1
+    assert envelope.steps == 3
@@ -0,0 +1,101 @@
+import numpy as np
+from pytest import approx, mark
+from unit_processing import compare_quantites
+
+from struct_codes.aisc_database import (
+    aisc_sections,
+    create_aisc_section,
+    get_aisc_geometry_table,
+)
+from struct_codes.criteria import StrengthType
+from struct_codes.fire import (
+    FireDesign,
+    FireExposure,
+    catalog_section_factors,
+    retention_factors,
+    section_factors,
+)
+from struct_codes.materials import steel355MPa
+from struct_codes.sections import RuleEd, SectionType
+from struct_codes.units import kilogram, meter, millimeter, newton
+
+
+def w14x22():
+    return create_aisc_section("W14X22", steel355MPa, None).geometry
+
+
+@mark.parametrize(
+    "temperature, expected",
+    [
+        (20, (1.0, 1.0, 1.0)),
+        (538, (0.49, 0.29, 0.66)),
+        # halfway between 538 and 649 °C
+        (593.5, (0.355, 0.21, 0.505)),
+    ],
+)
+def test_retention_factors(temperature, expected):
+    assert retention_factors(temperature) == approx(expected)
+
+
+def test_section_factors():
+    factors = section_factors(w14x22())
+    assert FireExposure.ANGLE_CONTOUR_THREE_SIDES not in factors
+    compare_quantites(
+        factors[FireExposure.CONTOUR_THREE_SIDES],
+        32.9 * kilogram / meter / (1050 * millimeter),
+    )
+
+
+def test_catalog_section_factors():
+    factors = catalog_section_factors(SectionType.W)
+    names = aisc_sections(RuleEd.ED15).names(SectionType.W)
+    assert factors[FireExposure.BOX_FOUR_SIDES].shape == (len(names),)
+    compare_quantites(
+        factors[FireExposure.CONTOUR_THREE_SIDES][names.index("W14X22")],
+        section_factors(w14x22())[FireExposure.CONTOUR_THREE_SIDES],
+    )
+
+
+def test_compression():
+    """Fcr(T) = 0.42^(Fy(T)/Fe(T))^0.5 Fy(T) at 538 °C"""
+    calc = FireDesign(w14x22(), steel355MPa, 538).compression(3 * meter)
+    compare_quantites(
+        calc.criteria[StrengthType.FLEXURAL_BUCKLING_MINOR_AXIS].nominal_strength,
+        211664.59508 * newton,
+    )
+
+
+@mark.parametrize(
+    "length, expected_strength",
+    [
+        # Lb < Lr(T) = 7.45 m, cx = 2.75
+        (3 * meter, 42630605.13655 * newton * millimeter),
+        # eq F2-4 with E(T)
+        (12 * meter, 8659921.91966 * newton * millimeter),
+    ],
+)
+def test_lateral_torsional_buckling(length, expected_strength):
+    calc = FireDesign(w14x22(), steel355MPa, 538).flexure_major_axis(length)
+    compare_quantites(
+        calc.criteria[StrengthType.LATERAL_TORSIONAL_BUCKLING].nominal_strength,
+        expected_strength,
+    )
+
+
+def test_temperature_sweep_matches_single_temperature():
+    names = ("W14X22", "W10X49", "W24X55")
+    temperatures = np.arange(20, 1001, 10)
+    design = FireDesign(get_aisc_geometry_table(names), steel355MPa, temperatures)
+    compression = design.compression(4 * meter).design_strength
+    flexure = design.flexure_major_axis(4 * meter).design_strength
+    assert compression.shape == flexure.shape == (len(names), len(temperatures))
+    for i, name in enumerate(names):
+        geometry = create_aisc_section(name, steel355MPa, None).geometry
+        for j in (0, 30, 51, 98):
+            single = FireDesign(geometry, steel355MPa, temperatures[j])
+            assert single.compression(4 * meter).design_strength.to(
+                "N"
+            ).magnitude == approx(compression[i, j].to("N").magnitude)
+            assert single.flexure_major_axis(4 * meter).design_strength.to(
+                "N*m"
+            ).magnitude == approx(flexure[i, j].to("N*m").magnitude)
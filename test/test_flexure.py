@@ -0,0 +1,71 @@
+import numpy as np
+from pytest import approx, mark
+from unit_processing import compare_quantites
+
+from struct_codes.aisc_database import create_aisc_section
+from struct_codes.flexure import lateral_torsional_buckling_modification_factor
+from struct_codes.materials import steel250MPa
+from struct_codes.sections import ConstructionType
+from struct_codes.units import meter, millimeter, newton
+
+POSITIONS = np.linspace(0.0, 1.0, 41)
+
+
+@mark.parametrize(
+    "moments, expected_factor",
+    [
+        (np.ones_like(POSITIONS), 1.0),
+        (POSITIONS, 1.67),
+        (4 * POSITIONS * (1 - POSITIONS), 1.14),
+        (1 - 2 * POSITIONS, 2.27),
+    ],
+)
+def test_modification_factor_single_segment(moments, expected_factor):
+    assert lateral_torsional_buckling_modification_factor(moments) == approx(
+        expected_factor, abs=0.01
+    )
+
+
+def test_modification_factor_many_members():
+    moments = np.stack(
+        [np.ones_like(POSITIONS), POSITIONS, 4 * POSITIONS * (1 - POSITIONS)]
+    )
+    factors = lateral_torsional_buckling_modification_factor(
+        moments * newton * meter, positions=POSITIONS * 6 * meter
+    )
+    assert factors == approx([1.0, 1.67, 1.14], abs=0.01)
+
+
+def test_modification_factor_per_segment():
+    # uniform load, braced at midspan, AISC Manual table 3-1
+    factors = lateral_torsional_buckling_modification_factor(
+        4 * POSITIONS * (1 - POSITIONS), brace_positions=[0.0, 0.5, 1.0]
+    )
+    assert factors.shape == (2,)
+    assert factors == approx([1.30, 1.30], abs=0.01)
+
+
+def test_modification_factor_braces_in_other_units():
+    factors = lateral_torsional_buckling_modification_factor(
+        4 * POSITIONS * (1 - POSITIONS),
+        positions=POSITIONS * 6 * meter,
+        brace_positions=[0.0, 3000.0, 6000.0] * millimeter,
+    )
+    assert factors == approx([1.30, 1.30], abs=0.01)
+
+
+def test_modification_factor_feeds_lateral_torsional_buckling():
+    section = create_aisc_section("W6X15", steel250MPa, ConstructionType.ROLLED)
+    moments = np.stack([POSITIONS, 4 * POSITIONS * (1 - POSITIONS)])
+    factors = lateral_torsional_buckling_modification_factor(moments)
+    strengths = section.flexure_major_axis(
+        length=7 * meter, lateral_torsional_buckling_modification_factor=factors
+    ).design_strength
+    for strength, factor in zip(strengths, factors):
+        compare_quantites(
+            strength,
+            section.flexure_major_axis(
+                length=7 * meter,
+                lateral_torsional_buckling_modification_factor=float(factor),
+            ).design_strength,
+        )
@@ -0,0 +1,139 @@
+from pytest import mark
+from unit_processing import assert_catalog_matches_scalar, compare_quantites
+
+from struct_codes.aisc_database import aisc_sections, create_aisc_section
+from struct_codes.criteria import StrengthType
+from struct_codes.hss import HollowStructuralSection
+from struct_codes.materials import steel250MPa, steel355MPa
+from struct_codes.sections import (
+    ConstructionType,
+    RuleEd,
+    SectionClassification,
+    SectionType,
+)
+from struct_codes.units import meter, newton
+
+
+def hss(section_name: str) -> HollowStructuralSection:
+    return create_aisc_section(section_name, steel355MPa, ConstructionType.ROLLED)
+
+
+@mark.parametrize(
+    "section_name, length, expected_strength",
+    [
+        # round, slender wall, eq E7-6
+        ("HSS16X.250", 4 * meter, 2427499.61284 * newton),
+        # rectangular, slender walls, eq E7-2 and E7-3
+        ("HSS8X8X.125", 3 * meter, 474934.62716 * newton),
+    ],
+)
+def test_compression(section_name, length, expected_strength):
+    calc = hss(section_name).compression(length_major_axis=length)
+    compare_quantites(
+        calc.criteria[StrengthType.FLEXURAL_BUCKLING_MAJOR_AXIS].nominal_strength,
+        expected_strength,
+    )
+
+
+@mark.parametrize(
+    "section_name, flexure, expected_strength, expected_criterion",
+    [
+        # compact flange, eq F7-1
+        (
+            "HSS6X6X.250",
+            "flexure_minor_axis",
+            65320 * newton * meter,
+            StrengthType.YIELD,
+        ),
+        # noncompact flange h/t = 31.3 about the minor axis, eq F7-2
+        (
+            "HSS8X4X.250",
+            "flexure_minor_axis",
+            43550.08220 * newton * meter,
+            StrengthType.COMPRESSION_FLANGE_LOCAL_BUCKLING,
+        ),
+        # slender flange, eq F7-3 and F7-4
+        (
+            "HSS8X8X.125",
+            "flexure_major_axis",
+            41214.74443 * newton * meter,
+            StrengthType.COMPRESSION_FLANGE_LOCAL_BUCKLING,
+        ),
+        # noncompact round, eq F8-2
+        (
+            "HSS16X.250",
+            "flexure_major_axis",
+            305443.36245 * newton * meter,
+            StrengthType.LOCAL_BUCKLING,
+        ),
+    ],
+)
+def test_flexure(section_name, flexure, expected_strength, expected_criterion):
+    calc = getattr(hss(section_name), flexure)()
+    assert calc.design_strength_criterion == expected_criterion
+    compare_quantites(
+        calc.criteria[expected_criterion].nominal_strength, expected_strength
+    )
+
+
+def test_lateral_torsional_buckling():
+    """Lp = 3160 mm and Lr = 87019 mm, eq F7-10"""
+    calc = hss("HSS8X4X.250").flexure_major_axis(length=6 * meter)
+    assert calc.design_strength_criterion == StrengthType.LATERAL_TORSIONAL_BUCKLING
+    compare_quantites(
+        calc.criteria[StrengthType.LATERAL_TORSIONAL_BUCKLING].nominal_strength,
+        76233.51725 * newton * meter,
+    )
+
+
+@mark.parametrize(
+    "section_name, expected_strength",
+    [
+        # h/t = 66, Cv2 by eq G2-10
+        ("HSS8X8X.125", 215659.16438 * newton),
+        # Fcr limited to 0.6 Fy
+        ("HSS16X.250", 790230 * newton),
+    ],
+)
+def test_shear(section_name, expected_strength):
+    calc = hss(section_name).shear_major_axis(shear_length=1 * meter)
+    compare_quantites(
+        calc.criteria[StrengthType.WEB_SHEAR].nominal_strength, expected_strength
+    )
+
+
+@mark.parametrize(
+    "section_name, expected_strength",
+    [
+        # h/t = 66, eq H3-4
+        ("HSS8X8X.125", 44290.90726 * newton * meter),
+        # C = 2J/D, Fcr limited to 0.6 Fy
+        ("HSS16X.250", 312679.80296 * newton * meter),
+    ],
+)
+def test_torsion(section_name, expected_strength):
+    calc = hss(section_name).torsion(length=4 * meter)
+    compare_quantites(
+        calc.criteria[StrengthType.TORSION].nominal_strength, expected_strength
+    )
+
+
+@mark.parametrize("material", [steel355MPa, steel250MPa])
+def test_whole_catalog_matches_scalar(material):
+    table = aisc_sections(RuleEd.ED15)
+    names = table.names(SectionType.HSS) + table.names(SectionType.PIPE)
+
+    def calculations(section: HollowStructuralSection):
+        return (
+            section.compression(length_major_axis=3 * meter),
+            section.flexure_major_axis(length=3 * meter),
+            section.flexure_minor_axis(),
+            section.shear_major_axis(shear_length=1 * meter),
+            section.shear_minor_axis(),
+            section.torsion(length=3 * meter),
+        )
+
+    batch = assert_catalog_matches_scalar(
+        HollowStructuralSection, names, material, calculations
+    )
+    assert set(batch.shape) == {SectionClassification.HSS, SectionClassification.PIPE}
@@ -0,0 +1,134 @@
+import numpy as np
+from pytest import approx, mark
+from unit_processing import compare_quantites
+
+from struct_codes.criteria import DesignType
+from struct_codes.fire import FireExposure, section_factors
+from struct_codes.i_section import (
+    BuiltUpIGeometry,
+    DoublySymmetricI,
+    built_up_i_geometry_grid,
+)
+from struct_codes.materials import steel355MPa
+from struct_codes.sections import ConstructionType
+from struct_codes.units import kilogram, meter, millimeter
+
+
+@mark.parametrize(
+    "girder, expected",
+    [
+        (
+            (300, 20, 1200, 10),
+            dict(
+                A=24000 * millimeter**2,
+                d=1240 * millimeter,
+                ho=1220 * millimeter,
+                Ix=5905600000 * millimeter**4,
+                Iy=90100000 * millimeter**4,
+                Sx=9525161.29032 * millimeter**3,
+                Sy=600666.66667 * millimeter**3,
+                Zx=10920000 * millimeter**3,
+                Zy=930000 * millimeter**3,
+                rx=496.05107 * millimeter,
+                ry=61.27125 * millimeter,
+                J=2000000 * millimeter**4,
+                Cw=33489000000000 * millimeter**6,
+            ),
+        ),
+        (
+            (300, 25, 600, 12),
+            dict(
+                A=22200 * millimeter**2,
+                d=650 * millimeter,
+                ho=625 * millimeter,
+                Ix=1681625000 * millimeter**4,
+                Iy=112586400 * millimeter**4,
+                Sx=5174230.76923 * millimeter**3,
+                Sy=750576 * millimeter**3,
+                Zx=5767500 * millimeter**3,
+                Zy=1146600 * millimeter**3,
+                rx=275.22513 * millimeter,
+                ry=71.21418 * millimeter,
+                J=3470600 * millimeter**4,
+                Cw=10986328125000 * millimeter**6,
+            ),
+        ),
+    ],
+)
+def test_built_up_i_geometry_properties(girder: tuple, expected: dict):
+    geometry = BuiltUpIGeometry(*np.array(girder) * millimeter)
+    for name, value in expected.items():
+        compare_quantites(getattr(geometry, name), value)
+    assert geometry.bf_2tf == approx(girder[0] / (2 * girder[1]))
+    assert geometry.h_tw == approx(girder[2] / girder[3])
+
+
+def test_built_up_i_geometry_derived_properties():
+    geometry = BuiltUpIGeometry(
+        bf=300 * millimeter, tf=20 * millimeter, h=1200 * millimeter, tw=10 * millimeter
+    )
+    compare_quantites(geometry.W, 188.4 * kilogram / meter)
+    compare_quantites(geometry.rts, 75.94 * millimeter)
+    compare_quantites(geometry.Wno, 91500 * millimeter**2)
+    compare_quantites(geometry.Sw1, 137250000 * millimeter**4)
+    compare_quantites(geometry.Qf, 1769000 * millimeter**3)
+    compare_quantites(geometry.PB, 3660 * millimeter)
+    compare_quantites(geometry.PC, 2780 * millimeter)
+    assert set(section_factors(geometry)) == set(FireExposure) - {
+        FireExposure.ANGLE_CONTOUR_THREE_SIDES
+    }
+
+
+def test_built_up_i_geometry_grid():
+    grid = built_up_i_geometry_grid(
+        bf=[300, 400] * millimeter,
+        tf=[16, 20, 25] * millimeter,
+        h=1200 * millimeter,
+        tw=[8, 10] * millimeter,
+    )
+    assert grid.A.shape == (12,)
+    single = BuiltUpIGeometry(
+        bf=400 * millimeter, tf=20 * millimeter, h=1200 * millimeter, tw=8 * millimeter
+    )
+    compare_quantites(grid.Zx[8], single.Zx)
+    compare_quantites(grid.Cw[8], single.Cw)
+
+
+@mark.parametrize("length", [2 * meter, 6 * meter])
+def test_built_up_i_geometry_batch_matches_scalar(length):
+    dimensions = [
+        (bf, tf, h, tw)
+        for bf in (250, 400)
+        for tf in (12, 25)
+        for h in (800, 1500)
+        for tw in (8, 14)
+    ]
+    batch = DoublySymmetricI(
+        geometry=BuiltUpIGeometry(
+            *(
+                np.array(column) * millimeter
+                for column in np.transpose(np.array(dimensions))
+            )
+        ),
+        material=steel355MPa,
+        construction=ConstructionType.BUILT_UP,
+    )
+    strengths, criteria = batch.flexure_major_axis(
+        length=length, design_type=DesignType.LRFD
+    ).design_strength_tuple
+    shear = batch.shear_major_axis(design_type=DesignType.LRFD).design_strength
+    for i, girder in enumerate(dimensions):
+        single = DoublySymmetricI(
+            geometry=BuiltUpIGeometry(
+                *(dimension * millimeter for dimension in girder)
+            ),
+            material=steel355MPa,
+            construction=ConstructionType.BUILT_UP,
+        )
+        calc = single.flexure_major_axis(length=length, design_type=DesignType.LRFD)
+        compare_quantites(strengths[i], calc.design_strength)
+        assert criteria[i] == calc.design_strength_criterion
+        compare_quantites(
+            shear[i],
+            single.shear_major_axis(design_type=DesignType.LRFD).design_strength,
+        )
@@ -4,14 +4,14 @@ from pint import Quantity
 from pytest import mark
 from unit_processing import compare_quantites
 
-from struct_codes.aisc_database import create_aisc_section
+from struct_codes.aisc_database import create_aisc_section, get_aisc_geometry_table
 from struct_codes.criteria import DesignType, StrengthType
 from struct_codes.i_section import DoublySymmetricI
 from struct_codes.i_section._compression import (
     BeamCompressionParam,
 )
 from struct_codes.materials import steel355MPa
-from struct_codes.sections import ConstructionType
+from struct_codes.sections import ConstructionType, SectionType
 from struct_codes.units import meter, newton
 
 
@@ -91,3 +91,59 @@ def test_w_section_torsional_calc_memory_2016(
         .design_strength
     )
     compare_quantites(ds, expected_design_strength)
+
+
+@mark.parametrize(
+    "section_name, length, expected_skipped",
+    [("W6X15", 1 * meter, 0), ("W6X15", 6 * meter, 1), ("W14X90", 1 * meter, 0)],
+)
+def test_w_section_compression_bounded_design_strength(
+    section_name: str, length: Quantity, expected_skipped: int
+):
+    section = create_aisc_section(section_name, steel355MPa, ConstructionType.ROLLED)
+    calc = section.compression(length_major_axis=length)
+    bounded = calc.bounded_design_strength()
+    assert bounded.criterion == calc.design_strength_criterion
+    assert bounded.skipped_evaluations == expected_skipped
+    compare_quantites(bounded.design_strength, calc.design_strength)
+
+
+@mark.parametrize(
+    "section, beam_compression_param, expected_nominal_strength",
+    [
+        (
+            create_aisc_section("W14X43", steel355MPa, ConstructionType.ROLLED),
+            BeamCompressionParam(length_major_axis=1 * meter),
+            2772292.02 * newton,
+        ),
+    ],
+)
+def test_w_section_slender_web_flexural_buckling_minor_axis_2016(
+    section: DoublySymmetricI,
+    beam_compression_param: BeamCompressionParam,
+    expected_nominal_strength: Quantity,
+):
+    beam = asdict(beam_compression_param)
+    ns = (
+        section.compression(**beam)
+        .criteria[StrengthType.FLEXURAL_BUCKLING_MINOR_AXIS]
+        .nominal_strength
+    )
+    compare_quantites(ns, expected_nominal_strength)
+
+
+@mark.parametrize("length", [1 * meter, 4 * meter, 12 * meter])
+def test_w_catalog_compression_batch_matches_scalar(length: Quantity):
+    geometry = get_aisc_geometry_table(section_type=SectionType.W)
+    strengths, criteria = (
+        DoublySymmetricI(geometry=geometry, material=steel355MPa)
+        .compression(length_major_axis=length)
+        .design_strength_tuple
+    )
+    assert strengths.shape == (len(geometry.EDI_STD_Nomenclature_imp),)
+    for i, name in enumerate(geometry.EDI_STD_Nomenclature_imp[::25]):
+        calc = create_aisc_section(
+            name, steel355MPa, ConstructionType.ROLLED
+        ).compression(length_major_axis=length)
+        compare_quantites(strengths[i * 25], calc.design_strength)
+        assert criteria[i * 25] == calc.design_strength_criterion
@@ -2,8 +2,12 @@ from pint import Quantity
 from pytest import approx, mark
 from unit_processing import simplify_units
 
+from struct_codes.aisc_database import create_aisc_section
 from struct_codes.criteria import DesignType, calculate_design_strength
-from struct_codes.units import kilonewton
+from struct_codes.i_section._tension import TesionYieldCalculation
+from struct_codes.materials import steel355MPa
+from struct_codes.sections import ConstructionType
+from struct_codes.units import kilonewton, megapascal, millimeter
 
 
 @mark.parametrize(
@@ -25,3 +29,25 @@ def test_design_strength(
             nominal_strength=nominal_strength, design_type=design_type, factor=factor
         )
     ) == approx(simplify_units(expected_strength))
+
+
+def test_design_strengths_single_nominal_evaluation():
+    calc = TesionYieldCalculation(
+        gross_area=1000 * millimeter**2,
+        yield_stress=250 * megapascal,
+        design_type=DesignType.ASD,
+    )
+    strengths = calc.design_strengths(factors={DesignType.LRFD: 0.75})
+    assert simplify_units(strengths[DesignType.ASD]) == approx(250_000 / 1.67)
+    assert simplify_units(strengths[DesignType.LRFD]) == approx(250_000 * 0.75)
+
+
+@mark.parametrize("design_type", list(DesignType))
+def test_load_strength_design_strengths_match_single_design_type(
+    design_type: DesignType,
+):
+    section = create_aisc_section("W6X15", steel355MPa, ConstructionType.ROLLED)
+    expected = section.tension(design_type=design_type)
+    strength, criterion = section.tension().design_strengths()[design_type]
+    assert criterion == expected.design_strength_criterion
+    assert simplify_units(strength) == approx(simplify_units(expected.design_strength))
@@ -1,13 +1,22 @@
+import numpy as np
 from pint import Quantity
-from pytest import mark
+from pytest import approx, mark
 from unit_processing import compare_quantites
 
-from struct_codes.aisc_database import create_aisc_section
+from struct_codes.aisc_database import create_aisc_section, get_aisc_geometry_table
+from struct_codes.beam import Beam
 from struct_codes.criteria import DesignType, StrengthType
-from struct_codes.i_section import DoublySymmetricI
+from struct_codes.i_section import BuiltUpIGeometry, DoublySymmetricI
 from struct_codes.materials import steel250MPa, steel355MPa
-from struct_codes.sections import ConstructionType
-from struct_codes.units import meter, newton
+from struct_codes.sections import ConstructionType, SectionType
+from struct_codes.units import meter, millimeter, newton
+
+GIRDERS = [
+    (300, 20, 1200, 10),
+    (300, 20, 1200, 8),
+    (400, 16, 1200, 8),
+    (300, 25, 600, 12),
+]
 
 
 @mark.parametrize(
@@ -108,3 +117,189 @@ def test_w_section_major_axis_lateral_torsional_buckling_calc_memory_2016(
         .design_strength
     )
     compare_quantites(ds, expected_design_strength)
+
+
+@mark.parametrize(
+    "length, expected_skipped",
+    [(1.0 * meter, 1), (2.1 * meter, 0), (7.0 * meter, 0)],
+)
+def test_w_section_major_axis_bounded_design_strength(
+    length: Quantity, expected_skipped: int
+):
+    section = create_aisc_section("W6X15", steel250MPa, ConstructionType.ROLLED)
+    calc = section.flexure_major_axis(length=length)
+    bounded = calc.bounded_design_strength()
+    assert bounded.exact
+    assert bounded.criterion == calc.design_strength_criterion
+    assert bounded.skipped_evaluations == expected_skipped
+    compare_quantites(bounded.design_strength, calc.design_strength)
+
+
+def test_w_section_major_axis_bounded_design_strength_demand_satisfied():
+    section = create_aisc_section("W6X15", steel250MPa, ConstructionType.ROLLED)
+    bounded = section.flexure_major_axis(length=2.1 * meter).bounded_design_strength(
+        demand=1000 * newton * meter
+    )
+    assert not bounded.exact
+    assert bounded.skipped == (StrengthType.LATERAL_TORSIONAL_BUCKLING,)
+
+
+def test_w_section_noncompact_flange_local_buckling_2016():
+    section = create_aisc_section("W6X15", steel250MPa, ConstructionType.ROLLED)
+    ns = (
+        section.flexure_major_axis(length=1 * meter)
+        .criteria[StrengthType.COMPRESSION_FLANGE_LOCAL_BUCKLING]
+        .nominal_strength
+    )
+    compare_quantites(ns, 43545.67483 * newton * meter)
+
+
+@mark.parametrize(
+    "girder, length, expected_nominal_strengths",
+    [
+        (
+            # F4 noncompact web
+            (300, 20, 1200, 10),
+            4 * meter,
+            {
+                StrengthType.COMPRESSION_FLANGE_YIELDING: 3545.89,
+                StrengthType.LATERAL_TORSIONAL_BUCKLING: 3055.90,
+            },
+        ),
+        (
+            # F5 slender web
+            (300, 20, 1200, 8),
+            8 * meter,
+            {
+                StrengthType.COMPRESSION_FLANGE_YIELDING: 3171.48,
+                StrengthType.LATERAL_TORSIONAL_BUCKLING: 1631.48,
+            },
+        ),
+        (
+            # F5 slender web, noncompact flanges
+            (400, 16, 1200, 8),
+            8 * meter,
+            {
+                StrengthType.COMPRESSION_FLANGE_YIELDING: 3345.59,
+                StrengthType.LATERAL_TORSIONAL_BUCKLING: 2527.72,
+                StrengthType.COMPRESSION_FLANGE_LOCAL_BUCKLING: 2841.14,
+            },
+        ),
+        (
+            # F4 noncompact web, slender flanges
+            (400, 12, 1000, 10),
+            20 * meter,
+            {
+                StrengthType.COMPRESSION_FLANGE_YIELDING: 2534.92,
+                StrengthType.LATERAL_TORSIONAL_BUCKLING: 369.47,
+                StrengthType.COMPRESSION_FLANGE_LOCAL_BUCKLING: 1641.71,
+            },
+        ),
+    ],
+)
+def test_built_up_noncompact_and_slender_web_flexure_2016(
+    girder: tuple, length: Quantity, expected_nominal_strengths: dict
+):
+    section = DoublySymmetricI(
+        geometry=BuiltUpIGeometry(*np.array(girder) * millimeter),
+        material=steel355MPa,
+        construction=ConstructionType.BUILT_UP,
+    )
+    criteria = section.flexure_major_axis(length=length).criteria
+    assert tuple(criteria) == tuple(expected_nominal_strengths)
+    for key, expected in expected_nominal_strengths.items():
+        nominal_strength = criteria[key].nominal_strength.to(newton * meter)
+        assert nominal_strength.magnitude == approx(expected * 1e3, abs=10)
+
+
+@mark.parametrize("length", [1 * meter, 4 * meter, 8 * meter])
+def test_mixed_compactness_batch_matches_scalar(length: Quantity):
+    geometries = [
+        BuiltUpIGeometry(*np.array(girder) * millimeter) for girder in GIRDERS
+    ]
+    strengths, criteria = (
+        DoublySymmetricI(
+            geometry=BuiltUpIGeometry(*np.transpose(GIRDERS) * millimeter),
+            material=steel355MPa,
+            construction=ConstructionType.BUILT_UP,
+        )
+        .flexure_major_axis(length=length)
+        .design_strength_tuple
+    )
+    for i, geometry in enumerate(geometries):
+        calc = DoublySymmetricI(
+            geometry=geometry,
+            material=steel355MPa,
+            construction=ConstructionType.BUILT_UP,
+        ).flexure_major_axis(length=length)
+        compare_quantites(strengths[i], calc.design_strength)
+        assert criteria[i] == calc.design_strength_criterion
+
+
+def test_w_section_major_axis_segments():
+    section = create_aisc_section("W6X15", steel250MPa, ConstructionType.ROLLED)
+    beam = Beam(length_major_axis=9 * meter, brace_positions=[2.0, 6.0] * meter)
+    positions = np.linspace(0.0, 9.0, 91)
+    moments = 4 * positions / 9 * (1 - positions / 9) * 1e4 * newton * meter
+    calc = section.flexure_major_axis_segments(
+        beam, moments=moments, moment_positions=positions * meter
+    )
+    compare_quantites(calc.segment_lengths, [2.0, 4.0, 3.0] * meter)
+    strengths, _ = calc.segment_design_strengths
+    for strength, length, factor in zip(
+        strengths, calc.segment_lengths, calc.modification_factors
+    ):
+        compare_quantites(
+            strength,
+            section.flexure_major_axis(
+                length=length,
+                lateral_torsional_buckling_modification_factor=float(factor),
+            ).design_strength,
+        )
+    assert calc.governing_segment == 1
+    assert calc.design_strength_criterion == StrengthType.LATERAL_TORSIONAL_BUCKLING
+    compare_quantites(calc.design_strength, strengths[1])
+
+
+@mark.parametrize(
+    "section, expected_design_strength",
+    [
+        # noncompact flange, F6-2
+        (
+            create_aisc_section("W14X90", steel355MPa, ConstructionType.ROLLED),
+            252212.43794 * newton * meter,
+        ),
+        # slender flange, F6-3
+        (
+            DoublySymmetricI(
+                BuiltUpIGeometry(*[400, 8, 1200, 10] * millimeter),
+                steel355MPa,
+                ConstructionType.BUILT_UP,
+            ),
+            56478.08383 * newton * meter,
+        ),
+    ],
+)
+def test_flange_local_buckling_minor_axis_2016(
+    section: DoublySymmetricI, expected_design_strength: Quantity
+):
+    calc = section.flexure_minor_axis()
+    compare_quantites(
+        calc.criteria[StrengthType.FLANGE_LOCAL_BUCKLING].design_strength,
+        expected_design_strength,
+    )
+    assert calc.design_strength_criterion == StrengthType.FLANGE_LOCAL_BUCKLING
+
+
+@mark.parametrize("material", [steel250MPa, steel355MPa])
+def test_w_catalog_minor_axis_batch_matches_scalar(material):
+    geometry = get_aisc_geometry_table(section_type=SectionType.W)
+    section = DoublySymmetricI(geometry=geometry, material=material)
+    flexure, criteria = section.flexure_minor_axis().design_strength_tuple
+    shear = section.shear_minor_axis().design_strength
+    for i, name in enumerate(geometry.EDI_STD_Nomenclature_imp[::25]):
+        scalar = create_aisc_section(name, material, ConstructionType.ROLLED)
+        calc = scalar.flexure_minor_axis()
+        compare_quantites(flexure[i * 25], calc.design_strength)
+        assert criteria[i * 25] == calc.design_strength_criterion
+        compare_quantites(shear[i * 25], scalar.shear_minor_axis().design_strength)
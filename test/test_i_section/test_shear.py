@@ -1,13 +1,14 @@
+import numpy as np
 from pint import Quantity
 from pytest import mark
 from unit_processing import compare_quantites
 
 from struct_codes.aisc_database import create_aisc_section
 from struct_codes.criteria import DesignType, StrengthType
-from struct_codes.i_section import DoublySymmetricI
+from struct_codes.i_section import BuiltUpIGeometry, DoublySymmetricI
 from struct_codes.materials import steel250MPa, steel355MPa
 from struct_codes.sections import ConstructionType
-from struct_codes.units import newton
+from struct_codes.units import millimeter, newton
 
 
 @mark.parametrize(
@@ -38,3 +39,104 @@ def test_w_section_web_shear_calc_memory_2016(
         .design_strength
     )
     compare_quantites(ds, expected_design_strength)
+
+
+GIRDER = DoublySymmetricI(
+    BuiltUpIGeometry(*[400, 25, 1500, 8] * millimeter),
+    steel355MPa,
+    ConstructionType.BUILT_UP,
+)
+
+
+@mark.parametrize(
+    "stiffener_spacing, tension_field_action, expected_design_strength",
+    [
+        (None, False, 508917.85 * newton),
+        (1500 * millimeter, False, 696429.33 * newton),
+        (3000 * millimeter, False, 550575.73 * newton),
+        (1500 * millimeter, True, 1119848.50 * newton),
+        (3000 * millimeter, True, 761210.78 * newton),
+        # a/h > 3, tension field action not permitted
+        (6000 * millimeter, True, 508917.85 * newton),
+    ],
+)
+def test_plate_girder_web_shear_2016(
+    stiffener_spacing: Quantity,
+    tension_field_action: bool,
+    expected_design_strength: Quantity,
+):
+    ds = GIRDER.shear_major_axis(
+        stiffener_spacing=stiffener_spacing,
+        tension_field_action=tension_field_action,
+    ).design_strength
+    compare_quantites(ds, expected_design_strength)
+
+
+def test_plate_girder_web_shear_narrow_flanges_2016():
+    # h/bf = 7.5 > 6, eq G2-8 with Cv2 = 0.24198
+    girder = DoublySymmetricI(
+        BuiltUpIGeometry(*[200, 25, 1500, 8] * millimeter),
+        steel355MPa,
+        ConstructionType.BUILT_UP,
+    )
+    ds = girder.shear_major_axis(
+        stiffener_spacing=1500 * millimeter, tension_field_action=True
+    ).design_strength
+    compare_quantites(ds, 814512.46815 * newton)
+
+
+def test_plate_girder_web_shear_stiffener_spacings():
+    spacings = np.array([1500, 3000, 6000]) * millimeter
+    ds = GIRDER.shear_major_axis(
+        stiffener_spacing=spacings, tension_field_action=True
+    ).design_strength
+    for spacing, strength in zip(spacings, ds):
+        compare_quantites(
+            strength,
+            GIRDER.shear_major_axis(
+                stiffener_spacing=spacing, tension_field_action=True
+            ).design_strength,
+        )
+
+
+def test_rolled_web_shear_factors_without_side_effects():
+    calc = (
+        create_aisc_section("W14X90", steel355MPa, ConstructionType.ROLLED)
+        .shear_major_axis()
+        .criteria[StrengthType.WEB_SHEAR]
+    )
+    assert calc.factors == {DesignType.ASD: 1.50, DesignType.LRFD: 1.0}
+
+
+@mark.parametrize(
+    "section, expected_design_strength",
+    [
+        (
+            create_aisc_section("W14X90", steel355MPa, ConstructionType.ROLLED),
+            1689714.97006 * newton,
+        ),
+        (
+            DoublySymmetricI(
+                BuiltUpIGeometry(*[400, 8, 1200, 10] * millimeter),
+                steel355MPa,
+                ConstructionType.BUILT_UP,
+            ),
+            816287.42515 * newton,
+        ),
+        # b/tf above 1.37 (kv E / Fy) ** 0.5, eq G2-11
+        (
+            DoublySymmetricI(
+                BuiltUpIGeometry(*[600, 8, 1200, 10] * millimeter),
+                steel355MPa,
+                ConstructionType.BUILT_UP,
+            ),
+            888856.52695 * newton,
+        ),
+    ],
+)
+def test_flange_shear_minor_axis_2016(
+    section: DoublySymmetricI, expected_design_strength: Quantity
+):
+    compare_quantites(
+        section.shear_minor_axis().design_strength, expected_design_strength
+    )
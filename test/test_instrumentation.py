@@ -0,0 +1,67 @@
+import pstats
+
+from struct_codes.aisc_database import create_aisc_section
+from struct_codes.criteria import StrengthType
+from struct_codes.instrumentation import (
+    INSTRUMENTATION,
+    instrumented,
+    instrumented_formula,
+)
+from struct_codes.materials import steel250MPa
+from struct_codes.sections import ConstructionType
+from struct_codes.units import meter
+
+
+def test_instrumentation_records_per_category():
+    section = create_aisc_section("W6X15", steel250MPa, ConstructionType.ROLLED)
+    calc = section.compression(length_major_axis=3 * meter)
+    with instrumented() as instrumentation:
+        calc.strengths
+    records = instrumentation.as_dict()
+    assert records["strength_type"][StrengthType.TORSIONAL_BUCKLING.value]["count"] == 1
+    assert records["calculation"]["FlexuralBucklingStrengthCalculation"]["count"] == 2
+    formula = records["formula"][
+        "struct_codes.compression."
+        "elastic_torsional_buckling_stress_doubly_symmetric_member"
+    ]
+    assert formula["count"] == 1
+    assert formula["total_time"] > 0
+
+
+def test_instrumentation_disabled_records_nothing():
+    INSTRUMENTATION.reset()
+    section = create_aisc_section("W6X15", steel250MPa, ConstructionType.ROLLED)
+    section.flexure_major_axis(length=3 * meter).design_strength
+    assert INSTRUMENTATION.records == {}
+
+
+def test_instrumentation_dump_stats(tmp_path):
+    section = create_aisc_section("W6X15", steel250MPa, ConstructionType.ROLLED)
+    with instrumented() as instrumentation:
+        section.flexure_major_axis(length=3 * meter).design_strength
+    file_path = tmp_path / "calc.prof"
+    instrumentation.dump_stats(file_path)
+    stats = pstats.Stats(str(file_path))
+    names = {function_name for _, _, function_name in stats.stats}
+    assert "limiting_length_lateral_torsional_buckling" in names
+
+
+def _formula_of_module(module: str):
+    def formula(value: float) -> float:
+        return value
+
+    formula.__module__ = module
+    return instrumented_formula(formula)
+
+
+def test_instrumentation_same_named_formulas_kept_apart():
+    first, second = _formula_of_module("first"), _formula_of_module("second")
+    with instrumented() as instrumentation:
+        first(1.0)
+        second(1.0)
+        second(1.0)
+    counts = {
+        name.split(".")[0]: record["count"]
+        for name, record in instrumentation.as_dict()["formula"].items()
+    }
+    assert counts == {"first": 1, "second": 2}
@@ -0,0 +1,126 @@
+import numpy as np
+from pytest import approx, mark
+from unit_processing import compare_quantites
+
+from struct_codes.aisc_database import create_aisc_section
+from struct_codes.beam import Beam
+from struct_codes.interaction import (
+    CombinedForcesCalculation2016,
+    InteractionEquation,
+    InteractionSurface,
+    InteractionSurfaceCache,
+)
+from struct_codes.materials import steel355MPa
+from struct_codes.sections import ConstructionType
+from struct_codes.units import kilonewton, meter, newton
+
+CALCULATION = CombinedForcesCalculation2016(
+    compression_strength=1000 * kilonewton,
+    tension_strength=1200 * kilonewton,
+    major_axis_flexural_strength=200 * kilonewton * meter,
+    minor_axis_flexural_strength=80 * kilonewton * meter,
+)
+
+
+@mark.parametrize(
+    "axial_force, major_axis_moment, minor_axis_moment, expected_ratio, expected_equation",
+    [
+        (-500, 100, 20, 0.5 + 8 / 9 * (0.5 + 0.25), InteractionEquation.H1_1A),
+        (-100, 100, 20, 0.05 + 0.5 + 0.25, InteractionEquation.H1_1B),
+        (600, 100, 0, 0.5 + 8 / 9 * 0.5, InteractionEquation.H1_1A),
+        (0, -150, 0, 0.75, InteractionEquation.H1_1B),
+    ],
+)
+def test_interaction(
+    axial_force, major_axis_moment, minor_axis_moment, expected_ratio, expected_equation
+):
+    result = CALCULATION.utilization(
+        axial_force * kilonewton,
+        major_axis_moment * kilonewton * meter,
+        minor_axis_moment * kilonewton * meter,
+    )
+    assert result.ratio == approx(expected_ratio)
+    assert result.equation == expected_equation
+
+
+def test_interaction_demand_arrays():
+    result = CALCULATION.utilization(
+        np.array([-500, -100, 600, 0]) * kilonewton,
+        np.array([100, 100, 100, -150]) * kilonewton * meter,
+        np.array([20, 20, 0, 0]) * kilonewton * meter,
+    )
+    assert result.ratio == approx([1.1667, 0.8, 0.9444, 0.75], abs=1e-4)
+    assert list(result.equation) == [
+        InteractionEquation.H1_1A,
+        InteractionEquation.H1_1B,
+        InteractionEquation.H1_1A,
+        InteractionEquation.H1_1B,
+    ]
+    assert list(result.passed) == [False, True, True, True]
+
+
+def test_w_section_combined_forces_reuses_capacities():
+    section = create_aisc_section("W14X90", steel355MPa, ConstructionType.ROLLED)
+    beam = Beam(length_major_axis=4 * meter)
+    calc = section.combined_forces(beam)
+    compare_quantites(
+        calc.compression_strength,
+        section.compression(length_major_axis=4 * meter).design_strength,
+    )
+    compare_quantites(
+        calc.major_axis_flexural_strength,
+        section.flexure_major_axis(length=4 * meter).design_strength,
+    )
+
+
+def test_interaction_surface_matches_calculation():
+    surface = InteractionSurface.from_calculation(CALCULATION)
+    rng = np.random.default_rng(0)
+    axial = rng.uniform(-1500, 1500, 1000) * kilonewton
+    major = rng.uniform(-250, 250, 1000) * kilonewton * meter
+    minor = rng.uniform(-100, 100, 1000) * kilonewton * meter
+    expected = CALCULATION.utilization(axial, major, minor)
+    assert surface.utilization(axial, major, minor) == approx(expected.ratio)
+    # plain arrays are taken in base units, newton and newton * meter
+    assert list(
+        surface.contains(
+            axial.to("N").magnitude,
+            major.to("N*m").magnitude,
+            minor.to("N*m").magnitude,
+        )
+    ) == list(expected.passed)
+
+
+def test_interaction_surface_cache():
+    cache = InteractionSurfaceCache(steel355MPa)
+    beam = Beam(length_major_axis=4 * meter)
+    surface = cache.surface("W14X90", beam)
+    assert cache.surface("W14X90", Beam(length_major_axis=4 * meter)) is surface
+    assert cache.surface("W14X90", Beam(length_major_axis=5 * meter)) is not surface
+    section = create_aisc_section("W14X90", steel355MPa, ConstructionType.ROLLED)
+    calc = section.combined_forces(beam)
+    demand = (np.array([-1000e3, 500e3]), np.array([100e3, 300e3]), np.zeros(2))
+    assert surface.utilization(*demand) == approx(
+        calc.utilization(
+            demand[0] * newton, demand[1] * newton * meter, demand[2] * newton * meter
+        ).ratio
+    )
+
+
+def test_interaction_surface_cache_per_segment_modification_factors():
+    cache = InteractionSurfaceCache(steel355MPa)
+    beam = Beam(
+        length_major_axis=6 * meter, brace_positions=[0.0, 2.0, 4.0, 6.0] * meter
+    )
+    factors = np.array([1.0, 1.3, 1.67])
+    surface = cache.surface("W14X90", beam, factors)
+    assert cache.surface("W14X90", beam, factors.copy()) is surface
+    assert cache.surface("W14X90", beam, factors[::-1]) is not surface
+    assert cache.surface("W14X90", beam, 1.0) is not surface
+    section = create_aisc_section("W14X90", steel355MPa, ConstructionType.ROLLED)
+    calc = section.combined_forces(
+        beam, lateral_torsional_buckling_modification_factor=factors
+    )
+    assert surface.major_axis_flexural_strength == approx(
+        calc.major_axis_flexural_strength.to(newton * meter).magnitude
+    )
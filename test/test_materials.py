@@ -0,0 +1,103 @@
+import numpy as np
+from pytest import approx, mark
+from unit_processing import assert_batch_matches_scalar
+
+from struct_codes.aisc_database import (
+    aisc_sections,
+    create_aisc_section,
+    get_aisc_geometry_table,
+)
+from struct_codes.angle import SingleAngle
+from struct_codes.channel import Channel
+from struct_codes.hss import HollowStructuralSection
+from struct_codes.i_section import DoublySymmetricI
+from struct_codes.materials import (
+    grades,
+    material_array,
+    steel250MPa,
+    steel355MPa,
+    steel_grades,
+)
+from struct_codes.sections import ConstructionType, RuleEd, SectionType
+from struct_codes.tee import Tee
+from struct_codes.units import meter
+
+GRADES = ("A36", "A992", "A913-65", "S355")
+
+
+def test_grade_values():
+    assert steel_grades["A992"].yield_strength.to("MPa").magnitude == approx(344.7379)
+    assert steel_grades["S355"].modulus_linear.to("GPa").magnitude == 210
+
+
+def test_material_array():
+    material = grades("A36", "A992")
+    assert material.yield_strength.shape == (2, 1)
+    # shared properties stay scalar
+    assert np.ndim(material.modulus_linear) == 0
+    flat = material_array([steel355MPa, steel250MPa], sections_axis=False)
+    assert flat.yield_strength.to("MPa").magnitude == approx([355, 250])
+    assert flat.density is None
+
+
+def test_missing_density_is_nan():
+    material = material_array([steel355MPa, steel_grades["A36"]])
+    assert np.isnan(material.density[0, 0].magnitude)
+    assert material.density[1, 0] == 7850 * material.density.units
+
+
+@mark.parametrize(
+    "section_class, section_type, calculations",
+    [
+        (
+            DoublySymmetricI,
+            SectionType.W,
+            lambda section: (
+                section.compression(length_major_axis=3 * meter),
+                section.flexure_major_axis(length=3 * meter),
+                section.shear_major_axis(),
+            ),
+        ),
+        (
+            Channel,
+            SectionType.C,
+            lambda section: (
+                section.compression(length_major_axis=3 * meter),
+                section.flexure_major_axis(length=3 * meter),
+            ),
+        ),
+        (
+            Tee,
+            SectionType.WT,
+            lambda section: (section.flexure_major_axis(length=3 * meter),),
+        ),
+        (
+            SingleAngle,
+            SectionType.L,
+            lambda section: (section.compression(length_major_axis=2 * meter),),
+        ),
+        (
+            HollowStructuralSection,
+            SectionType.HSS,
+            lambda section: (
+                section.compression(length_major_axis=3 * meter),
+                section.flexure_major_axis(),
+            ),
+        ),
+    ],
+)
+def test_sections_by_grades(section_class, section_type, calculations):
+    names = aisc_sections(RuleEd.ED15).names(section_type)[::7]
+    batch = section_class(get_aisc_geometry_table(names), grades(*GRADES))
+    assert calculations(batch)[0].design_strength.shape == (len(GRADES), len(names))
+    assert_batch_matches_scalar(
+        batch,
+        {
+            (g, i): create_aisc_section(
+                name, steel_grades[grade], ConstructionType.ROLLED
+            )
+            for g, grade in enumerate(GRADES)
+            for i, name in enumerate(names)
+        },
+        calculations,
+    )
@@ -0,0 +1,114 @@
+import numpy as np
+from pytest import approx, fixture, mark
+
+from struct_codes.criteria import DesignType
+from struct_codes.i_section import BuiltUpIGeometry, DoublySymmetricI
+from struct_codes.materials import steel250MPa, steel355MPa
+from struct_codes.plate_girder import (
+    GirderConstraint,
+    PlateGirderProblem,
+    maximum_web_ratio,
+    optimize_plate_girder,
+)
+from struct_codes.sections import ConstructionType
+from struct_codes.units import kilogram, meter, millimeter, newton
+
+
+@fixture
+def problem() -> PlateGirderProblem:
+    return PlateGirderProblem(
+        moment=6000e3 * newton * meter,
+        shear=1200e3 * newton,
+        length=6 * meter,
+        material=steel355MPa,
+        bf=(200 * millimeter, 600 * millimeter),
+        tf=(10 * millimeter, 50 * millimeter),
+        h=(800 * millimeter, 2400 * millimeter),
+        tw=(6 * millimeter, 25 * millimeter),
+    )
+
+
+@mark.parametrize(
+    "material, panel_aspect_ratio, expected",
+    [
+        (steel355MPa, 1.0, 284.82760),
+        (steel355MPa, 3.0, 225.35211),
+        (steel355MPa, np.inf, 225.35211),
+        (steel250MPa, 3.0, 320.0),
+        # 0.40 E / Fy = 320, unstiffened webs limited to 260
+        (steel250MPa, np.inf, 260.0),
+    ],
+)
+def test_maximum_web_ratio(material, panel_aspect_ratio: float, expected: float):
+    assert maximum_web_ratio(
+        modulus_linear=material.modulus_linear,
+        yield_strength=material.yield_strength,
+        panel_aspect_ratio=panel_aspect_ratio,
+    ) == approx(expected)
+
+
+def test_utilizations_match_section_checks(problem: PlateGirderProblem):
+    dimensions = np.array([[500, 25, 1800, 12], [300, 16, 1200, 8]])
+    utilizations, criteria = problem.utilizations(problem.geometry(dimensions))
+    for i, girder in enumerate(dimensions):
+        section = DoublySymmetricI(
+            geometry=BuiltUpIGeometry(*(girder * millimeter)),
+            material=steel355MPa,
+            construction=ConstructionType.BUILT_UP,
+        )
+        flexure = section.flexure_major_axis(
+            length=6 * meter, design_type=DesignType.LRFD
+        )
+        shear = section.shear_major_axis(design_type=DesignType.LRFD)
+        assert utilizations[GirderConstraint.FLEXURE][i] == approx(
+            (problem.moment / flexure.design_strength).to("").magnitude
+        )
+        assert utilizations[GirderConstraint.SHEAR][i] == approx(
+            (problem.shear / shear.design_strength).to("").magnitude
+        )
+        assert criteria[i] == flexure.design_strength_criterion
+
+
+def test_web_area_utilization(problem: PlateGirderProblem):
+    # web 1800 x 12 against 10 times a 200 x 10 flange
+    utilizations, _ = problem.utilizations(
+        problem.geometry(np.array([[500, 25, 1800, 12], [200, 10, 1800, 12]]))
+    )
+    assert utilizations[GirderConstraint.WEB_AREA] == approx([0.1728, 1.08])
+
+
+def test_optimize_plate_girder(problem: PlateGirderProblem):
+    optimum = optimize_plate_girder(problem, seed=1, generations=150)
+    assert optimum.feasible
+    assert set(optimum.active_constraints) == {
+        GirderConstraint.FLEXURE,
+        GirderConstraint.SHEAR,
+    }
+    assert optimum.active_bounds == ()
+    assert optimum.evaluations == 40 * 151
+    # lighter than a hand proportioned girder carrying the same loads
+    utilizations, _ = problem.utilizations(
+        problem.geometry(np.array([[500, 25, 1800, 12]]))
+    )
+    assert all(value[0] <= 1 for value in utilizations.values())
+    assert optimum.weight < 7850 * 0.0466 * kilogram / meter
+
+
+def test_optimize_plate_girder_active_bound(problem: PlateGirderProblem):
+    problem.tw = (14 * millimeter, 25 * millimeter)
+    optimum = optimize_plate_girder(problem, seed=1, generations=100)
+    assert optimum.feasible
+    assert ("tw", "lower") in optimum.active_bounds
+    assert GirderConstraint.FLEXURE in optimum.active_constraints
+    assert GirderConstraint.SHEAR not in optimum.active_constraints
+
+
+def test_optimize_plate_girder_workers_match_serial(problem: PlateGirderProblem):
+    serial, parallel = (
+        optimize_plate_girder(
+            problem, population=16, generations=5, workers=workers, seed=3
+        )
+        for workers in (1, 2)
+    )
+    assert serial.weight.magnitude == approx(parallel.weight.magnitude)
+    assert serial.utilizations == approx(parallel.utilizations)
@@ -0,0 +1,98 @@
+from pytest import mark
+from unit_processing import assert_catalog_matches_scalar, compare_quantites
+
+from struct_codes.aisc_database import aisc_sections, create_aisc_section
+from struct_codes.criteria import StrengthType
+from struct_codes.materials import steel250MPa, steel355MPa
+from struct_codes.sections import ConstructionType, RuleEd, SectionType
+from struct_codes.tee import Tee
+from struct_codes.units import megapascal, meter, newton
+
+
+def tee(section_name: str) -> Tee:
+    return create_aisc_section(section_name, steel250MPa, ConstructionType.ROLLED)
+
+
+def test_flexural_torsional_buckling():
+    """eq E4-5 with Fey, tabulated ro = 3.74 in and H = 0.662"""
+    calc = tee("WT9X17.5").compression(length_major_axis=3 * meter)
+    assert calc.design_strength_criterion == StrengthType.FLEXURAL_TORSIONAL_BUCKLING
+    criterion = calc.criteria[StrengthType.FLEXURAL_TORSIONAL_BUCKLING]
+    compare_quantites(criterion.elastic_buckling_stress, 148.97434 * megapascal)
+    compare_quantites(criterion.nominal_strength, 411183.29023 * newton)
+
+
+@mark.parametrize(
+    "section_name, kwargs, expected_strength, expected_criterion",
+    [
+        # Mp limited to 1.6My, compact flange
+        ("WT9X17.5", {}, 40800 * newton * meter, StrengthType.YIELD),
+        # stem in compression, d/tw = 29.5, eq F9-18
+        (
+            "WT9X17.5",
+            {"stem_in_compression": True},
+            22768.03229 * newton * meter,
+            StrengthType.STEM_LOCAL_BUCKLING,
+        ),
+        # Lp < Lb < Lr, eq F9-6
+        (
+            "MT6X5.9",
+            {"length": 1 * meter},
+            10226.66254 * newton * meter,
+            StrengthType.LATERAL_TORSIONAL_BUCKLING,
+        ),
+        # Lp < Lb < Lr, eq F9-6
+        (
+            "MT6X5.9",
+            {"length": 3 * meter},
+            7952.24906 * newton * meter,
+            StrengthType.LATERAL_TORSIONAL_BUCKLING,
+        ),
+    ],
+)
+def test_flexure_major_axis(
+    section_name, kwargs, expected_strength, expected_criterion
+):
+    calc = tee(section_name).flexure_major_axis(**kwargs)
+    assert calc.design_strength_criterion == expected_criterion
+    compare_quantites(
+        calc.criteria[expected_criterion].nominal_strength, expected_strength
+    )
+
+
+def test_stem_in_compression_lateral_torsional_buckling():
+    """eq F9-12 with B negative, Mcr above My is limited to My"""
+    section = tee("WT9X17.5")
+    short = section.flexure_major_axis(length=3 * meter, stem_in_compression=True)
+    compare_quantites(
+        short.criteria[StrengthType.LATERAL_TORSIONAL_BUCKLING].nominal_strength,
+        25500 * newton * meter,
+    )
+    long = section.flexure_major_axis(length=6 * meter, stem_in_compression=True)
+    compare_quantites(
+        long.criteria[StrengthType.LATERAL_TORSIONAL_BUCKLING].nominal_strength,
+        23769.38134 * newton * meter,
+    )
+
+
+@mark.parametrize("material", [steel355MPa, steel250MPa])
+def test_whole_catalog_matches_scalar(material):
+    catalog = aisc_sections(RuleEd.ED15)
+    names = sum(
+        (
+            catalog.names(kind)
+            for kind in (SectionType.WT, SectionType.MT, SectionType.ST)
+        ),
+        (),
+    )
+
+    def calculations(section: Tee):
+        return (
+            section.compression(length_major_axis=3 * meter),
+            section.flexure_major_axis(),
+            section.flexure_major_axis(length=3 * meter),
+            section.flexure_major_axis(length=3 * meter, stem_in_compression=True),
+            section.flexure_minor_axis(),
+        )
+
+    assert_catalog_matches_scalar(Tee, names, material, calculations)
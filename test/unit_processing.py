@@ -3,6 +3,10 @@ from dataclasses import asdict
 from pint import Quantity
 from pytest import approx
 
+from struct_codes.aisc_database import create_aisc_section, get_aisc_geometry_table
+from struct_codes.materials import Material
+from struct_codes.sections import ConstructionType
+
 
 def simplify_units(quantity: Quantity) -> float:
     """Reduce quantity to base units and get magnitude"""
@@ -22,3 +26,35 @@ def simplify_dataclass(data_objetct):
 
 def compare_quantites(q1: Quantity, q2: Quantity):
     assert q1.to_base_units().magnitude == approx(q2.to_base_units().magnitude)
+
+
+def assert_batch_matches_scalar(batch, scalars: dict, calculations):
+    """
+    Design strengths and governing criteria of a columnar section against the
+    same calculations on single sections, keyed by their index in the batch.
+    """
+    batch_calculations = calculations(batch)
+    strengths = [calc.design_strength for calc in batch_calculations]
+    criteria = [calc.design_strength_criterion for calc in batch_calculations]
+    for index, section in scalars.items():
+        for j, calc in enumerate(calculations(section)):
+            assert calc.design_strength.to(strengths[j].units).magnitude == approx(
+                strengths[j][index].magnitude
+            )
+            assert calc.design_strength_criterion == criteria[j][index]
+
+
+def assert_catalog_matches_scalar(
+    section_class, names: tuple[str, ...], material: Material, calculations
+):
+    """Database sections as one columnar section against each built alone"""
+    batch = section_class(get_aisc_geometry_table(names), material)
+    assert_batch_matches_scalar(
+        batch,
+        {
+            i: create_aisc_section(name, material, ConstructionType.ROLLED)
+            for i, name in enumerate(names)
+        },
+        calculations,
+    )
+    return batch